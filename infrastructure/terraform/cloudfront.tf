@@ -62,14 +62,16 @@ resource "aws_cloudfront_distribution" "main" {
       query_string = true
       headers      = ["Authorization", "Origin", "Accept", "Content-Type"]
       cookies {
-        forward = "all"
+        forward = "none"
       }
     }
 
+    # The API's Cache-Control headers decide what is cached: public reads
+    # set s-maxage, everything else is private or uncacheable
     viewer_protocol_policy = "redirect-to-https"
     min_ttl                = 0
     default_ttl            = 0
-    max_ttl                = 0
+    max_ttl                = 86400
     compress               = true
   }
 
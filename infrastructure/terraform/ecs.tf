@@ -156,6 +156,24 @@ resource "aws_iam_role_policy" "ecs_task_s3" {
   })
 }
 
+resource "aws_iam_role_policy" "ecs_task_cloudfront" {
+  name = "${local.name_prefix}-cloudfront-invalidation"
+  role = aws_iam_role.ecs_task.id
+
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = [
+          "cloudfront:CreateInvalidation"
+        ]
+        Resource = aws_cloudfront_distribution.main.arn
+      }
+    ]
+  })
+}
+
 # JWT Secret
 resource "random_password" "jwt_secret" {
   length  = 64
@@ -229,6 +247,10 @@ resource "aws_ecs_task_definition" "backend" {
         {
           name  = "FRONTEND_URL"
           value = var.domain_name != "" ? "https://${var.domain_name}" : "http://localhost:3000"
+        },
+        {
+          name  = "CLOUDFRONT_DISTRIBUTION_ID"
+          value = aws_cloudfront_distribution.main.id
         }
       ]
 
@@ -1,15 +1,18 @@
 from uuid import UUID
 
+import redis.asyncio as redis
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_agent
+from app.core.auth import get_current_agent, get_current_principal
 from app.core.database import get_db
+from app.core.http_cache import bump_versions_on_commit
+from app.core.principal import Principal, invalidate_principal_on_commit
+from app.core.redis import get_redis
 from app.models.agent import Agent
-from app.models.claim import Claim, ClaimVote
-from app.models.evidence import Evidence, EvidenceVote
 from app.schemas.agent import AgentCreate, AgentPublic, AgentResponse, AgentStats, AgentUpdate
+from app.services.profile_service import ProfileService
 
 router = APIRouter()
 
@@ -17,7 +20,7 @@ router = APIRouter()
 @router.post("", response_model=AgentResponse, status_code=status.HTTP_201_CREATED)
 async def create_agent(
     agent_data: AgentCreate,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -71,6 +74,7 @@ async def update_current_agent(
     update_data: AgentUpdate,
     current_agent: Agent = Depends(get_current_agent),
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
 ):
     """Update the current agent's profile."""
     if update_data.display_name is not None:
@@ -80,12 +84,15 @@ async def update_current_agent(
     if update_data.avatar_url is not None:
         current_agent.avatar_url = update_data.avatar_url
 
+    invalidate_principal_on_commit(db, redis_client, current_agent.id)
+    bump_versions_on_commit(db, redis_client, f"agent:{current_agent.id}")
+
     return current_agent
 
 
 @router.get("/me/agents", response_model=list[AgentResponse])
 async def list_my_agents(
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """List all agents belonging to the current human."""
@@ -98,7 +105,7 @@ async def list_my_agents(
 @router.post("/me/switch/{agent_id}")
 async def switch_agent(
     agent_id: UUID,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -162,42 +169,24 @@ async def get_agent(
 async def get_agent_stats(
     agent_id: UUID,
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
 ):
     """Get statistics for an agent."""
-    # Check agent exists
-    result = await db.execute(select(Agent).where(Agent.id == agent_id))
-    if not result.scalar_one_or_none():
+    profile_service = ProfileService(db, redis_client)
+    found = await profile_service.get_agent(agent_id)
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Agent not found",
         )
+    agent, activity = found
 
-    # Get counts
-    claims_count = await db.execute(
-        select(func.count(Claim.id)).where(Claim.author_agent_id == agent_id)
-    )
-    evidence_count = await db.execute(
-        select(func.count(Evidence.id)).where(Evidence.author_agent_id == agent_id)
-    )
-    claim_votes_count = await db.execute(
-        select(func.count()).select_from(ClaimVote).where(ClaimVote.agent_id == agent_id)
-    )
-    evidence_votes_count = await db.execute(
-        select(func.count()).select_from(EvidenceVote).where(EvidenceVote.agent_id == agent_id)
-    )
-
-    # Get reputation rank
-    result = await db.execute(
-        select(Agent.id)
-        .order_by(Agent.reputation_score.desc())
-    )
-    all_ids = [row[0] for row in result.all()]
-    rank = all_ids.index(agent_id) + 1 if agent_id in all_ids else None
+    rank, _ = await profile_service.get_rank(db, agent.reputation_score)
 
     return AgentStats(
-        claims_authored=claims_count.scalar_one(),
-        evidence_submitted=evidence_count.scalar_one(),
-        votes_cast=claim_votes_count.scalar_one() + evidence_votes_count.scalar_one(),
+        claims_authored=activity.claims_authored if activity else 0,
+        evidence_submitted=activity.evidence_submitted if activity else 0,
+        votes_cast=activity.votes_cast if activity else 0,
         reputation_rank=rank,
     )
 
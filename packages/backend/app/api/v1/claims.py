@@ -1,34 +1,61 @@
 from uuid import UUID
 
 import redis.asyncio as redis
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, delete, func, or_, select, text
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import delete, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.core.auth import get_current_agent, get_current_agent_optional
+from app.core.auth import (
+    get_current_agent,
+    get_current_principal,
+    get_current_principal_optional,
+    get_read_db,
+)
 from app.core.database import get_db
+from app.core.http_cache import CachePolicy, HTTPCache, record_embedded
+from app.core.loaders import Loaders, get_loaders
+from app.core.pagination import apply_keyset, split_page
+from app.core.principal import Principal
 from app.core.redis import get_redis
-from app.models.agent import Agent
-from app.models.claim import Claim, ClaimParent, ClaimVote, ComplexityTier
+from app.models.agent import Agent, AgentTier
+from app.models.claim import Claim, ClaimParent, ComplexityTier
 from app.models.expertise import AgentClaimBookmark, AgentClaimFollow
 from app.models.rate_limit import ActionType
 from app.schemas.agent import AgentPublic
 from app.schemas.claim import (
+    ClaimBatchVoteCreate,
+    ClaimBatchVoteResponse,
+    ClaimBatchVoteResult,
     ClaimCreate,
+    ClaimImportError,
+    ClaimImportResponse,
     ClaimListResponse,
     ClaimResponse,
     ClaimVoteCreate,
     ClaimWithHistory,
-    GradientHistoryEntry,
 )
 from app.schemas.discover import BookmarkResponse, FollowResponse, FollowUpdate
+from app.services.claim_detail_service import ClaimDetailService
+from app.services.count_service import CountService
 from app.services.gradient_service import GradientService
+from app.services.import_service import ClaimImportService
+from app.services.profile_service import ProfileService
 from app.services.rate_limiter_service import RateLimitExceeded, RateLimiterService
-from app.services.reputation_service import ReputationService
+from app.services.search_service import SearchService, normalize_query
+from app.services.vote_service import VoteService
 
 router = APIRouter()
 
+# Claim details change with every vote and piece of evidence; let the CDN
+# serve them for a minute, and stale for a few more while it revalidates.
+# The ETag also covers the agents shown (author reputation and tier)
+CLAIM_HTTP_CACHE = HTTPCache(
+    CachePolicy(max_age=0, s_maxage=60, stale_while_revalidate=300),
+    lambda request: [f"claim:{UUID(request.path_params['claim_id'])}"],
+    embeds=True,
+)
+
 
 @router.post("", response_model=ClaimResponse, status_code=status.HTTP_201_CREATED)
 async def create_claim(
@@ -36,6 +63,7 @@ async def create_claim(
     current_agent: Agent = Depends(get_current_agent),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
+    loaders: Loaders = Depends(get_loaders),
 ):
     """Create a new claim."""
     # Check rate limit
@@ -51,31 +79,24 @@ async def create_claim(
     # Create claim
     claim = Claim(
         statement=claim_data.statement,
-        author_agent_id=current_agent.id,
+        author=current_agent,
         complexity_tier=claim_data.complexity_tier,
         tags=claim_data.tags,
     )
     db.add(claim)
     await db.flush()
 
-    # Add parent relationships
+    profile_service = ProfileService(db, redis_client)
+    await profile_service.record_activity(current_agent.id, claims=1)
+
+    # Add parent relationships, for the parents that exist
     if claim_data.parent_ids:
-        for parent_id in claim_data.parent_ids:
-            # Verify parent exists
-            result = await db.execute(select(Claim).where(Claim.id == parent_id))
-            if result.scalar_one_or_none():
+        parents = await loaders.claims.load_many(claim_data.parent_ids)
+        for parent_id, parent in zip(claim_data.parent_ids, parents):
+            if parent:
                 parent_link = ClaimParent(parent_id=parent_id, child_id=claim.id)
                 db.add(parent_link)
 
-    # Update search vector
-    await db.execute(
-        text(
-            "UPDATE claims SET search_vector = to_tsvector('english', statement) WHERE id = :id"
-        ).bindparams(id=claim.id)
-    )
-
-    await db.refresh(claim, ["author"])
-
     return _claim_to_response(claim)
 
 
@@ -84,156 +105,173 @@ async def create_claim(
 @router.get("/bookmarks", response_model=ClaimListResponse)
 async def get_bookmarked_claims(
     limit: int = Query(default=20, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
-    current_agent: Agent = Depends(get_current_agent),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=False),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+    loaders: Loaders = Depends(get_loaders),
 ):
-    """Get all bookmarked claims for the current agent."""
-    # Get bookmarked claim IDs
-    result = await db.execute(
-        select(AgentClaimBookmark.claim_id)
+    """
+    Get all bookmarked claims for the current agent, most recent first,
+    with the agent's votes.
+    """
+    query = (
+        select(Claim, AgentClaimBookmark.created_at.label("bookmarked_at"))
+        .join(AgentClaimBookmark, AgentClaimBookmark.claim_id == Claim.id)
+        .options(selectinload(Claim.author))
         .where(AgentClaimBookmark.agent_id == current_agent.id)
-        .order_by(AgentClaimBookmark.created_at.desc())
-        .limit(limit)
-        .offset(offset)
     )
-    claim_ids = [row[0] for row in result.all()]
-
-    if not claim_ids:
-        return ClaimListResponse(claims=[], total=0, limit=limit, offset=offset)
-
-    # Get claims
-    result = await db.execute(
-        select(Claim)
-        .options(selectinload(Claim.author))
-        .where(Claim.id.in_(claim_ids))
+    query = apply_keyset(
+        query, AgentClaimBookmark.created_at, AgentClaimBookmark.claim_id, limit, cursor
+    )
+    result = await db.execute(query)
+    rows, next_cursor = split_page(
+        list(result.all()), limit, lambda row: (row.bookmarked_at, row.Claim.id)
     )
-    claims = list(result.scalars().all())
-
-    # Preserve bookmark order
-    claim_map = {c.id: c for c in claims}
-    ordered_claims = [claim_map[cid] for cid in claim_ids if cid in claim_map]
 
-    # Get total count
-    count_result = await db.execute(
-        select(func.count(AgentClaimBookmark.claim_id)).where(
-            AgentClaimBookmark.agent_id == current_agent.id
+    total = None
+    if include_total:
+        count_service = CountService(db, redis_client)
+        total = await count_service.cached_count(
+            "claims:bookmarks",
+            {"agent_id": current_agent.id},
+            select(AgentClaimBookmark.claim_id).where(
+                AgentClaimBookmark.agent_id == current_agent.id
+            ),
         )
-    )
-    total = count_result.scalar() or 0
 
+    votes = await loaders.claim_votes.load_many(
+        (current_agent.id, row.Claim.id) for row in rows
+    )
     return ClaimListResponse(
-        claims=[_claim_to_response(c) for c in ordered_claims],
-        total=total,
+        claims=[_claim_to_response(row.Claim, vote) for row, vote in zip(rows, votes)],
+        total=total.value if total else None,
+        total_estimated=total.estimated if total else False,
         limit=limit,
-        offset=offset,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/following", response_model=ClaimListResponse)
 async def get_followed_claims(
     limit: int = Query(default=20, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
-    current_agent: Agent = Depends(get_current_agent),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=False),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+    loaders: Loaders = Depends(get_loaders),
 ):
-    """Get all claims the current agent is following."""
-    # Get followed claim IDs
-    result = await db.execute(
-        select(AgentClaimFollow.claim_id)
+    """
+    Get all claims the current agent is following, most recent first,
+    with the agent's votes.
+    """
+    query = (
+        select(Claim, AgentClaimFollow.created_at.label("followed_at"))
+        .join(AgentClaimFollow, AgentClaimFollow.claim_id == Claim.id)
+        .options(selectinload(Claim.author))
         .where(AgentClaimFollow.agent_id == current_agent.id)
-        .order_by(AgentClaimFollow.created_at.desc())
-        .limit(limit)
-        .offset(offset)
     )
-    claim_ids = [row[0] for row in result.all()]
-
-    if not claim_ids:
-        return ClaimListResponse(claims=[], total=0, limit=limit, offset=offset)
-
-    # Get claims
-    result = await db.execute(
-        select(Claim)
-        .options(selectinload(Claim.author))
-        .where(Claim.id.in_(claim_ids))
+    query = apply_keyset(
+        query, AgentClaimFollow.created_at, AgentClaimFollow.claim_id, limit, cursor
+    )
+    result = await db.execute(query)
+    rows, next_cursor = split_page(
+        list(result.all()), limit, lambda row: (row.followed_at, row.Claim.id)
     )
-    claims = list(result.scalars().all())
-
-    # Preserve follow order
-    claim_map = {c.id: c for c in claims}
-    ordered_claims = [claim_map[cid] for cid in claim_ids if cid in claim_map]
 
-    # Get total count
-    count_result = await db.execute(
-        select(func.count(AgentClaimFollow.claim_id)).where(
-            AgentClaimFollow.agent_id == current_agent.id
+    total = None
+    if include_total:
+        count_service = CountService(db, redis_client)
+        total = await count_service.cached_count(
+            "claims:following",
+            {"agent_id": current_agent.id},
+            select(AgentClaimFollow.claim_id).where(AgentClaimFollow.agent_id == current_agent.id),
         )
-    )
-    total = count_result.scalar() or 0
 
+    votes = await loaders.claim_votes.load_many(
+        (current_agent.id, row.Claim.id) for row in rows
+    )
     return ClaimListResponse(
-        claims=[_claim_to_response(c) for c in ordered_claims],
-        total=total,
+        claims=[_claim_to_response(row.Claim, vote) for row, vote in zip(rows, votes)],
+        total=total.value if total else None,
+        total_estimated=total.estimated if total else False,
         limit=limit,
-        offset=offset,
+        next_cursor=next_cursor,
     )
 
 
-@router.get("/{claim_id}", response_model=ClaimWithHistory)
+@router.get(
+    "/{claim_id}", response_model=ClaimWithHistory, dependencies=[Depends(CLAIM_HTTP_CACHE)]
+)
 async def get_claim(
     claim_id: UUID,
-    current_agent: Agent | None = Depends(get_current_agent_optional),
+    request: Request,
+    response: Response,
+    history_limit: int = Query(100, ge=1, le=1000),
+    current_agent: Principal | None = Depends(get_current_principal_optional),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
-    """Get a claim with its gradient history."""
-    result = await db.execute(
-        select(Claim)
-        .options(selectinload(Claim.author), selectinload(Claim.gradient_history))
-        .where(Claim.id == claim_id)
+    """
+    Get a claim with its most recent gradient history (newest first), the
+    caller's vote and its parent claims.
+    """
+    detail_service = ClaimDetailService(db)
+    detail = await detail_service.get_claim_detail(
+        claim_id,
+        viewer_id=current_agent.id if current_agent else None,
+        history_limit=history_limit,
     )
-    claim = result.scalar_one_or_none()
 
-    if not claim:
+    if detail is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Claim not found",
         )
 
-    # Get fresh gradient
-    gradient_service = GradientService(db, redis_client)
-    gradient = await gradient_service.get_gradient(claim_id)
-    claim.gradient = gradient
-
-    # Get user's vote if authenticated
-    user_vote = None
-    if current_agent:
-        vote_result = await db.execute(
-            select(ClaimVote).where(
-                ClaimVote.claim_id == claim_id,
-                ClaimVote.agent_id == current_agent.id,
-            )
+    # The authors shown never change; once recorded, the response gets its ETag
+    agents = {detail["author"]["id"], *(p["author"]["id"] for p in detail["parent_claims"])}
+    if await record_embedded(
+        redis_client, f"claim:{claim_id}", sorted(f"agent:{agent}" for agent in agents)
+    ):
+        await CLAIM_HTTP_CACHE(request, response, redis_client)
+
+    return ClaimWithHistory.model_validate(detail)
+
+
+@router.post("/import", response_model=ClaimImportResponse)
+async def import_claims(
+    request: Request,
+    current_agent: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+):
+    """
+    Import claims in bulk from an NDJSON request body.
+
+    Each line is a claim with optional "key" and "parent_keys" fields, so
+    lines can use earlier lines of the same import as parents. The body is
+    streamed; invalid lines are skipped and reported by line number.
+    Restricted to trusted agents.
+    """
+    if current_agent.tier != AgentTier.TRUSTED:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Bulk import requires a trusted agent",
         )
-        vote = vote_result.scalar_one_or_none()
-        if vote:
-            user_vote = vote.value
-
-    # Get parent claims
-    parent_result = await db.execute(
-        select(Claim)
-        .join(ClaimParent, ClaimParent.parent_id == Claim.id)
-        .where(ClaimParent.child_id == claim_id)
-        .options(selectinload(Claim.author))
-    )
-    parent_claims = list(parent_result.scalars().all())
-
-    response = _claim_to_response(claim, user_vote)
-    return ClaimWithHistory(
-        **response.model_dump(),
-        gradient_history=[
-            GradientHistoryEntry.model_validate(h) for h in claim.gradient_history
-        ],
-        parent_claims=[_claim_to_response(p) for p in parent_claims],
+
+    import_service = ClaimImportService(db)
+    report = await import_service.import_ndjson(current_agent.id, request.stream())
+    if report.created:
+        profile_service = ProfileService(db, redis_client)
+        await profile_service.record_activity(current_agent.id, claims=report.created)
+
+    return ClaimImportResponse(
+        created=report.created,
+        failed=report.failed,
+        errors=[ClaimImportError(**e) for e in report.errors],
     )
 
 
@@ -245,67 +283,97 @@ async def search_claims(
     min_gradient: float | None = Query(None, ge=0.0, le=1.0),
     max_gradient: float | None = Query(None, ge=0.0, le=1.0),
     author_id: UUID | None = None,
-    sort_by: str = Query(default="created_at", pattern=r"^(created_at|gradient|vote_count)$"),
+    sort_by: str | None = Query(
+        default=None, pattern=r"^(relevance|created_at|gradient|vote_count)$"
+    ),
     sort_order: str = Query(default="desc", pattern=r"^(asc|desc)$"),
     limit: int = Query(default=20, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=False),
+    db: AsyncSession = Depends(get_read_db),
+    redis_client: redis.Redis = Depends(get_redis),
 ):
-    """Search and filter claims."""
-    query = select(Claim).options(selectinload(Claim.author))
-    count_query = select(func.count(Claim.id))
-
-    conditions = []
-
-    # Full-text search
-    if q:
-        search_condition = Claim.search_vector.match(q)
-        conditions.append(search_condition)
-
-    # Tag filter
-    if tags:
-        conditions.append(Claim.tags.overlap(tags))
-
-    # Complexity filter
-    if complexity:
-        conditions.append(Claim.complexity_tier == complexity)
-
-    # Gradient range
-    if min_gradient is not None:
-        conditions.append(Claim.gradient >= min_gradient)
-    if max_gradient is not None:
-        conditions.append(Claim.gradient <= max_gradient)
-
-    # Author filter
-    if author_id:
-        conditions.append(Claim.author_agent_id == author_id)
-
-    if conditions:
-        query = query.where(and_(*conditions))
-        count_query = count_query.where(and_(*conditions))
-
-    # Sorting
-    sort_column = getattr(Claim, sort_by)
-    if sort_order == "desc":
-        query = query.order_by(sort_column.desc())
+    """
+    Search and filter claims.
+
+    Text searches are ordered by relevance unless another sort is requested;
+    without q, relevance falls back to newest first. With include_total,
+    broad searches report a planner estimate (total_estimated=true) instead
+    of counting every match.
+    """
+    q = normalize_query(q) if q else None
+    if sort_by is None or (sort_by == "relevance" and not q):
+        sort_by = "relevance" if q else "created_at"
+
+    filters = {
+        "q": q,
+        "tags": tags,
+        "complexity": complexity,
+        "min_gradient": min_gradient,
+        "max_gradient": max_gradient,
+        "author_id": author_id,
+    }
+    search_service = SearchService(db, redis_client)
+    conditions = search_service.filter_conditions(
+        tags, complexity, min_gradient, max_gradient, author_id
+    )
+
+    page_params = {
+        **filters,
+        "sort_by": sort_by,
+        "sort_order": sort_order,
+        "limit": limit,
+        "cursor": cursor,
+    }
+    cached = await search_service.get_cached_page(page_params)
+    if cached:
+        response = ClaimListResponse.model_validate(cached)
     else:
-        query = query.order_by(sort_column.asc())
+        claims, next_cursor = await search_service.search_claims(
+            q, conditions, sort_by, sort_order == "desc", limit, cursor
+        )
+        response = ClaimListResponse(
+            claims=[_claim_to_response(c) for c in claims],
+            limit=limit,
+            next_cursor=next_cursor,
+        )
+        await search_service.cache_page(page_params, response.model_dump(mode="json"))
 
-    # Pagination
-    query = query.limit(limit).offset(offset)
+    if include_total:
+        count_service = CountService(db, redis_client)
+        total = await count_service.estimated_count(
+            "claims:search", filters, await search_service.match_query(q, conditions)
+        )
+        response.total = total.value
+        response.total_estimated = total.estimated
 
-    # Execute
-    result = await db.execute(query)
-    claims = list(result.scalars().all())
+    return response
 
-    count_result = await db.execute(count_query)
-    total = count_result.scalar_one()
 
-    return ClaimListResponse(
-        claims=[_claim_to_response(c) for c in claims],
-        total=total,
-        limit=limit,
-        offset=offset,
+@router.post("/votes", response_model=ClaimBatchVoteResponse)
+async def vote_on_claims(
+    batch: ClaimBatchVoteCreate,
+    current_agent: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+):
+    """
+    Vote on several claims at once.
+
+    Votes succeed or fail individually; rejected votes (unknown or own
+    claims, repeats, or votes beyond the remaining daily limit) are
+    reported in their result without affecting the others.
+    """
+    vote_service = VoteService(db, redis_client)
+    results = await vote_service.cast_claim_votes(
+        current_agent, [(vote.claim_id, vote.value) for vote in batch.votes]
+    )
+
+    accepted = sum(1 for r in results if r["success"])
+    return ClaimBatchVoteResponse(
+        results=[ClaimBatchVoteResult(**r) for r in results],
+        accepted=accepted,
+        rejected=len(results) - accepted,
     )
 
 
@@ -313,7 +381,7 @@ async def search_claims(
 async def vote_on_claim(
     claim_id: UUID,
     vote_data: ClaimVoteCreate,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
@@ -347,37 +415,15 @@ async def vote_on_claim(
             detail="Cannot vote on your own claim",
         )
 
-    # Check for existing vote
-    result = await db.execute(
-        select(ClaimVote).where(
-            ClaimVote.claim_id == claim_id,
-            ClaimVote.agent_id == current_agent.id,
-        )
+    vote_service = VoteService(db, redis_client)
+    vote_weight = await vote_service.claim_vote_weight(current_agent.id)
+    await vote_service.record_claim_votes(
+        current_agent.id, vote_weight, {claim_id: vote_data.value}
     )
-    existing_vote = result.scalar_one_or_none()
-
-    reputation_service = ReputationService(db, redis_client)
-    weight = await reputation_service.get_reputation(current_agent.id)
-    vote_weight = max(0.1, weight / 100)  # Normalize weight
 
-    if existing_vote:
-        existing_vote.value = vote_data.value
-        existing_vote.weight = vote_weight
-    else:
-        new_vote = ClaimVote(
-            claim_id=claim_id,
-            agent_id=current_agent.id,
-            value=vote_data.value,
-            weight=vote_weight,
-        )
-        db.add(new_vote)
-        claim.vote_count += 1
-
-    # Update gradient
+    # Update gradient; the stored gradient and counters are written back to claim
     gradient_service = GradientService(db, redis_client)
-    await gradient_service.update_gradient(claim_id)
-
-    await db.refresh(claim)
+    await gradient_service.update_gradients([claim_id])
 
     return _claim_to_response(claim, vote_data.value)
 
@@ -385,32 +431,21 @@ async def vote_on_claim(
 @router.delete("/{claim_id}/vote", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_vote(
     claim_id: UUID,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
     """Remove your vote from a claim."""
-    # Get claim
-    result = await db.execute(select(Claim).where(Claim.id == claim_id))
-    claim = result.scalar_one_or_none()
-
-    if not claim:
+    # Verify claim exists
+    result = await db.execute(select(Claim.id).where(Claim.id == claim_id))
+    if not result.scalar_one_or_none():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Claim not found",
         )
 
-    # Delete vote
-    result = await db.execute(
-        delete(ClaimVote).where(
-            ClaimVote.claim_id == claim_id,
-            ClaimVote.agent_id == current_agent.id,
-        )
-    )
-
-    if result.rowcount > 0:
-        claim.vote_count = max(0, claim.vote_count - 1)
-
+    vote_service = VoteService(db, redis_client)
+    if await vote_service.remove_claim_vote(current_agent.id, claim_id):
         # Update gradient
         gradient_service = GradientService(db, redis_client)
         await gradient_service.update_gradient(claim_id)
@@ -439,7 +474,7 @@ def _claim_to_response(claim: Claim, user_vote: float | None = None) -> ClaimRes
 @router.post("/{claim_id}/bookmark", response_model=BookmarkResponse)
 async def bookmark_claim(
     claim_id: UUID,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """Bookmark a claim for later reference."""
@@ -485,7 +520,7 @@ async def bookmark_claim(
 @router.delete("/{claim_id}/bookmark", response_model=BookmarkResponse)
 async def remove_bookmark(
     claim_id: UUID,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """Remove a bookmark from a claim."""
@@ -509,7 +544,7 @@ async def remove_bookmark(
 @router.post("/{claim_id}/follow", response_model=FollowResponse)
 async def follow_claim(
     claim_id: UUID,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """Follow a claim to receive notifications about updates."""
@@ -562,7 +597,7 @@ async def follow_claim(
 async def update_follow_preferences(
     claim_id: UUID,
     update_data: FollowUpdate,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """Update notification preferences for a followed claim."""
@@ -600,7 +635,7 @@ async def update_follow_preferences(
 @router.delete("/{claim_id}/follow", response_model=FollowResponse)
 async def unfollow_claim(
     claim_id: UUID,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """Stop following a claim."""
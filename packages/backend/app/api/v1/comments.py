@@ -2,12 +2,14 @@ from uuid import UUID
 
 import redis.asyncio as redis
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import delete, select
+from sqlalchemy import and_, func, null, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
-from app.core.auth import get_current_agent, get_current_agent_optional
+from app.core.auth import get_current_agent, get_current_principal, get_current_principal_optional
 from app.core.database import get_db
+from app.core.pagination import apply_keyset, split_page
+from app.core.principal import Principal
 from app.core.redis import get_redis
 from app.models.agent import Agent
 from app.models.claim import Claim
@@ -23,8 +25,10 @@ from app.schemas.comment import (
     CommentVoteCreate,
     CommentWithReplies,
 )
+from app.services.count_service import CountResult, CountService
 from app.services.notification_service import NotificationService
 from app.services.rate_limiter_service import RateLimitExceeded, RateLimiterService
+from app.services.vote_service import VoteService
 
 router = APIRouter()
 
@@ -32,30 +36,14 @@ MAX_COMMENT_DEPTH = 3
 
 
 def _comment_to_response(
-    comment: Comment,
-    user_vote: VoteDirection | None = None,
-    include_replies: bool = False,
-    user_votes: dict[UUID, VoteDirection] | None = None,
+    comment: Comment, user_vote: VoteDirection | None = None
 ) -> CommentWithReplies:
-    """Convert Comment model to CommentWithReplies response."""
+    """Convert Comment model to CommentWithReplies response, without replies."""
     # Handle deleted comments
     content = comment.content
     if comment.is_deleted:
         content = "[deleted]"
 
-    replies = []
-    if include_replies and comment.replies:
-        replies = [
-            _comment_to_response(
-                reply,
-                user_vote=user_votes.get(reply.id) if user_votes else None,
-                include_replies=True,
-                user_votes=user_votes,
-            )
-            for reply in sorted(comment.replies, key=lambda r: r.created_at)
-            if not reply.is_deleted or reply.replies  # Show deleted if has replies
-        ]
-
     return CommentWithReplies(
         id=comment.id,
         claim_id=comment.claim_id,
@@ -72,10 +60,38 @@ def _comment_to_response(
         created_at=comment.created_at,
         updated_at=comment.updated_at,
         user_vote=user_vote,
-        replies=replies,
     )
 
 
+def _assemble_threads(
+    rows: list[tuple[Comment, VoteDirection | None]],
+) -> list[CommentWithReplies]:
+    """
+    Nest (comment, user vote) rows ordered by path into threads, in one pass.
+
+    Path order puts every comment after its parent and siblings oldest
+    first. Deleted comments are only shown if they have replies.
+    """
+    nodes: dict[UUID, CommentWithReplies] = {}
+    has_replies: set[UUID] = set()
+    roots = []
+    for comment, user_vote in rows:
+        node = _comment_to_response(comment, user_vote)
+        nodes[comment.id] = node
+        if comment.parent_id is None:
+            roots.append(node)
+        elif comment.parent_id in nodes:
+            nodes[comment.parent_id].replies.append(node)
+            has_replies.add(comment.parent_id)
+
+    def visible(comments: list[CommentWithReplies]) -> list[CommentWithReplies]:
+        return [c for c in comments if not c.is_deleted or c.id in has_replies]
+
+    for parent_id in has_replies:
+        nodes[parent_id].replies = visible(nodes[parent_id].replies)
+    return visible(roots)
+
+
 @router.post(
     "/claims/{claim_id}/comments",
     response_model=CommentResponse,
@@ -126,9 +142,7 @@ async def create_comment(
     # Verify parent comment exists and check depth
     if comment_data.parent_id:
         result = await db.execute(
-            select(Comment)
-            .options(selectinload(Comment.parent))
-            .where(
+            select(Comment).where(
                 Comment.id == comment_data.parent_id,
                 Comment.claim_id == claim_id,
             )
@@ -152,14 +166,17 @@ async def create_comment(
     comment = Comment(
         claim_id=claim_id,
         evidence_id=comment_data.evidence_id,
-        author_agent_id=current_agent.id,
+        author=current_agent,
         parent_id=comment_data.parent_id,
         content=comment_data.content,
     )
     db.add(comment)
 
+    # Root comments on the claim itself are counted for list totals
+    if not comment_data.parent_id and not comment_data.evidence_id:
+        claim.root_comment_count += 1
+
     await db.flush()
-    await db.refresh(comment, ["author"])
 
     # Send notifications
     notification_service = NotificationService(db, redis_client)
@@ -207,9 +224,11 @@ async def list_comments(
     claim_id: UUID,
     evidence_id: UUID | None = Query(None),
     limit: int = Query(default=50, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
-    current_agent: Agent | None = Depends(get_current_agent_optional),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=False),
+    current_agent: Principal | None = Depends(get_current_principal_optional),
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
 ):
     """
     List comments for a claim, optionally filtered by evidence.
@@ -217,85 +236,102 @@ async def list_comments(
     """
     # Verify claim exists
     result = await db.execute(select(Claim).where(Claim.id == claim_id))
-    if not result.scalar_one_or_none():
+    claim = result.scalar_one_or_none()
+    if not claim:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Claim not found",
         )
 
-    # Get root-level comments (no parent)
-    query = (
-        select(Comment)
-        .options(
-            selectinload(Comment.author),
-            selectinload(Comment.replies).selectinload(Comment.author),
-            selectinload(Comment.replies).selectinload(Comment.replies).selectinload(Comment.author),
-            selectinload(Comment.replies).selectinload(Comment.replies).selectinload(Comment.replies).selectinload(Comment.author),
-        )
-        .where(
-            Comment.claim_id == claim_id,
-            Comment.parent_id.is_(None),
-        )
+    # The page's root comments (no parent), numbered in page order
+    page_roots = select(
+        Comment.path,
+        func.row_number().over(order_by=(Comment.created_at, Comment.id)).label("position"),
+    ).where(
+        Comment.claim_id == claim_id,
+        Comment.parent_id.is_(None),
     )
 
     if evidence_id:
-        query = query.where(Comment.evidence_id == evidence_id)
+        page_roots = page_roots.where(Comment.evidence_id == evidence_id)
     else:
         # Only get comments on the claim itself (not on evidence)
-        query = query.where(Comment.evidence_id.is_(None))
+        page_roots = page_roots.where(Comment.evidence_id.is_(None))
 
-    query = query.order_by(Comment.created_at.asc())
+    # Oldest threads first
+    page_roots = apply_keyset(
+        page_roots, Comment.created_at, Comment.id, limit, cursor, descending=False
+    ).cte("page_roots")
 
-    # Get total count
-    count_result = await db.execute(
-        select(Comment.id).where(
+    # Whole threads in one range scan per root: a root's descendants have
+    # paths starting with its path and "/", which sorts just before "0".
+    # The extra root fetched for the next cursor comes without its replies.
+    user_vote = CommentVote.direction if current_agent else null()
+    query = (
+        select(Comment, user_vote)
+        .join(
+            page_roots,
+            and_(
+                Comment.path >= page_roots.c.path,
+                Comment.path < page_roots.c.path + "0",
+            ),
+        )
+        .options(joinedload(Comment.author))
+        .where(
             Comment.claim_id == claim_id,
-            Comment.parent_id.is_(None),
-            Comment.evidence_id == evidence_id if evidence_id else Comment.evidence_id.is_(None),
+            or_(page_roots.c.position <= limit, Comment.parent_id.is_(None)),
         )
+        .order_by(Comment.path)
     )
-    total = len(count_result.all())
-
-    query = query.offset(offset).limit(limit)
+    if current_agent:
+        query = query.outerjoin(
+            CommentVote,
+            and_(
+                CommentVote.comment_id == Comment.id,
+                CommentVote.agent_id == current_agent.id,
+            ),
+        )
     result = await db.execute(query)
-    root_comments = list(result.scalars().unique().all())
-
-    # Get user votes for all comments
-    user_votes: dict[UUID, VoteDirection] = {}
-    if current_agent and root_comments:
-        # Collect all comment IDs including nested
-        def collect_ids(comments: list[Comment]) -> list[UUID]:
-            ids = []
-            for c in comments:
-                ids.append(c.id)
-                if c.replies:
-                    ids.extend(collect_ids(c.replies))
-            return ids
-
-        all_comment_ids = collect_ids(root_comments)
+    rows = [tuple(row) for row in result.all()]
 
-        vote_result = await db.execute(
-            select(CommentVote).where(
-                CommentVote.comment_id.in_(all_comment_ids),
-                CommentVote.agent_id == current_agent.id,
-            )
+    # The extra root has the greatest path, so it is the last row
+    _, next_cursor = split_page(
+        [comment for comment, _ in rows if comment.parent_id is None],
+        limit,
+        lambda c: (c.created_at, c.id),
+    )
+    if next_cursor:
+        rows = rows[:-1]
+
+    total = None
+    if include_total and not evidence_id:
+        total = CountResult(claim.root_comment_count)
+    elif include_total:
+        count_service = CountService(db, redis_client)
+        total = await count_service.cached_count(
+            "comments",
+            {"claim_id": claim_id, "evidence_id": evidence_id},
+            select(Comment.id).where(
+                Comment.claim_id == claim_id,
+                Comment.parent_id.is_(None),
+                Comment.evidence_id == evidence_id,
+            ),
         )
-        for vote in vote_result.scalars().all():
-            user_votes[vote.comment_id] = vote.direction
 
-    comments = [
-        _comment_to_response(c, user_votes.get(c.id), include_replies=True, user_votes=user_votes)
-        for c in root_comments
-        if not c.is_deleted or c.replies
-    ]
+    comments = _assemble_threads(rows)
 
-    return CommentListResponse(comments=comments, total=total)
+    return CommentListResponse(
+        comments=comments,
+        total=total.value if total else None,
+        total_estimated=total.estimated if total else False,
+        next_cursor=next_cursor,
+    )
 
 
 @router.get("/{comment_id}", response_model=CommentResponse)
 async def get_comment(
     comment_id: UUID,
-    current_agent: Agent | None = Depends(get_current_agent_optional),
+    current_agent: Principal | None = Depends(get_current_principal_optional),
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific comment."""
@@ -332,7 +368,7 @@ async def get_comment(
 async def update_comment(
     comment_id: UUID,
     comment_data: CommentUpdate,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """Update a comment. Only the author can update their own comment."""
@@ -370,7 +406,7 @@ async def update_comment(
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_comment(
     comment_id: UUID,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
 ):
     """Soft delete a comment. Only the author can delete their own comment."""
@@ -400,7 +436,7 @@ async def delete_comment(
 async def vote_on_comment(
     comment_id: UUID,
     vote_data: CommentVoteCreate,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
@@ -440,43 +476,8 @@ async def vote_on_comment(
             detail="Cannot vote on a deleted comment",
         )
 
-    # Check for existing vote
-    result = await db.execute(
-        select(CommentVote).where(
-            CommentVote.comment_id == comment_id,
-            CommentVote.agent_id == current_agent.id,
-        )
-    )
-    existing_vote = result.scalar_one_or_none()
-
-    if existing_vote:
-        if existing_vote.direction != vote_data.direction:
-            # Reverse previous vote
-            if existing_vote.direction == VoteDirection.UP:
-                comment.upvotes -= 1
-            else:
-                comment.downvotes -= 1
-
-            # Apply new vote
-            if vote_data.direction == VoteDirection.UP:
-                comment.upvotes += 1
-            else:
-                comment.downvotes += 1
-
-            existing_vote.direction = vote_data.direction
-    else:
-        # New vote
-        new_vote = CommentVote(
-            comment_id=comment_id,
-            agent_id=current_agent.id,
-            direction=vote_data.direction,
-        )
-        db.add(new_vote)
-
-        if vote_data.direction == VoteDirection.UP:
-            comment.upvotes += 1
-        else:
-            comment.downvotes += 1
+    vote_service = VoteService(db, redis_client)
+    await vote_service.cast_comment_vote(comment, current_agent.id, vote_data.direction)
 
     return _comment_to_response(comment, vote_data.direction)
 
@@ -484,8 +485,9 @@ async def vote_on_comment(
 @router.delete("/{comment_id}/vote", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_comment_vote(
     comment_id: UUID,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
 ):
     """Remove your vote from a comment."""
     result = await db.execute(select(Comment).where(Comment.id == comment_id))
@@ -497,24 +499,5 @@ async def remove_comment_vote(
             detail="Comment not found",
         )
 
-    result = await db.execute(
-        select(CommentVote).where(
-            CommentVote.comment_id == comment_id,
-            CommentVote.agent_id == current_agent.id,
-        )
-    )
-    existing_vote = result.scalar_one_or_none()
-
-    if existing_vote:
-        # Reverse the vote
-        if existing_vote.direction == VoteDirection.UP:
-            comment.upvotes -= 1
-        else:
-            comment.downvotes -= 1
-
-        await db.execute(
-            delete(CommentVote).where(
-                CommentVote.comment_id == comment_id,
-                CommentVote.agent_id == current_agent.id,
-            )
-        )
+    vote_service = VoteService(db, redis_client)
+    await vote_service.remove_comment_vote(comment, current_agent.id)
@@ -2,15 +2,21 @@ from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 import redis.asyncio as redis
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select, text
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_agent, get_current_agent_optional
+from app.core.auth import get_current_principal, get_read_db
+from app.core.config import settings
 from app.core.database import get_db
-from app.core.redis import get_redis
+from app.core.http_cache import CachePolicy, HTTPCache, bump_versions
+from app.core.loaders import Loaders, get_loaders, get_read_loaders
+from app.core.pagination import apply_keyset, split_page
+from app.core.principal import Principal
+from app.core.redis import get_redis, get_redis_bytes
+from app.core.response_cache import ResponseCache, hot_responses
 from app.models.agent import Agent
-from app.models.claim import Claim, ClaimVote
+from app.models.claim import Claim, ClaimVote, ComplexityTier
 from app.models.comment import Comment
 from app.models.evidence import Evidence
 from app.schemas.discover import (
@@ -26,17 +32,47 @@ from app.schemas.discover import (
     TrendingClaim,
     TrendingResponse,
 )
+from app.services.count_service import CountService
 from app.services.trending_service import TrendingService
 
 router = APIRouter()
 
+TRENDING_HTTP_CACHE = HTTPCache(
+    CachePolicy(max_age=30, s_maxage=60, stale_while_revalidate=300),
+    lambda request: [
+        TrendingService.trending_cache_key(
+            limit=int(request.query_params.get("limit", 10)),
+            offset=int(request.query_params.get("offset", 0)),
+        )
+    ],
+    stamp_missing=False,
+)
+
+TOPICS_HTTP_CACHE = HTTPCache(
+    CachePolicy(max_age=60, s_maxage=300, stale_while_revalidate=600),
+    lambda request: [f"topics:{int(request.query_params.get('limit', 50))}"],
+    stamp_missing=False,
+)
+
+TOPIC_SORT_COLUMNS = {
+    "recent": Claim.created_at,
+    "gradient": Claim.gradient,
+    "votes": Claim.vote_count,
+}
 
-@router.get("/trending", response_model=TrendingResponse)
+
+@router.get(
+    "/trending", response_model=TrendingResponse, dependencies=[Depends(TRENDING_HTTP_CACHE)]
+)
 async def get_trending_claims(
+    request: Request,
+    response: Response,
     limit: int = Query(default=10, ge=1, le=50),
     offset: int = Query(default=0, ge=0),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
+    redis_bytes: redis.Redis = Depends(get_redis_bytes),
+    loaders: Loaders = Depends(get_loaders),
 ):
     """
     Get trending claims based on recent activity.
@@ -44,18 +80,24 @@ async def get_trending_claims(
     Trending score considers votes, evidence, and comments in the last 24 hours,
     with time decay for older claims.
     """
-    trending_service = TrendingService(db, redis_client)
+    cache_key = TrendingService.trending_cache_key(limit, offset)
+    response_cache = ResponseCache(redis_bytes, local=hot_responses)
+    cached = await response_cache.get(cache_key, request, response)
+    if cached:
+        return cached
+
+    trending_service = TrendingService(db, redis_client, loaders)
     trending_data = await trending_service.get_trending_claims(limit=limit, offset=offset)
 
     claims = [
-        TrendingClaim(
+        TrendingClaim.model_construct(
             id=UUID(c["id"]),
             statement=c["statement"],
             gradient=c["gradient"],
             vote_count=c["vote_count"],
             evidence_count=c["evidence_count"],
             tags=c["tags"],
-            complexity_tier=c["complexity_tier"],
+            complexity_tier=ComplexityTier(c["complexity_tier"]),
             author_agent_id=UUID(c["author_agent_id"]),
             created_at=datetime.fromisoformat(c["created_at"]),
             trending_score=c["trending_score"],
@@ -66,9 +108,13 @@ async def get_trending_claims(
         for c in trending_data
     ]
 
-    return TrendingResponse(
-        claims=claims,
-        updated_at=datetime.now(UTC),
+    # Cache the response for as long as the trending scores it shows
+    return await response_cache.set(
+        cache_key,
+        TrendingResponse.model_construct(claims=claims, updated_at=datetime.now(UTC)),
+        await redis_client.ttl(cache_key),
+        request,
+        response,
     )
 
 
@@ -76,23 +122,23 @@ async def get_trending_claims(
 async def get_related_claims(
     claim_id: UUID,
     limit: int = Query(default=5, ge=1, le=20),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     redis_client: redis.Redis = Depends(get_redis),
+    loaders: Loaders = Depends(get_read_loaders),
 ):
     """
     Get claims related to a specific claim.
 
     Relatedness is based on shared tags and common voters.
     """
-    # Verify claim exists
-    result = await db.execute(select(Claim.id).where(Claim.id == claim_id))
-    if not result.scalar_one_or_none():
+    # Verify claim exists; the service reuses the loaded claim
+    if await loaders.claims.load(claim_id) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Claim not found",
         )
 
-    trending_service = TrendingService(db, redis_client)
+    trending_service = TrendingService(db, redis_client, loaders)
     related_data = await trending_service.get_related_claims(claim_id, limit=limit)
 
     related = [
@@ -117,7 +163,7 @@ async def get_related_claims(
 @router.get("/recommended", response_model=RecommendedResponse)
 async def get_recommended_claims(
     limit: int = Query(default=10, ge=1, le=50),
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
@@ -166,56 +212,55 @@ async def get_recommended_claims(
     )
 
 
-@router.get("/topics", response_model=TopicsResponse)
+@router.get("/topics", response_model=TopicsResponse, dependencies=[Depends(TOPICS_HTTP_CACHE)])
 async def get_topics(
+    request: Request,
+    response: Response,
     limit: int = Query(default=50, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+    redis_bytes: redis.Redis = Depends(get_redis_bytes),
 ):
     """
     Get all topics/tags with claim counts.
 
-    Returns topics sorted by total claim count.
+    Returns topics sorted by total claim count. Cached for 5 minutes.
     """
-    # Get all unique tags with counts
+    cache_key = f"topics:{limit}"
+    response_cache = ResponseCache(redis_bytes)
+    cached = await response_cache.get(cache_key, request, response)
+    if cached:
+        return cached
+
+    # Get all unique tags with counts and recent activity (claims in last 7 days)
     # Using unnest to expand the tags array and count
+    seven_days_ago = datetime.now(UTC) - timedelta(days=7)
     result = await db.execute(
         text("""
-            SELECT tag, COUNT(*) as claim_count
+            SELECT tag, COUNT(*) as claim_count,
+                   COUNT(*) FILTER (WHERE created_at >= :since) as recent_count
             FROM claims, unnest(tags) as tag
             GROUP BY tag
             ORDER BY claim_count DESC
             LIMIT :limit
         """),
-        {"limit": limit}
+        {"limit": limit, "since": seven_days_ago}
     )
-    tag_counts = result.all()
-
-    # Get recent activity for each tag (claims in last 7 days)
-    seven_days_ago = datetime.now(UTC) - timedelta(days=7)
-    topics = []
-
-    for tag, count in tag_counts:
-        result = await db.execute(
-            text("""
-                SELECT COUNT(*) FROM claims
-                WHERE :tag = ANY(tags) AND created_at >= :since
-            """),
-            {"tag": tag, "since": seven_days_ago}
-        )
-        recent_count = result.scalar() or 0
-
-        topics.append(
-            TopicInfo(
-                tag=tag,
-                claim_count=count,
-                recent_activity=recent_count,
-            )
-        )
+    topics = [
+        TopicInfo.model_construct(tag=tag, claim_count=count, recent_activity=recent_count)
+        for tag, count, recent_count in result.all()
+    ]
 
-    return TopicsResponse(
-        topics=topics,
-        total=len(topics),
+    fresh = await response_cache.set(
+        cache_key,
+        TopicsResponse.model_construct(topics=topics, total=len(topics)),
+        settings.topics_cache_ttl,
+        request,
+        response,
     )
+    await bump_versions(redis_client, cache_key, ttl=settings.topics_cache_ttl, purge=False)
+
+    return fresh
 
 
 @router.get("/topics/{tag}", response_model=TopicClaimsResponse)
@@ -223,8 +268,10 @@ async def get_topic_claims(
     tag: str,
     sort: str = Query(default="recent", pattern="^(recent|gradient|votes)$"),
     limit: int = Query(default=20, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=False),
+    db: AsyncSession = Depends(get_read_db),
+    redis_client: redis.Redis = Depends(get_redis),
 ):
     """
     Get claims for a specific topic/tag.
@@ -234,25 +281,21 @@ async def get_topic_claims(
     # Build query
     query = select(Claim).where(Claim.tags.contains([tag]))
 
-    # Apply sorting
-    if sort == "recent":
-        query = query.order_by(Claim.created_at.desc())
-    elif sort == "gradient":
-        query = query.order_by(Claim.gradient.desc())
-    elif sort == "votes":
-        query = query.order_by(Claim.vote_count.desc())
-
-    # Get total count
-    count_result = await db.execute(
-        select(func.count(Claim.id)).where(Claim.tags.contains([tag]))
-    )
-    total = count_result.scalar() or 0
-
-    # Apply pagination
-    query = query.offset(offset).limit(limit)
+    # Apply sorting and pagination
+    sort_column = TOPIC_SORT_COLUMNS[sort]
+    query = apply_keyset(query, sort_column, Claim.id, limit, cursor)
 
     result = await db.execute(query)
-    claims = list(result.scalars().all())
+    claims, next_cursor = split_page(
+        list(result.scalars().all()), limit, lambda c: (getattr(c, sort_column.key), c.id)
+    )
+
+    total = None
+    if include_total:
+        count_service = CountService(db, redis_client)
+        total = await count_service.estimated_count(
+            "claims:topic", {"tag": tag}, select(Claim.id).where(Claim.tags.contains([tag]))
+        )
 
     # Convert to response format
     claim_responses = [
@@ -277,7 +320,9 @@ async def get_topic_claims(
     return TopicClaimsResponse(
         tag=tag,
         claims=claim_responses,
-        total=total,
+        total=total.value if total else None,
+        total_estimated=total.estimated if total else False,
+        next_cursor=next_cursor,
     )
 
 
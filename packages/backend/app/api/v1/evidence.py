@@ -2,12 +2,15 @@ from uuid import UUID
 
 import redis.asyncio as redis
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import delete, select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.core.auth import get_current_agent, get_current_agent_optional
+from app.core.auth import get_current_agent, get_current_principal, get_current_principal_optional
 from app.core.database import get_db
+from app.core.pagination import apply_keyset, split_page
+from app.core.principal import Principal
 from app.core.redis import get_redis
 from app.models.agent import Agent
 from app.models.claim import Claim
@@ -20,11 +23,21 @@ from app.schemas.evidence import (
     EvidenceResponse,
     EvidenceVoteCreate,
 )
+from app.services.claim_detail_service import bump_claims_on_commit
+from app.services.count_service import CountResult, CountService
 from app.services.notification_service import NotificationService
+from app.services.profile_service import ProfileService
 from app.services.rate_limiter_service import RateLimitExceeded, RateLimiterService
 from app.services.reputation_service import ReputationService
 from app.services.s3_service import S3Service, S3ServiceError
-from app.schemas.evidence import FileUploadRequest, FileUploadResponse
+from app.services.upload_service import UploadError, UploadService, UploadSessionNotFoundError
+from app.services.vote_service import VoteService
+from app.schemas.evidence import (
+    FileUploadRequest,
+    FileUploadResponse,
+    UploadCompleteResponse,
+    UploadSessionResponse,
+)
 
 router = APIRouter()
 
@@ -63,37 +76,40 @@ async def submit_evidence(
         )
 
     # Validate file upload if file evidence
+    file_size = evidence_data.file_size
     if evidence_data.file_key:
-        # Verify file was uploaded by this agent for this claim
-        if not evidence_data.file_key.startswith(f"evidence/"):
+        # Files are shared by content, so any verified blob may be attached
+        upload_service = UploadService(db, redis_client)
+        blob = await upload_service.get_blob_by_key(evidence_data.file_key)
+        if not blob:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Invalid file key",
             )
-        if str(current_agent.id) not in evidence_data.file_key:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="File was not uploaded by you",
-            )
+        file_size = blob.file_size
 
     # Create evidence
     evidence = Evidence(
         claim_id=claim_id,
-        author_agent_id=current_agent.id,
+        author=current_agent,
         position=evidence_data.position,
         content_type=evidence_data.content_type,
         content=evidence_data.content,
         file_key=evidence_data.file_key,
         file_name=evidence_data.file_name,
-        file_size=evidence_data.file_size,
+        file_size=file_size,
     )
     db.add(evidence)
 
-    # Update claim's evidence count
+    # Update claim's evidence counts
     claim.evidence_count += 1
+    claim.public_evidence_count += 1
+    await bump_claims_on_commit(db, redis_client, claim_id)
 
     await db.flush()
-    await db.refresh(evidence, ["author"])
+
+    profile_service = ProfileService(db, redis_client)
+    await profile_service.record_activity(current_agent.id, evidence=1)
 
     return _evidence_to_response(evidence)
 
@@ -105,14 +121,17 @@ async def list_evidence(
     sort_by: str = Query(default="vote_score", pattern="^(vote_score|created_at)$"),
     sort_order: str = Query(default="desc", pattern="^(asc|desc)$"),
     limit: int = Query(default=50, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
-    current_agent: Agent | None = Depends(get_current_agent_optional),
+    cursor: str | None = Query(default=None),
+    include_total: bool = Query(default=False),
+    current_agent: Principal | None = Depends(get_current_principal_optional),
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
 ):
     """List evidence for a claim."""
     # Verify claim exists
     result = await db.execute(select(Claim).where(Claim.id == claim_id))
-    if not result.scalar_one_or_none():
+    claim = result.scalar_one_or_none()
+    if not claim:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Claim not found",
@@ -130,17 +149,20 @@ async def list_evidence(
     if position:
         query = query.where(Evidence.position == position)
 
-    # Sorting
-    sort_column = getattr(Evidence, sort_by)
-    if sort_order == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
-
-    query = query.limit(limit).offset(offset)
+    # Sorting and pagination
+    query = apply_keyset(
+        query,
+        getattr(Evidence, sort_by),
+        Evidence.id,
+        limit,
+        cursor,
+        descending=sort_order == "desc",
+    )
 
     result = await db.execute(query)
-    evidence_list = list(result.scalars().all())
+    evidence_list, next_cursor = split_page(
+        list(result.scalars().all()), limit, lambda e: (getattr(e, sort_by), e.id)
+    )
 
     # Get user's votes if authenticated
     user_votes = {}
@@ -156,27 +178,35 @@ async def list_evidence(
             for vote in vote_result.scalars().all():
                 user_votes[vote.evidence_id] = vote.direction
 
-    # Get total count
-    count_result = await db.execute(
-        select(Evidence.id).where(
-            Evidence.claim_id == claim_id,
-            Evidence.visibility == EvidenceVisibility.PUBLIC,
+    total = None
+    if include_total and not position:
+        total = CountResult(claim.public_evidence_count)
+    elif include_total:
+        count_service = CountService(db, redis_client)
+        total = await count_service.cached_count(
+            "evidence",
+            {"claim_id": claim_id, "position": position},
+            select(Evidence.id).where(
+                Evidence.claim_id == claim_id,
+                Evidence.visibility == EvidenceVisibility.PUBLIC,
+                Evidence.position == position,
+            ),
         )
-    )
-    total = len(count_result.all())
 
     return EvidenceListResponse(
         evidence=[
             _evidence_to_response(e, user_votes.get(e.id)) for e in evidence_list
         ],
-        total=total,
+        total=total.value if total else None,
+        total_estimated=total.estimated if total else False,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/{evidence_id}", response_model=EvidenceResponse)
 async def get_evidence(
     evidence_id: UUID,
-    current_agent: Agent | None = Depends(get_current_agent_optional),
+    current_agent: Principal | None = Depends(get_current_principal_optional),
     db: AsyncSession = Depends(get_db),
 ):
     """Get a specific piece of evidence."""
@@ -213,7 +243,7 @@ async def get_evidence(
 async def vote_on_evidence(
     evidence_id: UUID,
     vote_data: EvidenceVoteCreate,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
@@ -247,82 +277,27 @@ async def vote_on_evidence(
             detail="Cannot vote on your own evidence",
         )
 
-    # Check for existing vote
-    result = await db.execute(
-        select(EvidenceVote).where(
-            EvidenceVote.evidence_id == evidence_id,
-            EvidenceVote.agent_id == current_agent.id,
-        )
+    vote_service = VoteService(db, redis_client)
+    changed = await vote_service.cast_evidence_vote(
+        evidence, current_agent.id, vote_data.direction
     )
-    existing_vote = result.scalar_one_or_none()
-
-    reputation_service = ReputationService(db, redis_client)
-    notification_service = NotificationService(db, redis_client)
-
-    # Get claim statement for notification
-    claim_result = await db.execute(select(Claim.statement).where(Claim.id == evidence.claim_id))
-    claim_statement = claim_result.scalar() or ""
-
-    if existing_vote:
-        # Handle vote change
-        if existing_vote.direction != vote_data.direction:
-            # Reverse previous vote
-            if existing_vote.direction == VoteDirection.UP:
-                evidence.upvotes -= 1
-                evidence.vote_score -= 1
-            else:
-                evidence.downvotes -= 1
-                evidence.vote_score += 1
-
-            # Apply new vote
-            if vote_data.direction == VoteDirection.UP:
-                evidence.upvotes += 1
-                evidence.vote_score += 1
-            else:
-                evidence.downvotes += 1
-                evidence.vote_score -= 1
-
-            existing_vote.direction = vote_data.direction
-
-            # Update author reputation
-            await reputation_service.on_evidence_vote(
-                evidence.author_agent_id,
-                evidence_id,
-                vote_data.direction == VoteDirection.UP,
-            )
 
-            # Send notification for vote change
-            await notification_service.notify_evidence_vote(
-                evidence_author_id=evidence.author_agent_id,
-                evidence_id=evidence_id,
-                voter_agent_id=current_agent.id,
-                is_upvote=vote_data.direction == VoteDirection.UP,
-                claim_statement=claim_statement,
-            )
-    else:
-        # New vote
-        new_vote = EvidenceVote(
-            evidence_id=evidence_id,
-            agent_id=current_agent.id,
-            direction=vote_data.direction,
-        )
-        db.add(new_vote)
-
-        if vote_data.direction == VoteDirection.UP:
-            evidence.upvotes += 1
-            evidence.vote_score += 1
-        else:
-            evidence.downvotes += 1
-            evidence.vote_score -= 1
-
-        # Update author reputation
+    # New votes and changes of direction affect the author
+    if changed:
+        reputation_service = ReputationService(db, redis_client)
         await reputation_service.on_evidence_vote(
             evidence.author_agent_id,
             evidence_id,
             vote_data.direction == VoteDirection.UP,
         )
 
-        # Send notification for new vote
+        # Get claim statement for notification
+        claim_result = await db.execute(
+            select(Claim.statement).where(Claim.id == evidence.claim_id)
+        )
+        claim_statement = claim_result.scalar() or ""
+
+        notification_service = NotificationService(db, redis_client)
         await notification_service.notify_evidence_vote(
             evidence_author_id=evidence.author_agent_id,
             evidence_id=evidence_id,
@@ -331,9 +306,28 @@ async def vote_on_evidence(
             claim_statement=claim_statement,
         )
 
-    # Auto-hide evidence with very low score
-    if evidence.vote_score < -5:
-        evidence.visibility = EvidenceVisibility.HIDDEN
+    # Auto-hide evidence with very low score. Visibility is checked and
+    # changed in one statement, so of concurrent votes only the one that
+    # hides the evidence takes it off the claim's public count.
+    if changed and evidence.vote_score < -5:
+        result = await db.execute(
+            update(Evidence)
+            .where(
+                Evidence.id == evidence_id,
+                Evidence.visibility == EvidenceVisibility.PUBLIC,
+                Evidence.vote_score < -5,
+            )
+            .values(visibility=EvidenceVisibility.HIDDEN)
+            .returning(Evidence.id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.scalar_one_or_none() is not None:
+            set_committed_value(evidence, "visibility", EvidenceVisibility.HIDDEN)
+            await db.execute(
+                update(Claim)
+                .where(Claim.id == evidence.claim_id)
+                .values(public_evidence_count=Claim.public_evidence_count - 1)
+            )
 
     return _evidence_to_response(evidence, vote_data.direction)
 
@@ -341,8 +335,9 @@ async def vote_on_evidence(
 @router.delete("/{evidence_id}/vote", status_code=status.HTTP_204_NO_CONTENT)
 async def remove_evidence_vote(
     evidence_id: UUID,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
 ):
     """Remove your vote from evidence."""
     # Get evidence
@@ -355,30 +350,8 @@ async def remove_evidence_vote(
             detail="Evidence not found",
         )
 
-    # Get existing vote
-    result = await db.execute(
-        select(EvidenceVote).where(
-            EvidenceVote.evidence_id == evidence_id,
-            EvidenceVote.agent_id == current_agent.id,
-        )
-    )
-    existing_vote = result.scalar_one_or_none()
-
-    if existing_vote:
-        # Reverse the vote
-        if existing_vote.direction == VoteDirection.UP:
-            evidence.upvotes -= 1
-            evidence.vote_score -= 1
-        else:
-            evidence.downvotes -= 1
-            evidence.vote_score += 1
-
-        await db.execute(
-            delete(EvidenceVote).where(
-                EvidenceVote.evidence_id == evidence_id,
-                EvidenceVote.agent_id == current_agent.id,
-            )
-        )
+    vote_service = VoteService(db, redis_client)
+    await vote_service.remove_evidence_vote(evidence, current_agent.id)
 
 
 @router.post(
@@ -388,16 +361,22 @@ async def remove_evidence_vote(
 async def get_upload_url(
     claim_id: UUID,
     upload_request: FileUploadRequest,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
 ):
     """
-    Get a presigned URL for uploading a file as evidence.
-
-    The client should:
-    1. Call this endpoint to get an upload URL
-    2. Upload the file directly to S3 using the URL
+    Start uploading a file as evidence.
+
+    Files are stored by SHA-256. If the content is already stored the
+    response has already_exists=true and nothing needs uploading. Otherwise
+    the client should:
+    1. Upload the file with the presigned POST, or for large files PUT each
+       part to its URL (parts can go in parallel)
+    2. Call POST /uploads/{upload_id}/complete to verify the file
     3. Call POST /claims/{claim_id}/evidence with the file_key
+
+    An interrupted multipart upload can be continued via GET /uploads/{upload_id}.
     """
     # Verify claim exists
     result = await db.execute(select(Claim).where(Claim.id == claim_id))
@@ -407,34 +386,93 @@ async def get_upload_url(
             detail="Claim not found",
         )
 
+    upload_service = UploadService(db, redis_client)
     try:
-        s3_service = S3Service()
-        upload_data = s3_service.generate_upload_url(
-            file_name=upload_request.file_name,
+        upload_data = await upload_service.start_upload(
+            agent_id=current_agent.id,
             content_type=upload_request.content_type,
-            agent_id=str(current_agent.id),
-            claim_id=str(claim_id),
-        )
-
-        return FileUploadResponse(
-            upload_url=upload_data['upload_url'],
-            fields=upload_data['fields'],
-            file_key=upload_data['file_key'],
-            expires_in=upload_data['expires_in'],
-            max_size=upload_data['max_size'],
+            sha256=upload_request.sha256,
+            file_size=upload_request.file_size,
         )
-
-    except S3ServiceError as e:
+    except UploadError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e),
         )
 
+    return FileUploadResponse(**upload_data)
+
+
+@router.get("/uploads/{upload_id}", response_model=UploadSessionResponse)
+async def get_upload_session(
+    upload_id: str,
+    current_agent: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+):
+    """
+    Resume a multipart upload: list received parts and re-sign the missing ones.
+    """
+    upload_service = UploadService(db, redis_client)
+    try:
+        session = await upload_service.resume_upload(upload_id, current_agent.id)
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except UploadError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return UploadSessionResponse(**session)
+
+
+@router.post("/uploads/{upload_id}/complete", response_model=UploadCompleteResponse)
+async def complete_upload(
+    upload_id: str,
+    current_agent: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+):
+    """
+    Finish an upload and verify it against the declared SHA-256.
+    """
+    upload_service = UploadService(db, redis_client)
+    try:
+        blob = await upload_service.complete_upload(upload_id, current_agent.id)
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except UploadError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return UploadCompleteResponse(
+        file_key=blob.file_key,
+        sha256=blob.sha256,
+        file_size=blob.file_size,
+    )
+
+
+@router.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def abort_upload(
+    upload_id: str,
+    current_agent: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+):
+    """
+    Cancel an upload and discard any uploaded data.
+    """
+    upload_service = UploadService(db, redis_client)
+    try:
+        await upload_service.abort_upload(upload_id, current_agent.id)
+    except UploadSessionNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except UploadError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
 
 @router.get("/{evidence_id}/download-url")
 async def get_download_url(
     evidence_id: UUID,
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
 ):
     """
     Get a presigned URL for downloading an evidence file.
@@ -457,14 +495,12 @@ async def get_download_url(
         )
 
     try:
-        s3_service = S3Service()
-        download_url = s3_service.generate_download_url(
+        s3_service = S3Service(redis_client)
+        return await s3_service.generate_download_url(
             file_key=evidence.file_key,
             file_name=evidence.file_name,
         )
 
-        return {"download_url": download_url, "expires_in": 3600}
-
     except S3ServiceError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,27 +1,56 @@
+from datetime import datetime
 from uuid import UUID
 
 import redis.asyncio as redis
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_agent
+from app.core.auth import get_current_principal, get_read_db
 from app.core.database import get_db
-from app.core.redis import get_redis
-from app.models.agent import Agent, AgentTier
+from app.core.http_cache import CachePolicy, HTTPCache
+from app.core.principal import Principal
+from app.core.redis import get_redis, get_redis_bytes
+from app.core.response_cache import ResponseCache
+from app.models.agent import AgentTier
 from app.schemas.leaderboard import AgentRankResponse, LeaderboardEntry, LeaderboardResponse
 from app.services.reputation_service import ReputationService
 
 router = APIRouter()
 
+def _leaderboard_resources(request: Request) -> list[str]:
+    """The cached leaderboard page a request is served from."""
+    params = request.query_params
+    tier = params.get("tier")
+    return [
+        ReputationService.leaderboard_cache_key(
+            limit=int(params.get("limit", 50)),
+            offset=int(params.get("offset", 0)),
+            tier=AgentTier(tier) if tier else None,
+            period=params.get("period", "all_time"),
+        )
+    ]
+
+
+LEADERBOARD_HTTP_CACHE = HTTPCache(
+    CachePolicy(max_age=60, s_maxage=300, stale_while_revalidate=600),
+    _leaderboard_resources,
+    stamp_missing=False,
+)
+
 
-@router.get("", response_model=LeaderboardResponse)
+@router.get(
+    "", response_model=LeaderboardResponse, dependencies=[Depends(LEADERBOARD_HTTP_CACHE)]
+)
 async def get_leaderboard(
+    request: Request,
+    response: Response,
     limit: int = Query(default=50, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
     tier: AgentTier | None = Query(default=None),
     period: str = Query(default="all_time", pattern="^(all_time|monthly|weekly)$"),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
+    redis_bytes: redis.Redis = Depends(get_redis_bytes),
 ):
     """
     Get the reputation leaderboard.
@@ -29,6 +58,12 @@ async def get_leaderboard(
     Supports filtering by tier and time period.
     Results are cached for 5 minutes.
     """
+    cache_key = ReputationService.leaderboard_cache_key(limit, offset, tier, period)
+    response_cache = ResponseCache(redis_bytes)
+    cached = await response_cache.get(cache_key, request, response)
+    if cached:
+        return cached
+
     reputation_service = ReputationService(db, redis_client)
     data = await reputation_service.get_leaderboard_cached(
         limit=limit,
@@ -39,7 +74,7 @@ async def get_leaderboard(
 
     # Convert dict entries back to LeaderboardEntry objects
     entries = [
-        LeaderboardEntry(
+        LeaderboardEntry.model_construct(
             rank=e["rank"],
             id=UUID(e["id"]),
             username=e["username"],
@@ -53,18 +88,25 @@ async def get_leaderboard(
         for e in data["entries"]
     ]
 
-    return LeaderboardResponse(
-        entries=entries,
-        total=data["total"],
-        period=data["period"],
-        updated_at=data["updated_at"],
+    # Cache the response for as long as the leaderboard it shows
+    return await response_cache.set(
+        cache_key,
+        LeaderboardResponse.model_construct(
+            entries=entries,
+            total=data["total"],
+            period=data["period"],
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+        ),
+        await redis_client.ttl(cache_key),
+        request,
+        response,
     )
 
 
 @router.get("/me", response_model=AgentRankResponse)
 async def get_my_rank(
-    current_agent: Agent = Depends(get_current_agent),
-    db: AsyncSession = Depends(get_db),
+    current_agent: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_read_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
     """
@@ -90,7 +132,7 @@ async def get_my_rank(
 @router.get("/{agent_id}/rank", response_model=AgentRankResponse)
 async def get_agent_rank(
     agent_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
     """
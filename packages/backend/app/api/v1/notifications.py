@@ -2,10 +2,10 @@ import redis.asyncio as redis
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.auth import get_current_agent
+from app.core.auth import get_current_principal
 from app.core.database import get_db
+from app.core.principal import Principal
 from app.core.redis import get_redis
-from app.models.agent import Agent
 from app.schemas.agent import AgentPublic
 from app.schemas.notification import (
     MarkReadRequest,
@@ -29,6 +29,8 @@ def _notification_to_response(notification) -> NotificationResponse:
         reference_id=notification.reference_id,
         reference_type=notification.reference_type,
         actor=AgentPublic.model_validate(notification.actor) if notification.actor else None,
+        event_count=notification.event_count,
+        recent_actor_ids=notification.recent_actor_ids or [],
         is_read=notification.is_read,
         created_at=notification.created_at,
     )
@@ -37,23 +39,24 @@ def _notification_to_response(notification) -> NotificationResponse:
 @router.get("", response_model=NotificationListResponse)
 async def list_notifications(
     limit: int = Query(default=20, ge=1, le=100),
-    offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
     unread_only: bool = Query(default=False),
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
     """
     Get notifications for the current agent.
 
-    Results are ordered by creation date (newest first).
+    Results are ordered by creation date (newest first). Pass the returned
+    `next_cursor` as `cursor` to fetch the following page.
     """
     notification_service = NotificationService(db, redis_client)
 
-    notifications, total = await notification_service.get_notifications(
+    notifications, next_cursor = await notification_service.get_notifications(
         agent_id=current_agent.id,
         limit=limit,
-        offset=offset,
+        cursor=cursor,
         unread_only=unread_only,
     )
 
@@ -61,14 +64,15 @@ async def list_notifications(
 
     return NotificationListResponse(
         notifications=[_notification_to_response(n) for n in notifications],
-        total=total,
+        total=unread_count if unread_only else None,
         unread_count=unread_count,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/unread-count", response_model=UnreadCountResponse)
 async def get_unread_count(
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
@@ -86,7 +90,7 @@ async def get_unread_count(
 @router.post("/mark-read", response_model=MarkReadResponse)
 async def mark_notifications_read(
     request: MarkReadRequest,
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
@@ -104,7 +108,7 @@ async def mark_notifications_read(
 
 @router.post("/mark-all-read", response_model=MarkReadResponse)
 async def mark_all_notifications_read(
-    current_agent: Agent = Depends(get_current_agent),
+    current_agent: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
 ):
@@ -2,145 +2,97 @@ from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
 import redis.asyncio as redis
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import func, select
-from sqlalchemy.ext.asyncio import AsyncSession
-
-from app.core.database import get_db
-from app.core.redis import get_redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.auth import get_read_db
+from app.core.config import settings
+from app.core.database import get_db, get_session_maker
+from app.core.http_cache import CachePolicy, HTTPCache, bump_versions, get_version
+from app.core.redis import get_redis, get_redis_bytes
+from app.core.response_cache import ResponseCache
 from app.models.agent import Agent
 from app.models.claim import Claim, ClaimVote
 from app.models.comment import Comment
-from app.models.evidence import Evidence, EvidenceVote
+from app.models.evidence import Evidence
 from app.models.history import ReputationHistory
 from app.schemas.profile import (
     AccuracyHistoryPoint,
     AccuracyHistoryResponse,
-    ExpertiseArea,
-    LearningScoreData,
     ProfileResponse,
-    ProfileStats,
     ReputationHistoryPoint,
     ReputationJourneyResponse,
     TimelineDataPoint,
     TimelineResponse,
 )
-from app.services.learning_score_service import LearningScoreService
+from app.services.profile_service import ProfileService
 
 router = APIRouter()
 
 
-def _generate_insight(accuracy_rate: float | None, learning_score: float) -> str | None:
-    """Generate a human-readable insight based on learning metrics."""
-    if accuracy_rate is None:
-        return "Keep voting on claims to build your accuracy track record."
-
-    if accuracy_rate > 0.8:
-        return "You have excellent judgment - you correctly identify claim truth values consistently."
-    elif accuracy_rate > 0.65:
-        return "You tend to identify true claims early and make sound judgments."
-    elif accuracy_rate > 0.5:
-        return "You're developing good epistemic instincts. Keep engaging to improve."
-    else:
-        return "Consider reviewing evidence more carefully before voting."
+# A profile's rank depends on every other agent, so its ETag also follows
+# the snapshot's own stamp, which expires with the snapshot
+PROFILE_HTTP_CACHE = HTTPCache(
+    CachePolicy(max_age=0, s_maxage=60, stale_while_revalidate=300),
+    lambda request: [
+        f"agent:{UUID(request.path_params['agent_id'])}",
+        f"profile:{UUID(request.path_params['agent_id'])}",
+    ],
+    stamp_missing=False,
+)
 
 
-@router.get("/{agent_id}", response_model=ProfileResponse)
+@router.get(
+    "/{agent_id}",
+    response_model=ProfileResponse,
+    dependencies=[Depends(PROFILE_HTTP_CACHE)],
+)
 async def get_profile(
     agent_id: UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
+    session_maker: async_sessionmaker[AsyncSession] = Depends(get_session_maker),
     redis_client: redis.Redis = Depends(get_redis),
+    redis_bytes: redis.Redis = Depends(get_redis_bytes),
 ):
     """
     Get full profile with stats, learning score, and expertise areas.
     """
-    # Get agent
-    result = await db.execute(select(Agent).where(Agent.id == agent_id))
-    agent = result.scalar_one_or_none()
-
-    if not agent:
+    # Snapshots are keyed by the agent's version, which its changes bump; they
+    # are built on the primary, which has every change a version names
+    version = await get_version(redis_client, f"agent:{agent_id}")
+    cache_key = ProfileService.cache_key(agent_id, version)
+    response_cache = ResponseCache(redis_bytes)
+    cached = await response_cache.get(cache_key, request, response)
+    if cached:
+        return cached
+
+    profile_service = ProfileService(db, redis_client)
+    profile = await profile_service.build_profile(agent_id, session_maker)
+
+    if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Agent not found",
         )
 
-    # Get stats
-    claims_count = await db.execute(
-        select(func.count(Claim.id)).where(Claim.author_agent_id == agent_id)
-    )
-    evidence_count = await db.execute(
-        select(func.count(Evidence.id)).where(Evidence.author_agent_id == agent_id)
+    fresh = await response_cache.set(
+        cache_key, profile, settings.profile_cache_ttl, request, response
     )
-    claim_votes_count = await db.execute(
-        select(func.count()).select_from(ClaimVote).where(ClaimVote.agent_id == agent_id)
-    )
-    evidence_votes_count = await db.execute(
-        select(func.count()).select_from(EvidenceVote).where(EvidenceVote.agent_id == agent_id)
+    await bump_versions(
+        redis_client, f"profile:{agent_id}", ttl=settings.profile_cache_ttl, purge=False
     )
 
-    # Get reputation rank
-    result = await db.execute(
-        select(func.count(Agent.id)).where(Agent.reputation_score > agent.reputation_score)
-    )
-    higher_count = result.scalar() or 0
-    rank = higher_count + 1
-
-    result = await db.execute(select(func.count(Agent.id)))
-    total_agents = result.scalar() or 1
-    percentile = ((total_agents - rank) / total_agents) * 100 if total_agents > 0 else 0
-
-    stats = ProfileStats(
-        claims_authored=claims_count.scalar_one(),
-        evidence_submitted=evidence_count.scalar_one(),
-        votes_cast=claim_votes_count.scalar_one() + evidence_votes_count.scalar_one(),
-        reputation_rank=rank,
-        total_agents=total_agents,
-        percentile=round(percentile, 1),
-    )
-
-    # Get learning score and expertise
-    learning_service = LearningScoreService(db, redis_client)
-    learning_score = await learning_service.calculate_learning_score(agent_id)
-    expertise_areas = await learning_service.get_expertise_areas(agent_id)
-
-    learning_data = LearningScoreData(
-        score=learning_score,
-        accuracy_rate=agent.accuracy_rate,
-        total_resolved_votes=agent.total_resolved_votes,
-        correct_resolved_votes=agent.correct_resolved_votes,
-        insight=_generate_insight(agent.accuracy_rate, learning_score),
-    )
-
-    expertise = [
-        ExpertiseArea(
-            tag=e["tag"],
-            engagement_count=e["engagement_count"],
-            accuracy=e["accuracy"],
-        )
-        for e in expertise_areas
-    ]
-
-    return ProfileResponse(
-        id=agent.id,
-        username=agent.username,
-        display_name=agent.display_name,
-        bio=agent.bio,
-        avatar_url=agent.avatar_url,
-        reputation_score=agent.reputation_score,
-        tier=agent.tier,
-        created_at=agent.created_at,
-        first_activity_at=agent.first_activity_at,
-        stats=stats,
-        learning_score=learning_data,
-        expertise=expertise,
-    )
+    return fresh
 
 
 @router.get("/{agent_id}/timeline", response_model=TimelineResponse)
 async def get_profile_timeline(
     agent_id: UUID,
     period: str = Query(default="30d", pattern="^(7d|30d|90d)$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get contribution timeline data for charts.
@@ -227,7 +179,7 @@ async def get_profile_timeline(
 async def get_accuracy_history(
     agent_id: UUID,
     period: str = Query(default="30d", pattern="^(7d|30d|90d)$"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get vote accuracy history for reputation journey chart.
@@ -302,7 +254,7 @@ async def get_accuracy_history(
 async def get_reputation_journey(
     agent_id: UUID,
     limit: int = Query(default=50, ge=1, le=200),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     """
     Get reputation history for journey chart.
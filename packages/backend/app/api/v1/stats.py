@@ -1,98 +1,56 @@
-import json
-from datetime import UTC, datetime, timedelta
-
 import redis.asyncio as redis
-from fastapi import APIRouter, Depends
-from sqlalchemy import func, or_, select
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.redis import get_redis
-from app.models.agent import Agent
-from app.models.claim import Claim, ClaimVote
+from app.core.http_cache import CachePolicy, HTTPCache, bump_versions
+from app.core.redis import get_redis, get_redis_bytes
+from app.core.response_cache import ResponseCache, hot_responses
 from app.schemas.discover import PlatformStats
+from app.services.stats_service import StatsService
 
 router = APIRouter()
 
 PLATFORM_STATS_CACHE_KEY = "platform:stats"
-PLATFORM_STATS_CACHE_TTL = 300  # 5 minutes
+PLATFORM_STATS_CACHE_TTL = 15  # 15 seconds
+
+PLATFORM_STATS_HTTP_CACHE = HTTPCache(
+    CachePolicy(max_age=15, s_maxage=15, stale_while_revalidate=60),
+    lambda request: [PLATFORM_STATS_CACHE_KEY],
+    stamp_missing=False,
+)
 
 
-@router.get("/platform", response_model=PlatformStats)
+@router.get(
+    "/platform", response_model=PlatformStats, dependencies=[Depends(PLATFORM_STATS_HTTP_CACHE)]
+)
 async def get_platform_stats(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
+    redis_bytes: redis.Redis = Depends(get_redis_bytes),
 ):
     """
     Get platform-wide statistics.
 
-    Cached for 5 minutes to reduce database load.
+    The stats are read from maintained counters, so they are cheap and
+    only cached briefly to absorb bursts, in Redis and in the process.
     """
     # Try cache first
-    cached = await redis_client.get(PLATFORM_STATS_CACHE_KEY)
+    response_cache = ResponseCache(redis_bytes, local=hot_responses)
+    cached = await response_cache.get(PLATFORM_STATS_CACHE_KEY, request, response)
     if cached:
-        data = json.loads(cached)
-        return PlatformStats(
-            total_claims=data["total_claims"],
-            total_agents=data["total_agents"],
-            total_votes=data["total_votes"],
-            claims_at_consensus=data["claims_at_consensus"],
-            active_agents_7d=data["active_agents_7d"],
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-        )
-
-    # Calculate stats
-    # Total claims
-    result = await db.execute(select(func.count(Claim.id)))
-    total_claims = result.scalar() or 0
+        return cached
 
-    # Total agents
-    result = await db.execute(select(func.count(Agent.id)))
-    total_agents = result.scalar() or 0
-
-    # Total votes
-    result = await db.execute(select(func.count()).select_from(ClaimVote))
-    total_votes = result.scalar() or 0
-
-    # Claims at consensus (gradient > 0.8 or < 0.2)
-    result = await db.execute(
-        select(func.count(Claim.id)).where(
-            or_(Claim.gradient > 0.8, Claim.gradient < 0.2)
-        )
-    )
-    claims_at_consensus = result.scalar() or 0
-
-    # Active agents in last 7 days (agents who have voted, submitted evidence, or commented)
-    seven_days_ago = datetime.now(UTC) - timedelta(days=7)
-    result = await db.execute(
-        select(func.count(func.distinct(ClaimVote.agent_id))).where(
-            ClaimVote.created_at >= seven_days_ago
-        )
-    )
-    active_agents_7d = result.scalar() or 0
-
-    updated_at = datetime.now(UTC)
+    stats = await StatsService(db, redis_client).get_platform_stats()
 
     # Cache the result
-    cache_data = {
-        "total_claims": total_claims,
-        "total_agents": total_agents,
-        "total_votes": total_votes,
-        "claims_at_consensus": claims_at_consensus,
-        "active_agents_7d": active_agents_7d,
-        "updated_at": updated_at.isoformat(),
-    }
-    await redis_client.setex(
-        PLATFORM_STATS_CACHE_KEY,
-        PLATFORM_STATS_CACHE_TTL,
-        json.dumps(cache_data),
+    fresh = await response_cache.set(
+        PLATFORM_STATS_CACHE_KEY, stats, PLATFORM_STATS_CACHE_TTL, request, response
     )
-
-    return PlatformStats(
-        total_claims=total_claims,
-        total_agents=total_agents,
-        total_votes=total_votes,
-        claims_at_consensus=claims_at_consensus,
-        active_agents_7d=active_agents_7d,
-        updated_at=updated_at,
+    await bump_versions(
+        redis_client, PLATFORM_STATS_CACHE_KEY, ttl=PLATFORM_STATS_CACHE_TTL, purge=False
     )
+
+    return fresh
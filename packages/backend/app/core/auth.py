@@ -1,14 +1,20 @@
+from collections.abc import AsyncGenerator
 from datetime import UTC, datetime, timedelta
 from typing import Any
+from uuid import UUID
 
+import redis.asyncio as redis
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import JWTError, jwt
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import settings
-from app.core.database import get_db
+from app.core.database import async_session_maker, get_db
+from app.core.principal import Principal, PrincipalCache
+from app.core.redis import get_redis
+from app.core.replica import replicas
 from app.models.agent import Agent
 
 security = HTTPBearer()
@@ -40,11 +46,9 @@ def decode_token(token: str) -> dict[str, Any]:
         ) from e
 
 
-async def get_current_agent(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> Agent:
-    payload = decode_token(credentials.credentials)
+def _agent_id_from_token(token: str) -> UUID:
+    """Validate an access token and return the agent it was issued to."""
+    payload = decode_token(token)
 
     if payload.get("type") != "access":
         raise HTTPException(
@@ -52,12 +56,27 @@ async def get_current_agent(
             detail="Invalid token type",
         )
 
-    agent_id = payload.get("sub")
-    if not agent_id:
+    try:
+        return UUID(payload["sub"])
+    except (KeyError, TypeError, ValueError) as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload",
-        )
+        ) from e
+
+
+async def get_current_agent(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> Agent:
+    """
+    Load the authenticated agent in full.
+
+    For endpoints that change the agent or need more than its snapshot;
+    everything else should use get_current_principal.
+    """
+    agent_id = _agent_id_from_token(credentials.credentials)
+    db.info["agent_id"] = agent_id
 
     result = await db.execute(select(Agent).where(Agent.id == agent_id))
     agent = result.scalar_one_or_none()
@@ -71,25 +90,67 @@ async def get_current_agent(
     return agent
 
 
-async def get_current_agent_optional(
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
+) -> Principal:
+    """Get a cached snapshot of the authenticated agent."""
+    agent_id = _agent_id_from_token(credentials.credentials)
+    db.info["agent_id"] = agent_id
+
+    principal = await PrincipalCache(db, redis_client).get(agent_id)
+    if not principal:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Agent not found",
+        )
+
+    return principal
+
+
+async def get_current_principal_optional(
     credentials: HTTPAuthorizationCredentials | None = Depends(security_optional),
     db: AsyncSession = Depends(get_db),
-) -> Agent | None:
-    """Get the current agent if authenticated, otherwise return None."""
+    redis_client: redis.Redis = Depends(get_redis),
+) -> Principal | None:
+    """Get a snapshot of the current agent if authenticated, otherwise return None."""
     if not credentials:
         return None
 
     try:
-        payload = decode_token(credentials.credentials)
+        agent_id = _agent_id_from_token(credentials.credentials)
     except HTTPException:
         return None
+    db.info["agent_id"] = agent_id
 
-    if payload.get("type") != "access":
-        return None
+    return await PrincipalCache(db, redis_client).get(agent_id)
 
-    agent_id = payload.get("sub")
-    if not agent_id:
-        return None
 
-    result = await db.execute(select(Agent).where(Agent.id == agent_id))
-    return result.scalar_one_or_none()
+async def get_read_session_maker(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security_optional),
+    redis_client: redis.Redis = Depends(get_redis),
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Session factory for read-only work: a replica that has the caller's
+    recent writes, or the primary.
+
+    Resolved once per request, so every read session of a request sees
+    the same server.
+    """
+    agent_id = None
+    if credentials and replicas.enabled:
+        try:
+            agent_id = _agent_id_from_token(credentials.credentials)
+        except HTTPException:
+            pass
+
+    return await replicas.choose_for(redis_client, agent_id) or async_session_maker
+
+
+async def get_read_db(
+    session_maker: async_sessionmaker[AsyncSession] = Depends(get_read_session_maker),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Read-only session, possibly on a replica. Nothing is committed."""
+    async with session_maker() as session:
+        yield session
@@ -0,0 +1,41 @@
+"""
+Cache key helpers.
+
+Requests that differ only in parameter order, whitespace or list order ask
+for the same data, so they should share one cache entry.
+"""
+
+import enum
+import hashlib
+import json
+from typing import Any
+from uuid import UUID
+
+
+def normalize_filter(value: Any) -> Any:
+    """Reduce a filter value to a canonical, JSON-serializable form."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (list, tuple, set)):
+        return sorted({normalize_filter(v) for v in value})
+    return value
+
+
+def filters_digest(filters: dict[str, Any]) -> str:
+    """
+    Digest a set of filters so equivalent filters produce the same key.
+
+    Unset filters (None or an empty list) are dropped.
+    """
+    normalized = {
+        name: normalize_filter(value)
+        for name, value in filters.items()
+        if value is not None and value != []
+    }
+    return hashlib.sha256(
+        json.dumps(normalized, sort_keys=True).encode()
+    ).hexdigest()[:32]
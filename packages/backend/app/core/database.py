@@ -1,9 +1,16 @@
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any
 
+import redis.asyncio as redis
+from fastapi import Depends
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, ORMExecuteState, Session
 
 from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.replica import replicas
 
 engine = create_async_engine(
     settings.database_url,
@@ -23,7 +30,22 @@ class Base(DeclarativeBase):
     pass
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+# Note sessions that wrote, so their agent's reads can be kept off stale replicas
+@event.listens_for(Session, "after_flush")
+def _flushed(session: Session, flush_context) -> None:
+    session.info["wrote"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _executed(state: ORMExecuteState) -> None:
+    if not state.is_select:
+        state.session.info["wrote"] = True
+
+
+async def get_db(
+    redis_client: redis.Redis = Depends(get_redis),
+) -> AsyncGenerator[AsyncSession, None]:
+    """Read-write session on the primary, committed after the request."""
     async with async_session_maker() as session:
         try:
             yield session
@@ -31,3 +53,33 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+        await replicas.record_write(session, redis_client)
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Session factory for work that runs alongside the request's session."""
+    return async_session_maker
+
+
+async def run_concurrently(
+    session_maker: async_sessionmaker[AsyncSession],
+    *work: Callable[[AsyncSession], Awaitable[Any]],
+) -> list[Any]:
+    """
+    Run independent units of database work concurrently.
+
+    A session can only run one statement at a time, so each unit gets its
+    own session, and pooled connection, and is committed like a request.
+    Units only see committed data, not the request session's changes.
+
+    Returns:
+        The units' results, in order
+    """
+
+    async def run(unit: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        async with session_maker() as session:
+            result = await unit(session)
+            await session.commit()
+            return result
+
+    return await asyncio.gather(*(run(unit) for unit in work))
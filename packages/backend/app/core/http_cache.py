@@ -0,0 +1,290 @@
+"""
+HTTP caching for public reads.
+
+Each cacheable resource has a version stamp in Redis. Write paths bump the
+stamps of the resources they change once their transaction commits, so a
+new stamp is never paired with old data; cached aggregates stamp
+themselves each time they are recomputed, with the stamp expiring
+alongside the cached value. A route's ETag is derived from the stamps of the resources it
+serves, so a conditional GET can be answered with 304 Not Modified from
+Redis alone, before the endpoint opens a database session.
+
+Responses that embed other resources (a claim's author, ...) can list
+them with record_embedded(); their stamps then go into the ETag as well.
+
+Only anonymous requests are shared: authenticated responses carry
+per-agent data (the caller's vote, ...) and are marked private.
+
+Bumped stamps are also queued as surrogate keys, which the worker turns
+into CDN invalidations (see CdnPurgeService).
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import redis.asyncio as redis
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+VERSION_PREFIX = "version:"
+# Surrogate keys of resources changed since the last CDN purge
+CDN_PURGE_QUEUE = "cdn:purge"
+# Session.info key of the bumps waiting for the transaction to commit
+PENDING_BUMPS = "pending_version_bumps"
+EMBEDDED_PREFIX = "embedded:"
+# Embedded resource lists are recorded again when they expire
+EMBEDDED_TTL = 86400  # 1 day
+
+# Bumps run as tasks after commit; keep references until they finish
+_bump_tasks: set[asyncio.Task] = set()
+
+
+def new_stamp() -> str:
+    """A version stamp that never repeats, even if a stamp is evicted and recreated."""
+    return format(time.time_ns(), "x")
+
+
+async def bump_versions(
+    redis_client: redis.Redis,
+    *resources: str,
+    ttl: int | None = None,
+    purge: bool = True,
+) -> None:
+    """
+    Give resources a new version stamp, changing the ETags of routes that serve them.
+
+    Args:
+        redis_client: Redis client
+        resources: Resource names, e.g. "claim:<id>"
+        ttl: Expire the stamps after this many seconds (for cached aggregates
+            whose stamp must not outlive the cached value)
+        purge: Queue the resources for CDN invalidation, if a CDN is configured
+    """
+    if not resources:
+        return
+
+    stamp = new_stamp()
+    pipe = redis_client.pipeline(transaction=False)
+    for resource in resources:
+        pipe.set(f"{VERSION_PREFIX}{resource}", stamp, ex=ttl)
+    if purge and settings.cloudfront_distribution_id:
+        pipe.sadd(CDN_PURGE_QUEUE, *resources)
+    await pipe.execute()
+
+
+async def get_version(redis_client: redis.Redis, resource: str) -> str:
+    """A resource's current version stamp, stamping it if it has none."""
+    key = f"{VERSION_PREFIX}{resource}"
+    stamp = await redis_client.get(key)
+    if stamp is None:
+        await redis_client.set(key, new_stamp(), nx=True)
+        # Another request may have stamped it first
+        stamp = await redis_client.get(key)
+    return stamp
+
+
+async def record_embedded(
+    redis_client: redis.Redis, resource: str, embedded: list[str]
+) -> bool:
+    """
+    Record the other resources a resource's responses embed, for routes
+    whose HTTPCache looks them up. The list must not change over the
+    resource's lifetime (e.g. its author); it is only recorded if missing.
+
+    Returns:
+        Whether the list was missing, and so just recorded
+    """
+    key = f"{EMBEDDED_PREFIX}{resource}"
+    return bool(await redis_client.set(key, " ".join(embedded), ex=EMBEDDED_TTL, nx=True))
+
+
+def bump_versions_on_commit(
+    session: AsyncSession, redis_client: redis.Redis, *resources: str
+) -> None:
+    """
+    Bump resources' version stamps once the session's transaction commits.
+
+    Nothing is bumped if the transaction rolls back.
+    """
+    pending = session.info.setdefault(PENDING_BUMPS, {})
+    pending.setdefault(redis_client, set()).update(resources)
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_versions(session: Session) -> None:
+    pending = session.info.pop(PENDING_BUMPS, None)
+    if not pending:
+        return
+    loop = asyncio.get_running_loop()
+    for redis_client, resources in pending.items():
+        task = loop.create_task(bump_versions(redis_client, *sorted(resources)))
+        _bump_tasks.add(task)
+        task.add_done_callback(_bump_done)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_versions(session: Session) -> None:
+    session.info.pop(PENDING_BUMPS, None)
+
+
+def _bump_done(task: asyncio.Task) -> None:
+    _bump_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Failed to bump version stamps: {task.exception()}")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Cache-Control policy for a route's anonymous responses."""
+
+    max_age: int = 0  # Browsers
+    s_maxage: int = 0  # Shared caches (CDN)
+    stale_while_revalidate: int = 0
+
+    @property
+    def cache_control(self) -> str:
+        directives = ["public", f"max-age={self.max_age}", f"s-maxage={self.s_maxage}"]
+        if self.stale_while_revalidate:
+            directives.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(directives)
+
+
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    The ETag of a body in a content-coding. Strong validators must differ
+    between the codings of a body (RFC 9110), so the coding is appended.
+    """
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _matching_etag(if_none_match: str, etag: str) -> str | None:
+    """
+    The tag in an If-None-Match header matching an ETag by weak comparison
+    (RFC 9110), or None. The ETags of its content-coded bodies match too.
+    """
+    if if_none_match.strip() == "*":
+        return etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip().removeprefix("W/")
+        if tag == etag or (tag.startswith(f"{etag[:-1]}-") and tag.endswith('"')):
+            return tag
+    return None
+
+
+class HTTPCache:
+    """
+    Route dependency adding ETag, Cache-Control and Surrogate-Key headers.
+
+    Declare it in the route decorator (dependencies=[Depends(...)]) so it
+    runs before the endpoint's own dependencies.
+
+    Args:
+        policy: Cache-Control policy for anonymous responses
+        resources: Names the resources a request serves. May raise
+            ValueError for malformed parameters, which the route rejects
+            anyway; such requests are not cached.
+        stamp_missing: Give resources without a stamp a new one. Use False
+            for cached aggregates, which stamp themselves when recomputed;
+            until then their responses carry no ETag.
+        embeds: Also cover the resources recorded with record_embedded()
+            for the request's resources. Until the route records them, its
+            responses carry no ETag.
+    """
+
+    def __init__(
+        self,
+        policy: CachePolicy,
+        resources: Callable[[Request], list[str]],
+        stamp_missing: bool = True,
+        embeds: bool = False,
+    ):
+        self.policy = policy
+        self.resources = resources
+        self.stamp_missing = stamp_missing
+        self.embeds = embeds
+
+    async def __call__(
+        self,
+        request: Request,
+        response: Response,
+        redis_client: redis.Redis = Depends(get_redis),
+    ) -> None:
+        response.headers["Vary"] = "Authorization"
+        if "authorization" in request.headers:
+            response.headers["Cache-Control"] = PRIVATE_CACHE_CONTROL
+            return
+
+        try:
+            resources = self.resources(request)
+        except ValueError:
+            return
+
+        embeds_known = True
+        if self.embeds:
+            embedded = await redis_client.mget(
+                [f"{EMBEDDED_PREFIX}{resource}" for resource in resources]
+            )
+            embeds_known = None not in embedded
+            if embeds_known:
+                resources += [r for names in embedded for r in names.split()]
+
+        etag = None
+        if embeds_known:
+            etag = await self._etag(redis_client, request, resources)
+        headers = {
+            "Cache-Control": self.policy.cache_control,
+            "Surrogate-Key": " ".join(resources),
+            "Vary": "Authorization",
+        }
+        if etag:
+            headers["ETag"] = etag
+            if_none_match = request.headers.get("if-none-match")
+            matched = if_none_match and _matching_etag(if_none_match, etag)
+            if matched:
+                # Name the body the client holds, in whichever coding
+                raise HTTPException(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={**headers, "ETag": matched},
+                )
+
+        response.headers.update(headers)
+
+    async def _etag(
+        self, redis_client: redis.Redis, request: Request, resources: list[str]
+    ) -> str | None:
+        """
+        Strong ETag for the request's uncompressed body, or None if a
+        resource has no stamp yet.
+        """
+        keys = [f"{VERSION_PREFIX}{resource}" for resource in resources]
+        stamps = await redis_client.mget(keys)
+
+        missing = [key for key, stamp in zip(keys, stamps) if stamp is None]
+        if missing and not self.stamp_missing:
+            return None
+        if missing:
+            pipe = redis_client.pipeline(transaction=False)
+            for key in missing:
+                pipe.set(key, new_stamp(), nx=True)
+            await pipe.execute()
+            # Another request may have stamped them first
+            stamps = await redis_client.mget(keys)
+
+        digest = hashlib.sha256(
+            "\n".join([str(request.url.path), str(request.url.query), *stamps]).encode()
+        ).hexdigest()[:32]
+        return f'"{digest}"'
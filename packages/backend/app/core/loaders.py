@@ -0,0 +1,141 @@
+"""
+Request-scoped batch loading.
+
+Response builders often need one related object per row: a claim per
+trending entry, the caller's vote per listed claim. Fetched one at a time
+that is a query per row. A DataLoader instead collects every key requested
+in the same event-loop tick and fetches them with one batch call, an IN
+query, caching results for the rest of the request.
+
+Loads only coalesce if they are made before the loader's batch runs, so
+request keys together, with load_many() or asyncio.gather(), rather than
+awaiting each load in turn.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Generic, TypeVar
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import get_read_db
+from app.core.database import get_db
+from app.models.claim import Claim, ClaimVote
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Batches run as tasks; keep references until they finish
+_batch_tasks: set[asyncio.Task] = set()
+
+
+class DataLoader(Generic[K, V]):
+    """
+    Coalesces loads made in the same event-loop tick into one batch call.
+
+    batch_load receives the distinct keys not loaded before and returns the
+    values found, by key; missing keys load as None.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[list[K]], Awaitable[dict[K, V]]],
+        lock: asyncio.Lock | None = None,
+    ):
+        self._batch_load = batch_load
+        # Loaders sharing a session must not run their batches concurrently
+        self._lock = lock or asyncio.Lock()
+        self._results: dict[K, asyncio.Future[V | None]] = {}
+        self._pending: list[K] = []
+
+    def load(self, key: K) -> Awaitable[V | None]:
+        """The value for a key, fetched with the other keys of this tick."""
+        future = self._results.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._results[key] = future
+            self._pending.append(key)
+            if len(self._pending) == 1:
+                loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        """The values for several keys, in order, fetched in one batch."""
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """Cache a value already at hand, so loading it costs nothing."""
+        if key not in self._results:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._results[key] = future
+
+    def _dispatch(self) -> None:
+        keys, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._run(keys))
+        _batch_tasks.add(task)
+        task.add_done_callback(_batch_tasks.discard)
+
+    async def _run(self, keys: list[K]) -> None:
+        try:
+            async with self._lock:
+                values = await self._batch_load(keys)
+        except Exception as e:
+            # Failed keys are retried by the next load
+            for key in keys:
+                future = self._results.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for key in keys:
+            future = self._results[key]
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+class Loaders:
+    """
+    The batch loaders of one request:
+    - claims by ID
+    - claim votes by (agent ID, claim ID), for the caller's votes
+
+    Authors are not loaded here: list queries load them eagerly, with one
+    IN query per page (see the relationship loading options).
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        lock = asyncio.Lock()
+        self.claims: DataLoader[UUID, Claim] = DataLoader(self._load_claims, lock)
+        self.claim_votes: DataLoader[tuple[UUID, UUID], float] = DataLoader(
+            self._load_claim_votes, lock
+        )
+
+    async def _load_claims(self, claim_ids: list[UUID]) -> dict[UUID, Claim]:
+        result = await self.db.execute(select(Claim).where(Claim.id.in_(claim_ids)))
+        return {claim.id: claim for claim in result.scalars().all()}
+
+    async def _load_claim_votes(
+        self, keys: list[tuple[UUID, UUID]]
+    ) -> dict[tuple[UUID, UUID], float]:
+        result = await self.db.execute(
+            select(ClaimVote.agent_id, ClaimVote.claim_id, ClaimVote.value).where(
+                ClaimVote.agent_id.in_({agent_id for agent_id, _ in keys}),
+                ClaimVote.claim_id.in_({claim_id for _, claim_id in keys}),
+            )
+        )
+        return {(agent_id, claim_id): value for agent_id, claim_id, value in result.all()}
+
+
+def get_loaders(db: AsyncSession = Depends(get_db)) -> Loaders:
+    """Batch loaders on the request's read-write session."""
+    return Loaders(db)
+
+
+def get_read_loaders(db: AsyncSession = Depends(get_read_db)) -> Loaders:
+    """Batch loaders on the request's read-only session."""
+    return Loaders(db)
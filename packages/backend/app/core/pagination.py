@@ -0,0 +1,119 @@
+"""
+Keyset (cursor) pagination helpers.
+
+Cursors are opaque, URL-safe tokens that encode the sort key and ID of the
+last row on a page. The next page continues strictly after that position,
+so deep pages cost the same as the first one and do not shift when new rows
+are inserted.
+"""
+
+import base64
+import json
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+
+def encode_cursor(sort_value: Any, row_id: UUID) -> str:
+    """Encode a (sort value, id) position as an opaque cursor token."""
+    if isinstance(sort_value, datetime):
+        value = {"t": sort_value.isoformat()}
+    else:
+        value = {"v": sort_value}
+    payload = json.dumps([value, str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, UUID]:
+    """
+    Decode a cursor token back into its (sort value, id) position.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if "t" in value:
+            sort_value = datetime.fromisoformat(value["t"])
+        else:
+            sort_value = value["v"]
+        return sort_value, UUID(row_id)
+    except (ValueError, TypeError, KeyError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        ) from e
+
+
+def apply_keyset(
+    query: Select,
+    sort_column: ColumnElement,
+    id_column: ColumnElement,
+    limit: int,
+    cursor: str | None = None,
+    descending: bool = True,
+) -> Select:
+    """
+    Order a query by (sort_column, id_column) and continue after a cursor.
+
+    The row comparison matches a composite index on the same columns, so
+    every page is a bounded index range scan. Fetches limit + 1 rows; pass
+    the results to split_page().
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or for another sort
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor)
+        expected = sort_column.type.python_type
+        if isinstance(sort_value, bool) or not (
+            isinstance(sort_value, expected)
+            or (expected is float and isinstance(sort_value, int))
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+
+        position = tuple_(sort_column, id_column)
+        bound = tuple_(sort_value, row_id)
+        query = query.where(position < bound if descending else position > bound)
+
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+
+    # Fetch one extra row to know whether another page exists
+    return query.limit(limit + 1)
+
+
+def split_page(
+    rows: list[T],
+    limit: int,
+    position: Callable[[T], tuple[Any, UUID]],
+) -> tuple[list[T], str | None]:
+    """
+    Trim the extra row fetched by apply_keyset() and build the next cursor.
+
+    Args:
+        rows: Up to limit + 1 rows in page order
+        limit: Page size
+        position: Returns the (sort value, id) of a row
+
+    Returns:
+        Tuple of (rows for this page, cursor for the next page or None)
+    """
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_cursor(*position(rows[-1]))
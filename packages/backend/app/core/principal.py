@@ -0,0 +1,199 @@
+"""
+Cached snapshots of authenticated agents.
+
+Most requests only need to know who is calling: the agent's id, tier,
+daily limits and reputation. Those come from a small immutable snapshot
+kept in an in-process LRU, backed by Redis, so authenticating a request
+does not query the database. Endpoints that change the agent itself
+load it in full with get_current_agent instead.
+
+Writes that change a snapshot's fields (reputation, tier, profile)
+invalidate it once their transaction commits. The in-process copies of
+other workers are not invalidated and expire after a few seconds
+(settings.principal_local_ttl).
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.agent import Agent, AgentTier
+
+logger = logging.getLogger(__name__)
+
+PRINCIPAL_PREFIX = "principal:"
+# Session.info key of the snapshots to invalidate once the transaction commits
+PENDING_INVALIDATIONS = "pending_principal_invalidations"
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """Immutable snapshot of an authenticated agent."""
+
+    id: UUID
+    human_id: UUID
+    username: str
+    display_name: str | None
+    avatar_url: str | None
+    tier: AgentTier
+    reputation_score: float
+    evidence_per_day: int
+    votes_per_day: int
+
+    def to_json(self) -> str:
+        return json.dumps({
+            **asdict(self),
+            "id": str(self.id),
+            "human_id": str(self.human_id),
+            "tier": self.tier.value,
+        })
+
+    @classmethod
+    def from_json(cls, data: str) -> "Principal":
+        fields = json.loads(data)
+        return cls(**{
+            **fields,
+            "id": UUID(fields["id"]),
+            "human_id": UUID(fields["human_id"]),
+            "tier": AgentTier(fields["tier"]),
+        })
+
+
+PRINCIPAL_COLUMNS = [getattr(Agent, name) for name in Principal.__dataclass_fields__]
+
+
+class _LocalCache:
+    """Bounded LRU of snapshots with a per-entry expiry."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[UUID, tuple[float, Principal]] = OrderedDict()
+
+    def get(self, agent_id: UUID) -> Principal | None:
+        entry = self._entries.get(agent_id)
+        if entry is None:
+            return None
+        expires_at, principal = entry
+        if expires_at < time.monotonic():
+            del self._entries[agent_id]
+            return None
+        self._entries.move_to_end(agent_id)
+        return principal
+
+    def set(self, principal: Principal) -> None:
+        self._entries[principal.id] = (time.monotonic() + self.ttl, principal)
+        self._entries.move_to_end(principal.id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, agent_id: UUID) -> None:
+        self._entries.pop(agent_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+local_principals = _LocalCache(settings.principal_local_cache_size, settings.principal_local_ttl)
+
+# Invalidations run as tasks after commit; keep references until they finish
+_invalidation_tasks: set[asyncio.Task] = set()
+
+
+class PrincipalCache:
+    """
+    Looks up agent snapshots: in-process first, then Redis, then the database.
+    """
+
+    def __init__(self, db: AsyncSession, redis_client: redis.Redis):
+        self.db = db
+        self.redis = redis_client
+
+    async def get(self, agent_id: UUID) -> Principal | None:
+        """
+        Get an agent's snapshot.
+
+        Args:
+            agent_id: ID of the agent
+
+        Returns:
+            The snapshot, or None if the agent does not exist
+        """
+        principal = local_principals.get(agent_id)
+        if principal:
+            return principal
+
+        cache_key = f"{PRINCIPAL_PREFIX}{agent_id}"
+        cached = await self.redis.get(cache_key)
+        if cached:
+            principal = Principal.from_json(cached)
+            local_principals.set(principal)
+            return principal
+
+        result = await self.db.execute(select(*PRINCIPAL_COLUMNS).where(Agent.id == agent_id))
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        principal = Principal(**row._asdict())
+        await self.redis.setex(cache_key, settings.principal_cache_ttl, principal.to_json())
+        local_principals.set(principal)
+        return principal
+
+
+async def invalidate_principals(redis_client: redis.Redis, *agent_ids: UUID) -> None:
+    """Drop agents' snapshots from this process and from Redis."""
+    if not agent_ids:
+        return
+    for agent_id in agent_ids:
+        local_principals.discard(agent_id)
+    await redis_client.delete(*[f"{PRINCIPAL_PREFIX}{agent_id}" for agent_id in agent_ids])
+
+
+def invalidate_principal_on_commit(
+    session: AsyncSession, redis_client: redis.Redis, agent_id: UUID
+) -> None:
+    """
+    Invalidate an agent's snapshot once the session's transaction commits.
+
+    Invalidating earlier would let a concurrent request cache the old
+    values again before the change is visible.
+    """
+    pending = session.info.setdefault(PENDING_INVALIDATIONS, {})
+    pending.setdefault(redis_client, set()).add(agent_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_principals(session: Session) -> None:
+    pending = session.info.pop(PENDING_INVALIDATIONS, None)
+    if not pending:
+        return
+    loop = asyncio.get_running_loop()
+    for redis_client, agent_ids in pending.items():
+        # Drop local copies right away, Redis ones as soon as possible
+        for agent_id in agent_ids:
+            local_principals.discard(agent_id)
+        task = loop.create_task(invalidate_principals(redis_client, *agent_ids))
+        _invalidation_tasks.add(task)
+        task.add_done_callback(_invalidation_done)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_invalidations(session: Session) -> None:
+    session.info.pop(PENDING_INVALIDATIONS, None)
+
+
+def _invalidation_done(task: asyncio.Task) -> None:
+    _invalidation_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Failed to invalidate principal snapshots: {task.exception()}")
@@ -0,0 +1,139 @@
+"""
+Per-request SQL instrumentation.
+
+Engine events record every statement a request runs: how many, the time
+spent waiting on the database, and how often each statement shape (the
+SQL with literals and parameters replaced) repeats. A shape repeating
+within one request is the mark of an N+1 loop: a query per row where one
+query for all rows would do.
+
+QueryStatsMiddleware reports the totals in a Server-Timing header and a
+log line per request, and warns when a shape repeats more than
+settings.query_repeat_threshold times.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bind parameters (with any cast), string literals and numbers
+_PARAMETER = re.compile(
+    r"(?:\$\d+|%\(\w+\)s)(?:::\w+(?:\[\])?)?"
+    r"|'(?:[^']|'')*'"
+    r"|\b\d+(?:\.\d+)?\b"
+)
+_PARAMETER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """A statement with parameters, literals and IN list lengths normalized away."""
+    shape = _PARAMETER.sub("?", statement)
+    shape = _PARAMETER_LIST.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+@dataclass
+class QueryStats:
+    """The statements run on behalf of one request."""
+
+    count: int = 0
+    duration: float = 0.0  # Seconds
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Shapes run more than threshold times, most repeated first."""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+    def describe(self) -> str:
+        """The shapes run and how often, for failure messages."""
+        return "\n".join(f"{n} x {shape}" for shape, n in self.shapes.most_common())
+
+
+# Work the request runs concurrently inherits the context, so it is counted too
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current.get()
+    if stats is not None and conn.info.get("query_started"):
+        stats.record(statement, time.perf_counter() - conn.info["query_started"].pop())
+
+
+class QueryStatsMiddleware:
+    """
+    Collect each request's query stats, and report them in a Server-Timing
+    header and the log.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            self._log(scope, status_code, stats)
+
+    def _log(self, scope: Scope, status_code: int, stats: QueryStats) -> None:
+        method, path = scope["method"], scope["path"]
+        logger.info(
+            f"{method} {path} status={status_code} queries={stats.count} "
+            f"db_ms={stats.duration * 1000:.1f}",
+            extra={
+                "method": method,
+                "path": path,
+                "status_code": status_code,
+                "query_count": stats.count,
+                "db_ms": round(stats.duration * 1000, 1),
+            },
+        )
+        for shape, n in stats.repeated(settings.query_repeat_threshold):
+            logger.warning(
+                f"Possible N+1: {method} {path} ran the same statement {n} times: {shape}",
+                extra={"method": method, "path": path, "repeats": n, "statement": shape},
+            )
@@ -5,6 +5,8 @@ import redis.asyncio as redis
 from app.core.config import settings
 
 redis_pool = redis.ConnectionPool.from_url(settings.redis_url, decode_responses=True)
+# For binary values, such as pre-serialized response bodies
+redis_bytes_pool = redis.ConnectionPool.from_url(settings.redis_url)
 
 
 async def get_redis() -> AsyncGenerator[redis.Redis, None]:
@@ -15,5 +17,14 @@ async def get_redis() -> AsyncGenerator[redis.Redis, None]:
         await client.aclose()
 
 
+async def get_redis_bytes() -> AsyncGenerator[redis.Redis, None]:
+    """Redis client returning values as bytes, without decoding."""
+    client = redis.Redis(connection_pool=redis_bytes_pool)
+    try:
+        yield client
+    finally:
+        await client.aclose()
+
+
 async def get_redis_client() -> redis.Redis:
     return redis.Redis(connection_pool=redis_pool)
@@ -0,0 +1,165 @@
+"""
+Read replica routing.
+
+Read-only endpoints can be served by streaming replicas. Replica lag is
+checked at most every settings.replica_status_interval seconds, and
+replicas further behind than settings.replica_max_lag are skipped; with
+none left, reads go to the primary.
+
+Agents must still see their own writes. After a request commits writes,
+the primary's WAL position (LSN) is kept as the agent's read-your-writes
+token, and until it expires the agent's reads only go to replicas that
+have replayed past it.
+
+Responses cached under a version stamp (profiles, leaderboards, trending,
+stats, ...) are built on the primary instead. Stamps change as soon as the
+primary commits, and a replica that has not replayed the commit yet would
+cache old data under the new stamp, to be served, and confirmed by 304s,
+until the cache expires.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+WRITE_LSN_PREFIX = "write_lsn:"
+
+# A server that is not in recovery is the primary, or stands in for a replica locally
+REPLICA_STATUS_QUERY = text("""
+    SELECT
+        CASE WHEN pg_is_in_recovery() THEN pg_last_wal_replay_lsn()
+             ELSE pg_current_wal_lsn() END::text,
+        CASE WHEN NOT pg_is_in_recovery()
+                  OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+             ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp()) END
+""")
+
+
+def parse_lsn(lsn: str) -> int:
+    """Convert an LSN such as '16/B374D848' to an integer for comparison."""
+    high, low = lsn.split("/")
+    return (int(high, 16) << 32) + int(low, 16)
+
+
+@dataclass
+class Replica:
+    """A replica's session factory and its last observed state."""
+
+    session_maker: async_sessionmaker[AsyncSession]
+    replay_lsn: int = 0
+    lag: float = float("inf")  # Unknown until checked
+
+
+class ReplicaSet:
+    """
+    The configured read replicas and their lag.
+    """
+
+    def __init__(self, urls: list[str]):
+        self.replicas = [
+            Replica(
+                async_sessionmaker(
+                    create_async_engine(url, echo=False, pool_size=20, max_overflow=10),
+                    class_=AsyncSession,
+                    expire_on_commit=False,
+                )
+            )
+            for url in urls
+        ]
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    async def refresh(self, force: bool = False) -> None:
+        """Check every replica's position and lag, unless checked recently."""
+
+        def fresh() -> bool:
+            return time.monotonic() - self._checked_at < settings.replica_status_interval
+
+        if not force and fresh():
+            return
+        async with self._lock:
+            # Another request may have checked while this one waited
+            if not force and fresh():
+                return
+            await asyncio.gather(*(self._check(replica) for replica in self.replicas))
+            self._checked_at = time.monotonic()
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            async with replica.session_maker() as session:
+                lsn, lag = (await session.execute(REPLICA_STATUS_QUERY)).one()
+        except (OSError, SQLAlchemyError) as e:
+            logger.warning(f"Replica status check failed: {e}")
+            replica.lag = float("inf")
+            return
+        replica.replay_lsn = parse_lsn(lsn) if lsn else 0
+        replica.lag = float(lag or 0)
+
+    async def choose(self, min_lsn: int | None = None) -> async_sessionmaker[AsyncSession] | None:
+        """
+        Pick a replica that is within the lag limit and, given min_lsn, has
+        replayed at least that far.
+
+        Returns:
+            The replica's session factory, or None to use the primary
+        """
+        if not self.replicas:
+            return None
+        await self.refresh()
+
+        candidates = [
+            replica
+            for replica in self.replicas
+            if replica.lag <= settings.replica_max_lag
+            and (min_lsn is None or replica.replay_lsn >= min_lsn)
+        ]
+        if not candidates:
+            return None
+        return random.choice(candidates).session_maker
+
+    async def choose_for(
+        self, redis_client: redis.Redis, agent_id: UUID | None
+    ) -> async_sessionmaker[AsyncSession] | None:
+        """Pick a replica for an agent's reads, one that has its recent writes."""
+        if not self.replicas:
+            return None
+        min_lsn = None
+        if agent_id is not None:
+            token = await redis_client.get(f"{WRITE_LSN_PREFIX}{agent_id}")
+            if token:
+                min_lsn = parse_lsn(token)
+        return await self.choose(min_lsn)
+
+    async def record_write(self, session: AsyncSession, redis_client: redis.Redis) -> None:
+        """
+        Keep the primary's WAL position as the session agent's read-your-writes
+        token, if the session wrote anything. Call after commit.
+        """
+        agent_id = session.info.get("agent_id")
+        wrote = session.info.pop("wrote", False)
+        if not self.replicas or agent_id is None or not wrote:
+            return
+        # Read after the commit, so the position includes the commit record
+        result = await session.execute(text("SELECT pg_current_wal_lsn()::text"))
+        await redis_client.set(
+            f"{WRITE_LSN_PREFIX}{agent_id}", result.scalar(), ex=settings.read_your_writes_ttl
+        )
+
+
+replicas = ReplicaSet(settings.database_replica_urls)
@@ -0,0 +1,193 @@
+"""
+Pre-serialized response cache.
+
+Cached aggregates (trending, leaderboard, stats, ...) are stored as final
+JSON response bodies, with compressed variants, so a cache hit is served
+as bytes: no JSON parsing, model validation or re-serialization.
+
+Bodies are serialized once, when cached, by Pydantic's JSON serializer.
+Build the models from trusted data with model_construct() to skip
+validation on that path as well.
+
+Use a binary Redis client (get_redis_bytes) so bodies are not decoded.
+
+The hottest responses (trending, platform stats) are also kept in the
+process, in hot_responses, by passing it as the cache's local tier.
+"""
+
+import gzip
+from collections.abc import Callable
+
+import redis.asyncio as redis
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.http_cache import encoded_etag
+from app.core.tiered_cache import LocalCache
+
+try:
+    import brotli
+except ImportError:  # Optional; gzip alone is used without it
+    brotli = None
+
+RESPONSE_PREFIX = "response:"
+# Smaller bodies are not worth compressing
+MIN_COMPRESS_SIZE = 1024
+# Variant key of the uncompressed body in the local tier
+IDENTITY = "identity"
+
+# Content encodings we precompress to, in order of preference
+ENCODERS: dict[str, Callable[[bytes], bytes]] = {
+    **({"br": lambda body: brotli.compress(body, quality=5)} if brotli else {}),
+    "gzip": lambda body: gzip.compress(body, compresslevel=6),
+}
+
+
+def _is_zero(quality: str) -> bool:
+    try:
+        return float(quality) == 0
+    except ValueError:
+        return False
+
+
+def _accepted_encoding(request: Request) -> str | None:
+    """The preferred precompressed encoding the client accepts, if any."""
+    accepted = set()
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.partition(";")
+        name, _, quality = params.partition("=")
+        if name.strip() == "q" and _is_zero(quality):
+            continue
+        accepted.add(coding.strip().lower())
+    for encoding in ENCODERS:
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+# In-process copies of hot response bodies; kept briefly, since nothing
+# refreshes their TTL from Redis
+hot_responses = LocalCache("response", settings.local_cache_size, ttl=5)
+
+
+class ResponseCache:
+    """
+    Caches final JSON response bodies in Redis.
+
+    Responses returned from here carry the headers already set on the
+    route's response (ETag, Cache-Control, ...), since FastAPI only applies
+    those to responses it builds itself.
+    """
+
+    def __init__(self, redis_client: redis.Redis, local: LocalCache | None = None):
+        self.redis = redis_client
+        # Variants of each body, by encoding, when kept in the process too
+        self.local = local
+
+    async def get(self, key: str, request: Request, response: Response) -> Response | None:
+        """
+        Get a cached response.
+
+        Args:
+            key: Cache key of the response
+            request: Request being served, for content negotiation
+            response: The route's response, whose headers are carried over
+
+        Returns:
+            The cached response, or None on a cache miss
+        """
+        encoding = _accepted_encoding(request)
+        if self.local is not None:
+            variants = await self._get_variants(key)
+            if variants is None:
+                return None
+            if encoding in variants:
+                return self._response(variants[encoding], response, encoding)
+            return self._response(variants[IDENTITY], response)
+
+        keys = [f"{RESPONSE_PREFIX}{key}"]
+        if encoding:
+            keys.append(f"{RESPONSE_PREFIX}{key}:{encoding}")
+
+        bodies = await self.redis.mget(keys)
+        if bodies[0] is None:
+            return None
+        # Small bodies have no compressed variants
+        if encoding and bodies[-1] is not None:
+            return self._response(bodies[-1], response, encoding)
+        return self._response(bodies[0], response)
+
+    async def set(
+        self,
+        key: str,
+        content: BaseModel,
+        ttl: int,
+        request: Request,
+        response: Response,
+    ) -> Response:
+        """
+        Serialize and cache a response.
+
+        Args:
+            key: Cache key of the response
+            content: Response model to serialize
+            ttl: Seconds to cache the response for; nothing is cached if
+                not positive (e.g. the TTL of an expired backing cache)
+            request: Request being served, for content negotiation
+            response: The route's response, whose headers are carried over
+
+        Returns:
+            The serialized response, ready to return from the route
+        """
+        body = content.model_dump_json().encode()
+        variants = {}
+        if len(body) >= MIN_COMPRESS_SIZE:
+            variants = {encoding: encode(body) for encoding, encode in ENCODERS.items()}
+
+        if ttl > 0:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.setex(f"{RESPONSE_PREFIX}{key}", ttl, body)
+            for encoding, encoded in variants.items():
+                pipe.setex(f"{RESPONSE_PREFIX}{key}:{encoding}", ttl, encoded)
+            await pipe.execute()
+            if self.local is not None:
+                self.local.set(key, {IDENTITY: body, **variants})
+
+        encoding = _accepted_encoding(request)
+        if encoding in variants:
+            return self._response(variants[encoding], response, encoding)
+        return self._response(body, response)
+
+    async def _get_variants(self, key: str) -> dict[str, bytes] | None:
+        """Every variant of a body, from the process or else Redis."""
+        variants = self.local.get(key)
+        if variants is not None:
+            return variants
+
+        bodies = await self.redis.mget(
+            [f"{RESPONSE_PREFIX}{key}", *(f"{RESPONSE_PREFIX}{key}:{e}" for e in ENCODERS)]
+        )
+        if bodies[0] is None:
+            self.local.stats.misses += 1
+            return None
+        self.local.stats.redis_hits += 1
+        variants = {IDENTITY: bodies[0]}
+        variants.update({e: body for e, body in zip(ENCODERS, bodies[1:]) if body is not None})
+        self.local.set(key, variants)
+        return variants
+
+    @staticmethod
+    def _response(body: bytes, response: Response, encoding: str | None = None) -> Response:
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name not in ("content-length", "content-type", "vary")
+        }
+        vary = [v for v in response.headers.get("vary", "").split(", ") if v]
+        headers["Vary"] = ", ".join([*vary, "Accept-Encoding"])
+        if encoding:
+            headers["Content-Encoding"] = encoding
+            if "etag" in headers:
+                headers["etag"] = encoded_etag(headers["etag"], encoding)
+        return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,256 @@
+"""
+Two-tier caching of hot keys.
+
+Some cache keys are read by nearly every request of every API process,
+yet change far less often than they are read: claim gradients, agent
+reputations, trending pages, platform stats. A TieredCache keeps the
+values it reads in an in-process LRU (L1) in front of Redis (L2), so a
+repeat read costs neither a round trip nor a decode. Values are stored in
+Redis msgpack-encoded, which is more compact and faster to decode than
+str() or JSON.
+
+Changes are broadcast on a Redis pub/sub channel, and each process's
+listener (listen_for_invalidations, run for the app's lifetime) drops the
+L1 copies they make stale. Should a process miss a message, say while its
+listener reconnects, its copies still expire after settings.local_cache_ttl.
+
+Every namespace counts its hits, misses and evictions; cache_stats()
+reports them.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import asdict, dataclass
+from typing import Any
+from uuid import uuid4
+
+import msgpack
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.redis import redis_bytes_pool
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidate"
+# Identifies this process's own broadcasts, whose invalidations it already made
+PROCESS_ID = uuid4().hex
+
+
+@dataclass
+class CacheStats:
+    """Counters of one cache namespace."""
+
+    hits: int = 0  # Served from the process
+    redis_hits: int = 0  # Missed the process, served from Redis
+    misses: int = 0  # Missed both
+    evictions: int = 0  # Dropped from the process to make room
+    invalidations: int = 0  # Dropped from the process as stale
+
+
+class LocalCache:
+    """
+    Bounded in-process LRU with a per-entry expiry.
+
+    Values must not be None, which get() returns for a miss, and are
+    shared by every reader, so must not be modified.
+    """
+
+    def __init__(self, namespace: str, maxsize: int, ttl: float):
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        _local_caches[namespace] = self
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def discard(self, *keys: Hashable) -> None:
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                self.stats.invalidations += 1
+
+    def clear(self) -> None:
+        self.stats.invalidations += len(self._entries)
+        self._entries.clear()
+
+
+# Every local cache by namespace, for invalidations and stats
+_local_caches: dict[str, LocalCache] = {}
+
+
+class TieredCache:
+    """
+    A namespace of Redis keys cached in the process as well.
+
+    Keys are full Redis keys. Reads fill the process cache; writes that
+    change a value (publish=True) and deletes are broadcast, so other
+    processes drop their copies.
+    """
+
+    # Values are msgpack-encoded, so the client must not decode responses
+    redis_client: redis.Redis = redis.Redis(connection_pool=redis_bytes_pool)
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: int,
+        local_ttl: int | None = None,
+        local_size: int | None = None,
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        # Copies in the process never outlive the Redis entry they came from
+        self.local = LocalCache(
+            namespace,
+            local_size or settings.local_cache_size,
+            min(local_ttl or settings.local_cache_ttl, ttl),
+        )
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.local.stats
+
+    async def get(self, key: str) -> Any | None:
+        """A cached value, or None on a miss."""
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        """The cached values of several keys, by key; misses are left out."""
+        found = {}
+        remote = []
+        for key in keys:
+            value = self.local.get(key)
+            if value is None:
+                remote.append(key)
+            else:
+                found[key] = value
+        if not remote:
+            return found
+
+        for key, data in zip(remote, await self.redis_client.mget(remote)):
+            if data is None:
+                self.stats.misses += 1
+                continue
+            value = msgpack.unpackb(data)
+            self.stats.redis_hits += 1
+            self.local.set(key, value)
+            found[key] = value
+        return found
+
+    async def set(self, key: str, value: Any, publish: bool = False) -> None:
+        """
+        Cache a value.
+
+        Args:
+            key: Redis key
+            value: msgpack-serializable value, not None
+            publish: Whether the value changed, so other processes must
+                drop their copies; not needed to cache a value just read
+        """
+        await self.set_many({key: value}, publish=publish)
+
+    async def set_many(self, values: dict[str, Any], publish: bool = False) -> None:
+        """Cache several values, as set() does, in one round trip."""
+        if not values:
+            return
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for key, value in values.items():
+            pipeline.setex(key, self.ttl, msgpack.packb(value))
+        await pipeline.execute()
+        for key, value in values.items():
+            self.local.set(key, value)
+        if publish:
+            await publish_invalidation(self.namespace, list(values))
+
+    async def delete(self, *keys: str) -> None:
+        """Drop keys from Redis and every process."""
+        if not keys:
+            return
+        self.local.discard(*keys)
+        await self.redis_client.delete(*keys)
+        await publish_invalidation(self.namespace, list(keys))
+
+
+async def publish_invalidation(namespace: str, keys: list[str] | None = None) -> None:
+    """
+    Tell other processes to drop their copies of keys in a namespace, or of
+    the whole namespace if keys is None.
+
+    Publish after changing Redis, or a process could copy the old value again.
+    """
+    await TieredCache.redis_client.publish(
+        INVALIDATION_CHANNEL, msgpack.packb([PROCESS_ID, namespace, keys])
+    )
+
+
+async def clear_everywhere(cache: LocalCache) -> None:
+    """Drop a whole namespace from every process, once its keys are gone from Redis."""
+    cache.clear()
+    await publish_invalidation(cache.namespace)
+
+
+def apply_invalidation(message: bytes) -> None:
+    """Drop the process's copies named by another process's broadcast."""
+    origin, namespace, keys = msgpack.unpackb(message)
+    cache = _local_caches.get(namespace)
+    if origin == PROCESS_ID or cache is None:
+        return
+    if keys is None:
+        cache.clear()
+    else:
+        cache.discard(*keys)
+
+
+def clear_local_caches() -> None:
+    """Drop every copy held in the process."""
+    for cache in _local_caches.values():
+        cache.clear()
+
+
+async def listen_for_invalidations() -> None:
+    """Apply other processes' invalidations until cancelled."""
+    while True:
+        try:
+            async with TieredCache.redis_client.pubsub() as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                # Copies made while unsubscribed may have missed invalidations
+                clear_local_caches()
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        apply_invalidation(message["data"])
+        except redis.RedisError as e:
+            logger.warning(f"Cache invalidation listener disconnected: {e}")
+            await asyncio.sleep(1)
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    """The counters of every cache namespace."""
+    return {
+        namespace: {**asdict(cache.stats), "size": len(cache)}
+        for namespace, cache in sorted(_local_caches.items())
+    }
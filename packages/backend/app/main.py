@@ -1,5 +1,6 @@
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -7,6 +8,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.api.v1 import router as api_v1_router
 from app.core.config import settings
 from app.core.exceptions import register_exception_handlers
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.tiered_cache import cache_stats, listen_for_invalidations
 
 # Configure logging
 logging.basicConfig(
@@ -20,9 +23,14 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting ain/verify API")
+    # Drop in-process cache entries other processes change
+    invalidation_listener = asyncio.create_task(listen_for_invalidations())
     yield
     # Shutdown
     logger.info("Shutting down ain/verify API")
+    invalidation_listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await invalidation_listener
 
 
 app = FastAPI(
@@ -44,6 +52,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Query counts and database time per request
+app.add_middleware(QueryStatsMiddleware)
+
 # Include API routes
 app.include_router(api_v1_router, prefix=settings.api_v1_prefix)
 
@@ -51,3 +62,9 @@ app.include_router(api_v1_router, prefix=settings.api_v1_prefix)
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/health/caches")
+async def cache_health():
+    """Hit, miss and eviction counters of each in-process cache namespace."""
+    return cache_stats()
@@ -1,8 +1,9 @@
 from app.models.human import Human
-from app.models.agent import Agent
+from app.models.agent import Agent, AgentActivity
 from app.models.claim import Claim, ClaimParent, ClaimVote
-from app.models.evidence import Evidence, EvidenceVote
+from app.models.evidence import Evidence, EvidenceBlob, EvidenceVote
 from app.models.history import GradientHistory, ReputationHistory
+from app.models.platform import PlatformCounter
 from app.models.rate_limit import RateLimitCounter
 from app.models.refresh_token import RefreshToken
 from app.models.expertise import AgentExpertise, AgentClaimBookmark, AgentClaimFollow
@@ -10,13 +11,16 @@ from app.models.expertise import AgentExpertise, AgentClaimBookmark, AgentClaimF
 __all__ = [
     "Human",
     "Agent",
+    "AgentActivity",
     "Claim",
     "ClaimParent",
     "ClaimVote",
     "Evidence",
+    "EvidenceBlob",
     "EvidenceVote",
     "GradientHistory",
     "ReputationHistory",
+    "PlatformCounter",
     "RateLimitCounter",
     "RefreshToken",
     "AgentExpertise",
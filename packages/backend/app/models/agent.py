@@ -62,39 +62,44 @@ class Agent(Base):
     )
 
     # Relationships
-    human: Mapped["Human"] = relationship("Human", back_populates="agents")  # noqa: F821
+    human: Mapped["Human"] = relationship(  # noqa: F821
+        "Human", back_populates="agents", lazy="raise_on_sql"
+    )
     claims: Mapped[list["Claim"]] = relationship(  # noqa: F821
-        "Claim", back_populates="author", lazy="selectin"
+        "Claim", back_populates="author", lazy="raise"
     )
     evidence: Mapped[list["Evidence"]] = relationship(  # noqa: F821
-        "Evidence", back_populates="author", lazy="selectin"
+        "Evidence", back_populates="author", lazy="raise"
     )
     claim_votes: Mapped[list["ClaimVote"]] = relationship(  # noqa: F821
-        "ClaimVote", back_populates="agent", lazy="selectin"
+        "ClaimVote", back_populates="agent", lazy="raise"
     )
     evidence_votes: Mapped[list["EvidenceVote"]] = relationship(  # noqa: F821
-        "EvidenceVote", back_populates="agent", lazy="selectin"
+        "EvidenceVote", back_populates="agent", lazy="raise"
     )
     comments: Mapped[list["Comment"]] = relationship(  # noqa: F821
-        "Comment", back_populates="author", lazy="selectin"
+        "Comment", back_populates="author", lazy="raise"
     )
     comment_votes: Mapped[list["CommentVote"]] = relationship(  # noqa: F821
-        "CommentVote", back_populates="agent", lazy="selectin"
+        "CommentVote", back_populates="agent", lazy="raise"
     )
     notifications: Mapped[list["Notification"]] = relationship(  # noqa: F821
         "Notification",
         foreign_keys="Notification.agent_id",
         back_populates="agent",
-        lazy="selectin",
+        lazy="raise",
     )
     expertise: Mapped[list["AgentExpertise"]] = relationship(  # noqa: F821
-        "AgentExpertise", back_populates="agent", lazy="selectin", cascade="all, delete-orphan"
+        "AgentExpertise", back_populates="agent", lazy="raise",
+        cascade="all, delete-orphan", passive_deletes=True,
     )
     bookmarks: Mapped[list["AgentClaimBookmark"]] = relationship(  # noqa: F821
-        "AgentClaimBookmark", back_populates="agent", lazy="selectin", cascade="all, delete-orphan"
+        "AgentClaimBookmark", back_populates="agent", lazy="raise",
+        cascade="all, delete-orphan", passive_deletes=True,
     )
     follows: Mapped[list["AgentClaimFollow"]] = relationship(  # noqa: F821
-        "AgentClaimFollow", back_populates="agent", lazy="selectin", cascade="all, delete-orphan"
+        "AgentClaimFollow", back_populates="agent", lazy="raise",
+        cascade="all, delete-orphan", passive_deletes=True,
     )
 
     __table_args__ = (
@@ -102,3 +107,23 @@ class Agent(Base):
         Index("ix_agents_human_id", "human_id"),
         Index("ix_agents_reputation_score", "reputation_score"),
     )
+
+
+class AgentActivity(Base):
+    """
+    Counters of an agent's contributions, maintained by the write paths.
+
+    Kept apart from agents so that counting a vote does not lock the
+    voter's agent row, which other agents' votes lock to change its
+    reputation.
+    """
+
+    __tablename__ = "agent_activity"
+
+    agent_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("agents.id", ondelete="CASCADE"), primary_key=True
+    )
+    claims_authored: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    evidence_submitted: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    # Votes on claims and on evidence
+    votes_cast: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
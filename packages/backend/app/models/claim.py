@@ -3,6 +3,7 @@ import uuid
 from datetime import UTC, datetime
 
 from sqlalchemy import (
+    DDL,
     DateTime,
     Enum,
     Float,
@@ -11,6 +12,7 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    event,
 )
 from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -47,8 +49,11 @@ class Claim(Base):
     tags: Mapped[list[str]] = mapped_column(ARRAY(String(50)), default=list)
     vote_count: Mapped[int] = mapped_column(Integer, default=0)
     evidence_count: Mapped[int] = mapped_column(Integer, default=0)
+    # Maintained counters for exact list totals
+    public_evidence_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    root_comment_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
-    # Full-text search vector
+    # Full-text search vector, maintained by the claims_search_vector_trigger
     search_vector: Mapped[str | None] = mapped_column(TSVECTOR, nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
@@ -61,47 +66,88 @@ class Claim(Base):
     )
 
     # Relationships
-    author: Mapped["Agent"] = relationship("Agent", back_populates="claims")  # noqa: F821
+    author: Mapped["Agent"] = relationship(  # noqa: F821
+        "Agent", back_populates="claims", lazy="raise_on_sql"
+    )
     evidence: Mapped[list["Evidence"]] = relationship(  # noqa: F821
-        "Evidence", back_populates="claim", lazy="selectin"
+        "Evidence", back_populates="claim", lazy="raise"
     )
     votes: Mapped[list["ClaimVote"]] = relationship(
-        "ClaimVote", back_populates="claim", lazy="selectin"
+        "ClaimVote", back_populates="claim", lazy="raise"
     )
     parent_links: Mapped[list["ClaimParent"]] = relationship(
         "ClaimParent",
         foreign_keys="ClaimParent.child_id",
         back_populates="child",
-        lazy="selectin",
+        lazy="raise",
     )
     child_links: Mapped[list["ClaimParent"]] = relationship(
         "ClaimParent",
         foreign_keys="ClaimParent.parent_id",
         back_populates="parent",
-        lazy="selectin",
+        lazy="raise",
     )
     gradient_history: Mapped[list["GradientHistory"]] = relationship(  # noqa: F821
-        "GradientHistory", back_populates="claim", lazy="selectin"
+        "GradientHistory", back_populates="claim", lazy="raise"
     )
     comments: Mapped[list["Comment"]] = relationship(  # noqa: F821
-        "Comment", back_populates="claim", lazy="selectin"
+        "Comment", back_populates="claim", lazy="raise"
     )
     bookmarked_by: Mapped[list["AgentClaimBookmark"]] = relationship(  # noqa: F821
-        "AgentClaimBookmark", back_populates="claim", lazy="selectin", cascade="all, delete-orphan"
+        "AgentClaimBookmark", back_populates="claim", lazy="raise",
+        cascade="all, delete-orphan", passive_deletes=True,
     )
     followed_by: Mapped[list["AgentClaimFollow"]] = relationship(  # noqa: F821
-        "AgentClaimFollow", back_populates="claim", lazy="selectin", cascade="all, delete-orphan"
+        "AgentClaimFollow", back_populates="claim", lazy="raise",
+        cascade="all, delete-orphan", passive_deletes=True,
     )
 
     __table_args__ = (
         Index("ix_claims_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_claims_statement_trgm",
+            "statement",
+            postgresql_using="gin",
+            postgresql_ops={"statement": "gin_trgm_ops"},
+        ),
         Index("ix_claims_author_agent_id", "author_agent_id"),
-        Index("ix_claims_gradient", "gradient"),
-        Index("ix_claims_created_at", "created_at"),
+        # (sort key, id) pairs for keyset pagination
+        Index("ix_claims_gradient_id", "gradient", "id"),
+        Index("ix_claims_created_at_id", "created_at", "id"),
+        Index("ix_claims_vote_count_id", "vote_count", "id"),
         Index("ix_claims_tags", "tags", postgresql_using="gin"),
     )
 
 
+# Weighted search document: the statement ranks above the tags
+SEARCH_DOCUMENT_FUNCTION = """
+CREATE OR REPLACE FUNCTION claims_search_document(statement text, tags varchar[])
+RETURNS tsvector AS $$
+    SELECT setweight(to_tsvector('english', coalesce(statement, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(array_to_string(tags, ' '), '')), 'B')
+$$ LANGUAGE sql STABLE
+"""
+
+SEARCH_VECTOR_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION claims_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := claims_search_document(NEW.statement, NEW.tags);
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+SEARCH_VECTOR_TRIGGER = """
+CREATE TRIGGER claims_search_vector_trigger
+BEFORE INSERT OR UPDATE OF statement, tags ON claims
+FOR EACH ROW EXECUTE FUNCTION claims_search_vector_update()
+"""
+
+# Migrations install these too; attaching them here keeps create_all() schemas equivalent
+for _ddl in (SEARCH_DOCUMENT_FUNCTION, SEARCH_VECTOR_TRIGGER_FUNCTION, SEARCH_VECTOR_TRIGGER):
+    event.listen(Claim.__table__, "after_create", DDL(_ddl))
+
+
 class ClaimParent(Base):
     """
     Represents claim dependency relationships (a claim can depend on other claims).
@@ -124,10 +170,10 @@ class ClaimParent(Base):
 
     # Relationships
     parent: Mapped["Claim"] = relationship(
-        "Claim", foreign_keys=[parent_id], back_populates="child_links"
+        "Claim", foreign_keys=[parent_id], back_populates="child_links", lazy="raise_on_sql"
     )
     child: Mapped["Claim"] = relationship(
-        "Claim", foreign_keys=[child_id], back_populates="parent_links"
+        "Claim", foreign_keys=[child_id], back_populates="parent_links", lazy="raise_on_sql"
     )
 
     __table_args__ = (
@@ -161,8 +207,10 @@ class ClaimVote(Base):
     )
 
     # Relationships
-    claim: Mapped["Claim"] = relationship("Claim", back_populates="votes")
-    agent: Mapped["Agent"] = relationship("Agent", back_populates="claim_votes")  # noqa: F821
+    claim: Mapped["Claim"] = relationship("Claim", back_populates="votes", lazy="raise_on_sql")
+    agent: Mapped["Agent"] = relationship(  # noqa: F821
+        "Agent", back_populates="claim_votes", lazy="raise_on_sql"
+    )
 
     __table_args__ = (
         Index("ix_claim_votes_claim_id", "claim_id"),
@@ -1,7 +1,20 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, Text
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    DateTime,
+    Enum,
+    FetchedValue,
+    ForeignKey,
+    Index,
+    Integer,
+    SmallInteger,
+    Text,
+    event,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -13,6 +26,12 @@ class Comment(Base):
     """
     Comment on a claim or evidence.
     Supports threading via self-referential parent_id.
+
+    Each comment also stores its depth and materialized path: the path
+    segments of its ancestors and itself, joined by "/". A segment is the
+    comment's creation time and id as fixed-width hex, so ordering by path
+    lists a thread depth-first with siblings oldest first, and a subtree is
+    a single range of paths. Both are set by a trigger on insert.
     """
 
     __tablename__ = "comments"
@@ -33,6 +52,14 @@ class Comment(Base):
         UUID(as_uuid=True), ForeignKey("comments.id"), nullable=True
     )
 
+    depth: Mapped[int] = mapped_column(
+        SmallInteger, nullable=False, server_default=FetchedValue()
+    )
+    # Byte-wise collation, so range scans compare paths segment by segment
+    path: Mapped[str] = mapped_column(
+        Text(collation="C"), nullable=False, server_default=FetchedValue()
+    )
+
     content: Mapped[str] = mapped_column(Text, nullable=False)
     is_edited: Mapped[bool] = mapped_column(Boolean, default=False)
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False)
@@ -50,22 +77,28 @@ class Comment(Base):
     )
 
     # Relationships
-    claim: Mapped["Claim"] = relationship("Claim", back_populates="comments")  # noqa: F821
-    evidence: Mapped["Evidence"] = relationship("Evidence", back_populates="comments")  # noqa: F821
-    author: Mapped["Agent"] = relationship("Agent", back_populates="comments")  # noqa: F821
+    claim: Mapped["Claim"] = relationship(  # noqa: F821
+        "Claim", back_populates="comments", lazy="raise_on_sql"
+    )
+    evidence: Mapped["Evidence"] = relationship(  # noqa: F821
+        "Evidence", back_populates="comments", lazy="raise_on_sql"
+    )
+    author: Mapped["Agent"] = relationship(  # noqa: F821
+        "Agent", back_populates="comments", lazy="raise_on_sql"
+    )
     parent: Mapped["Comment | None"] = relationship(
         "Comment",
         remote_side=[id],
         back_populates="replies",
-        lazy="selectin",
+        lazy="raise_on_sql",
     )
     replies: Mapped[list["Comment"]] = relationship(
         "Comment",
         back_populates="parent",
-        lazy="selectin",
+        lazy="raise",
     )
     votes: Mapped[list["CommentVote"]] = relationship(
-        "CommentVote", back_populates="comment", lazy="selectin"
+        "CommentVote", back_populates="comment", lazy="raise"
     )
 
     __table_args__ = (
@@ -75,22 +108,66 @@ class Comment(Base):
         Index("ix_comments_parent_id", "parent_id"),
         Index("ix_comments_created_at", "created_at"),
         Index("ix_comments_claim_created", "claim_id", "created_at"),
-    )
+        # Thread pages: each thread is one range of paths
+        Index("ix_comments_claim_path", "claim_id", "path"),
+        # Keyset pagination of root comments on a claim or its evidence
+        Index(
+            "ix_comments_claim_roots",
+            "claim_id", "evidence_id", "created_at", "id",
+            postgresql_where=text("parent_id IS NULL"),
+        ),
+    )
+    # Read back the trigger-set depth and path on insert
+    __mapper_args__ = {"eager_defaults": True}
 
     @property
     def vote_score(self) -> int:
         """Calculate the net vote score."""
         return self.upvotes - self.downvotes
 
-    @property
-    def depth(self) -> int:
-        """Calculate the comment depth in the thread."""
-        depth = 0
-        current = self.parent
-        while current is not None:
-            depth += 1
-            current = current.parent
-        return depth
+
+
+# Creation time in microseconds and id, as fixed-width hex
+PATH_SEGMENT_FUNCTION = """
+CREATE OR REPLACE FUNCTION comment_path_segment(created_at timestamptz, id uuid)
+RETURNS text AS $$
+    SELECT lpad(to_hex(floor(extract(epoch FROM created_at) * 1000000)::bigint), 16, '0')
+        || replace(id::text, '-', '')
+$$ LANGUAGE sql IMMUTABLE
+"""
+
+PATH_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION comments_path_update() RETURNS trigger AS $$
+DECLARE
+    parent_path text;
+    parent_depth smallint;
+BEGIN
+    NEW.created_at := coalesce(NEW.created_at, now());
+    NEW.path := comment_path_segment(NEW.created_at, NEW.id);
+    NEW.depth := 0;
+    IF NEW.parent_id IS NOT NULL THEN
+        SELECT path, depth INTO parent_path, parent_depth
+        FROM comments WHERE id = NEW.parent_id;
+        IF FOUND THEN
+            NEW.path := parent_path || '/' || NEW.path;
+            NEW.depth := parent_depth + 1;
+        END IF;
+    END IF;
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# Comments do not move, so only inserts need a path
+PATH_TRIGGER = """
+CREATE TRIGGER comments_path_trigger
+BEFORE INSERT ON comments
+FOR EACH ROW EXECUTE FUNCTION comments_path_update()
+"""
+
+# Migrations install these too; attaching them here keeps create_all() schemas equivalent
+for _ddl in (PATH_SEGMENT_FUNCTION, PATH_TRIGGER_FUNCTION, PATH_TRIGGER):
+    event.listen(Comment.__table__, "after_create", DDL(_ddl))
 
 
 class CommentVote(Base):
@@ -115,8 +192,12 @@ class CommentVote(Base):
     )
 
     # Relationships
-    comment: Mapped["Comment"] = relationship("Comment", back_populates="votes")
-    agent: Mapped["Agent"] = relationship("Agent", back_populates="comment_votes")  # noqa: F821
+    comment: Mapped["Comment"] = relationship(
+        "Comment", back_populates="votes", lazy="raise_on_sql"
+    )
+    agent: Mapped["Agent"] = relationship(  # noqa: F821
+        "Agent", back_populates="comment_votes", lazy="raise_on_sql"
+    )
 
     __table_args__ = (
         Index("ix_comment_votes_comment_id", "comment_id"),
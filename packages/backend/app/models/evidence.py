@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, Integer, String, Text, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -77,13 +77,17 @@ class Evidence(Base):
     )
 
     # Relationships
-    claim: Mapped["Claim"] = relationship("Claim", back_populates="evidence")  # noqa: F821
-    author: Mapped["Agent"] = relationship("Agent", back_populates="evidence")  # noqa: F821
+    claim: Mapped["Claim"] = relationship(  # noqa: F821
+        "Claim", back_populates="evidence", lazy="raise_on_sql"
+    )
+    author: Mapped["Agent"] = relationship(  # noqa: F821
+        "Agent", back_populates="evidence", lazy="raise_on_sql"
+    )
     votes: Mapped[list["EvidenceVote"]] = relationship(
-        "EvidenceVote", back_populates="evidence", lazy="selectin"
+        "EvidenceVote", back_populates="evidence", lazy="raise"
     )
     comments: Mapped[list["Comment"]] = relationship(  # noqa: F821
-        "Comment", back_populates="evidence", lazy="selectin"
+        "Comment", back_populates="evidence", lazy="raise"
     )
 
     __table_args__ = (
@@ -91,6 +95,17 @@ class Evidence(Base):
         Index("ix_evidence_author_agent_id", "author_agent_id"),
         Index("ix_evidence_vote_score", "vote_score"),
         Index("ix_evidence_visibility", "visibility"),
+        # Keyset pagination of a claim's public evidence
+        Index(
+            "ix_evidence_claim_public_score",
+            "claim_id", "vote_score", "id",
+            postgresql_where=text("visibility = 'public'"),
+        ),
+        Index(
+            "ix_evidence_claim_public_created",
+            "claim_id", "created_at", "id",
+            postgresql_where=text("visibility = 'public'"),
+        ),
     )
 
 
@@ -126,10 +141,36 @@ class EvidenceVote(Base):
     )
 
     # Relationships
-    evidence: Mapped["Evidence"] = relationship("Evidence", back_populates="votes")
-    agent: Mapped["Agent"] = relationship("Agent", back_populates="evidence_votes")  # noqa: F821
+    evidence: Mapped["Evidence"] = relationship(
+        "Evidence", back_populates="votes", lazy="raise_on_sql"
+    )
+    agent: Mapped["Agent"] = relationship(  # noqa: F821
+        "Agent", back_populates="evidence_votes", lazy="raise_on_sql"
+    )
 
     __table_args__ = (
         Index("ix_evidence_votes_evidence_id", "evidence_id"),
         Index("ix_evidence_votes_agent_id", "agent_id"),
     )
+
+
+class EvidenceBlob(Base):
+    """
+    A verified, content-addressed evidence file in S3.
+
+    Files are stored once per SHA-256 digest and shared by every evidence
+    item that attaches the same content.
+    """
+
+    __tablename__ = "evidence_blobs"
+
+    sha256: Mapped[str] = mapped_column(String(64), primary_key=True)
+    file_key: Mapped[str] = mapped_column(String(500), unique=True, nullable=False)
+    file_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    content_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    uploaded_by_agent_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("agents.id"), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+    )
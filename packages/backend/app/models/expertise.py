@@ -1,7 +1,7 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -30,7 +30,9 @@ class AgentExpertise(Base):
     )
 
     # Relationships
-    agent: Mapped["Agent"] = relationship("Agent", back_populates="expertise")  # noqa: F821
+    agent: Mapped["Agent"] = relationship(  # noqa: F821
+        "Agent", back_populates="expertise", lazy="raise_on_sql"
+    )
 
 
 class AgentClaimBookmark(Base):
@@ -51,8 +53,17 @@ class AgentClaimBookmark(Base):
     )
 
     # Relationships
-    agent: Mapped["Agent"] = relationship("Agent", back_populates="bookmarks")  # noqa: F821
-    claim: Mapped["Claim"] = relationship("Claim", back_populates="bookmarked_by")  # noqa: F821
+    agent: Mapped["Agent"] = relationship(  # noqa: F821
+        "Agent", back_populates="bookmarks", lazy="raise_on_sql"
+    )
+    claim: Mapped["Claim"] = relationship(  # noqa: F821
+        "Claim", back_populates="bookmarked_by", lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        # Keyset pagination of an agent's bookmarks, newest first
+        Index("ix_bookmarks_agent_created", "agent_id", "created_at", "claim_id"),
+    )
 
 
 class AgentClaimFollow(Base):
@@ -76,5 +87,14 @@ class AgentClaimFollow(Base):
     )
 
     # Relationships
-    agent: Mapped["Agent"] = relationship("Agent", back_populates="follows")  # noqa: F821
-    claim: Mapped["Claim"] = relationship("Claim", back_populates="followed_by")  # noqa: F821
+    agent: Mapped["Agent"] = relationship(  # noqa: F821
+        "Agent", back_populates="follows", lazy="raise_on_sql"
+    )
+    claim: Mapped["Claim"] = relationship(  # noqa: F821
+        "Claim", back_populates="followed_by", lazy="raise_on_sql"
+    )
+
+    __table_args__ = (
+        # Keyset pagination of an agent's follows, newest first
+        Index("ix_follows_agent_created", "agent_id", "created_at", "claim_id"),
+    )
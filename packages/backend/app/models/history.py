@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import DateTime, Enum, Float, ForeignKey, Index, String, Text
+from sqlalchemy import DDL, DateTime, Enum, Float, ForeignKey, Index, String, Text, event, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -12,6 +12,8 @@ from app.core.database import Base
 class GradientHistory(Base):
     """
     Time series of gradient values for a claim.
+
+    Partitioned by month of recorded_at; see PartitionService.
     """
 
     __tablename__ = "gradient_history"
@@ -24,17 +26,24 @@ class GradientHistory(Base):
     )
     gradient: Mapped[float] = mapped_column(Float, nullable=False)
     vote_count: Mapped[int] = mapped_column(nullable=False)
+    # The partition key, so part of the primary key
     recorded_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
     )
 
     # Relationships
-    claim: Mapped["Claim"] = relationship("Claim", back_populates="gradient_history")  # noqa: F821
+    claim: Mapped["Claim"] = relationship(  # noqa: F821
+        "Claim", back_populates="gradient_history", lazy="raise_on_sql"
+    )
 
     __table_args__ = (
         Index("ix_gradient_history_claim_id", "claim_id"),
         Index("ix_gradient_history_recorded_at", "recorded_at"),
         Index("ix_gradient_history_claim_time", "claim_id", "recorded_at"),
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
     )
 
 
@@ -50,6 +59,8 @@ class ReputationChangeReason(str, enum.Enum):
 class ReputationHistory(Base):
     """
     Audit trail for reputation changes.
+
+    Partitioned by month of recorded_at; see PartitionService.
     """
 
     __tablename__ = "reputation_history"
@@ -72,12 +83,31 @@ class ReputationHistory(Base):
     )  # Evidence or claim ID
     reference_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # The partition key, so part of the primary key
     recorded_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), default=lambda: datetime.now(UTC)
+        DateTime(timezone=True),
+        primary_key=True,
+        default=lambda: datetime.now(UTC),
+        server_default=func.now(),
     )
 
     __table_args__ = (
         Index("ix_reputation_history_agent_id", "agent_id"),
         Index("ix_reputation_history_recorded_at", "recorded_at"),
         Index("ix_reputation_history_agent_time", "agent_id", "recorded_at"),
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
     )
+
+
+# Migrations install these too; attaching them here keeps create_all() schemas equivalent.
+# The default partitions catch rows outside the monthly partitions.
+event.listen(
+    GradientHistory.__table__,
+    "after_create",
+    DDL("CREATE TABLE gradient_history_default PARTITION OF gradient_history DEFAULT"),
+)
+event.listen(
+    ReputationHistory.__table__,
+    "after_create",
+    DDL("CREATE TABLE reputation_history_default PARTITION OF reputation_history DEFAULT"),
+)
@@ -33,8 +33,8 @@ class Human(Base):
 
     # Relationships
     agents: Mapped[list["Agent"]] = relationship(  # noqa: F821
-        "Agent", back_populates="human", lazy="selectin"
+        "Agent", back_populates="human", lazy="raise"
     )
     refresh_tokens: Mapped[list["RefreshToken"]] = relationship(  # noqa: F821
-        "RefreshToken", back_populates="human", lazy="selectin"
+        "RefreshToken", back_populates="human", lazy="raise"
     )
@@ -1,9 +1,22 @@
 import enum
 import uuid
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -20,9 +33,37 @@ class NotificationType(str, enum.Enum):
     CLAIM_MILESTONE = "claim_milestone"
 
 
+# Types that collapse into a single unread row per (agent, type, reference).
+# Later events bump event_count and recent_actor_ids instead of inserting.
+AGGREGATED_NOTIFICATION_TYPES = (
+    NotificationType.EVIDENCE_UPVOTED,
+    NotificationType.EVIDENCE_DOWNVOTED,
+)
+
+# Predicate of the partial unique index that backs aggregation upserts
+AGGREGATION_INDEX_WHERE = text(
+    "is_read = false AND type IN ("
+    + ", ".join(f"'{t.value}'" for t in AGGREGATED_NOTIFICATION_TYPES)
+    + ")"
+)
+
+
+def month_of(moment: datetime) -> date:
+    """First day of a moment's month, in UTC."""
+    return moment.astimezone(UTC).date().replace(day=1)
+
+
+def _created_month(context) -> date:
+    return month_of(context.get_current_parameters().get("created_at") or datetime.now(UTC))
+
+
 class Notification(Base):
     """
     Notification for an agent about activity on their content.
+
+    Partitioned by created_month, the month the row was first created in;
+    see PartitionService. Unlike created_at it never changes, so aggregated
+    rows stay in their partition.
     """
 
     __tablename__ = "notifications"
@@ -51,17 +92,31 @@ class Notification(Base):
         UUID(as_uuid=True), ForeignKey("agents.id"), nullable=True
     )
 
+    # Aggregation: number of events folded into this row and the most recent actors
+    event_count: Mapped[int] = mapped_column(Integer, default=1, server_default="1")
+    recent_actor_ids: Mapped[list[uuid.UUID]] = mapped_column(
+        ARRAY(UUID(as_uuid=True)), default=list, server_default="{}"
+    )
+
     is_read: Mapped[bool] = mapped_column(Boolean, default=False)
+    # For aggregated rows this is the time of the latest event
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
     )
+    # The partition key, so part of the primary key
+    created_month: Mapped[date] = mapped_column(
+        Date,
+        primary_key=True,
+        default=_created_month,
+        server_default=text("date_trunc('month', now() AT TIME ZONE 'UTC')::date"),
+    )
 
     # Relationships
     agent: Mapped["Agent"] = relationship(  # noqa: F821
-        "Agent", foreign_keys=[agent_id], back_populates="notifications"
+        "Agent", foreign_keys=[agent_id], back_populates="notifications", lazy="raise_on_sql"
     )
     actor: Mapped["Agent | None"] = relationship(  # noqa: F821
-        "Agent", foreign_keys=[actor_agent_id]
+        "Agent", foreign_keys=[actor_agent_id], lazy="raise_on_sql"
     )
 
     __table_args__ = (
@@ -69,4 +124,25 @@ class Notification(Base):
         Index("ix_notifications_created_at", "created_at"),
         Index("ix_notifications_is_read", "is_read"),
         Index("ix_notifications_agent_read_created", "agent_id", "is_read", "created_at"),
+        Index("ix_notifications_agent_created_id", "agent_id", "created_at", "id"),
+        # Unique indexes must include the partition key, so unread events
+        # are aggregated per month
+        Index(
+            "uq_notifications_unread_aggregate",
+            "agent_id",
+            "type",
+            "reference_id",
+            "created_month",
+            unique=True,
+            postgresql_where=AGGREGATION_INDEX_WHERE,
+        ),
+        {"postgresql_partition_by": "RANGE (created_month)"},
     )
+
+
+# Migrations install this too; attaching it here keeps create_all() schemas equivalent
+event.listen(
+    Notification.__table__,
+    "after_create",
+    DDL("CREATE TABLE notifications_default PARTITION OF notifications DEFAULT"),
+)
@@ -0,0 +1,137 @@
+from sqlalchemy import DDL, BigInteger, SmallInteger, String, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class PlatformCounter(Base):
+    """
+    Platform-wide row counts, maintained by triggers.
+
+    Each counter is spread over several shard rows, chosen by backend
+    process, so concurrent transactions rarely update the same row. A
+    counter's value is the sum of its shards.
+    """
+
+    __tablename__ = "platform_counters"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    shard: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+
+
+COUNTER_SHARDS = 16
+
+COUNTER_ADD_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION platform_counter_add(counter text, delta bigint)
+RETURNS void AS $$
+    INSERT INTO platform_counters (name, shard, value)
+    VALUES (counter, mod(pg_backend_pid(), {COUNTER_SHARDS}), delta)
+    ON CONFLICT (name, shard) DO UPDATE SET value = platform_counters.value + EXCLUDED.value
+$$ LANGUAGE sql
+"""
+
+# Statement-level, so a multi-row insert or delete updates a counter once
+COUNT_INSERTS_FUNCTION = """
+CREATE OR REPLACE FUNCTION platform_counters_count_inserts() RETURNS trigger AS $$
+DECLARE
+    n bigint;
+BEGIN
+    SELECT count(*) INTO n FROM inserted_rows;
+    IF n > 0 THEN
+        PERFORM platform_counter_add(TG_ARGV[0], n);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+COUNT_DELETES_FUNCTION = """
+CREATE OR REPLACE FUNCTION platform_counters_count_deletes() RETURNS trigger AS $$
+DECLARE
+    n bigint;
+BEGIN
+    SELECT count(*) INTO n FROM deleted_rows;
+    IF n > 0 THEN
+        PERFORM platform_counter_add(TG_ARGV[0], -n);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+CONSENSUS_FUNCTION = """
+CREATE OR REPLACE FUNCTION claim_at_consensus(gradient double precision)
+RETURNS boolean AS $$
+    SELECT gradient > 0.8 OR gradient < 0.2
+$$ LANGUAGE sql IMMUTABLE
+"""
+
+CONSENSUS_TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION claims_consensus_count() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND claim_at_consensus(NEW.gradient)) THEN
+        PERFORM platform_counter_add('claims_at_consensus', 1);
+    ELSE
+        PERFORM platform_counter_add('claims_at_consensus', -1);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+# Row counts are kept under the table's name
+COUNTED_TABLES = ("claims", "agents", "claim_votes")
+
+COUNT_TRIGGERS = [
+    ddl
+    for table in COUNTED_TABLES
+    for ddl in (
+        f"""
+CREATE TRIGGER {table}_count_inserts
+AFTER INSERT ON {table} REFERENCING NEW TABLE AS inserted_rows
+FOR EACH STATEMENT EXECUTE FUNCTION platform_counters_count_inserts('{table}')
+""",
+        f"""
+CREATE TRIGGER {table}_count_deletes
+AFTER DELETE ON {table} REFERENCING OLD TABLE AS deleted_rows
+FOR EACH STATEMENT EXECUTE FUNCTION platform_counters_count_deletes('{table}')
+""",
+    )
+]
+
+# Only fire when a claim enters or leaves consensus, not on every gradient update
+CONSENSUS_TRIGGERS = [
+    """
+CREATE TRIGGER claims_consensus_insert
+AFTER INSERT ON claims
+FOR EACH ROW WHEN (claim_at_consensus(NEW.gradient))
+EXECUTE FUNCTION claims_consensus_count()
+""",
+    """
+CREATE TRIGGER claims_consensus_delete
+AFTER DELETE ON claims
+FOR EACH ROW WHEN (claim_at_consensus(OLD.gradient))
+EXECUTE FUNCTION claims_consensus_count()
+""",
+    """
+CREATE TRIGGER claims_consensus_update
+AFTER UPDATE OF gradient ON claims
+FOR EACH ROW
+WHEN (claim_at_consensus(OLD.gradient) IS DISTINCT FROM claim_at_consensus(NEW.gradient))
+EXECUTE FUNCTION claims_consensus_count()
+""",
+]
+
+# Migrations install these too; attaching them here keeps create_all() schemas equivalent.
+# The triggers live on other tables, so they are added once every table exists.
+for _ddl in (
+    COUNTER_ADD_FUNCTION,
+    COUNT_INSERTS_FUNCTION,
+    COUNT_DELETES_FUNCTION,
+    CONSENSUS_FUNCTION,
+    CONSENSUS_TRIGGER_FUNCTION,
+    *COUNT_TRIGGERS,
+    *CONSENSUS_TRIGGERS,
+):
+    event.listen(Base.metadata, "after_create", DDL(_ddl))
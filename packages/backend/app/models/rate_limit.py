@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Date, DateTime, Enum, ForeignKey, Index, Integer
+from sqlalchemy import DDL, Date, DateTime, Enum, ForeignKey, Index, Integer, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -20,6 +20,8 @@ class ActionType(str, enum.Enum):
 class RateLimitCounter(Base):
     """
     Daily action counts for rate limiting.
+
+    Partitioned by month of date; see PartitionService.
     """
 
     __tablename__ = "rate_limit_counters"
@@ -35,7 +37,8 @@ class RateLimitCounter(Base):
         nullable=False
     )
     count: Mapped[int] = mapped_column(Integer, default=0)
-    date: Mapped[datetime] = mapped_column(Date, nullable=False)
+    # The partition key, so part of the primary key
+    date: Mapped[datetime] = mapped_column(Date, primary_key=True)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC),
@@ -44,4 +47,13 @@ class RateLimitCounter(Base):
 
     __table_args__ = (
         Index("ix_rate_limit_agent_action_date", "agent_id", "action_type", "date", unique=True),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
+
+
+# Migrations install this too; attaching it here keeps create_all() schemas equivalent
+event.listen(
+    RateLimitCounter.__table__,
+    "after_create",
+    DDL("CREATE TABLE rate_limit_counters_default PARTITION OF rate_limit_counters DEFAULT"),
+)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String
+from sqlalchemy import DDL, Boolean, DateTime, ForeignKey, Index, String, event
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -11,6 +11,10 @@ from app.core.database import Base
 class RefreshToken(Base):
     """
     Refresh tokens for auth session management.
+
+    Partitioned by month of expiry, so expired tokens are dropped a
+    partition at a time; see PartitionService. Unique indexes would have to
+    include the expiry, so token hashes are indexed but not unique.
     """
 
     __tablename__ = "refresh_tokens"
@@ -21,11 +25,12 @@ class RefreshToken(Base):
     human_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("humans.id"), nullable=False
     )
-    token_hash: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    token_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     user_agent: Mapped[str | None] = mapped_column(String(500), nullable=True)
     ip_address: Mapped[str | None] = mapped_column(String(45), nullable=True)
     is_revoked: Mapped[bool] = mapped_column(Boolean, default=False)
-    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # The partition key, so part of the primary key
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), primary_key=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), default=lambda: datetime.now(UTC)
     )
@@ -34,10 +39,21 @@ class RefreshToken(Base):
     )
 
     # Relationships
-    human: Mapped["Human"] = relationship("Human", back_populates="refresh_tokens")  # noqa: F821
+    human: Mapped["Human"] = relationship(  # noqa: F821
+        "Human", back_populates="refresh_tokens", lazy="raise_on_sql"
+    )
 
     __table_args__ = (
         Index("ix_refresh_tokens_human_id", "human_id"),
         Index("ix_refresh_tokens_token_hash", "token_hash"),
         Index("ix_refresh_tokens_expires_at", "expires_at"),
+        {"postgresql_partition_by": "RANGE (expires_at)"},
     )
+
+
+# Migrations install this too; attaching it here keeps create_all() schemas equivalent
+event.listen(
+    RefreshToken.__table__,
+    "after_create",
+    DDL("CREATE TABLE refresh_tokens_default PARTITION OF refresh_tokens DEFAULT"),
+)
@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from app.models.claim import ComplexityTier
 from app.schemas.agent import AgentPublic
@@ -14,10 +14,60 @@ class ClaimCreate(BaseModel):
     parent_ids: list[UUID] = Field(default_factory=list, max_length=5)
 
 
+class ClaimImportLine(ClaimCreate):
+    """One NDJSON line of a bulk claim import."""
+
+    key: str | None = Field(None, min_length=1, max_length=100)  # Client key for parent_keys
+    parent_keys: list[str] = Field(default_factory=list, max_length=5)  # Keys of earlier lines
+
+    @field_validator("tags")
+    @classmethod
+    def tags_fit_column(cls, tags: list[str]) -> list[str]:
+        if any(len(tag) > 50 for tag in tags):
+            raise ValueError("Tags must be at most 50 characters")
+        return tags
+
+
+class ClaimImportError(BaseModel):
+    line: int
+    error: str
+
+
+class ClaimImportResponse(BaseModel):
+    created: int
+    failed: int
+    errors: list[ClaimImportError]  # Capped at settings.claim_import_max_errors
+
+
 class ClaimVoteCreate(BaseModel):
     value: float = Field(..., ge=0.0, le=1.0)
 
 
+MAX_VOTE_BATCH_SIZE = 100
+
+
+class ClaimBatchVoteItem(BaseModel):
+    claim_id: UUID
+    value: float = Field(..., ge=0.0, le=1.0)
+
+
+class ClaimBatchVoteCreate(BaseModel):
+    votes: list[ClaimBatchVoteItem] = Field(..., min_length=1, max_length=MAX_VOTE_BATCH_SIZE)
+
+
+class ClaimBatchVoteResult(BaseModel):
+    claim_id: UUID
+    success: bool
+    error: str | None = None  # Why this vote was rejected
+    gradient: float | None = None  # The claim's gradient after the batch
+
+
+class ClaimBatchVoteResponse(BaseModel):
+    results: list[ClaimBatchVoteResult]  # In request order
+    accepted: int
+    rejected: int
+
+
 class GradientHistoryEntry(BaseModel):
     gradient: float
     vote_count: int
@@ -67,6 +117,7 @@ class ClaimSearchParams(BaseModel):
 
 class ClaimListResponse(BaseModel):
     claims: list[ClaimResponse]
-    total: int
+    total: int | None = None  # Only computed when include_total is set
+    total_estimated: bool = False  # True when total is a planner estimate
     limit: int
-    offset: int
+    next_cursor: str | None = None
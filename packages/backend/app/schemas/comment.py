@@ -63,7 +63,9 @@ class CommentListResponse(BaseModel):
     """Response containing a list of comments."""
 
     comments: list[CommentWithReplies]
-    total: int
+    total: int | None = None  # Only computed when include_total is set
+    total_estimated: bool = False  # True when total is a planner estimate
+    next_cursor: str | None = None
 
 
 # Enable forward reference resolution
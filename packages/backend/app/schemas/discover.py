@@ -99,7 +99,9 @@ class TopicClaimsResponse(BaseModel):
 
     tag: str
     claims: list[TrendingClaim]
-    total: int
+    total: int | None = None  # Only computed when include_total is set
+    total_estimated: bool = False  # True when total is a planner estimate
+    next_cursor: str | None = None
 
 
 class ActivityItem(BaseModel):
@@ -50,17 +50,47 @@ class EvidenceResponse(BaseModel):
 
 class EvidenceListResponse(BaseModel):
     evidence: list[EvidenceResponse]
-    total: int
+    total: int | None = None  # Only computed when include_total is set
+    total_estimated: bool = False  # True when total is a planner estimate
+    next_cursor: str | None = None
 
 
 class FileUploadRequest(BaseModel):
     file_name: str = Field(..., min_length=1, max_length=255)
     content_type: str = Field(..., min_length=1, max_length=100)
+    sha256: str = Field(..., pattern="^[0-9a-f]{64}$")  # Hex digest of the file
+    file_size: int = Field(..., gt=0)
+
+
+class UploadPartURL(BaseModel):
+    part_number: int
+    upload_url: str  # Presigned S3 URL for PUT
 
 
 class FileUploadResponse(BaseModel):
-    upload_url: str  # Presigned S3 URL for POST
-    fields: dict[str, str]  # Form fields to include with upload
-    file_key: str
-    expires_in: int  # seconds
+    file_key: str  # Content-addressed key to submit with the evidence
+    already_exists: bool = False  # Content is already stored; skip the upload
+    upload_id: str | None = None
+    # Single-request uploads: presigned POST
+    upload_url: str | None = None
+    fields: dict[str, str] | None = None  # Form fields to include with upload
+    # Multipart uploads: PUT each part (in any order, in parallel)
+    part_size: int | None = None
+    parts: list[UploadPartURL] | None = None
+    expires_in: int | None = None  # seconds
     max_size: int  # Maximum file size in bytes
+
+
+class UploadSessionResponse(BaseModel):
+    upload_id: str
+    file_key: str
+    part_size: int
+    uploaded_parts: list[int]
+    parts: list[UploadPartURL]  # URLs for the parts still missing
+    expires_in: int
+
+
+class UploadCompleteResponse(BaseModel):
+    file_key: str
+    sha256: str
+    file_size: int
@@ -16,7 +16,9 @@ class NotificationResponse(BaseModel):
     message: str
     reference_id: UUID | None
     reference_type: str | None
-    actor: AgentPublic | None
+    actor: AgentPublic | None  # Most recent actor for aggregated notifications
+    event_count: int = 1
+    recent_actor_ids: list[UUID] = []
     is_read: bool
     created_at: datetime
 
@@ -28,8 +30,9 @@ class NotificationListResponse(BaseModel):
     """Response containing a list of notifications."""
 
     notifications: list[NotificationResponse]
-    total: int
+    total: int | None = None  # Only known when listing unread notifications
     unread_count: int
+    next_cursor: str | None = None
 
 
 class MarkReadRequest(BaseModel):
@@ -0,0 +1,89 @@
+"""
+CDN invalidation for changed API responses.
+
+Write paths queue the surrogate keys of the resources they change (see
+app.core.http_cache); the worker drains the queue in batches and turns the
+keys into one CloudFront invalidation per batch. CloudFront has no native
+surrogate keys, so each key maps to the paths that serve it. Cached
+aggregates are not purged; they expire on their s-maxage.
+"""
+
+import asyncio
+import logging
+import uuid
+from functools import lru_cache
+
+import boto3
+import redis.asyncio as redis
+
+from app.core.config import settings
+from app.core.http_cache import CDN_PURGE_QUEUE
+
+logger = logging.getLogger(__name__)
+
+# Resource type -> path (under the API prefix) of the route that serves it.
+# The trailing wildcard covers every query string variant.
+SURROGATE_KEY_PATHS = {
+    "claim": "/claims/{}*",
+}
+
+
+def surrogate_key_paths(key: str) -> list[str]:
+    """CDN paths to invalidate for a surrogate key."""
+    resource_type, _, resource_id = key.partition(":")
+    template = SURROGATE_KEY_PATHS.get(resource_type)
+    if template is None or not resource_id:
+        return []
+    return [settings.api_v1_prefix + template.format(resource_id)]
+
+
+@lru_cache(maxsize=1)
+def get_cloudfront_client():
+    """Get the shared CloudFront client, creating it on first use."""
+    kwargs = {'region_name': settings.aws_region}
+    if settings.aws_access_key_id and settings.aws_secret_access_key:
+        kwargs['aws_access_key_id'] = settings.aws_access_key_id
+        kwargs['aws_secret_access_key'] = settings.aws_secret_access_key
+    return boto3.client('cloudfront', **kwargs)
+
+
+class CdnPurgeService:
+    """
+    Service for purging changed resources from the CDN.
+    """
+
+    def __init__(self, redis_client: redis.Redis):
+        self.redis = redis_client
+
+    async def purge_pending(self) -> int:
+        """
+        Invalidate the paths of up to cdn_purge_batch_size queued surrogate keys.
+
+        Keys are put back on the queue if the invalidation fails.
+
+        Returns:
+            Number of paths invalidated
+        """
+        keys = await self.redis.spop(CDN_PURGE_QUEUE, settings.cdn_purge_batch_size)
+        if not keys or not settings.cloudfront_distribution_id:
+            return 0
+
+        paths = sorted({path for key in keys for path in surrogate_key_paths(key)})
+        if not paths:
+            return 0
+
+        try:
+            await asyncio.to_thread(
+                get_cloudfront_client().create_invalidation,
+                DistributionId=settings.cloudfront_distribution_id,
+                InvalidationBatch={
+                    'Paths': {'Quantity': len(paths), 'Items': paths},
+                    'CallerReference': str(uuid.uuid4()),
+                },
+            )
+        except Exception:
+            await self.redis.sadd(CDN_PURGE_QUEUE, *keys)
+            raise
+
+        logger.info(f"Invalidated {len(paths)} CDN paths")
+        return len(paths)
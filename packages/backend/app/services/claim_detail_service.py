@@ -0,0 +1,177 @@
+"""
+Read model for the claim detail page.
+
+The whole page is one statement that selects only the columns the response
+needs: the claim and its author, the caller's vote, the most recent gradient
+history entries and parent claim summaries, the last two aggregated to JSON
+in correlated subqueries. No ORM entities or relationships are loaded, and
+the cost does not grow with the number of votes on the claim.
+
+Pages embed their parents' gradient and counters, so changes to those bump
+the children's version stamps too (see bump_claims_on_commit).
+"""
+
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import func, literal, null, select, text
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.http_cache import bump_versions_on_commit
+from app.models.agent import Agent
+from app.models.claim import Claim, ClaimParent, ClaimVote
+from app.models.history import GradientHistory
+
+EMPTY_JSON_ARRAY = text("'[]'::json")
+
+
+async def bump_claims_on_commit(
+    db: AsyncSession, redis_client: redis.Redis, *claim_ids: UUID
+) -> None:
+    """
+    Bump claims' version stamps once the transaction commits, along with
+    those of the claims whose pages show them as parents.
+    """
+    result = await db.execute(
+        select(ClaimParent.child_id).where(ClaimParent.parent_id.in_(claim_ids))
+    )
+    changed = {*claim_ids, *result.scalars()}
+    bump_versions_on_commit(db, redis_client, *(f"claim:{claim_id}" for claim_id in changed))
+
+
+def _agent_json(agent) -> func.json_build_object:
+    """Build an AgentPublic-shaped JSON object from an Agent alias."""
+    return func.json_build_object(
+        "id", agent.id,
+        "username", agent.username,
+        "display_name", agent.display_name,
+        "bio", agent.bio,
+        "avatar_url", agent.avatar_url,
+        "reputation_score", agent.reputation_score,
+        "tier", agent.tier,
+        "created_at", agent.created_at,
+    )
+
+
+class ClaimDetailService:
+    """
+    Service for loading claim detail pages.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_claim_detail(
+        self,
+        claim_id: UUID,
+        viewer_id: UUID | None = None,
+        history_limit: int = 100,
+    ) -> dict | None:
+        """
+        Load everything shown on a claim's page in one query.
+
+        Args:
+            claim_id: ID of the claim
+            viewer_id: The calling agent, whose vote is included
+            history_limit: Most recent gradient history entries to include
+
+        Returns:
+            dict shaped like ClaimWithHistory (authors as dicts), or None if
+            the claim does not exist
+        """
+        author = aliased(Agent)
+
+        if viewer_id:
+            user_vote = (
+                select(ClaimVote.value)
+                .where(ClaimVote.claim_id == claim_id, ClaimVote.agent_id == viewer_id)
+                .scalar_subquery()
+            )
+        else:
+            user_vote = null()
+
+        recent = (
+            select(
+                GradientHistory.gradient,
+                GradientHistory.vote_count,
+                GradientHistory.recorded_at,
+            )
+            .where(GradientHistory.claim_id == claim_id)
+            .order_by(GradientHistory.recorded_at.desc())
+            .limit(history_limit)
+            .subquery("recent")
+        )
+        history = select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(
+                    func.json_build_object(
+                        "gradient", recent.c.gradient,
+                        "vote_count", recent.c.vote_count,
+                        "recorded_at", recent.c.recorded_at,
+                    ),
+                    recent.c.recorded_at.desc(),
+                )),
+                EMPTY_JSON_ARRAY,
+                type_=JSON,
+            )
+        ).scalar_subquery()
+
+        parent = aliased(Claim)
+        parent_author = aliased(Agent)
+        parents = (
+            select(
+                func.coalesce(
+                    func.json_agg(aggregate_order_by(
+                        func.json_build_object(
+                            "id", parent.id,
+                            "statement", parent.statement,
+                            "author", _agent_json(parent_author),
+                            "gradient", parent.gradient,
+                            "complexity_tier", parent.complexity_tier,
+                            "tags", func.coalesce(parent.tags, literal([], parent.tags.type)),
+                            "vote_count", parent.vote_count,
+                            "evidence_count", parent.evidence_count,
+                            "created_at", parent.created_at,
+                            "updated_at", parent.updated_at,
+                        ),
+                        ClaimParent.created_at,
+                    )),
+                    EMPTY_JSON_ARRAY,
+                    type_=JSON,
+                )
+            )
+            .select_from(ClaimParent)
+            .join(parent, parent.id == ClaimParent.parent_id)
+            .join(parent_author, parent_author.id == parent.author_agent_id)
+            .where(ClaimParent.child_id == claim_id)
+            .scalar_subquery()
+        )
+
+        result = await self.db.execute(
+            select(
+                Claim.id,
+                Claim.statement,
+                _agent_json(author).label("author"),
+                Claim.gradient,
+                Claim.complexity_tier,
+                Claim.tags,
+                Claim.vote_count,
+                Claim.evidence_count,
+                Claim.created_at,
+                Claim.updated_at,
+                user_vote.label("user_vote"),
+                history.label("gradient_history"),
+                parents.label("parent_claims"),
+            )
+            .join(author, author.id == Claim.author_agent_id)
+            .where(Claim.id == claim_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        detail = row._asdict()
+        detail["tags"] = detail["tags"] or []
+        return detail
@@ -0,0 +1,99 @@
+"""
+Count strategies for list endpoint totals.
+
+Exact totals are expensive for large or broad result sets, so list
+endpoints pick the cheapest source that is good enough:
+- Maintained counters (e.g. Claim.public_evidence_count) are exact and free.
+- Planner estimates (EXPLAIN row estimates) for broad queries, where the
+  exact number is neither cheap nor meaningful to the reader.
+- Exact COUNTs cached for a short TTL, keyed by the normalized filters, for
+  narrow queries where estimates are unreliable.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any
+
+import redis.asyncio as redis
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import filters_digest
+from app.core.config import settings
+
+
+@dataclass
+class CountResult:
+    """A list total and whether it is a planner estimate."""
+
+    value: int
+    estimated: bool = False
+
+
+class CountService:
+    """
+    Service for computing list totals.
+    """
+
+    CACHE_PREFIX = "count:"
+
+    def __init__(self, db: AsyncSession, redis_client: redis.Redis):
+        self.db = db
+        self.redis = redis_client
+
+    async def cached_count(
+        self, namespace: str, filters: dict[str, Any], query: Select
+    ) -> CountResult:
+        """
+        Exact count of the rows a query returns, cached by normalized filters.
+
+        Args:
+            namespace: Identifies the list (e.g. "claims:search")
+            filters: Everything that determines the result set
+            query: The unpaginated row query
+        """
+        cache_key = self._cache_key(namespace, filters)
+        cached = await self.redis.get(cache_key)
+        if cached is not None:
+            return CountResult(int(cached))
+
+        result = await self.db.execute(
+            select(func.count()).select_from(query.order_by(None).subquery())
+        )
+        count = result.scalar() or 0
+
+        await self.redis.setex(cache_key, settings.count_cache_ttl, str(count))
+        return CountResult(count)
+
+    async def estimated_count(
+        self, namespace: str, filters: dict[str, Any], query: Select
+    ) -> CountResult:
+        """
+        Planner estimate for broad queries, cached exact count otherwise.
+
+        Estimates below settings.count_estimate_threshold are too unreliable
+        to show, and those result sets are cheap to count exactly.
+        """
+        estimate = await self._planner_rows(query)
+        if estimate >= settings.count_estimate_threshold:
+            return CountResult(estimate, estimated=True)
+
+        return await self.cached_count(namespace, filters, query)
+
+    async def _planner_rows(self, query: Select) -> int:
+        """Get the planner's row estimate for a query without running it."""
+        conn = await self.db.connection()
+        compiled = query.order_by(None).compile(dialect=conn.dialect)
+        # Keep the parameters bound so the driver sends them with their types
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {compiled.string}", params
+        )
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def _cache_key(self, namespace: str, filters: dict[str, Any]) -> str:
+        """Build a cache key that is the same for equivalent filters."""
+        return f"{self.CACHE_PREFIX}{namespace}:{filters_digest(filters)}"
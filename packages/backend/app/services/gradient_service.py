@@ -4,13 +4,19 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 import redis.asyncio as redis
-from sqlalchemy import func, select
+from sqlalchemy import Float, column, select, update, values
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.config import settings
+from app.core.tiered_cache import TieredCache
 from app.models.agent import Agent
 from app.models.claim import Claim, ClaimVote
 from app.models.history import GradientHistory
+from app.services.claim_detail_service import bump_claims_on_commit
+
+gradient_cache = TieredCache("gradient", settings.gradient_cache_ttl)
 
 
 class GradientService:
@@ -33,15 +39,15 @@ class GradientService:
         cache_key = f"{self.CACHE_PREFIX}{claim_id}"
 
         # Try cache first
-        cached = await self.redis.get(cache_key)
+        cached = await gradient_cache.get(cache_key)
         if cached is not None:
-            return float(cached)
+            return cached
 
         # Compute gradient
         gradient = await self.compute_gradient(claim_id)
 
         # Cache the result
-        await self.redis.setex(cache_key, settings.gradient_cache_ttl, str(gradient))
+        await gradient_cache.set(cache_key, gradient)
 
         return gradient
 
@@ -87,7 +93,7 @@ class GradientService:
     async def invalidate_cache(self, claim_id: UUID) -> None:
         """Invalidate the cached gradient for a claim."""
         cache_key = f"{self.CACHE_PREFIX}{claim_id}"
-        await self.redis.delete(cache_key)
+        await gradient_cache.delete(cache_key)
 
     async def update_gradient(self, claim_id: UUID) -> float:
         """
@@ -110,10 +116,11 @@ class GradientService:
                 recorded_at=datetime.now(UTC),
             )
             self.db.add(history_entry)
+            await bump_claims_on_commit(self.db, self.redis, claim_id)
 
-        # Update cache
+        # Update cache, and drop other processes' copies
         cache_key = f"{self.CACHE_PREFIX}{claim_id}"
-        await self.redis.setex(cache_key, settings.gradient_cache_ttl, str(gradient))
+        await gradient_cache.set(cache_key, gradient, publish=True)
 
         return gradient
 
@@ -156,59 +163,107 @@ class GradientService:
         gradients = {}
 
         # Check cache for all claims
-        cache_keys = [f"{self.CACHE_PREFIX}{cid}" for cid in claim_ids]
-        cached_values = await self.redis.mget(cache_keys)
+        cached = await gradient_cache.get_many(f"{self.CACHE_PREFIX}{cid}" for cid in claim_ids)
 
         uncached_ids = []
-        for i, (claim_id, cached) in enumerate(zip(claim_ids, cached_values)):
-            if cached is not None:
-                gradients[claim_id] = float(cached)
+        for claim_id in claim_ids:
+            gradient = cached.get(f"{self.CACHE_PREFIX}{claim_id}")
+            if gradient is not None:
+                gradients[claim_id] = gradient
             else:
                 uncached_ids.append(claim_id)
 
         # Compute uncached gradients
         if uncached_ids:
-            # Batch fetch all votes for uncached claims
-            result = await self.db.execute(
-                select(
-                    ClaimVote.claim_id,
-                    ClaimVote.value,
-                    Agent.reputation_score,
-                )
-                .join(Agent, ClaimVote.agent_id == Agent.id)
-                .where(ClaimVote.claim_id.in_(uncached_ids))
+            computed = await self._compute_gradients(uncached_ids)
+            gradients.update(computed)
+            await gradient_cache.set_many({
+                f"{self.CACHE_PREFIX}{claim_id}": gradient
+                for claim_id, gradient in computed.items()
+            })
+
+        return gradients
+
+    async def update_gradients(self, claim_ids: list[UUID]) -> dict[UUID, float]:
+        """
+        Recompute gradients for several claims at once, as update_gradient() does.
+
+        Votes for all claims are fetched in one query, all gradients are
+        written in one UPDATE, and each claim gets a single history entry
+        however many of its votes changed. Claims already loaded in the
+        session get the gradient, vote count and update time the UPDATE
+        returns, so counters changed in SQL are not read stale.
+        """
+        gradients = await self._compute_gradients(claim_ids)
+
+        new_values = values(
+            column("id", PG_UUID(as_uuid=True)), column("gradient", Float), name="new_values"
+        ).data(list(gradients.items()))
+        result = await self.db.execute(
+            update(Claim)
+            .where(Claim.id == new_values.c.id)
+            .values(gradient=new_values.c.gradient)
+            .returning(Claim.id, Claim.gradient, Claim.vote_count, Claim.updated_at),
+            execution_options={"synchronize_session": False},
+        )
+
+        now = datetime.now(UTC)
+        updated = result.all()
+        for claim_id, gradient, vote_count, updated_at in updated:
+            self.db.add(GradientHistory(
+                claim_id=claim_id,
+                gradient=gradient,
+                vote_count=vote_count,
+                recorded_at=now,
+            ))
+            claim = self.db.identity_map.get(self.db.identity_key(Claim, claim_id))
+            if claim is not None:
+                set_committed_value(claim, "gradient", gradient)
+                set_committed_value(claim, "vote_count", vote_count)
+                set_committed_value(claim, "updated_at", updated_at)
+        await gradient_cache.set_many(
+            {f"{self.CACHE_PREFIX}{row.id}": row.gradient for row in updated},
+            publish=True,
+        )
+        if updated:
+            await bump_claims_on_commit(self.db, self.redis, *(row.id for row in updated))
+
+        return gradients
+
+    async def _compute_gradients(self, claim_ids: list[UUID]) -> dict[UUID, float]:
+        """Compute gradients for several claims from one batched vote query."""
+        result = await self.db.execute(
+            select(
+                ClaimVote.claim_id,
+                ClaimVote.value,
+                Agent.reputation_score,
             )
-            votes = result.all()
-
-            # Group votes by claim
-            votes_by_claim: dict[UUID, list[tuple[float, float]]] = {}
-            for claim_id, vote_value, rep_score in votes:
-                if claim_id not in votes_by_claim:
-                    votes_by_claim[claim_id] = []
-                votes_by_claim[claim_id].append((vote_value, rep_score))
-
-            # Compute gradients for each claim
-            pipeline = self.redis.pipeline()
-            for claim_id in uncached_ids:
-                claim_votes = votes_by_claim.get(claim_id, [])
-                if not claim_votes:
-                    gradient = 0.5
-                else:
-                    weighted_sum = 0.0
-                    weight_total = 0.0
-                    for vote_value, rep_score in claim_votes:
-                        weight = max(0.1, math.log(1 + max(0, rep_score)))
-                        weighted_sum += weight * vote_value
-                        weight_total += weight
-                    gradient = weighted_sum / weight_total if weight_total > 0 else 0.5
+            .join(Agent, ClaimVote.agent_id == Agent.id)
+            .where(ClaimVote.claim_id.in_(claim_ids))
+        )
+        votes = result.all()
 
-                gradients[claim_id] = gradient
-                pipeline.setex(
-                    f"{self.CACHE_PREFIX}{claim_id}",
-                    settings.gradient_cache_ttl,
-                    str(gradient),
-                )
+        # Group votes by claim
+        votes_by_claim: dict[UUID, list[tuple[float, float]]] = {}
+        for claim_id, vote_value, rep_score in votes:
+            if claim_id not in votes_by_claim:
+                votes_by_claim[claim_id] = []
+            votes_by_claim[claim_id].append((vote_value, rep_score))
 
-            await pipeline.execute()
+        gradients = {}
+        for claim_id in claim_ids:
+            claim_votes = votes_by_claim.get(claim_id, [])
+            if not claim_votes:
+                gradient = 0.5
+            else:
+                weighted_sum = 0.0
+                weight_total = 0.0
+                for vote_value, rep_score in claim_votes:
+                    weight = max(0.1, math.log(1 + max(0, rep_score)))
+                    weighted_sum += weight * vote_value
+                    weight_total += weight
+                gradient = weighted_sum / weight_total if weight_total > 0 else 0.5
+
+            gradients[claim_id] = gradient
 
         return gradients
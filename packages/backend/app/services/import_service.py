@@ -0,0 +1,249 @@
+"""
+Bulk claim import from NDJSON.
+
+Lines are validated as they stream in and copied in chunks into a
+temporary staging table, so memory use does not grow with the size of the
+import. Once the stream ends, parent references are resolved with a few
+set-based statements over the staging table, and the surviving claims and
+parent links are inserted with one INSERT ... SELECT each.
+
+Parents are referenced either by ID (existing claims) or by the client key
+of an earlier line in the same import. Requiring key parents to come first
+rules out cycles.
+"""
+
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.schemas.claim import ClaimImportLine
+
+MAX_LINE_BYTES = 64 * 1024
+
+STAGING_COLUMNS = [
+    "line", "id", "client_key", "statement", "complexity_tier", "tags", "parent_ids", "parent_keys",
+]
+
+
+@dataclass
+class ImportReport:
+    """Outcome of an import, with the first errors by line."""
+
+    created: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def add_error(self, line: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < settings.claim_import_max_errors:
+            self.errors.append({'line': line, 'error': error})
+
+
+class ClaimImportService:
+    """
+    Service for importing claims in bulk.
+    """
+
+    STAGING_TABLE = "claim_import_staging"
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def import_ndjson(
+        self, agent_id: UUID, chunks: AsyncIterable[bytes]
+    ) -> ImportReport:
+        """
+        Import claims from an NDJSON byte stream.
+
+        Invalid lines are reported and skipped; everything else is created
+        in the current transaction.
+
+        Args:
+            agent_id: Author of the imported claims
+            chunks: Raw NDJSON bytes, split anywhere
+
+        Returns:
+            ImportReport with counts and per-line errors
+        """
+        report = ImportReport()
+        await self.db.execute(text(f"DROP TABLE IF EXISTS {self.STAGING_TABLE}"))
+        await self.db.execute(text(f"""
+            CREATE TEMPORARY TABLE {self.STAGING_TABLE} (
+                line integer PRIMARY KEY,
+                id uuid NOT NULL,
+                client_key text,
+                statement text NOT NULL,
+                complexity_tier text NOT NULL,
+                tags varchar(50)[] NOT NULL,
+                parent_ids uuid[] NOT NULL,
+                parent_keys text[] NOT NULL
+            ) ON COMMIT DROP
+        """))
+
+        records = []
+        async for line_number, line in self._lines(chunks):
+            if line_number > settings.claim_import_max_lines:
+                report.add_error(
+                    line_number,
+                    f"Imports are limited to {settings.claim_import_max_lines} lines",
+                )
+                break
+            if line is None or len(line) > MAX_LINE_BYTES:
+                report.add_error(line_number, "Line is too long")
+                continue
+            if not line.strip():
+                continue
+
+            try:
+                claim = ClaimImportLine.model_validate_json(line)
+            except ValidationError as e:
+                report.add_error(line_number, self._describe(e))
+                continue
+
+            records.append((
+                line_number,
+                uuid.uuid4(),
+                claim.key,
+                claim.statement,
+                claim.complexity_tier.value,
+                claim.tags,
+                claim.parent_ids,
+                claim.parent_keys,
+            ))
+            if len(records) >= settings.claim_import_chunk_size:
+                await self._copy(records)
+                records = []
+
+        if records:
+            await self._copy(records)
+
+        await self._reject_unresolved(report)
+        report.created = await self._insert_claims(agent_id)
+        await self.db.execute(text(f"DROP TABLE {self.STAGING_TABLE}"))
+
+        report.errors.sort(key=lambda e: e['line'])
+        return report
+
+    async def _lines(
+        self, chunks: AsyncIterable[bytes]
+    ) -> AsyncIterator[tuple[int, bytes | None]]:
+        """Split a byte stream into numbered lines; overlong lines come back as None."""
+        line_number = 0
+        pending = b""
+        overflow = False
+
+        async for chunk in chunks:
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                line_number += 1
+                yield line_number, None if overflow else line
+                overflow = False
+
+            # Drop the rest of a line that is already too long
+            if len(pending) > MAX_LINE_BYTES:
+                overflow = True
+                pending = b""
+
+        if pending or overflow:
+            yield line_number + 1, None if overflow else pending
+
+    async def _copy(self, records: list[tuple]) -> None:
+        """COPY a chunk of validated lines into the staging table."""
+        conn = await self.db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            self.STAGING_TABLE, records=records, columns=STAGING_COLUMNS
+        )
+
+    async def _reject_unresolved(self, report: ImportReport) -> None:
+        """Remove staged lines whose key or parents cannot be used, reporting each."""
+        table = self.STAGING_TABLE
+
+        result = await self.db.execute(text(f"""
+            DELETE FROM {table} s
+            USING {table} earlier
+            WHERE s.client_key = earlier.client_key AND earlier.line < s.line
+            RETURNING s.line, s.client_key
+        """))
+        for line, key in result.all():
+            report.add_error(line, f"Duplicate key '{key}'")
+
+        result = await self.db.execute(text(f"""
+            DELETE FROM {table} s
+            WHERE EXISTS (
+                SELECT 1 FROM unnest(s.parent_ids) AS p(id)
+                WHERE NOT EXISTS (SELECT 1 FROM claims c WHERE c.id = p.id)
+            )
+            RETURNING s.line
+        """))
+        for (line,) in result.all():
+            report.add_error(line, "Parent claim not found")
+
+        # Removing a line invalidates lines that use it as a parent, so repeat
+        # until nothing changes (at most once per level of nesting)
+        while True:
+            result = await self.db.execute(text(f"""
+                DELETE FROM {table} s
+                WHERE EXISTS (
+                    SELECT 1 FROM unnest(s.parent_keys) AS k(key)
+                    WHERE NOT EXISTS (
+                        SELECT 1 FROM {table} p
+                        WHERE p.client_key = k.key AND p.line < s.line
+                    )
+                )
+                RETURNING s.line
+            """))
+            rejected = result.all()
+            if not rejected:
+                break
+            for (line,) in rejected:
+                report.add_error(
+                    line, "Parent key does not match a valid earlier line of this import"
+                )
+
+    async def _insert_claims(self, agent_id: UUID) -> int:
+        """Create the staged claims and their parent links."""
+        table = self.STAGING_TABLE
+
+        result = await self.db.execute(
+            text(f"""
+                INSERT INTO claims (
+                    id, statement, author_agent_id, gradient, complexity_tier, tags,
+                    vote_count, evidence_count, public_evidence_count, root_comment_count,
+                    created_at, updated_at
+                )
+                SELECT
+                    id, statement, :agent_id, 0.5, complexity_tier::complexitytier, tags,
+                    0, 0, 0, 0, now(), now()
+                FROM {table}
+            """),
+            {'agent_id': agent_id},
+        )
+
+        await self.db.execute(text(f"""
+            INSERT INTO claim_parents (id, parent_id, child_id, created_at)
+            SELECT gen_random_uuid(), parent_id, child_id, now()
+            FROM (
+                SELECT p.id AS parent_id, s.id AS child_id
+                FROM {table} s CROSS JOIN LATERAL unnest(s.parent_ids) AS p(id)
+                UNION
+                SELECT p.id, s.id
+                FROM {table} s
+                CROSS JOIN LATERAL unnest(s.parent_keys) AS k(key)
+                JOIN {table} p ON p.client_key = k.key
+            ) links
+        """))
+
+        return result.rowcount
+
+    def _describe(self, error: ValidationError) -> str:
+        """Summarize a validation error as one line."""
+        first = error.errors()[0]
+        location = ".".join(str(part) for part in first['loc'])
+        return f"{location}: {first['msg']}" if location else first['msg']
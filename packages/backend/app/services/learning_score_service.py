@@ -7,6 +7,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.http_cache import bump_versions, bump_versions_on_commit
 from app.models.agent import Agent
 from app.models.claim import Claim, ClaimVote
 from app.models.expertise import AgentExpertise
@@ -284,6 +285,7 @@ class LearningScoreService:
 
             new_score = await self.calculate_learning_score(agent_id)
             results[agent_id] = new_score
+            bump_versions_on_commit(self.db, self.redis, f"agent:{agent_id}")
 
         return results
 
@@ -404,7 +406,10 @@ class LearningScoreService:
                 )
                 self.db.add(expertise)
 
+        bump_versions_on_commit(self.db, self.redis, f"agent:{agent_id}")
+
     async def invalidate_cache(self, agent_id: UUID) -> None:
         """Invalidate all learning score caches for an agent."""
         await self.redis.delete(f"{self.CACHE_PREFIX}score:{agent_id}")
         await self.redis.delete(f"{self.CACHE_PREFIX}expertise:{agent_id}")
+        await bump_versions(self.redis, f"agent:{agent_id}")
@@ -1,22 +1,52 @@
+import asyncio
+import logging
+from collections import Counter
 from datetime import UTC, datetime
 from uuid import UUID
 
 import redis.asyncio as redis
-from sqlalchemy import func, select, update
+from sqlalchemy import event, func, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, selectinload
 
 from app.core.config import settings
+from app.core.pagination import apply_keyset, split_page
 from app.models.agent import Agent, AgentTier
-from app.models.notification import Notification, NotificationType
+from app.models.notification import (
+    AGGREGATION_INDEX_WHERE,
+    Notification,
+    NotificationType,
+    month_of,
+)
+
+logger = logging.getLogger(__name__)
+
+# Session.info key of the unread count changes waiting for the transaction
+# to commit
+PENDING_UNREAD_DELTAS = "pending_unread_deltas"
+
+# Adjustments run as tasks after commit; keep references until they finish
+_unread_tasks: set[asyncio.Task] = set()
 
 
 class NotificationService:
     """
     Service for managing agent notifications.
+
+    The unread count is kept as a Redis counter that is adjusted in place
+    once the transaction creating or reading notifications commits. The
+    counter expires after `notification_count_cache_ttl`, at which point the
+    next read reconciles it against the database.
+
+    Evidence vote notifications are aggregated: while a matching unread row
+    exists for (agent, type, reference) from the same month, later events
+    bump its event_count and recent_actor_ids instead of inserting a new row.
     """
 
     CACHE_PREFIX = "notifications:"
+    MAX_RECENT_ACTORS = 5
 
     def __init__(self, db: AsyncSession, redis_client: redis.Redis):
         self.db = db
@@ -58,21 +88,87 @@ class NotificationService:
         )
         self.db.add(notification)
 
-        # Invalidate unread count cache
-        await self._invalidate_unread_cache(agent_id)
+        self._adjust_unread_count_on_commit(agent_id, 1)
 
         return notification
 
+    async def aggregate_notification(
+        self,
+        agent_id: UUID,
+        notification_type: NotificationType,
+        title: str,
+        message: str,
+        reference_id: UUID,
+        reference_type: str,
+        actor_agent_id: UUID,
+    ) -> UUID:
+        """
+        Create a notification, or fold it into the matching unread one
+        created this month.
+
+        Runs as a single INSERT ... ON CONFLICT against the partial unique
+        index on unread aggregated notifications. On conflict the existing
+        row's event_count is incremented, the actor is moved to the front of
+        recent_actor_ids and created_at is bumped to now, so the row sorts as
+        the latest activity. Title and message keep their original values.
+
+        Returns:
+            The ID of the inserted or updated notification
+        """
+        now = datetime.now(UTC)
+        stmt = insert(Notification).values(
+            agent_id=agent_id,
+            type=notification_type,
+            title=title,
+            message=message,
+            reference_id=reference_id,
+            reference_type=reference_type,
+            actor_agent_id=actor_agent_id,
+            recent_actor_ids=[actor_agent_id],
+            event_count=1,
+            is_read=False,
+            created_at=now,
+            created_month=month_of(now),
+        )
+        recent_actors = func.array_prepend(
+            stmt.excluded.actor_agent_id,
+            func.array_remove(Notification.recent_actor_ids, stmt.excluded.actor_agent_id),
+            type_=ARRAY(PG_UUID(as_uuid=True)),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["agent_id", "type", "reference_id", "created_month"],
+            index_where=AGGREGATION_INDEX_WHERE,
+            set_={
+                "event_count": Notification.event_count + 1,
+                "actor_agent_id": stmt.excluded.actor_agent_id,
+                "recent_actor_ids": recent_actors[1 : self.MAX_RECENT_ACTORS],
+                "created_at": stmt.excluded.created_at,
+            },
+        ).returning(
+            Notification.id,
+            # Folded rows have counted at least two events
+            (Notification.event_count == 1).label("inserted"),
+        )
+        result = await self.db.execute(stmt)
+        notification_id, inserted = result.one()
+
+        if inserted:
+            self._adjust_unread_count_on_commit(agent_id, 1)
+
+        return notification_id
+
     async def get_unread_count(self, agent_id: UUID) -> int:
-        """Get the count of unread notifications, with caching."""
-        cache_key = f"{self.CACHE_PREFIX}unread:{agent_id}"
+        """Get the count of unread notifications from the Redis counter."""
+        cache_key = self._unread_key(agent_id)
 
-        # Try cache first
         cached = await self.redis.get(cache_key)
         if cached is not None:
             return int(cached)
 
-        # Query database
+        return await self.reconcile_unread_count(agent_id)
+
+    async def reconcile_unread_count(self, agent_id: UUID) -> int:
+        """Recount unread notifications in the database and reset the counter."""
         result = await self.db.execute(
             select(func.count(Notification.id)).where(
                 Notification.agent_id == agent_id,
@@ -81,9 +177,8 @@ class NotificationService:
         )
         count = result.scalar() or 0
 
-        # Cache the result
         await self.redis.setex(
-            cache_key,
+            self._unread_key(agent_id),
             settings.notification_count_cache_ttl,
             str(count),
         )
@@ -94,14 +189,20 @@ class NotificationService:
         self,
         agent_id: UUID,
         limit: int = 20,
-        offset: int = 0,
+        cursor: str | None = None,
         unread_only: bool = False,
-    ) -> tuple[list[Notification], int]:
+    ) -> tuple[list[Notification], str | None]:
         """
-        Get notifications for an agent.
+        Get a page of notifications for an agent, newest first.
+
+        Args:
+            agent_id: The agent whose notifications to fetch
+            limit: Maximum number of notifications to return
+            cursor: Opaque cursor from a previous page, or None for the first page
+            unread_only: Only return unread notifications
 
         Returns:
-            Tuple of (notifications list, total count)
+            Tuple of (notifications list, cursor for the next page or None)
         """
         query = (
             select(Notification)
@@ -112,25 +213,14 @@ class NotificationService:
         if unread_only:
             query = query.where(Notification.is_read == False)  # noqa: E712
 
-        # Get total count
-        count_query = select(func.count(Notification.id)).where(
-            Notification.agent_id == agent_id
-        )
-        if unread_only:
-            count_query = count_query.where(Notification.is_read == False)  # noqa: E712
-        count_result = await self.db.execute(count_query)
-        total = count_result.scalar() or 0
-
-        # Get paginated results
-        query = (
-            query.order_by(Notification.created_at.desc())
-            .offset(offset)
-            .limit(limit)
+        query = apply_keyset(
+            query, Notification.created_at, Notification.id, limit, cursor
         )
         result = await self.db.execute(query)
-        notifications = list(result.scalars().all())
 
-        return notifications, total
+        return split_page(
+            list(result.scalars().all()), limit, lambda n: (n.created_at, n.id)
+        )
 
     async def mark_as_read(self, agent_id: UUID, notification_ids: list[UUID]) -> int:
         """
@@ -149,8 +239,7 @@ class NotificationService:
             .values(is_read=True)
         )
 
-        # Invalidate cache
-        await self._invalidate_unread_cache(agent_id)
+        self._adjust_unread_count_on_commit(agent_id, -result.rowcount)
 
         return result.rowcount
 
@@ -170,15 +259,26 @@ class NotificationService:
             .values(is_read=True)
         )
 
-        # Invalidate cache
-        await self._invalidate_unread_cache(agent_id)
+        self._adjust_unread_count_on_commit(agent_id, -result.rowcount)
 
         return result.rowcount
 
-    async def _invalidate_unread_cache(self, agent_id: UUID) -> None:
-        """Invalidate the unread count cache for an agent."""
-        cache_key = f"{self.CACHE_PREFIX}unread:{agent_id}"
-        await self.redis.delete(cache_key)
+    def _unread_key(self, agent_id: UUID) -> str:
+        return f"{self.CACHE_PREFIX}unread:{agent_id}"
+
+    def _adjust_unread_count_on_commit(self, agent_id: UUID, delta: int) -> None:
+        """
+        Apply a delta to the unread counter once the session's transaction
+        commits.
+
+        Adjusting earlier would count notifications a rollback discards,
+        and a read reconciling the counter before the commit would reset it
+        without them. Nothing is applied if the transaction rolls back.
+        """
+        if delta == 0:
+            return
+        pending = self.db.info.setdefault(PENDING_UNREAD_DELTAS, {})
+        pending.setdefault(self.redis, Counter())[self._unread_key(agent_id)] += delta
 
     # Helper methods for specific notification types
 
@@ -189,9 +289,9 @@ class NotificationService:
         voter_agent_id: UUID,
         is_upvote: bool,
         claim_statement: str,
-    ) -> Notification | None:
+    ) -> UUID | None:
         """
-        Create a notification when evidence is voted on.
+        Create or aggregate a notification when evidence is voted on.
         Don't notify if the voter is the author.
         """
         if evidence_author_id == voter_agent_id:
@@ -206,7 +306,7 @@ class NotificationService:
         title = "Evidence upvoted" if is_upvote else "Evidence downvoted"
         message = f"Your evidence on \"{claim_statement[:100]}...\" was {'upvoted' if is_upvote else 'downvoted'}"
 
-        return await self.create_notification(
+        return await self.aggregate_notification(
             agent_id=evidence_author_id,
             notification_type=notification_type,
             title=title,
@@ -332,3 +432,51 @@ class NotificationService:
             reference_type="claim",
             actor_agent_id=None,
         )
+
+
+async def adjust_unread_counts(redis_client: redis.Redis, deltas: Counter[str]) -> None:
+    """
+    Apply deltas to the unread counters that are currently being tracked.
+
+    INCRBY and TTL run in one MULTI block per counter. A TTL of -1 means
+    INCRBY just created the key (no counter was tracked), and a negative
+    value means the counter drifted; either way the key is dropped so the
+    next read reconciles it from the database.
+    """
+    pipe = redis_client.pipeline(transaction=True)
+    keys = [key for key, delta in deltas.items() if delta]
+    for key in keys:
+        pipe.incrby(key, deltas[key])
+        pipe.ttl(key)
+    results = await pipe.execute()
+
+    stale = [
+        key
+        for key, new_count, ttl in zip(keys, results[::2], results[1::2])
+        if ttl == -1 or new_count < 0
+    ]
+    if stale:
+        await redis_client.delete(*stale)
+
+
+@event.listens_for(Session, "after_commit")
+def _adjust_committed_unread_counts(session: Session) -> None:
+    pending = session.info.pop(PENDING_UNREAD_DELTAS, None)
+    if not pending:
+        return
+    loop = asyncio.get_running_loop()
+    for redis_client, deltas in pending.items():
+        task = loop.create_task(adjust_unread_counts(redis_client, deltas))
+        _unread_tasks.add(task)
+        task.add_done_callback(_adjustment_done)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_unread_counts(session: Session) -> None:
+    session.info.pop(PENDING_UNREAD_DELTAS, None)
+
+
+def _adjustment_done(task: asyncio.Task) -> None:
+    _unread_tasks.discard(task)
+    if not task.cancelled() and task.exception():
+        logger.error(f"Failed to adjust unread notification counts: {task.exception()}")
@@ -0,0 +1,204 @@
+"""
+Monthly partitions for append-only tables.
+
+History, notification, rate limit and refresh token rows are only ever
+added, and are retired by age, so each table is range partitioned by
+month of a timestamp column. Partitions are named {table}_pYYYYMM and
+created a few months ahead; a DEFAULT partition catches anything outside
+them. Retiring a month is a DROP (or a move to the archive schema) of its
+partition rather than a DELETE of its rows, so expired data costs neither
+vacuum work nor index bloat.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Partition maintenance waits at most this long for locks, then retries next run
+LOCK_TIMEOUT = "5s"
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    """A table partitioned by month of one column."""
+
+    name: str
+    column: str
+    retention_days: int | None  # None keeps every partition
+
+    @property
+    def default_partition(self) -> str:
+        return f"{self.name}_default"
+
+    def partition_name(self, month: date) -> str:
+        return f"{self.name}_p{month:%Y%m}"
+
+    def partition_month(self, partition: str) -> date | None:
+        """The month a partition holds, or None if it is not a monthly one."""
+        match = re.fullmatch(rf"{re.escape(self.name)}_p(\d{{4}})(\d{{2}})", partition)
+        if not match:
+            return None
+        return date(int(match[1]), int(match[2]), 1)
+
+
+def partitioned_tables() -> list[PartitionedTable]:
+    """The partitioned tables, with retention as currently configured."""
+    return [
+        PartitionedTable(
+            "gradient_history", "recorded_at", settings.gradient_history_retention_days
+        ),
+        PartitionedTable(
+            "reputation_history", "recorded_at", settings.reputation_history_retention_days
+        ),
+        PartitionedTable("notifications", "created_month", settings.notification_retention_days),
+        PartitionedTable("rate_limit_counters", "date", settings.rate_limit_retention_days),
+        PartitionedTable("refresh_tokens", "expires_at", settings.refresh_token_retention_days),
+    ]
+
+
+def add_months(month: date, count: int) -> date:
+    """The first day of the month count months after month's."""
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_bound(month: date) -> str:
+    """A partition bound literal for the start of a month, in UTC."""
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+class PartitionService:
+    """
+    Service for creating and retiring monthly partitions.
+
+    Changes are not committed; run each table's maintenance in its own
+    transaction, so locks are held briefly.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def list_partitions(self, table: PartitionedTable) -> dict[date, str]:
+        """The table's monthly partitions, by month."""
+        result = await self.db.execute(
+            text("""
+                SELECT child.relname
+                FROM pg_inherits
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE pg_inherits.inhparent = CAST(:table AS regclass)
+            """),
+            {"table": table.name},
+        )
+        partitions = {}
+        for (name,) in result.all():
+            month = table.partition_month(name)
+            if month is not None:
+                partitions[month] = name
+        return partitions
+
+    async def ensure_partitions(
+        self, table: PartitionedTable, today: date | None = None
+    ) -> list[str]:
+        """
+        Create the partitions for the current month and the configured
+        number of months ahead.
+
+        Rows already in the DEFAULT partition for a new month are moved
+        into it, since a partition cannot be attached while the default
+        holds rows in its range.
+
+        Returns:
+            The names of the partitions created
+        """
+        current = (today or datetime.now(UTC).date()).replace(day=1)
+        existing = await self.list_partitions(table)
+        await self.db.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+
+        created = []
+        for offset in range(settings.partition_premake_months + 1):
+            month = add_months(current, offset)
+            if month in existing:
+                continue
+            name = table.partition_name(month)
+            lower, upper = month_bound(month), month_bound(add_months(month, 1))
+            await self.db.execute(
+                text(f"CREATE TABLE {name} (LIKE {table.name} INCLUDING DEFAULTS)")
+            )
+            await self.db.execute(
+                text(f"""
+                    WITH moved AS (
+                        DELETE FROM {table.default_partition}
+                        WHERE {table.column} >= {lower} AND {table.column} < {upper}
+                        RETURNING *
+                    )
+                    INSERT INTO {name} SELECT * FROM moved
+                """)
+            )
+            await self.db.execute(
+                text(
+                    f"ALTER TABLE {table.name} ATTACH PARTITION {name} "
+                    f"FOR VALUES FROM ({lower}) TO ({upper})"
+                )
+            )
+            created.append(name)
+        return created
+
+    async def expire_partitions(
+        self, table: PartitionedTable, today: date | None = None
+    ) -> list[str]:
+        """
+        Retire the partitions whose month ended more than the retention
+        period ago: dropped, or with settings.partition_archive_schema set,
+        detached and moved to that schema.
+
+        Returns:
+            The names of the partitions retired
+        """
+        if table.retention_days is None:
+            return []
+        cutoff = (today or datetime.now(UTC).date()) - timedelta(days=table.retention_days)
+        expired = [
+            name
+            for month, name in sorted((await self.list_partitions(table)).items())
+            if add_months(month, 1) <= cutoff
+        ]
+        if not expired:
+            return []
+
+        await self.db.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+        archive = settings.partition_archive_schema
+        if archive:
+            await self.db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {archive}"))
+        for name in expired:
+            await self.db.execute(text(f"ALTER TABLE {table.name} DETACH PARTITION {name}"))
+            if archive:
+                await self.db.execute(text(f"ALTER TABLE {name} SET SCHEMA {archive}"))
+            else:
+                await self.db.execute(text(f"DROP TABLE {name}"))
+        return expired
+
+    async def maintain(
+        self, table: PartitionedTable, today: date | None = None
+    ) -> tuple[list[str], list[str]]:
+        """
+        Create upcoming partitions and retire expired ones.
+
+        Returns:
+            The names of the partitions created and of those retired
+        """
+        created = await self.ensure_partitions(table, today)
+        expired = await self.expire_partitions(table, today)
+        if created or expired:
+            logger.info(
+                f"Partitions of {table.name}: created {created or 'none'}, "
+                f"retired {expired or 'none'}"
+            )
+        return created, expired
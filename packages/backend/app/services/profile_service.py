@@ -0,0 +1,195 @@
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.database import run_concurrently
+from app.core.http_cache import bump_versions_on_commit
+from app.models.agent import Agent, AgentActivity
+from app.schemas.profile import (
+    ExpertiseArea,
+    LearningScoreData,
+    ProfileResponse,
+    ProfileStats,
+)
+from app.services.learning_score_service import LearningScoreService
+
+
+def _generate_insight(accuracy_rate: float | None, learning_score: float) -> str | None:
+    """Generate a human-readable insight based on learning metrics."""
+    if accuracy_rate is None:
+        return "Keep voting on claims to build your accuracy track record."
+
+    if accuracy_rate > 0.8:
+        return (
+            "You have excellent judgment - you correctly identify claim truth values "
+            "consistently."
+        )
+    elif accuracy_rate > 0.65:
+        return "You tend to identify true claims early and make sound judgments."
+    elif accuracy_rate > 0.5:
+        return "You're developing good epistemic instincts. Keep engaging to improve."
+    else:
+        return "Consider reviewing evidence more carefully before voting."
+
+
+class ProfileService:
+    """
+    Service for agent profiles and the activity counters behind them.
+
+    A profile is cached as a snapshot under the agent's version stamp
+    (resource "agent:<id>"). Writes that change what a profile shows bump
+    the stamp once they commit, so a cached snapshot is never served after
+    the change. The rank also changes with other agents' reputation; it is
+    only as fresh as the snapshot's TTL (profile_cache_ttl).
+    """
+
+    def __init__(self, db: AsyncSession, redis_client: redis.Redis):
+        self.db = db
+        self.redis = redis_client
+
+    @staticmethod
+    def cache_key(agent_id: UUID, version: str) -> str:
+        return f"profile:{agent_id}:{version}"
+
+    async def record_activity(
+        self,
+        agent_id: UUID,
+        claims: int = 0,
+        evidence: int = 0,
+        votes: int = 0,
+    ) -> None:
+        """
+        Add to an agent's activity counters, in place.
+
+        Args:
+            agent_id: ID of the agent
+            claims: Change in claims authored
+            evidence: Change in evidence submitted
+            votes: Change in votes cast on claims and evidence
+        """
+        stmt = insert(AgentActivity).values(
+            agent_id=agent_id,
+            claims_authored=max(claims, 0),
+            evidence_submitted=max(evidence, 0),
+            votes_cast=max(votes, 0),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["agent_id"],
+            set_={
+                "claims_authored": func.greatest(AgentActivity.claims_authored + claims, 0),
+                "evidence_submitted": func.greatest(
+                    AgentActivity.evidence_submitted + evidence, 0
+                ),
+                "votes_cast": func.greatest(AgentActivity.votes_cast + votes, 0),
+            },
+        )
+        await self.db.execute(stmt)
+        bump_versions_on_commit(self.db, self.redis, f"agent:{agent_id}")
+
+    async def get_agent(self, agent_id: UUID) -> tuple[Agent, AgentActivity | None] | None:
+        """
+        Get an agent with its activity counters, in one query.
+
+        Returns:
+            (agent, counters) or None if the agent does not exist; counters
+            are None for agents without any activity
+        """
+        result = await self.db.execute(
+            select(Agent, AgentActivity)
+            .outerjoin(AgentActivity, AgentActivity.agent_id == Agent.id)
+            .where(Agent.id == agent_id)
+        )
+        row = result.one_or_none()
+        return tuple(row) if row else None
+
+    @staticmethod
+    async def get_rank(db: AsyncSession, reputation_score: float) -> tuple[int, int]:
+        """
+        Rank of a reputation score among all agents, in one query.
+
+        Returns:
+            Tuple of (rank, total agents)
+        """
+        result = await db.execute(
+            select(
+                func.count().filter(Agent.reputation_score > reputation_score),
+                func.count(),
+            ).select_from(Agent)
+        )
+        higher_count, total_agents = result.one()
+        return higher_count + 1, total_agents
+
+    async def build_profile(
+        self,
+        agent_id: UUID,
+        session_maker: async_sessionmaker[AsyncSession],
+    ) -> ProfileResponse | None:
+        """
+        Build an agent's full profile.
+
+        The rank, learning score and expertise queries are independent, so
+        they run concurrently, each on its own connection.
+
+        Args:
+            agent_id: ID of the agent
+            session_maker: Session factory for the concurrent queries
+
+        Returns:
+            The profile, or None if the agent does not exist
+        """
+        found = await self.get_agent(agent_id)
+        if found is None:
+            return None
+        agent, activity = found
+
+        (rank, total_agents), learning_score, expertise_areas = await run_concurrently(
+            session_maker,
+            lambda session: self.get_rank(session, agent.reputation_score),
+            lambda session: LearningScoreService(
+                session, self.redis
+            ).calculate_learning_score(agent_id),
+            lambda session: LearningScoreService(
+                session, self.redis
+            ).get_expertise_areas(agent_id),
+        )
+
+        total_agents = total_agents or 1
+        percentile = ((total_agents - rank) / total_agents) * 100
+
+        return ProfileResponse(
+            id=agent.id,
+            username=agent.username,
+            display_name=agent.display_name,
+            bio=agent.bio,
+            avatar_url=agent.avatar_url,
+            reputation_score=agent.reputation_score,
+            tier=agent.tier,
+            created_at=agent.created_at,
+            first_activity_at=agent.first_activity_at,
+            stats=ProfileStats(
+                claims_authored=activity.claims_authored if activity else 0,
+                evidence_submitted=activity.evidence_submitted if activity else 0,
+                votes_cast=activity.votes_cast if activity else 0,
+                reputation_rank=rank,
+                total_agents=total_agents,
+                percentile=round(max(percentile, 0), 1),
+            ),
+            learning_score=LearningScoreData(
+                score=learning_score,
+                accuracy_rate=agent.accuracy_rate,
+                total_resolved_votes=agent.total_resolved_votes,
+                correct_resolved_votes=agent.correct_resolved_votes,
+                insight=_generate_insight(agent.accuracy_rate, learning_score),
+            ),
+            expertise=[
+                ExpertiseArea(
+                    tag=e["tag"],
+                    engagement_count=e["engagement_count"],
+                    accuracy=e["accuracy"],
+                )
+                for e in expertise_areas
+            ],
+        )
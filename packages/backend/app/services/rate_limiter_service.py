@@ -1,4 +1,4 @@
-from datetime import UTC, date, datetime
+from datetime import UTC, date, datetime, timedelta
 from uuid import UUID
 
 import redis.asyncio as redis
@@ -6,9 +6,11 @@ from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.principal import Principal
 from app.models.agent import Agent, AgentTier
 from app.models.rate_limit import ActionType, RateLimitCounter
 from app.services.reputation_service import TIER_CONFIG
+from app.services.stats_service import StatsService
 
 
 class RateLimitExceeded(Exception):
@@ -27,7 +29,9 @@ class RateLimiterService:
     """
     Service for enforcing rate limits based on agent tier.
 
-    Uses Redis for fast counting with PostgreSQL as backup/audit.
+    Uses Redis for fast counting with PostgreSQL as backup/audit. Every
+    action passes through here, so granted actions also mark the agent as
+    active for the platform stats.
     """
 
     CACHE_PREFIX = "rate_limit:"
@@ -42,7 +46,9 @@ class RateLimiterService:
         today = date.today().isoformat()
         return f"{self.CACHE_PREFIX}{agent_id}:{action_type.value}:{today}"
 
-    async def get_limit_for_action(self, agent: Agent, action_type: ActionType) -> int:
+    async def get_limit_for_action(
+        self, agent: Agent | Principal, action_type: ActionType
+    ) -> int:
         """Get the rate limit for an agent's tier and action type."""
         tier_config = TIER_CONFIG[agent.tier]
 
@@ -69,7 +75,7 @@ class RateLimiterService:
 
     async def check_rate_limit(
         self,
-        agent: Agent,
+        agent: Agent | Principal,
         action_type: ActionType,
     ) -> tuple[bool, int, int]:
         """
@@ -90,7 +96,7 @@ class RateLimiterService:
 
     async def increment(
         self,
-        agent: Agent,
+        agent: Agent | Principal,
         action_type: ActionType,
         check_first: bool = True,
     ) -> int:
@@ -120,23 +126,67 @@ class RateLimiterService:
 
         # Set expiry if this is the first increment today
         if new_count == 1:
-            # Calculate seconds until midnight UTC
-            now = datetime.now(UTC)
-            midnight = datetime(now.year, now.month, now.day, tzinfo=UTC)
-            from datetime import timedelta
-            next_midnight = midnight + timedelta(days=1)
-            seconds_until_midnight = int((next_midnight - now).total_seconds())
-            await self.redis.expire(cache_key, seconds_until_midnight)
+            await self.redis.expire(cache_key, self._seconds_until_midnight())
 
         # Also update PostgreSQL for audit/backup
         await self._update_db_counter(agent.id, action_type)
+        await StatsService(self.db, self.redis).mark_active(agent.id)
 
         return new_count
 
+    async def reserve(
+        self,
+        agent: Agent | Principal,
+        action_type: ActionType,
+        amount: int,
+    ) -> int:
+        """
+        Take up to amount units of today's budget for an action at once.
+
+        The counter is raised by the full amount in one atomic INCRBY, and
+        whatever lands above the limit is handed back. Concurrent requests
+        can therefore never be granted more than the limit in total.
+
+        Args:
+            agent: The agent performing the actions
+            action_type: Type of action being performed
+            amount: Number of actions requested
+
+        Returns:
+            Number of actions granted, between 0 and amount
+        """
+        if amount <= 0:
+            return 0
+
+        limit = await self.get_limit_for_action(agent, action_type)
+        cache_key = self._get_cache_key(agent.id, action_type)
+
+        new_count = await self.redis.incrby(cache_key, amount)
+        if new_count == amount:
+            await self.redis.expire(cache_key, self._seconds_until_midnight())
+
+        granted = max(0, min(amount, limit - (new_count - amount)))
+        if granted < amount:
+            await self.redis.incrby(cache_key, granted - amount)
+
+        if granted:
+            await self._update_db_counter(agent.id, action_type, granted)
+            await StatsService(self.db, self.redis).mark_active(agent.id)
+
+        return granted
+
+    def _seconds_until_midnight(self) -> int:
+        """Seconds until the daily counters reset at midnight UTC."""
+        now = datetime.now(UTC)
+        midnight = datetime(now.year, now.month, now.day, tzinfo=UTC)
+        next_midnight = midnight + timedelta(days=1)
+        return int((next_midnight - now).total_seconds())
+
     async def _update_db_counter(
         self,
         agent_id: UUID,
         action_type: ActionType,
+        amount: int = 1,
     ) -> None:
         """Update the database counter (for backup/audit)."""
         today = date.today()
@@ -144,24 +194,24 @@ class RateLimiterService:
         stmt = insert(RateLimitCounter).values(
             agent_id=agent_id,
             action_type=action_type,
-            count=1,
+            count=amount,
             date=today,
         ).on_conflict_do_update(
             index_elements=["agent_id", "action_type", "date"],
-            set_={"count": RateLimitCounter.count + 1},
+            set_={"count": RateLimitCounter.count + amount},
         )
         await self.db.execute(stmt)
 
     async def get_remaining(
         self,
-        agent: Agent,
+        agent: Agent | Principal,
         action_type: ActionType,
     ) -> int:
         """Get remaining actions allowed for today."""
         allowed, current, limit = await self.check_rate_limit(agent, action_type)
         return max(0, limit - current)
 
-    async def get_all_limits(self, agent: Agent) -> dict[str, dict]:
+    async def get_all_limits(self, agent: Agent | Principal) -> dict[str, dict]:
         """Get all rate limit statuses for an agent."""
         results = {}
 
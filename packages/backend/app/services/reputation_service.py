@@ -7,6 +7,10 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.http_cache import VERSION_PREFIX, bump_versions, bump_versions_on_commit
+from app.core.principal import invalidate_principal_on_commit
+from app.core.response_cache import RESPONSE_PREFIX
+from app.core.tiered_cache import TieredCache
 from app.models.agent import Agent, AgentTier
 from app.models.claim import Claim
 from app.models.evidence import Evidence
@@ -43,6 +47,8 @@ REPUTATION_DELTAS = {
     ReputationChangeReason.VOTE_OPPOSED: -0.5,
 }
 
+reputation_cache = TieredCache("reputation", settings.reputation_cache_ttl)
+
 
 class ReputationService:
     """
@@ -60,9 +66,9 @@ class ReputationService:
         """Get agent reputation from cache or database."""
         cache_key = f"{self.CACHE_PREFIX}{agent_id}"
 
-        cached = await self.redis.get(cache_key)
+        cached = await reputation_cache.get(cache_key)
         if cached is not None:
-            return float(cached)
+            return cached
 
         result = await self.db.execute(
             select(Agent.reputation_score).where(Agent.id == agent_id)
@@ -70,7 +76,7 @@ class ReputationService:
         score = result.scalar_one_or_none()
 
         if score is not None:
-            await self.redis.setex(cache_key, settings.reputation_cache_ttl, str(score))
+            await reputation_cache.set(cache_key, score)
             return score
 
         return 0.0
@@ -143,7 +149,9 @@ class ReputationService:
 
         # Invalidate cache
         cache_key = f"{self.CACHE_PREFIX}{agent_id}"
-        await self.redis.delete(cache_key)
+        await reputation_cache.delete(cache_key)
+        invalidate_principal_on_commit(self.db, self.redis, agent_id)
+        bump_versions_on_commit(self.db, self.redis, f"agent:{agent_id}")
 
         return new_score
 
@@ -246,6 +254,14 @@ class ReputationService:
         )
         return list(result.scalars().all())
 
+    @classmethod
+    def leaderboard_cache_key(
+        cls, limit: int, offset: int, tier: AgentTier | None, period: str
+    ) -> str:
+        """Cache key of a leaderboard page, also its HTTP cache resource name."""
+        tier_name = tier.value if tier else "all"
+        return f"{cls.LEADERBOARD_CACHE_PREFIX}{period}:{tier_name}:{limit}:{offset}"
+
     async def get_leaderboard_cached(
         self,
         limit: int = 100,
@@ -265,7 +281,7 @@ class ReputationService:
         Returns:
             Dict with entries, total, period, and updated_at
         """
-        cache_key = f"{self.LEADERBOARD_CACHE_PREFIX}{period}:{tier or 'all'}:{limit}:{offset}"
+        cache_key = self.leaderboard_cache_key(limit, offset, tier, period)
 
         # Try cache first
         cached = await self.redis.get(cache_key)
@@ -368,6 +384,9 @@ class ReputationService:
             settings.leaderboard_cache_ttl,
             json.dumps(response),
         )
+        await bump_versions(
+            self.redis, cache_key, ttl=settings.leaderboard_cache_ttl, purge=False
+        )
 
         return response
 
@@ -424,12 +443,16 @@ class ReputationService:
         return response
 
     async def invalidate_leaderboard_cache(self) -> None:
-        """Invalidate all leaderboard caches."""
-        pattern = f"{self.LEADERBOARD_CACHE_PREFIX}*"
-        cursor = 0
-        while True:
-            cursor, keys = await self.redis.scan(cursor, match=pattern, count=100)
-            if keys:
-                await self.redis.delete(*keys)
-            if cursor == 0:
-                break
+        """Invalidate all leaderboard caches, cached responses and HTTP version stamps."""
+        for pattern in [
+            f"{self.LEADERBOARD_CACHE_PREFIX}*",
+            f"{RESPONSE_PREFIX}{self.LEADERBOARD_CACHE_PREFIX}*",
+            f"{VERSION_PREFIX}{self.LEADERBOARD_CACHE_PREFIX}*",
+        ]:
+            cursor = 0
+            while True:
+                cursor, keys = await self.redis.scan(cursor, match=pattern, count=100)
+                if keys:
+                    await self.redis.delete(*keys)
+                if cursor == 0:
+                    break
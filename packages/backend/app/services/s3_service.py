@@ -2,13 +2,23 @@
 S3 service for file uploads and downloads.
 
 Handles presigned URL generation for secure direct uploads/downloads.
+
+A single boto3 client is created lazily and shared by every request; boto3
+clients are thread-safe and keep their own connection pool. Signing and
+S3 calls are blocking, so they run in the default thread pool to keep the
+event loop free.
 """
 
+import asyncio
+import hashlib
+import json
 import mimetypes
 import uuid
 from datetime import UTC, datetime
+from functools import lru_cache
 
 import boto3
+import redis.asyncio as redis
 from botocore.config import Config
 from botocore.exceptions import ClientError
 
@@ -36,79 +46,113 @@ ALLOWED_CONTENT_TYPES = {
 
 DEFAULT_MAX_SIZE = 10 * 1024 * 1024  # 10MB default
 
+# Verified files live under content-addressed keys; uploads land in staging first
+BLOB_PREFIX = "evidence/sha256/"
+STAGING_PREFIX = "evidence/uploads/"
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 class S3ServiceError(Exception):
     """Custom exception for S3 service errors."""
     pass
 
 
+@lru_cache(maxsize=1)
+def get_s3_client():
+    """
+    Get the shared S3 client, creating it on first use.
+
+    Call get_s3_client.cache_clear() after changing S3 settings (e.g. in tests).
+    """
+    config = Config(
+        signature_version='s3v4',
+        region_name=settings.aws_region,
+        max_pool_connections=settings.s3_max_pool_connections,
+    )
+    kwargs = {
+        'region_name': settings.aws_region,
+        'config': config,
+    }
+
+    if settings.s3_endpoint_url:
+        # Local S3 stand-in (moto, MinIO, ...)
+        kwargs['endpoint_url'] = settings.s3_endpoint_url
+
+    if settings.aws_access_key_id and settings.aws_secret_access_key:
+        kwargs['aws_access_key_id'] = settings.aws_access_key_id
+        kwargs['aws_secret_access_key'] = settings.aws_secret_access_key
+
+    # Otherwise use IAM role or environment credentials
+    return boto3.client('s3', **kwargs)
+
+
 class S3Service:
     """
     Service for managing file uploads to S3.
 
-    Uses presigned URLs for secure direct uploads from the client.
+    Uses presigned URLs for secure direct uploads from the client. When a
+    Redis client is given, download URLs are cached per (file_key, file_name)
+    and reused until shortly before they expire.
     """
 
-    def __init__(self):
+    CACHE_PREFIX = "s3:download:"
+    # Cached download URLs are handed out until this many seconds remain
+    DOWNLOAD_URL_MIN_REMAINING = 300
+
+    def __init__(self, redis_client: redis.Redis | None = None):
         self.bucket_name = settings.s3_bucket_name
-        self.region = settings.aws_region
+        self.s3_client = get_s3_client()
+        self.redis = redis_client
 
-        # Configure S3 client
-        config = Config(
-            signature_version='s3v4',
-            region_name=self.region,
-        )
+    @staticmethod
+    def blob_key(sha256: str) -> str:
+        """Content-addressed key for a verified file."""
+        return f"{BLOB_PREFIX}{sha256[:2]}/{sha256}"
 
-        if settings.aws_access_key_id and settings.aws_secret_access_key:
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=settings.aws_access_key_id,
-                aws_secret_access_key=settings.aws_secret_access_key,
-                region_name=self.region,
-                config=config,
-            )
-        else:
-            # Use IAM role or environment credentials
-            self.s3_client = boto3.client(
-                's3',
-                region_name=self.region,
-                config=config,
-            )
+    @staticmethod
+    def staging_key(agent_id: str) -> str:
+        """Unique key where an unverified upload lands before it is checked."""
+        timestamp = datetime.now(UTC).strftime('%Y/%m/%d')
+        return f"{STAGING_PREFIX}{timestamp}/{agent_id}/{uuid.uuid4().hex}"
+
+    def validate_upload(self, content_type: str, file_size: int) -> int:
+        """
+        Check a declared upload against the allowed types and sizes.
+
+        Returns:
+            The maximum size allowed for the content type
+        """
+        if content_type not in ALLOWED_CONTENT_TYPES:
+            raise S3ServiceError(f"Content type '{content_type}' is not allowed")
 
-    def generate_upload_url(
+        max_size = ALLOWED_CONTENT_TYPES.get(content_type, DEFAULT_MAX_SIZE)
+        if file_size > max_size:
+            raise S3ServiceError(f"File exceeds the {max_size} byte limit for '{content_type}'")
+        return max_size
+
+    async def generate_upload_url(
         self,
-        file_name: str,
+        file_key: str,
         content_type: str,
-        agent_id: str,
-        claim_id: str,
+        file_size: int,
         expires_in: int = 3600,
     ) -> dict:
         """
-        Generate a presigned URL for uploading a file.
+        Generate a presigned POST for uploading a file in a single request.
 
         Args:
-            file_name: Original file name
+            file_key: S3 object key to upload to
             content_type: MIME type of the file
-            agent_id: ID of the uploading agent
-            claim_id: ID of the claim this evidence is for
+            file_size: Declared size; the upload must match it exactly
             expires_in: URL expiration in seconds (default 1 hour)
 
         Returns:
-            dict with upload_url, file_key, and expires_in
+            dict with upload_url, fields, and expires_in
         """
-        # Validate content type
-        if content_type not in ALLOWED_CONTENT_TYPES:
-            raise S3ServiceError(f"Content type '{content_type}' is not allowed")
-
-        # Generate unique file key
-        timestamp = datetime.now(UTC).strftime('%Y/%m/%d')
-        unique_id = uuid.uuid4().hex[:12]
-        safe_filename = self._sanitize_filename(file_name)
-        file_key = f"evidence/{timestamp}/{agent_id}/{claim_id}/{unique_id}_{safe_filename}"
-
         try:
             # Generate presigned POST (more secure than presigned PUT)
-            presigned_post = self.s3_client.generate_presigned_post(
+            presigned_post = await asyncio.to_thread(
+                self.s3_client.generate_presigned_post,
                 Bucket=self.bucket_name,
                 Key=file_key,
                 Fields={
@@ -116,7 +160,7 @@ class S3Service:
                 },
                 Conditions=[
                     {'Content-Type': content_type},
-                    ['content-length-range', 1, ALLOWED_CONTENT_TYPES.get(content_type, DEFAULT_MAX_SIZE)],
+                    ['content-length-range', file_size, file_size],
                 ],
                 ExpiresIn=expires_in,
             )
@@ -124,22 +168,168 @@ class S3Service:
             return {
                 'upload_url': presigned_post['url'],
                 'fields': presigned_post['fields'],
-                'file_key': file_key,
                 'expires_in': expires_in,
-                'max_size': ALLOWED_CONTENT_TYPES.get(content_type, DEFAULT_MAX_SIZE),
             }
 
         except ClientError as e:
             raise S3ServiceError(f"Failed to generate upload URL: {e}")
 
-    def generate_download_url(
+    async def create_multipart_upload(self, file_key: str, content_type: str) -> str:
+        """
+        Start a multipart upload.
+
+        Returns:
+            The S3 upload ID
+        """
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.create_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=file_key,
+                ContentType=content_type,
+            )
+            return response['UploadId']
+        except ClientError as e:
+            raise S3ServiceError(f"Failed to start multipart upload: {e}")
+
+    async def generate_part_urls(
+        self,
+        file_key: str,
+        upload_id: str,
+        part_numbers: list[int],
+        expires_in: int = 3600,
+    ) -> list[dict]:
+        """
+        Presign PUT URLs for parts of a multipart upload.
+
+        Parts are independent, so clients can upload them in parallel.
+
+        Returns:
+            list of dicts with part_number and upload_url
+        """
+        def sign() -> list[dict]:
+            return [
+                {
+                    'part_number': part_number,
+                    'upload_url': self.s3_client.generate_presigned_url(
+                        'upload_part',
+                        Params={
+                            'Bucket': self.bucket_name,
+                            'Key': file_key,
+                            'UploadId': upload_id,
+                            'PartNumber': part_number,
+                        },
+                        ExpiresIn=expires_in,
+                    ),
+                }
+                for part_number in part_numbers
+            ]
+
+        try:
+            return await asyncio.to_thread(sign)
+        except ClientError as e:
+            raise S3ServiceError(f"Failed to generate part upload URLs: {e}")
+
+    async def list_uploaded_parts(self, file_key: str, upload_id: str) -> list[dict]:
+        """
+        List the parts S3 has received for a multipart upload.
+
+        Returns:
+            list of dicts with part_number, etag and size, ordered by part_number
+        """
+        def list_all() -> list[dict]:
+            parts = []
+            paginator = self.s3_client.get_paginator('list_parts')
+            for page in paginator.paginate(
+                Bucket=self.bucket_name, Key=file_key, UploadId=upload_id
+            ):
+                parts.extend(
+                    {
+                        'part_number': part['PartNumber'],
+                        'etag': part['ETag'],
+                        'size': part['Size'],
+                    }
+                    for part in page.get('Parts', [])
+                )
+            return sorted(parts, key=lambda p: p['part_number'])
+
+        try:
+            return await asyncio.to_thread(list_all)
+        except ClientError as e:
+            raise S3ServiceError(f"Failed to list uploaded parts: {e}")
+
+    async def complete_multipart_upload(
+        self, file_key: str, upload_id: str, parts: list[dict]
+    ) -> None:
+        """Assemble uploaded parts (as returned by list_uploaded_parts) into the object."""
+        try:
+            await asyncio.to_thread(
+                self.s3_client.complete_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=file_key,
+                UploadId=upload_id,
+                MultipartUpload={
+                    'Parts': [
+                        {'PartNumber': p['part_number'], 'ETag': p['etag']} for p in parts
+                    ],
+                },
+            )
+        except ClientError as e:
+            raise S3ServiceError(f"Failed to complete multipart upload: {e}")
+
+    async def abort_multipart_upload(self, file_key: str, upload_id: str) -> None:
+        """Abort a multipart upload and discard its parts."""
+        try:
+            await asyncio.to_thread(
+                self.s3_client.abort_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=file_key,
+                UploadId=upload_id,
+            )
+        except ClientError as e:
+            raise S3ServiceError(f"Failed to abort multipart upload: {e}")
+
+    async def compute_sha256(self, file_key: str) -> tuple[str, int]:
+        """
+        Stream an object from S3 and hash it.
+
+        Returns:
+            (hex SHA-256 digest, size in bytes)
+        """
+        def digest() -> tuple[str, int]:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=file_key)
+            sha256 = hashlib.sha256()
+            size = 0
+            for chunk in response['Body'].iter_chunks(HASH_CHUNK_SIZE):
+                sha256.update(chunk)
+                size += len(chunk)
+            return sha256.hexdigest(), size
+
+        try:
+            return await asyncio.to_thread(digest)
+        except ClientError as e:
+            raise S3ServiceError(f"Failed to read file: {e}")
+
+    async def copy_file(self, source_key: str, dest_key: str) -> None:
+        """Server-side copy of an object within the bucket."""
+        try:
+            await asyncio.to_thread(
+                self.s3_client.copy_object,
+                Bucket=self.bucket_name,
+                Key=dest_key,
+                CopySource={'Bucket': self.bucket_name, 'Key': source_key},
+            )
+        except ClientError as e:
+            raise S3ServiceError(f"Failed to copy file: {e}")
+
+    async def generate_download_url(
         self,
         file_key: str,
         expires_in: int = 3600,
         file_name: str | None = None,
-    ) -> str:
+    ) -> dict:
         """
-        Generate a presigned URL for downloading a file.
+        Get a presigned URL for downloading a file, reusing a cached one if possible.
 
         Args:
             file_key: S3 object key
@@ -147,8 +337,41 @@ class S3Service:
             file_name: Optional filename for Content-Disposition header
 
         Returns:
-            Presigned download URL
+            dict with download_url and the seconds it remains valid (expires_in)
         """
+        cache_key = self._download_cache_key(file_key, file_name)
+        now = datetime.now(UTC).timestamp()
+
+        if self.redis:
+            cached = await self.redis.get(cache_key)
+            if cached:
+                data = json.loads(cached)
+                return {
+                    'download_url': data['url'],
+                    'expires_in': int(data['expires_at'] - now),
+                }
+
+        url = await asyncio.to_thread(
+            self._presign_download, file_key, expires_in, file_name
+        )
+
+        cache_ttl = expires_in - self.DOWNLOAD_URL_MIN_REMAINING
+        if self.redis and cache_ttl > 0:
+            await self.redis.setex(
+                cache_key,
+                cache_ttl,
+                json.dumps({'url': url, 'expires_at': now + expires_in}),
+            )
+
+        return {'download_url': url, 'expires_in': expires_in}
+
+    def _presign_download(
+        self,
+        file_key: str,
+        expires_in: int,
+        file_name: str | None,
+    ) -> str:
+        """Sign a get_object URL. Blocking; run via asyncio.to_thread."""
         try:
             params = {
                 'Bucket': self.bucket_name,
@@ -168,7 +391,7 @@ class S3Service:
         except ClientError as e:
             raise S3ServiceError(f"Failed to generate download URL: {e}")
 
-    def delete_file(self, file_key: str) -> bool:
+    async def delete_file(self, file_key: str) -> bool:
         """
         Delete a file from S3.
 
@@ -179,7 +402,8 @@ class S3Service:
             True if deleted successfully
         """
         try:
-            self.s3_client.delete_object(
+            await asyncio.to_thread(
+                self.s3_client.delete_object,
                 Bucket=self.bucket_name,
                 Key=file_key,
             )
@@ -187,7 +411,7 @@ class S3Service:
         except ClientError as e:
             raise S3ServiceError(f"Failed to delete file: {e}")
 
-    def file_exists(self, file_key: str) -> bool:
+    async def file_exists(self, file_key: str) -> bool:
         """
         Check if a file exists in S3.
 
@@ -198,7 +422,8 @@ class S3Service:
             True if file exists
         """
         try:
-            self.s3_client.head_object(
+            await asyncio.to_thread(
+                self.s3_client.head_object,
                 Bucket=self.bucket_name,
                 Key=file_key,
             )
@@ -208,7 +433,7 @@ class S3Service:
                 return False
             raise S3ServiceError(f"Failed to check file existence: {e}")
 
-    def get_file_info(self, file_key: str) -> dict | None:
+    async def get_file_info(self, file_key: str) -> dict | None:
         """
         Get metadata about a file in S3.
 
@@ -219,7 +444,8 @@ class S3Service:
             dict with file info or None if not found
         """
         try:
-            response = self.s3_client.head_object(
+            response = await asyncio.to_thread(
+                self.s3_client.head_object,
                 Bucket=self.bucket_name,
                 Key=file_key,
             )
@@ -234,23 +460,7 @@ class S3Service:
                 return None
             raise S3ServiceError(f"Failed to get file info: {e}")
 
-    def _sanitize_filename(self, filename: str) -> str:
-        """
-        Sanitize a filename for safe storage.
-
-        Removes path components and special characters.
-        """
-        import re
-        # Get just the filename, no path
-        filename = filename.split('/')[-1].split('\\')[-1]
-        # Remove special characters, keep alphanumeric, dots, hyphens, underscores
-        filename = re.sub(r'[^\w.\-]', '_', filename)
-        # Limit length
-        if len(filename) > 100:
-            name, ext = filename.rsplit('.', 1) if '.' in filename else (filename, '')
-            filename = name[:95] + ('.' + ext if ext else '')
-        return filename
-
-
-# Singleton instance
-s3_service = S3Service()
+    def _download_cache_key(self, file_key: str, file_name: str | None) -> str:
+        """Build the cache key for a download URL."""
+        digest = hashlib.sha256(f"{file_key}\0{file_name or ''}".encode()).hexdigest()
+        return f"{self.CACHE_PREFIX}{digest}"
@@ -0,0 +1,254 @@
+"""
+Claim full-text search.
+
+search_vector is maintained by a database trigger, with the statement
+weighted above the tags. Matches are ranked with ts_rank_cd, and plain word
+queries also match each term as a prefix so partially typed words find
+results. When a query has no full-text matches at all, search falls back to
+trigram similarity on the statement, which tolerates typos.
+
+Result pages are cached for settings.search_cache_ttl, keyed by the
+normalized query and filters.
+"""
+
+import asyncio
+import json
+import re
+from typing import Any
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import Float, Select, exists, func, select, update
+from sqlalchemy.dialects.postgresql import TSQUERY, TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.cache import filters_digest
+from app.core.config import settings
+from app.core.pagination import apply_keyset, split_page
+from app.models.claim import Claim, ComplexityTier
+
+SORT_COLUMNS = {
+    "created_at": Claim.created_at,
+    "gradient": Claim.gradient,
+    "vote_count": Claim.vote_count,
+}
+
+# Queries made only of words get prefix matching; anything else (quotes,
+# "or", "-term") is left to websearch_to_tsquery's operators
+PLAIN_QUERY = re.compile(r"[^\W_]+(?:\s+[^\W_]+)*")
+
+
+def normalize_query(q: str) -> str:
+    """Collapse case and whitespace, which do not change search results."""
+    return " ".join(q.lower().split())
+
+
+class SearchService:
+    """
+    Service for ranked claim search.
+    """
+
+    CACHE_PREFIX = "search:claims:"
+
+    def __init__(self, db: AsyncSession, redis_client: redis.Redis):
+        self.db = db
+        self.redis = redis_client
+
+    async def search_claims(
+        self,
+        q: str | None,
+        conditions: list[ColumnElement[bool]],
+        sort_by: str,
+        descending: bool,
+        limit: int,
+        cursor: str | None = None,
+    ) -> tuple[list[Claim], str | None]:
+        """
+        Get one page of matching claims.
+
+        Args:
+            q: Normalized search text, or None to only filter
+            conditions: Filter conditions from filter_conditions()
+            sort_by: "relevance" (requires q) or a key of SORT_COLUMNS
+            descending: Sort direction
+            limit: Page size
+            cursor: Cursor from the previous page
+
+        Returns:
+            Tuple of (claims, cursor for the next page or None)
+        """
+        if not q:
+            query = apply_keyset(
+                select(Claim).options(selectinload(Claim.author)).where(*conditions),
+                SORT_COLUMNS[sort_by],
+                Claim.id,
+                limit,
+                cursor,
+                descending,
+            )
+            result = await self.db.execute(query)
+            return split_page(
+                list(result.scalars().all()), limit, lambda c: (getattr(c, sort_by), c.id)
+            )
+
+        claims, next_cursor = await self._text_page(
+            q, conditions, sort_by, descending, limit, cursor, fuzzy=False
+        )
+        if not claims:
+            claims, next_cursor = await self._text_page(
+                q, conditions, sort_by, descending, limit, cursor, fuzzy=True
+            )
+        return claims, next_cursor
+
+    async def match_query(
+        self, q: str | None, conditions: list[ColumnElement[bool]]
+    ) -> Select:
+        """Build the unpaginated ID query for the rows a search matches, for counting."""
+        if not q:
+            return select(Claim.id).where(*conditions)
+
+        match, _ = self._text_match(q, fuzzy=False)
+        has_matches = await self.db.scalar(select(exists().where(match, *conditions)))
+        if not has_matches:
+            match, _ = self._text_match(q, fuzzy=True)
+        return select(Claim.id).where(match, *conditions)
+
+    @staticmethod
+    def filter_conditions(
+        tags: list[str] | None = None,
+        complexity: ComplexityTier | None = None,
+        min_gradient: float | None = None,
+        max_gradient: float | None = None,
+        author_id: UUID | None = None,
+    ) -> list[ColumnElement[bool]]:
+        """Build the non-text filter conditions of a search."""
+        conditions = []
+        if tags:
+            conditions.append(Claim.tags.overlap(tags))
+        if complexity:
+            conditions.append(Claim.complexity_tier == complexity)
+        if min_gradient is not None:
+            conditions.append(Claim.gradient >= min_gradient)
+        if max_gradient is not None:
+            conditions.append(Claim.gradient <= max_gradient)
+        if author_id:
+            conditions.append(Claim.author_agent_id == author_id)
+        return conditions
+
+    async def get_cached_page(self, params: dict[str, Any]) -> dict | None:
+        """Get a cached result page for these search parameters."""
+        cached = await self.redis.get(self._cache_key(params))
+        if cached:
+            return json.loads(cached)
+        return None
+
+    async def cache_page(self, params: dict[str, Any], page: dict) -> None:
+        """Cache a JSON-serializable result page."""
+        await self.redis.setex(
+            self._cache_key(params), settings.search_cache_ttl, json.dumps(page)
+        )
+
+    async def _text_page(
+        self,
+        q: str,
+        conditions: list[ColumnElement[bool]],
+        sort_by: str,
+        descending: bool,
+        limit: int,
+        cursor: str | None,
+        fuzzy: bool,
+    ) -> tuple[list[Claim], str | None]:
+        match, rank = self._text_match(q, fuzzy)
+        query = (
+            select(Claim, rank.label("rank"))
+            .options(selectinload(Claim.author))
+            .where(match, *conditions)
+        )
+
+        if sort_by == "relevance":
+            sort_column = rank
+            position = lambda row: (row.rank, row.Claim.id)  # noqa: E731
+        else:
+            sort_column = SORT_COLUMNS[sort_by]
+            position = lambda row: (getattr(row.Claim, sort_by), row.Claim.id)  # noqa: E731
+
+        query = apply_keyset(query, sort_column, Claim.id, limit, cursor, descending)
+        result = await self.db.execute(query)
+        rows, next_cursor = split_page(list(result.all()), limit, position)
+        return [row.Claim for row in rows], next_cursor
+
+    def _text_match(
+        self, q: str, fuzzy: bool
+    ) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+        """Build the (match condition, rank) pair for search text."""
+        if fuzzy:
+            return (
+                Claim.statement.bool_op("%")(q),
+                func.similarity(Claim.statement, q, type_=Float),
+            )
+
+        tsquery = func.websearch_to_tsquery("english", q, type_=TSQUERY)
+        if PLAIN_QUERY.fullmatch(q):
+            prefix = " & ".join(f"{term}:*" for term in q.split())
+            tsquery = tsquery.op("||")(func.to_tsquery("english", prefix))
+
+        return (
+            Claim.search_vector.bool_op("@@")(tsquery),
+            func.ts_rank_cd(Claim.search_vector, tsquery, type_=Float),
+        )
+
+    def _cache_key(self, params: dict[str, Any]) -> str:
+        return f"{self.CACHE_PREFIX}{filters_digest(params)}"
+
+
+async def backfill_search_vectors(
+    session_maker: async_sessionmaker[AsyncSession],
+    chunk_size: int = 1000,
+    concurrency: int = 4,
+) -> int:
+    """
+    Recompute search vectors that differ from the current search document.
+
+    Claims are split into ID ranges of chunk_size rows, and up to
+    concurrency ranges are updated at once, each in its own short
+    transaction so no lock is held for long.
+
+    Returns:
+        Number of claims updated
+    """
+    async with session_maker() as session:
+        numbered = select(
+            Claim.id, func.row_number().over(order_by=Claim.id).label("n")
+        ).subquery()
+        result = await session.execute(
+            select(numbered.c.id)
+            .where((numbered.c.n - 1) % chunk_size == 0)
+            .order_by(numbered.c.id)
+        )
+        starts = list(result.scalars().all())
+
+    table = Claim.__table__
+    document = func.claims_search_document(table.c.statement, table.c.tags, type_=TSVECTOR)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def backfill_range(start: UUID, end: UUID | None) -> int:
+        statement = (
+            update(table)
+            .where(table.c.id >= start, table.c.search_vector.is_distinct_from(document))
+            # Not a content change, so keep updated_at as is
+            .values(search_vector=document, updated_at=table.c.updated_at)
+        )
+        if end is not None:
+            statement = statement.where(table.c.id < end)
+
+        async with semaphore, session_maker() as range_session:
+            result = await range_session.execute(statement)
+            await range_session.commit()
+            return result.rowcount
+
+    counts = await asyncio.gather(*(
+        backfill_range(start, end) for start, end in zip(starts, starts[1:] + [None])
+    ))
+    return sum(counts)
@@ -0,0 +1,68 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.platform import PlatformCounter
+from app.schemas.discover import PlatformStats
+
+
+class StatsService:
+    """
+    Service for platform-wide statistics.
+
+    Row counts come from trigger-maintained platform counters, and active
+    agents from one HyperLogLog per day in Redis, so the stats cost one
+    small query and one PFCOUNT however large the tables grow.
+    """
+
+    ACTIVE_PREFIX = "active_agents:"
+    ACTIVE_WINDOW_DAYS = 7
+
+    def __init__(self, db: AsyncSession, redis_client: redis.Redis):
+        self.db = db
+        self.redis = redis_client
+
+    def _active_key(self, day: datetime) -> str:
+        return f"{self.ACTIVE_PREFIX}{day.date().isoformat()}"
+
+    async def mark_active(self, agent_id: UUID) -> None:
+        """Count an agent as active today."""
+        key = self._active_key(datetime.now(UTC))
+        pipeline = self.redis.pipeline(transaction=False)
+        pipeline.pfadd(key, str(agent_id))
+        # Kept one day past the window, so the oldest day is complete
+        pipeline.expire(key, int(timedelta(days=self.ACTIVE_WINDOW_DAYS + 1).total_seconds()))
+        await pipeline.execute()
+
+    async def count_active(self, days: int = ACTIVE_WINDOW_DAYS) -> int:
+        """
+        Approximate number of distinct agents active in the last days,
+        today included (HyperLogLog, about 1% standard error).
+        """
+        now = datetime.now(UTC)
+        keys = [self._active_key(now - timedelta(days=i)) for i in range(days)]
+        return await self.redis.pfcount(*keys)
+
+    async def get_counters(self) -> dict[str, int]:
+        """Current value of every platform counter, summed over its shards."""
+        result = await self.db.execute(
+            select(PlatformCounter.name, func.sum(PlatformCounter.value)).group_by(
+                PlatformCounter.name
+            )
+        )
+        return {name: int(value) for name, value in result.all()}
+
+    async def get_platform_stats(self) -> PlatformStats:
+        """Get platform-wide statistics."""
+        counters = await self.get_counters()
+        return PlatformStats.model_construct(
+            total_claims=counters.get("claims", 0),
+            total_agents=counters.get("agents", 0),
+            total_votes=counters.get("claim_votes", 0),
+            claims_at_consensus=counters.get("claims_at_consensus", 0),
+            active_agents_7d=await self.count_active(),
+            updated_at=datetime.now(UTC),
+        )
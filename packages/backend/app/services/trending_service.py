@@ -5,7 +5,12 @@ from uuid import UUID
 import redis.asyncio as redis
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, aliased
 
+from app.core.http_cache import VERSION_PREFIX, bump_versions
+from app.core.loaders import Loaders
+from app.core.response_cache import RESPONSE_PREFIX, hot_responses
+from app.core.tiered_cache import TieredCache, clear_everywhere
 from app.models.claim import Claim, ClaimVote
 from app.models.comment import Comment
 from app.models.evidence import Evidence
@@ -27,9 +32,17 @@ class TrendingService:
     CACHE_KEY = "trending:claims"
     CACHE_TTL = 300  # 5 minutes
 
-    def __init__(self, db: AsyncSession, redis_client: redis.Redis):
+    def __init__(
+        self, db: AsyncSession, redis_client: redis.Redis, loaders: Loaders | None = None
+    ):
         self.db = db
         self.redis = redis_client
+        self.loaders = loaders or Loaders(db)
+
+    @classmethod
+    def trending_cache_key(cls, limit: int, offset: int) -> str:
+        """Cache key of a trending page, also its HTTP cache resource name."""
+        return f"{cls.CACHE_KEY}:{limit}:{offset}"
 
     async def get_trending_claims(
         self,
@@ -41,12 +54,12 @@ class TrendingService:
 
         Returns list of dicts with claim data and trending score.
         """
-        cache_key = f"{self.CACHE_KEY}:{limit}:{offset}"
+        cache_key = self.trending_cache_key(limit, offset)
 
         # Try cache first
-        cached = await self.redis.get(cache_key)
-        if cached:
-            return json.loads(cached)
+        cached = await trending_pages.get(cache_key)
+        if cached is not None:
+            return cached
 
         # Calculate trending scores
         trending = await self._calculate_trending_scores()
@@ -57,15 +70,12 @@ class TrendingService:
         # Apply pagination
         paginated = trending[offset:offset + limit]
 
-        # Fetch full claim data for the paginated results
+        # Fetch full claim data for the paginated results; scoring loaded them
+        claims = await self.loaders.claims.load_many(
+            UUID(item["claim_id"]) for item in paginated
+        )
         result_claims = []
-        for item in paginated:
-            claim_id = UUID(item["claim_id"])
-            result = await self.db.execute(
-                select(Claim).where(Claim.id == claim_id)
-            )
-            claim = result.scalar_one_or_none()
-
+        for item, claim in zip(paginated, claims):
             if claim:
                 result_claims.append({
                     "id": str(claim.id),
@@ -84,7 +94,8 @@ class TrendingService:
                 })
 
         # Cache the result
-        await self.redis.setex(cache_key, self.CACHE_TTL, json.dumps(result_claims))
+        await trending_pages.set(cache_key, result_claims)
+        await bump_versions(self.redis, cache_key, ttl=self.CACHE_TTL, purge=False)
 
         return result_claims
 
@@ -103,36 +114,26 @@ class TrendingService:
             select(Claim).where(Claim.created_at >= seven_days_ago)
         )
         claims = list(result.scalars().all())
+        claim_ids = [claim.id for claim in claims]
+
+        # Activity in the last 24 hours, counted for all claims at once
+        votes = await self._count_since(
+            ClaimVote.claim_id, ClaimVote.created_at, claim_ids, twenty_four_hours_ago
+        )
+        evidence = await self._count_since(
+            Evidence.claim_id, Evidence.created_at, claim_ids, twenty_four_hours_ago
+        )
+        comments = await self._count_since(
+            Comment.claim_id, Comment.created_at, claim_ids, twenty_four_hours_ago
+        )
 
         trending = []
 
         for claim in claims:
-            # Count votes in last 24 hours
-            votes_result = await self.db.execute(
-                select(func.count(ClaimVote.claim_id)).where(
-                    ClaimVote.claim_id == claim.id,
-                    ClaimVote.created_at >= twenty_four_hours_ago,
-                )
-            )
-            votes_24h = votes_result.scalar() or 0
-
-            # Count evidence in last 24 hours
-            evidence_result = await self.db.execute(
-                select(func.count(Evidence.id)).where(
-                    Evidence.claim_id == claim.id,
-                    Evidence.created_at >= twenty_four_hours_ago,
-                )
-            )
-            evidence_24h = evidence_result.scalar() or 0
-
-            # Count comments in last 24 hours
-            comments_result = await self.db.execute(
-                select(func.count(Comment.id)).where(
-                    Comment.claim_id == claim.id,
-                    Comment.created_at >= twenty_four_hours_ago,
-                )
-            )
-            comments_24h = comments_result.scalar() or 0
+            self.loaders.claims.prime(claim.id, claim)
+            votes_24h = votes.get(claim.id, 0)
+            evidence_24h = evidence.get(claim.id, 0)
+            comments_24h = comments.get(claim.id, 0)
 
             # Calculate age in hours
             age_seconds = (now - claim.created_at).total_seconds()
@@ -154,6 +155,23 @@ class TrendingService:
 
         return trending
 
+    async def _count_since(
+        self,
+        claim_column: InstrumentedAttribute,
+        created_column: InstrumentedAttribute,
+        claim_ids: list[UUID],
+        since: datetime,
+    ) -> dict[UUID, int]:
+        """Rows per claim created since a moment, for claims with any."""
+        if not claim_ids:
+            return {}
+        result = await self.db.execute(
+            select(claim_column, func.count())
+            .where(claim_column.in_(claim_ids), created_column >= since)
+            .group_by(claim_column)
+        )
+        return dict(result.all())
+
     async def get_related_claims(
         self,
         claim_id: UUID,
@@ -173,22 +191,13 @@ class TrendingService:
             return json.loads(cached)
 
         # Get the source claim
-        result = await self.db.execute(
-            select(Claim).where(Claim.id == claim_id)
-        )
-        source_claim = result.scalar_one_or_none()
+        source_claim = await self.loaders.claims.load(claim_id)
 
         if not source_claim:
             return []
 
         source_tags = set(source_claim.tags or [])
 
-        # Get voters on source claim
-        result = await self.db.execute(
-            select(ClaimVote.agent_id).where(ClaimVote.claim_id == claim_id)
-        )
-        source_voters = {row[0] for row in result.all()}
-
         # Find related claims
         result = await self.db.execute(
             select(Claim).where(
@@ -198,6 +207,22 @@ class TrendingService:
         )
         candidates = list(result.scalars().all())
 
+        # Voters each candidate shares with the source claim, in one query
+        voter_overlaps = {}
+        if candidates:
+            source_vote = aliased(ClaimVote)
+            result = await self.db.execute(
+                select(ClaimVote.claim_id, func.count())
+                .where(
+                    ClaimVote.claim_id.in_([candidate.id for candidate in candidates]),
+                    ClaimVote.agent_id.in_(
+                        select(source_vote.agent_id).where(source_vote.claim_id == claim_id)
+                    ),
+                )
+                .group_by(ClaimVote.claim_id)
+            )
+            voter_overlaps = dict(result.all())
+
         related = []
         for candidate in candidates:
             candidate_tags = set(candidate.tags or [])
@@ -207,11 +232,7 @@ class TrendingService:
             tag_score = tag_overlap * 10 if tag_overlap > 0 else 0
 
             # Calculate voter overlap
-            result = await self.db.execute(
-                select(ClaimVote.agent_id).where(ClaimVote.claim_id == candidate.id)
-            )
-            candidate_voters = {row[0] for row in result.all()}
-            voter_overlap = len(source_voters & candidate_voters)
+            voter_overlap = voter_overlaps.get(candidate.id, 0)
             voter_score = voter_overlap * 5 if voter_overlap > 0 else 0
 
             relevance_score = tag_score + voter_score
@@ -327,17 +348,16 @@ class TrendingService:
 
     async def invalidate_cache(self) -> None:
         """Invalidate all trending caches."""
-        pattern = "trending:*"
-        cursor = 0
-        while True:
-            cursor, keys = await self.redis.scan(cursor, match=pattern, count=100)
-            if keys:
-                await self.redis.delete(*keys)
-            if cursor == 0:
-                break
-
-        # Also invalidate related and recommended caches
-        for prefix in ["related:*", "recommended:*"]:
+        # Trending pages, their cached responses and HTTP version stamps,
+        # plus related and recommended caches
+        patterns = [
+            "trending:*",
+            f"{RESPONSE_PREFIX}trending:*",
+            f"{VERSION_PREFIX}trending:*",
+            "related:*",
+            "recommended:*",
+        ]
+        for prefix in patterns:
             cursor = 0
             while True:
                 cursor, keys = await self.redis.scan(cursor, match=prefix, count=100)
@@ -345,3 +365,9 @@ class TrendingService:
                     await self.redis.delete(*keys)
                 if cursor == 0:
                     break
+        # And every process's copies of the pages and their responses
+        await clear_everywhere(trending_pages.local)
+        await clear_everywhere(hot_responses)
+
+
+trending_pages = TieredCache("trending", TrendingService.CACHE_TTL)
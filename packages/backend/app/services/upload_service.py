@@ -0,0 +1,266 @@
+"""
+Evidence file upload sessions.
+
+Files are content-addressed: the client declares the SHA-256 of the file up
+front, and if a verified blob with that digest already exists the upload is
+skipped entirely. Otherwise the file is uploaded to a staging key (a single
+presigned POST, or a presigned multipart session for large files), hashed
+server-side, and copied to its content-addressed key once verified.
+
+Session state lives in Redis. Incomplete multipart uploads left behind by
+expired sessions should be cleaned up with an S3 lifecycle rule on the
+staging prefix.
+"""
+
+import json
+import math
+import uuid
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.evidence import EvidenceBlob
+from app.services.s3_service import S3Service, S3ServiceError
+
+
+class UploadError(Exception):
+    """Raised when an upload session cannot be started, resumed or completed."""
+    pass
+
+
+class UploadSessionNotFoundError(UploadError):
+    """Raised when an upload session does not exist or belongs to another agent."""
+    pass
+
+
+class UploadService:
+    """
+    Service for deduplicated, resumable evidence uploads.
+    """
+
+    CACHE_PREFIX = "uploads:session:"
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        redis_client: redis.Redis,
+        s3_service: S3Service | None = None,
+    ):
+        self.db = db
+        self.redis = redis_client
+        self.s3 = s3_service or S3Service()
+
+    async def get_blob(self, sha256: str) -> EvidenceBlob | None:
+        """Get a verified blob by digest."""
+        result = await self.db.execute(
+            select(EvidenceBlob).where(EvidenceBlob.sha256 == sha256)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_blob_by_key(self, file_key: str) -> EvidenceBlob | None:
+        """Get a verified blob by its content-addressed key."""
+        result = await self.db.execute(
+            select(EvidenceBlob).where(EvidenceBlob.file_key == file_key)
+        )
+        return result.scalar_one_or_none()
+
+    async def start_upload(
+        self,
+        agent_id: UUID,
+        content_type: str,
+        sha256: str,
+        file_size: int,
+    ) -> dict:
+        """
+        Start an upload, or skip it if the content is already stored.
+
+        Args:
+            agent_id: ID of the uploading agent
+            content_type: MIME type of the file
+            sha256: Client-declared hex SHA-256 of the file
+            file_size: Client-declared size in bytes
+
+        Returns:
+            dict describing either the existing blob (already_exists=True) or
+            the new session: upload_id, and either a presigned POST
+            (upload_url/fields) or multipart part URLs
+        """
+        try:
+            max_size = self.s3.validate_upload(content_type, file_size)
+        except S3ServiceError as e:
+            raise UploadError(str(e))
+
+        blob = await self.get_blob(sha256)
+        if blob:
+            return {
+                'already_exists': True,
+                'file_key': blob.file_key,
+                'max_size': max_size,
+            }
+
+        session = {
+            'agent_id': str(agent_id),
+            'sha256': sha256,
+            'file_size': file_size,
+            'content_type': content_type,
+            'staging_key': self.s3.staging_key(str(agent_id)),
+            's3_upload_id': None,
+            'part_size': None,
+        }
+
+        response = {
+            'already_exists': False,
+            'upload_id': uuid.uuid4().hex,
+            'file_key': self.s3.blob_key(sha256),
+            'max_size': max_size,
+        }
+
+        try:
+            if file_size > settings.s3_multipart_threshold:
+                session['part_size'] = settings.s3_multipart_part_size
+                session['s3_upload_id'] = await self.s3.create_multipart_upload(
+                    session['staging_key'], content_type
+                )
+                response.update(await self._multipart_details(session, uploaded=[]))
+            else:
+                response.update(
+                    await self.s3.generate_upload_url(
+                        session['staging_key'], content_type, file_size
+                    )
+                )
+        except S3ServiceError as e:
+            raise UploadError(str(e))
+
+        await self._save_session(response['upload_id'], session)
+        return response
+
+    async def resume_upload(self, upload_id: str, agent_id: UUID) -> dict:
+        """
+        Get the state of a multipart upload so the client can continue it.
+
+        Returns:
+            dict with the parts already received and fresh URLs for the rest
+        """
+        session = await self._load_session(upload_id, agent_id)
+        if not session['s3_upload_id']:
+            raise UploadError("Only multipart uploads can be resumed")
+
+        try:
+            uploaded = await self.s3.list_uploaded_parts(
+                session['staging_key'], session['s3_upload_id']
+            )
+            details = await self._multipart_details(session, uploaded)
+        except S3ServiceError as e:
+            raise UploadError(str(e))
+
+        return {
+            'upload_id': upload_id,
+            'file_key': self.s3.blob_key(session['sha256']),
+            **details,
+        }
+
+    async def complete_upload(self, upload_id: str, agent_id: UUID) -> EvidenceBlob:
+        """
+        Finish an upload: assemble parts, verify the digest, store the blob.
+
+        On a digest or size mismatch the staged file is discarded and the
+        session ends.
+        """
+        session = await self._load_session(upload_id, agent_id)
+        staging_key = session['staging_key']
+
+        try:
+            if session['s3_upload_id']:
+                parts = await self.s3.list_uploaded_parts(staging_key, session['s3_upload_id'])
+                if len(parts) != self._part_count(session):
+                    raise UploadError("Not all parts have been uploaded")
+                await self.s3.complete_multipart_upload(
+                    staging_key, session['s3_upload_id'], parts
+                )
+            elif not await self.s3.file_exists(staging_key):
+                raise UploadError("File has not been uploaded")
+
+            sha256, size = await self.s3.compute_sha256(staging_key)
+            if sha256 != session['sha256'] or size != session['file_size']:
+                await self.s3.delete_file(staging_key)
+                await self.redis.delete(f"{self.CACHE_PREFIX}{upload_id}")
+                raise UploadError("Uploaded file does not match the declared SHA-256")
+
+            file_key = self.s3.blob_key(sha256)
+            await self.s3.copy_file(staging_key, file_key)
+            await self.s3.delete_file(staging_key)
+        except S3ServiceError as e:
+            raise UploadError(str(e))
+
+        # Another session may have stored the same content concurrently
+        await self.db.execute(
+            insert(EvidenceBlob)
+            .values(
+                sha256=sha256,
+                file_key=file_key,
+                file_size=size,
+                content_type=session['content_type'],
+                uploaded_by_agent_id=agent_id,
+            )
+            .on_conflict_do_nothing(index_elements=["sha256"])
+        )
+        await self.redis.delete(f"{self.CACHE_PREFIX}{upload_id}")
+
+        return await self.get_blob(sha256)
+
+    async def abort_upload(self, upload_id: str, agent_id: UUID) -> None:
+        """Cancel an upload and discard anything staged for it."""
+        session = await self._load_session(upload_id, agent_id)
+
+        try:
+            if session['s3_upload_id']:
+                await self.s3.abort_multipart_upload(
+                    session['staging_key'], session['s3_upload_id']
+                )
+            else:
+                await self.s3.delete_file(session['staging_key'])
+        except S3ServiceError as e:
+            raise UploadError(str(e))
+
+        await self.redis.delete(f"{self.CACHE_PREFIX}{upload_id}")
+
+    async def _multipart_details(self, session: dict, uploaded: list[dict]) -> dict:
+        """Build the multipart part of an upload response."""
+        received = {p['part_number'] for p in uploaded}
+        missing = [
+            n for n in range(1, self._part_count(session) + 1) if n not in received
+        ]
+        expires_in = 3600
+        return {
+            'part_size': session['part_size'],
+            'uploaded_parts': sorted(received),
+            'parts': await self.s3.generate_part_urls(
+                session['staging_key'], session['s3_upload_id'], missing, expires_in
+            ),
+            'expires_in': expires_in,
+        }
+
+    def _part_count(self, session: dict) -> int:
+        return math.ceil(session['file_size'] / session['part_size'])
+
+    async def _save_session(self, upload_id: str, session: dict) -> None:
+        await self.redis.setex(
+            f"{self.CACHE_PREFIX}{upload_id}",
+            settings.upload_session_ttl,
+            json.dumps(session),
+        )
+
+    async def _load_session(self, upload_id: str, agent_id: UUID) -> dict:
+        """Load a session, treating other agents' sessions as missing."""
+        data = await self.redis.get(f"{self.CACHE_PREFIX}{upload_id}")
+        if not data:
+            raise UploadSessionNotFoundError("Upload session not found or expired")
+
+        session = json.loads(data)
+        if session['agent_id'] != str(agent_id):
+            raise UploadSessionNotFoundError("Upload session not found or expired")
+        return session
@@ -0,0 +1,373 @@
+from datetime import UTC, datetime
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy import delete, func, literal_column, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.database import Base
+from app.core.principal import Principal
+from app.models.agent import Agent
+from app.models.claim import Claim, ClaimVote
+from app.models.comment import Comment, CommentVote
+from app.models.evidence import Evidence, EvidenceVote, VoteDirection
+from app.models.rate_limit import ActionType
+from app.services.gradient_service import GradientService
+from app.services.profile_service import ProfileService
+from app.services.rate_limiter_service import RateLimiterService
+from app.services.reputation_service import ReputationService
+
+
+class VoteService:
+    """
+    Service for recording votes and keeping vote counters exact.
+
+    Votes are written with a single upsert or delete that reports what it
+    replaced, and counters are adjusted in place (col = col + delta), so
+    concurrent votes neither lose counter updates nor insert duplicate
+    votes, and no row is read before it is written.
+
+    A batch costs one validation query, one rate-limit reservation, one
+    upsert and one gradient update per affected claim, instead of the
+    same round trips once per vote.
+    """
+
+    def __init__(self, db: AsyncSession, redis_client: redis.Redis):
+        self.db = db
+        self.redis = redis_client
+
+    async def cast_claim_votes(
+        self,
+        agent: Agent | Principal,
+        votes: list[tuple[UUID, float]],
+    ) -> list[dict]:
+        """
+        Record an agent's votes on several claims.
+
+        Each vote succeeds or fails on its own. Votes on unknown claims, on
+        the agent's own claims, repeated claims within the batch, and votes
+        beyond the agent's remaining daily budget are rejected; the rest are
+        recorded.
+
+        Args:
+            agent: The voting agent
+            votes: (claim_id, value) pairs in request order
+
+        Returns:
+            One dict per vote, in request order, with claim_id, success,
+            error and the claim's resulting gradient
+        """
+        results = [
+            {'claim_id': claim_id, 'success': False, 'error': None, 'gradient': None}
+            for claim_id, _ in votes
+        ]
+
+        result = await self.db.execute(
+            select(Claim.id, Claim.author_agent_id).where(
+                Claim.id.in_({claim_id for claim_id, _ in votes})
+            )
+        )
+        authors = dict(result.all())
+
+        # claim_id -> (position in batch, value)
+        accepted: dict[UUID, tuple[int, float]] = {}
+        for i, (claim_id, value) in enumerate(votes):
+            if claim_id not in authors:
+                results[i]['error'] = "Claim not found"
+            elif authors[claim_id] == agent.id:
+                results[i]['error'] = "Cannot vote on your own claim"
+            elif claim_id in accepted:
+                results[i]['error'] = "Duplicate vote on this claim in the batch"
+            else:
+                accepted[claim_id] = (i, value)
+
+        rate_limiter = RateLimiterService(self.db, self.redis)
+        granted = await rate_limiter.reserve(agent, ActionType.CLAIM_VOTE, len(accepted))
+        for claim_id in list(accepted)[granted:]:
+            i, _ = accepted.pop(claim_id)
+            results[i]['error'] = f"Rate limit exceeded for {ActionType.CLAIM_VOTE.value}"
+
+        if not accepted:
+            return results
+
+        vote_weight = await self.claim_vote_weight(agent.id)
+        await self.record_claim_votes(
+            agent.id, vote_weight, {claim_id: value for claim_id, (_, value) in accepted.items()}
+        )
+
+        gradient_service = GradientService(self.db, self.redis)
+        gradients = await gradient_service.update_gradients(list(accepted))
+
+        for claim_id, (i, _) in accepted.items():
+            results[i]['success'] = True
+            results[i]['gradient'] = gradients[claim_id]
+
+        return results
+
+    async def claim_vote_weight(self, agent_id: UUID) -> float:
+        """
+        Weight of an agent's claim votes, from its current reputation rather
+        than the principal snapshot, which can lag behind reputation changes.
+        """
+        reputation_service = ReputationService(self.db, self.redis)
+        reputation = await reputation_service.get_reputation(agent_id)
+        return max(0.1, reputation / 100)  # Normalize weight
+
+    async def record_claim_votes(
+        self, agent_id: UUID, weight: float, values: dict[UUID, float]
+    ) -> None:
+        """
+        Insert or replace an agent's votes on claims.
+
+        First votes on a claim add to its vote count. Gradients are not
+        updated.
+
+        Args:
+            agent_id: ID of the voting agent
+            weight: Weight of the agent's votes
+            values: Vote value per claim ID
+        """
+        stmt = insert(ClaimVote).values([
+            {
+                'claim_id': claim_id,
+                'agent_id': agent_id,
+                'value': value,
+                'weight': weight,
+            }
+            for claim_id, value in values.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=['claim_id', 'agent_id'],
+            set_={
+                'value': stmt.excluded.value,
+                'weight': stmt.excluded.weight,
+                'updated_at': datetime.now(UTC),
+            },
+        ).returning(ClaimVote.claim_id, literal_column("xmax = 0").label("inserted"))
+        result = await self.db.execute(stmt)
+
+        # Only first votes on a claim change its vote count
+        new_vote_claim_ids = [row.claim_id for row in result.all() if row.inserted]
+        if new_vote_claim_ids:
+            await self.db.execute(
+                update(Claim)
+                .where(Claim.id.in_(new_vote_claim_ids))
+                .values(vote_count=Claim.vote_count + 1)
+                .execution_options(synchronize_session=False)
+            )
+            profile_service = ProfileService(self.db, self.redis)
+            await profile_service.record_activity(agent_id, votes=len(new_vote_claim_ids))
+
+    async def remove_claim_vote(self, agent_id: UUID, claim_id: UUID) -> bool:
+        """
+        Remove an agent's vote on a claim. Gradients are not updated.
+
+        Returns:
+            Whether there was a vote to remove
+        """
+        result = await self.db.execute(
+            delete(ClaimVote)
+            .where(ClaimVote.claim_id == claim_id, ClaimVote.agent_id == agent_id)
+            .returning(ClaimVote.claim_id)
+        )
+        if result.scalar_one_or_none() is None:
+            return False
+
+        await self.db.execute(
+            update(Claim)
+            .where(Claim.id == claim_id)
+            .values(vote_count=func.greatest(Claim.vote_count - 1, 0))
+            .execution_options(synchronize_session=False)
+        )
+        profile_service = ProfileService(self.db, self.redis)
+        await profile_service.record_activity(agent_id, votes=-1)
+        return True
+
+    async def cast_evidence_vote(
+        self, evidence: Evidence, agent_id: UUID, direction: VoteDirection
+    ) -> bool:
+        """
+        Record an agent's up/down vote on evidence and refresh its counters.
+
+        Args:
+            evidence: The evidence voted on
+            agent_id: ID of the voting agent
+            direction: Direction of the vote
+
+        Returns:
+            Whether the vote is new or changed direction
+        """
+        previous = await self._upsert_vote(
+            EvidenceVote, EvidenceVote.evidence_id, evidence.id, agent_id, direction
+        )
+        if previous == direction:
+            return False
+        await self._adjust_evidence_counters(evidence, previous, direction)
+        if previous is None:
+            profile_service = ProfileService(self.db, self.redis)
+            await profile_service.record_activity(agent_id, votes=1)
+        return True
+
+    async def remove_evidence_vote(self, evidence: Evidence, agent_id: UUID) -> bool:
+        """
+        Remove an agent's vote on evidence and refresh its counters.
+
+        Returns:
+            Whether there was a vote to remove
+        """
+        previous = await self._delete_vote(
+            EvidenceVote, EvidenceVote.evidence_id, evidence.id, agent_id
+        )
+        if previous is None:
+            return False
+        await self._adjust_evidence_counters(evidence, previous, None)
+        profile_service = ProfileService(self.db, self.redis)
+        await profile_service.record_activity(agent_id, votes=-1)
+        return True
+
+    async def cast_comment_vote(
+        self, comment: Comment, agent_id: UUID, direction: VoteDirection
+    ) -> bool:
+        """
+        Record an agent's up/down vote on a comment and refresh its counters.
+
+        Args:
+            comment: The comment voted on
+            agent_id: ID of the voting agent
+            direction: Direction of the vote
+
+        Returns:
+            Whether the vote is new or changed direction
+        """
+        previous = await self._upsert_vote(
+            CommentVote, CommentVote.comment_id, comment.id, agent_id, direction
+        )
+        if previous == direction:
+            return False
+        upvotes, downvotes = _counter_deltas(previous, direction)
+        await self._adjust_counters(
+            comment,
+            upvotes=Comment.upvotes + upvotes,
+            downvotes=Comment.downvotes + downvotes,
+        )
+        return True
+
+    async def remove_comment_vote(self, comment: Comment, agent_id: UUID) -> bool:
+        """
+        Remove an agent's vote on a comment and refresh its counters.
+
+        Returns:
+            Whether there was a vote to remove
+        """
+        previous = await self._delete_vote(
+            CommentVote, CommentVote.comment_id, comment.id, agent_id
+        )
+        if previous is None:
+            return False
+        upvotes, downvotes = _counter_deltas(previous, None)
+        await self._adjust_counters(
+            comment,
+            upvotes=Comment.upvotes + upvotes,
+            downvotes=Comment.downvotes + downvotes,
+        )
+        return True
+
+    async def _upsert_vote(
+        self,
+        vote_model: type[EvidenceVote] | type[CommentVote],
+        target_column,
+        target_id: UUID,
+        agent_id: UUID,
+        direction: VoteDirection,
+    ) -> VoteDirection | None:
+        """
+        Insert or flip an up/down vote, returning the direction it replaced.
+
+        A vote in the same direction is left alone and returns no row; an
+        updated row can only have had the opposite direction. Unlike a
+        read before the write, this holds for concurrent votes too.
+        """
+        stmt = insert(vote_model).values({
+            target_column.key: target_id,
+            'agent_id': agent_id,
+            'direction': direction,
+        })
+        set_ = {'direction': stmt.excluded.direction}
+        if 'updated_at' in vote_model.__table__.c:
+            set_['updated_at'] = datetime.now(UTC)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[target_column.key, 'agent_id'],
+            set_=set_,
+            where=vote_model.direction != stmt.excluded.direction,
+        ).returning(literal_column("xmax = 0").label("inserted"))
+        row = (await self.db.execute(stmt)).one_or_none()
+
+        if row is None:
+            return direction
+        if row.inserted:
+            return None
+        return VoteDirection.DOWN if direction == VoteDirection.UP else VoteDirection.UP
+
+    async def _delete_vote(
+        self,
+        vote_model: type[EvidenceVote] | type[CommentVote],
+        target_column,
+        target_id: UUID,
+        agent_id: UUID,
+    ) -> VoteDirection | None:
+        """Delete an up/down vote, returning its direction if there was one."""
+        result = await self.db.execute(
+            delete(vote_model)
+            .where(target_column == target_id, vote_model.agent_id == agent_id)
+            .returning(vote_model.direction)
+        )
+        return result.scalar_one_or_none()
+
+    async def _adjust_evidence_counters(
+        self,
+        evidence: Evidence,
+        previous: VoteDirection | None,
+        direction: VoteDirection | None,
+    ) -> None:
+        upvotes, downvotes = _counter_deltas(previous, direction)
+        await self._adjust_counters(
+            evidence,
+            upvotes=Evidence.upvotes + upvotes,
+            downvotes=Evidence.downvotes + downvotes,
+            vote_score=Evidence.vote_score + upvotes - downvotes,
+        )
+
+    async def _adjust_counters(self, target: Base, **values) -> None:
+        """
+        Apply counter expressions to a row and refresh the loaded object
+        with the results, rather than with values computed in Python. Only
+        the counters are refreshed, so eagerly loaded relationships survive.
+        """
+        model = type(target)
+        result = await self.db.execute(
+            update(model)
+            .where(model.id == target.id)
+            .values(**values)
+            .returning(*(getattr(model, name) for name in values))
+            .execution_options(synchronize_session=False)
+        )
+        for name, value in zip(values, result.one()):
+            set_committed_value(target, name, value)
+
+
+def _counter_deltas(
+    previous: VoteDirection | None, direction: VoteDirection | None
+) -> tuple[int, int]:
+    """(upvotes, downvotes) changes for replacing one vote with another."""
+    upvotes = downvotes = 0
+    if previous == VoteDirection.UP:
+        upvotes -= 1
+    elif previous == VoteDirection.DOWN:
+        downvotes -= 1
+    if direction == VoteDirection.UP:
+        upvotes += 1
+    elif direction == VoteDirection.DOWN:
+        downvotes += 1
+    return upvotes, downvotes
@@ -5,18 +5,24 @@ Handles:
 - Gradient recalculation batching
 - Consensus checking
 - Reputation updates
+- CDN invalidation of changed resources
+- Monthly partition creation and retention
 """
 
 import asyncio
 import json
 import logging
-from datetime import UTC, datetime
 
 import redis.asyncio as redis
+from sqlalchemy import select
 
 from app.core.config import settings
 from app.core.database import async_session_maker
+from app.core.tiered_cache import listen_for_invalidations
+from app.models.claim import Claim, ClaimVote
+from app.services.cdn_service import CdnPurgeService
 from app.services.gradient_service import GradientService
+from app.services.partition_service import PartitionService, partitioned_tables
 from app.services.reputation_service import ReputationService
 
 logging.basicConfig(level=logging.INFO)
@@ -38,7 +44,9 @@ class Worker:
         await asyncio.gather(
             self.process_gradient_updates(),
             self.process_consensus_checks(),
-            self.cleanup_expired_tokens(),
+            self.manage_partitions(),
+            self.purge_cdn(),
+            listen_for_invalidations(),
         )
 
     async def stop(self):
@@ -89,9 +97,6 @@ class Worker:
             try:
                 # Check claims that have enough votes for consensus
                 async with async_session_maker() as db:
-                    from sqlalchemy import select
-                    from app.models.claim import Claim, ClaimVote
-
                     # Find claims with significant vote counts that need consensus check
                     result = await db.execute(
                         select(Claim)
@@ -136,33 +141,36 @@ class Worker:
                 logger.error(f"Error processing consensus checks: {e}")
                 await asyncio.sleep(60)
 
-    async def cleanup_expired_tokens(self):
-        """Clean up expired refresh tokens."""
+    async def manage_partitions(self):
+        """
+        Create upcoming monthly partitions and retire expired ones, which
+        also clears out expired refresh tokens.
+        """
         while self.running:
-            try:
-                async with async_session_maker() as db:
-                    from sqlalchemy import delete
-                    from app.models.refresh_token import RefreshToken
+            for table in partitioned_tables():
+                try:
+                    async with async_session_maker() as db:
+                        await PartitionService(db).maintain(table)
+                        await db.commit()
+                except Exception as e:
+                    logger.error(f"Error maintaining partitions of {table.name}: {e}")
 
-                    # Delete expired or revoked tokens
-                    result = await db.execute(
-                        delete(RefreshToken).where(
-                            (RefreshToken.expires_at < datetime.now(UTC))
-                            | (RefreshToken.is_revoked == True)
-                        )
-                    )
-                    deleted_count = result.rowcount
-                    await db.commit()
+            await asyncio.sleep(settings.partition_maintenance_interval)
 
-                    if deleted_count > 0:
-                        logger.info(f"Cleaned up {deleted_count} expired/revoked tokens")
+    async def purge_cdn(self):
+        """Invalidate CDN paths of resources changed since the last batch."""
+        if not settings.cloudfront_distribution_id:
+            return
 
-                # Run every hour
-                await asyncio.sleep(3600)
+        cdn_service = CdnPurgeService(self.redis)
+        while self.running:
+            try:
+                await cdn_service.purge_pending()
+                await asyncio.sleep(settings.cdn_purge_interval)
 
             except Exception as e:
-                logger.error(f"Error cleaning up tokens: {e}")
-                await asyncio.sleep(600)
+                logger.error(f"Error purging CDN: {e}")
+                await asyncio.sleep(settings.cdn_purge_interval * 2)
 
 
 async def main():
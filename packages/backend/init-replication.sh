@@ -0,0 +1,3 @@
+#!/bin/sh
+# Let the local read replica (the compose "replica" profile) stream from this server
+echo "host replication all all scram-sha-256" >> "$PGDATA/pg_hba.conf"
@@ -0,0 +1,79 @@
+"""Aggregate evidence vote notifications
+
+Revision ID: 006_notification_aggregation
+Revises: 005_profiles_and_discovery
+Create Date: 2024-01-27 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_notification_aggregation'
+down_revision: Union[str, None] = '005_profiles_and_discovery'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AGGREGATED_WHERE = "is_read = false AND type IN ('evidence_upvoted', 'evidence_downvoted')"
+
+
+def upgrade() -> None:
+    op.add_column('notifications', sa.Column('event_count', sa.Integer, server_default='1', nullable=False))
+    op.add_column(
+        'notifications',
+        sa.Column('recent_actor_ids', postgresql.ARRAY(postgresql.UUID(as_uuid=True)), server_default='{}', nullable=False),
+    )
+
+    # Collapse existing duplicate unread rows into the newest one per key
+    op.execute(f"""
+        WITH ranked AS (
+            SELECT id,
+                   row_number() OVER w AS rn,
+                   count(*) OVER (PARTITION BY agent_id, type, reference_id) AS total,
+                   (array_agg(actor_agent_id) FILTER (WHERE actor_agent_id IS NOT NULL) OVER w) AS actors
+            FROM notifications
+            WHERE {AGGREGATED_WHERE}
+            WINDOW w AS (
+                PARTITION BY agent_id, type, reference_id
+                ORDER BY created_at DESC, id DESC
+                ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+            )
+        )
+        UPDATE notifications n
+        SET event_count = ranked.total,
+            recent_actor_ids = COALESCE(ranked.actors[1:5], '{{}}')
+        FROM ranked
+        WHERE n.id = ranked.id AND ranked.rn = 1
+    """)
+    op.execute(f"""
+        DELETE FROM notifications
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY agent_id, type, reference_id
+                    ORDER BY created_at DESC, id DESC
+                ) AS rn
+                FROM notifications
+                WHERE {AGGREGATED_WHERE}
+            ) ranked
+            WHERE rn > 1
+        )
+    """)
+
+    op.create_index(
+        'uq_notifications_unread_aggregate',
+        'notifications',
+        ['agent_id', 'type', 'reference_id'],
+        unique=True,
+        postgresql_where=sa.text(AGGREGATED_WHERE),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_notifications_unread_aggregate', table_name='notifications')
+    op.drop_column('notifications', 'recent_actor_ids')
+    op.drop_column('notifications', 'event_count')
@@ -0,0 +1,35 @@
+"""Add content-addressed evidence blobs
+
+Revision ID: 007_evidence_blobs
+Revises: 006_notification_aggregation
+Create Date: 2024-01-28 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_evidence_blobs'
+down_revision: Union[str, None] = '006_notification_aggregation'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'evidence_blobs',
+        sa.Column('sha256', sa.String(64), primary_key=True),
+        sa.Column('file_key', sa.String(500), nullable=False, unique=True),
+        sa.Column('file_size', sa.Integer, nullable=False),
+        sa.Column('content_type', sa.String(100), nullable=False),
+        sa.Column('uploaded_by_agent_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('agents.id'), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('evidence_blobs')
@@ -0,0 +1,62 @@
+"""Add composite indexes for keyset pagination
+
+Revision ID: 008_keyset_pagination_indexes
+Revises: 007_evidence_blobs
+Create Date: 2024-01-29 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_keyset_pagination_indexes'
+down_revision: Union[str, None] = '007_evidence_blobs'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Claims: (sort key, id) for every supported sort; replaces single-column indexes
+    op.drop_index('ix_claims_gradient', table_name='claims')
+    op.drop_index('ix_claims_created_at', table_name='claims')
+    op.create_index('ix_claims_gradient_id', 'claims', ['gradient', 'id'])
+    op.create_index('ix_claims_created_at_id', 'claims', ['created_at', 'id'])
+    op.create_index('ix_claims_vote_count_id', 'claims', ['vote_count', 'id'])
+
+    # Public evidence on a claim
+    op.create_index(
+        'ix_evidence_claim_public_score', 'evidence', ['claim_id', 'vote_score', 'id'],
+        postgresql_where=sa.text("visibility = 'public'"),
+    )
+    op.create_index(
+        'ix_evidence_claim_public_created', 'evidence', ['claim_id', 'created_at', 'id'],
+        postgresql_where=sa.text("visibility = 'public'"),
+    )
+
+    # Root comments on a claim or its evidence
+    op.create_index(
+        'ix_comments_claim_roots', 'comments', ['claim_id', 'evidence_id', 'created_at', 'id'],
+        postgresql_where=sa.text('parent_id IS NULL'),
+    )
+
+    # An agent's bookmarks, follows and notifications, newest first
+    op.create_index('ix_bookmarks_agent_created', 'agent_claim_bookmarks', ['agent_id', 'created_at', 'claim_id'])
+    op.create_index('ix_follows_agent_created', 'agent_claim_follows', ['agent_id', 'created_at', 'claim_id'])
+    op.create_index('ix_notifications_agent_created_id', 'notifications', ['agent_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_agent_created_id', table_name='notifications')
+    op.drop_index('ix_follows_agent_created', table_name='agent_claim_follows')
+    op.drop_index('ix_bookmarks_agent_created', table_name='agent_claim_bookmarks')
+    op.drop_index('ix_comments_claim_roots', table_name='comments')
+    op.drop_index('ix_evidence_claim_public_created', table_name='evidence')
+    op.drop_index('ix_evidence_claim_public_score', table_name='evidence')
+    op.drop_index('ix_claims_vote_count_id', table_name='claims')
+    op.drop_index('ix_claims_created_at_id', table_name='claims')
+    op.drop_index('ix_claims_gradient_id', table_name='claims')
+    op.create_index('ix_claims_created_at', 'claims', ['created_at'])
+    op.create_index('ix_claims_gradient', 'claims', ['gradient'])
@@ -0,0 +1,52 @@
+"""Add maintained per-claim counters for list totals
+
+Revision ID: 009_claim_list_counters
+Revises: 008_keyset_pagination_indexes
+Create Date: 2024-01-30 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009_claim_list_counters'
+down_revision: Union[str, None] = '008_keyset_pagination_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('claims', sa.Column('public_evidence_count', sa.Integer, server_default='0', nullable=False))
+    op.add_column('claims', sa.Column('root_comment_count', sa.Integer, server_default='0', nullable=False))
+
+    # Backfill from existing rows
+    op.execute("""
+        UPDATE claims c
+        SET public_evidence_count = e.count
+        FROM (
+            SELECT claim_id, count(*) AS count
+            FROM evidence
+            WHERE visibility = 'public'
+            GROUP BY claim_id
+        ) e
+        WHERE e.claim_id = c.id
+    """)
+    op.execute("""
+        UPDATE claims c
+        SET root_comment_count = r.count
+        FROM (
+            SELECT claim_id, count(*) AS count
+            FROM comments
+            WHERE parent_id IS NULL AND evidence_id IS NULL
+            GROUP BY claim_id
+        ) r
+        WHERE r.claim_id = c.id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('claims', 'root_comment_count')
+    op.drop_column('claims', 'public_evidence_count')
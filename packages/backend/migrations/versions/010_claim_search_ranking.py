@@ -0,0 +1,69 @@
+"""Weighted, trigger-maintained claim search vectors and trigram index
+
+Revision ID: 010_claim_search_ranking
+Revises: 009_claim_list_counters
+Create Date: 2024-02-02 00:00:00.000000
+
+Existing rows keep their old vectors until backfilled; run
+`python -m scripts.backfill_search_vectors` after upgrading.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010_claim_search_ranking'
+down_revision: Union[str, None] = '009_claim_list_counters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION claims_search_document(statement text, tags varchar[])
+        RETURNS tsvector AS $$
+            SELECT setweight(to_tsvector('english', coalesce(statement, '')), 'A')
+                || setweight(to_tsvector('english', coalesce(array_to_string(tags, ' '), '')), 'B')
+        $$ LANGUAGE sql STABLE
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION claims_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := claims_search_document(NEW.statement, NEW.tags);
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+    # Only recompute when the searchable columns change
+    op.execute('DROP TRIGGER IF EXISTS claims_search_vector_trigger ON claims')
+    op.execute("""
+        CREATE TRIGGER claims_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF statement, tags ON claims
+        FOR EACH ROW EXECUTE FUNCTION claims_search_vector_update()
+    """)
+
+    # Fuzzy fallback for queries with no full-text matches
+    op.execute('CREATE INDEX ix_claims_statement_trgm ON claims USING gin (statement gin_trgm_ops)')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_claims_statement_trgm', table_name='claims')
+
+    op.execute('DROP TRIGGER IF EXISTS claims_search_vector_trigger ON claims')
+    op.execute("""
+        CREATE OR REPLACE FUNCTION claims_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := to_tsvector('english', COALESCE(NEW.statement, ''));
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER claims_search_vector_trigger
+        BEFORE INSERT OR UPDATE ON claims
+        FOR EACH ROW EXECUTE FUNCTION claims_search_vector_update()
+    """)
+    op.execute('DROP FUNCTION IF EXISTS claims_search_document(text, varchar[])')
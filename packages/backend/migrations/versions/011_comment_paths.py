@@ -0,0 +1,88 @@
+"""Stored depth and materialized paths for comment threads
+
+Revision ID: 011_comment_paths
+Revises: 010_claim_search_ranking
+Create Date: 2024-02-09 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011_comment_paths'
+down_revision: Union[str, None] = '010_claim_search_ranking'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('comments', sa.Column('depth', sa.SmallInteger(), nullable=True))
+    op.add_column('comments', sa.Column('path', sa.Text(collation='C'), nullable=True))
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION comment_path_segment(created_at timestamptz, id uuid)
+        RETURNS text AS $$
+            SELECT lpad(to_hex(floor(extract(epoch FROM created_at) * 1000000)::bigint), 16, '0')
+                || replace(id::text, '-', '')
+        $$ LANGUAGE sql IMMUTABLE
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION comments_path_update() RETURNS trigger AS $$
+        DECLARE
+            parent_path text;
+            parent_depth smallint;
+        BEGIN
+            NEW.created_at := coalesce(NEW.created_at, now());
+            NEW.path := comment_path_segment(NEW.created_at, NEW.id);
+            NEW.depth := 0;
+            IF NEW.parent_id IS NOT NULL THEN
+                SELECT path, depth INTO parent_path, parent_depth
+                FROM comments WHERE id = NEW.parent_id;
+                IF FOUND THEN
+                    NEW.path := parent_path || '/' || NEW.path;
+                    NEW.depth := parent_depth + 1;
+                END IF;
+            END IF;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER comments_path_trigger
+        BEFORE INSERT ON comments
+        FOR EACH ROW EXECUTE FUNCTION comments_path_update()
+    """)
+
+    # Backfill existing threads top-down
+    op.execute("UPDATE comments SET created_at = now() WHERE created_at IS NULL")
+    op.execute("""
+        WITH RECURSIVE threads AS (
+            SELECT id, 0 AS depth, comment_path_segment(created_at, id) AS path
+            FROM comments
+            WHERE parent_id IS NULL
+            UNION ALL
+            SELECT c.id, t.depth + 1, t.path || '/' || comment_path_segment(c.created_at, c.id)
+            FROM comments c
+            JOIN threads t ON c.parent_id = t.id
+        )
+        UPDATE comments
+        SET depth = threads.depth, path = threads.path
+        FROM threads
+        WHERE comments.id = threads.id
+    """)
+
+    op.alter_column('comments', 'depth', nullable=False)
+    op.alter_column('comments', 'path', nullable=False)
+    op.create_index('ix_comments_claim_path', 'comments', ['claim_id', 'path'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_comments_claim_path', table_name='comments')
+    op.execute('DROP TRIGGER IF EXISTS comments_path_trigger ON comments')
+    op.execute('DROP FUNCTION IF EXISTS comments_path_update()')
+    op.execute('DROP FUNCTION IF EXISTS comment_path_segment(timestamptz, uuid)')
+    op.drop_column('comments', 'path')
+    op.drop_column('comments', 'depth')
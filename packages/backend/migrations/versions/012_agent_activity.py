@@ -0,0 +1,45 @@
+"""Add maintained per-agent activity counters for profiles
+
+Revision ID: 012_agent_activity
+Revises: 011_comment_paths
+Create Date: 2024-02-14 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012_agent_activity'
+down_revision: Union[str, None] = '011_comment_paths'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'agent_activity',
+        sa.Column('agent_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('agents.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('claims_authored', sa.Integer, server_default='0', nullable=False),
+        sa.Column('evidence_submitted', sa.Integer, server_default='0', nullable=False),
+        sa.Column('votes_cast', sa.Integer, server_default='0', nullable=False),
+    )
+
+    # Backfill from existing rows
+    op.execute("""
+        INSERT INTO agent_activity (agent_id, claims_authored, evidence_submitted, votes_cast)
+        SELECT
+            a.id,
+            (SELECT count(*) FROM claims c WHERE c.author_agent_id = a.id),
+            (SELECT count(*) FROM evidence e WHERE e.author_agent_id = a.id),
+            (SELECT count(*) FROM claim_votes cv WHERE cv.agent_id = a.id)
+                + (SELECT count(*) FROM evidence_votes ev WHERE ev.agent_id = a.id)
+        FROM agents a
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('agent_activity')
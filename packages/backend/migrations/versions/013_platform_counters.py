@@ -0,0 +1,139 @@
+"""Add trigger-maintained platform counters
+
+Revision ID: 013_platform_counters
+Revises: 012_agent_activity
+Create Date: 2024-02-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013_platform_counters'
+down_revision: Union[str, None] = '012_agent_activity'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTED_TABLES = ('claims', 'agents', 'claim_votes')
+
+
+def upgrade() -> None:
+    op.create_table(
+        'platform_counters',
+        sa.Column('name', sa.String(50), primary_key=True),
+        sa.Column('shard', sa.SmallInteger, primary_key=True),
+        sa.Column('value', sa.BigInteger, server_default='0', nullable=False),
+    )
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION platform_counter_add(counter text, delta bigint)
+        RETURNS void AS $$
+            INSERT INTO platform_counters (name, shard, value)
+            VALUES (counter, mod(pg_backend_pid(), 16), delta)
+            ON CONFLICT (name, shard) DO UPDATE SET value = platform_counters.value + EXCLUDED.value
+        $$ LANGUAGE sql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION platform_counters_count_inserts() RETURNS trigger AS $$
+        DECLARE
+            n bigint;
+        BEGIN
+            SELECT count(*) INTO n FROM inserted_rows;
+            IF n > 0 THEN
+                PERFORM platform_counter_add(TG_ARGV[0], n);
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION platform_counters_count_deletes() RETURNS trigger AS $$
+        DECLARE
+            n bigint;
+        BEGIN
+            SELECT count(*) INTO n FROM deleted_rows;
+            IF n > 0 THEN
+                PERFORM platform_counter_add(TG_ARGV[0], -n);
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION claim_at_consensus(gradient double precision)
+        RETURNS boolean AS $$
+            SELECT gradient > 0.8 OR gradient < 0.2
+        $$ LANGUAGE sql IMMUTABLE
+    """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION claims_consensus_count() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' OR (TG_OP = 'UPDATE' AND claim_at_consensus(NEW.gradient)) THEN
+                PERFORM platform_counter_add('claims_at_consensus', 1);
+            ELSE
+                PERFORM platform_counter_add('claims_at_consensus', -1);
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+    for table in COUNTED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_count_inserts
+            AFTER INSERT ON {table} REFERENCING NEW TABLE AS inserted_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION platform_counters_count_inserts('{table}')
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_count_deletes
+            AFTER DELETE ON {table} REFERENCING OLD TABLE AS deleted_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION platform_counters_count_deletes('{table}')
+        """)
+    op.execute("""
+        CREATE TRIGGER claims_consensus_insert
+        AFTER INSERT ON claims
+        FOR EACH ROW WHEN (claim_at_consensus(NEW.gradient))
+        EXECUTE FUNCTION claims_consensus_count()
+    """)
+    op.execute("""
+        CREATE TRIGGER claims_consensus_delete
+        AFTER DELETE ON claims
+        FOR EACH ROW WHEN (claim_at_consensus(OLD.gradient))
+        EXECUTE FUNCTION claims_consensus_count()
+    """)
+    op.execute("""
+        CREATE TRIGGER claims_consensus_update
+        AFTER UPDATE OF gradient ON claims
+        FOR EACH ROW
+        WHEN (claim_at_consensus(OLD.gradient) IS DISTINCT FROM claim_at_consensus(NEW.gradient))
+        EXECUTE FUNCTION claims_consensus_count()
+    """)
+
+    # Backfill. Creating the triggers locked the counted tables against
+    # writes until this migration commits, so the counts are exact.
+    op.execute("""
+        INSERT INTO platform_counters (name, shard, value)
+        SELECT 'claims', 0, count(*) FROM claims
+        UNION ALL SELECT 'agents', 0, count(*) FROM agents
+        UNION ALL SELECT 'claim_votes', 0, count(*) FROM claim_votes
+        UNION ALL SELECT 'claims_at_consensus', 0, count(*) FROM claims
+            WHERE claim_at_consensus(gradient)
+    """)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS claims_consensus_update ON claims')
+    op.execute('DROP TRIGGER IF EXISTS claims_consensus_delete ON claims')
+    op.execute('DROP TRIGGER IF EXISTS claims_consensus_insert ON claims')
+    for table in COUNTED_TABLES:
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_count_deletes ON {table}')
+        op.execute(f'DROP TRIGGER IF EXISTS {table}_count_inserts ON {table}')
+    op.execute('DROP FUNCTION IF EXISTS claims_consensus_count()')
+    op.execute('DROP FUNCTION IF EXISTS claim_at_consensus(double precision)')
+    op.execute('DROP FUNCTION IF EXISTS platform_counters_count_deletes()')
+    op.execute('DROP FUNCTION IF EXISTS platform_counters_count_inserts()')
+    op.execute('DROP FUNCTION IF EXISTS platform_counter_add(text, bigint)')
+    op.drop_table('platform_counters')
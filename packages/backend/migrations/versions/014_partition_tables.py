@@ -0,0 +1,173 @@
+"""Partition append-only tables by month
+
+Revision ID: 014_partition_tables
+Revises: 013_platform_counters
+Create Date: 2024-02-17 00:00:00.000000
+
+"""
+from datetime import UTC, date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '014_partition_tables'
+down_revision: Union[str, None] = '013_platform_counters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+AGGREGATED_WHERE = "is_read = false AND type IN ('evidence_upvoted', 'evidence_downvoted')"
+
+# Months created ahead of the current one; the worker keeps this many ahead
+PREMAKE_MONTHS = 3
+
+# Table: (partition column, indexes, foreign keys)
+PARTITIONED_TABLES = {
+    'gradient_history': (
+        'recorded_at',
+        {
+            'ix_gradient_history_claim_id': ['claim_id'],
+            'ix_gradient_history_recorded_at': ['recorded_at'],
+            'ix_gradient_history_claim_time': ['claim_id', 'recorded_at'],
+        },
+        {'claim_id': 'claims'},
+    ),
+    'reputation_history': (
+        'recorded_at',
+        {
+            'ix_reputation_history_agent_id': ['agent_id'],
+            'ix_reputation_history_recorded_at': ['recorded_at'],
+            'ix_reputation_history_agent_time': ['agent_id', 'recorded_at'],
+        },
+        {'agent_id': 'agents'},
+    ),
+    'notifications': (
+        'created_month',
+        {
+            'ix_notifications_agent_id': ['agent_id'],
+            'ix_notifications_created_at': ['created_at'],
+            'ix_notifications_is_read': ['is_read'],
+            'ix_notifications_agent_read_created': ['agent_id', 'is_read', 'created_at'],
+            'ix_notifications_agent_created_id': ['agent_id', 'created_at', 'id'],
+        },
+        {'agent_id': 'agents', 'actor_agent_id': 'agents'},
+    ),
+    'rate_limit_counters': (
+        'date',
+        {},  # The unique index is created separately
+        {'agent_id': 'agents'},
+    ),
+    'refresh_tokens': (
+        'expires_at',
+        {
+            'ix_refresh_tokens_human_id': ['human_id'],
+            'ix_refresh_tokens_token_hash': ['token_hash'],
+            'ix_refresh_tokens_expires_at': ['expires_at'],
+        },
+        {'human_id': 'humans'},
+    ),
+}
+
+
+def _month_of(value: date | datetime) -> date:
+    if isinstance(value, datetime):
+        value = value.astimezone(UTC).date()
+    return value.replace(day=1)
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _bound(month: date) -> str:
+    return f"'{month.isoformat()} 00:00:00+00'"
+
+
+def _add_constraints(table: str, key: list[str], indexes: dict, foreign_keys: dict) -> None:
+    op.create_primary_key(f'{table}_pkey', table, key)
+    for column, referred in foreign_keys.items():
+        op.create_foreign_key(f'{table}_{column}_fkey', table, referred, [column], ['id'])
+    for name, columns in indexes.items():
+        op.create_index(name, table, columns)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    current = _month_of(datetime.now(UTC))
+
+    # Partition keys must be set and never change: history timestamps are
+    # filled in, and notifications, whose created_at moves as events are
+    # aggregated, get the month they were created in
+    op.execute('UPDATE gradient_history SET recorded_at = now() WHERE recorded_at IS NULL')
+    op.execute('UPDATE reputation_history SET recorded_at = now() WHERE recorded_at IS NULL')
+    op.add_column(
+        'notifications',
+        sa.Column(
+            'created_month',
+            sa.Date,
+            server_default=sa.text("date_trunc('month', now() AT TIME ZONE 'UTC')::date"),
+            nullable=False,
+        ),
+    )
+    op.execute("""
+        UPDATE notifications
+        SET created_month = date_trunc('month', created_at AT TIME ZONE 'UTC')::date
+        WHERE created_at IS NOT NULL
+    """)
+
+    for table, (column, indexes, foreign_keys) in PARTITIONED_TABLES.items():
+        old = f'{table}_unpartitioned'
+        op.rename_table(table, old)
+        op.execute(f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS) PARTITION BY RANGE ({column})')
+
+        oldest = bind.execute(sa.text(f'SELECT min({column}) FROM {old}')).scalar()
+        month = min(_month_of(oldest), current) if oldest is not None else current
+        while month <= _add_months(current, PREMAKE_MONTHS):
+            upper = _add_months(month, 1)
+            op.execute(
+                f'CREATE TABLE {table}_p{month:%Y%m} PARTITION OF {table} '
+                f'FOR VALUES FROM ({_bound(month)}) TO ({_bound(upper)})'
+            )
+            month = upper
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+        op.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+        op.drop_table(old)
+        _add_constraints(table, ['id', column], indexes, foreign_keys)
+
+    # Unique indexes must include the partition key
+    op.create_index(
+        'uq_notifications_unread_aggregate',
+        'notifications',
+        ['agent_id', 'type', 'reference_id', 'created_month'],
+        unique=True,
+        postgresql_where=sa.text(AGGREGATED_WHERE),
+    )
+    op.create_index('ix_rate_limit_agent_action_date', 'rate_limit_counters', ['agent_id', 'action_type', 'date'], unique=True)
+
+
+def downgrade() -> None:
+    for table, (column, indexes, foreign_keys) in PARTITIONED_TABLES.items():
+        partitioned = f'{table}_partitioned'
+        op.rename_table(table, partitioned)
+        op.execute(f'CREATE TABLE {table} (LIKE {partitioned} INCLUDING DEFAULTS)')
+        op.execute(f'INSERT INTO {table} SELECT * FROM {partitioned}')
+        # Drops the partitions along with it
+        op.drop_table(partitioned)
+        _add_constraints(table, ['id'], indexes, foreign_keys)
+
+    op.drop_column('notifications', 'created_month')
+    op.alter_column('gradient_history', 'recorded_at', nullable=True)
+    op.alter_column('reputation_history', 'recorded_at', nullable=True)
+    op.create_unique_constraint('refresh_tokens_token_hash_key', 'refresh_tokens', ['token_hash'])
+    op.create_index(
+        'uq_notifications_unread_aggregate',
+        'notifications',
+        ['agent_id', 'type', 'reference_id'],
+        unique=True,
+        postgresql_where=sa.text(AGGREGATED_WHERE),
+    )
+    op.create_index('ix_rate_limit_agent_action_date', 'rate_limit_counters', ['agent_id', 'action_type', 'date'], unique=True)
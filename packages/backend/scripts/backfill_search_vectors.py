@@ -0,0 +1,39 @@
+"""
+Backfill claim search vectors.
+
+New and edited claims get their search vector from a database trigger. Run
+this after changing the search document definition (or on data loaded with
+triggers disabled) to bring existing claims up to date. Claims that are
+already current are skipped, so it is safe to re-run.
+
+Run with: python -m scripts.backfill_search_vectors [--chunk-size N] [--concurrency N]
+"""
+
+import argparse
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.services.search_service import backfill_search_vectors
+
+
+async def main(chunk_size: int, concurrency: int) -> None:
+    """Backfill search vectors in concurrent chunks."""
+    engine = create_async_engine(settings.database_url, echo=False, pool_size=concurrency)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        updated = await backfill_search_vectors(async_session, chunk_size, concurrency)
+        print(f"Updated {updated} claim search vectors")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Claims per transaction")
+    parser.add_argument("--concurrency", type=int, default=4, help="Chunks updated at once")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.chunk_size, args.concurrency))
@@ -0,0 +1,484 @@
+"""
+Load-test the API with a weighted mix of realistic scenarios.
+
+Virtual users repeatedly pick a scenario: anonymous browsing of trending
+claims, claim lists and topics; a burst of authenticated votes on the most
+voted claim; an evidence and comment thread on a claim; and profile views.
+Each request's latency, status and query count (from the Server-Timing
+header QueryStatsMiddleware sets) is recorded per endpoint, and the run
+reports p50/p95/p99 latency, throughput and queries per request.
+
+By default the app runs in-process against the configured database and
+Redis, e.g. the docker-compose services loaded with
+scripts/generate_dataset.py; pass --url to load a running server instead.
+In-process users share the event loop with the app, so only compare runs
+made the same way.
+
+A report saved with --save-baseline can be passed to later runs as
+--baseline; the run then fails if overall throughput, or any endpoint's
+latency, query count or error rate, regresses past the thresholds.
+
+Scenarios write votes, evidence and comments, so use a disposable database.
+Daily rate limits carry over between runs on the same day; spread writes
+over more agents with --agents if writes start failing with 429s.
+
+Run with: python -m scripts.benchmark --users 20 --duration 60 --baseline benchmarks/baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import re
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.auth import create_access_token
+from app.core.config import settings
+from app.main import app
+from app.models.agent import Agent
+from app.models.claim import Claim
+
+# Relative weights of the scenarios in the mix
+SCENARIOS = {
+    "browse": 6,
+    "vote_burst": 2,
+    "discuss": 1,
+    "view_profiles": 2,
+}
+VOTE_BURST_SIZE = 10  # Agents voting on the hot claim at once
+CLAIM_SORTS = ["gradient", "vote_count", "created_at"]
+CONTENT = [
+    "The cited study used a much larger sample than earlier work.",
+    "Independent replication attempts have reported the same effect.",
+    "The original source was later corrected on this point.",
+    "Figures from the statistics office point the other way.",
+]
+
+_SERVER_TIMING_DB = re.compile(r'\bdb;dur=([\d.]+);desc="(\d+) queries"')
+
+
+def parse_server_timing(header: str | None) -> tuple[float, int] | None:
+    """The database time (ms) and query count from a Server-Timing header."""
+    match = _SERVER_TIMING_DB.search(header or "")
+    if match is None:
+        return None
+    return float(match.group(1)), int(match.group(2))
+
+
+def latency_percentiles(latencies: list[float]) -> dict[str, float]:
+    """The p50, p95 and p99 of latencies."""
+    if len(latencies) < 2:
+        value = latencies[0] if latencies else 0.0
+        return {"p50": value, "p95": value, "p99": value}
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {"p50": cuts[49], "p95": cuts[94], "p99": cuts[98]}
+
+
+@dataclass
+class EndpointStats:
+    """The requests made to one endpoint."""
+
+    latencies: list[float] = field(default_factory=list)  # Milliseconds
+    statuses: Counter[int] = field(default_factory=Counter)  # 0 for transport errors
+    queries: list[int] = field(default_factory=list)
+    db_ms: list[float] = field(default_factory=list)
+
+    def record(self, latency: float, status: int, timing: tuple[float, int] | None) -> None:
+        self.latencies.append(latency)
+        self.statuses[status] += 1
+        if timing is not None:
+            self.db_ms.append(timing[0])
+            self.queries.append(timing[1])
+
+    def summary(self, elapsed: float) -> dict[str, Any]:
+        requests = len(self.latencies)
+        errors = sum(n for status, n in self.statuses.items() if not 0 < status < 400)
+        return {
+            "requests": requests,
+            "throughput": round(requests / elapsed, 2),
+            "error_rate": round(errors / requests, 4),
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items())},
+            "latency_ms": {
+                name: round(value, 2)
+                for name, value in latency_percentiles(self.latencies).items()
+            },
+            # Queries are only reported by the app's middleware
+            "queries": {
+                "mean": round(statistics.fmean(self.queries), 2),
+                "max": max(self.queries),
+            } if self.queries else None,
+            "db_ms": round(statistics.fmean(self.db_ms), 2) if self.db_ms else None,
+        }
+
+
+@dataclass
+class Fixtures:
+    """Existing rows the scenarios act on."""
+
+    claim_ids: list[str]  # Most voted first; the first is the hot claim
+    agents: list[tuple[str, str]]  # Agent and human IDs, most reputable first
+
+
+async def load_fixtures(session: AsyncSession, claims: int, agents: int) -> Fixtures:
+    """
+    Pick the most voted claims and the most reputable agents, whose higher
+    tiers let them write the most before being rate limited.
+    """
+    result = await session.execute(
+        select(Claim.id, Claim.author_agent_id)
+        .order_by(Claim.vote_count.desc(), Claim.id)
+        .limit(claims)
+    )
+    rows = result.all()
+    if not rows:
+        raise RuntimeError("No claims to benchmark; load some with scripts/generate_dataset.py")
+
+    # The hot claim's author cannot vote on it
+    result = await session.execute(
+        select(Agent.id, Agent.human_id)
+        .where(Agent.id != rows[0].author_agent_id)
+        .order_by(Agent.reputation_score.desc(), Agent.id)
+        .limit(agents)
+    )
+    agent_ids = [(str(agent_id), str(human_id)) for agent_id, human_id in result]
+    if len(agent_ids) < 2:
+        raise RuntimeError(
+            "Too few agents to benchmark; load some with scripts/generate_dataset.py"
+        )
+    return Fixtures([str(claim_id) for claim_id, _ in rows], agent_ids)
+
+
+class LoadTest:
+    """Virtual users running scenarios against a client, recording every request."""
+
+    def __init__(self, client: httpx.AsyncClient, fixtures: Fixtures):
+        self.client = client
+        self.fixtures = fixtures
+        self.endpoints: defaultdict[str, EndpointStats] = defaultdict(EndpointStats)
+
+    async def request(
+        self,
+        method: str,
+        route: str,
+        *,
+        agent: tuple[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        **path: str,
+    ) -> Any:
+        """
+        Make a request, recorded under its route, and return the response
+        body, or None if it failed.
+        """
+        headers = {}
+        if agent is not None:
+            # Minted per request, so long runs outlive the token lifetime
+            token = create_access_token({"sub": agent[0], "human_id": agent[1]})
+            headers["Authorization"] = f"Bearer {token}"
+        url = settings.api_v1_prefix + route.format(**path)
+        stats = self.endpoints[f"{method} {route}"]
+
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(
+                method, url, headers=headers, params=params, json=json
+            )
+        except httpx.HTTPError:
+            stats.record((time.perf_counter() - started) * 1000, 0, None)
+            return None
+        stats.record(
+            (time.perf_counter() - started) * 1000,
+            response.status_code,
+            parse_server_timing(response.headers.get("server-timing")),
+        )
+        return response.json() if response.is_success else None
+
+    async def browse(self, rng: random.Random) -> None:
+        """An anonymous visitor looking through trending claims, lists and topics."""
+        await self.request("GET", "/discover/trending")
+        params = {"sort_by": rng.choice(CLAIM_SORTS)}
+        page = await self.request("GET", "/claims", params=params)
+        if page and page.get("next_cursor"):
+            page = await self.request(
+                "GET", "/claims", params={**params, "cursor": page["next_cursor"]}
+            )
+
+        topics = await self.request("GET", "/discover/topics")
+        if topics and topics["topics"]:
+            await self.request(
+                "GET", "/discover/topics/{tag}", tag=rng.choice(topics["topics"])["tag"]
+            )
+
+        if page and page["claims"]:
+            claim_id = rng.choice(page["claims"])["id"]
+        else:
+            claim_id = rng.choice(self.fixtures.claim_ids)
+        await self.request("GET", "/claims/{claim_id}", claim_id=claim_id)
+        await self.request("GET", "/evidence/claims/{claim_id}/evidence", claim_id=claim_id)
+        await self.request("GET", "/comments/claims/{claim_id}/comments", claim_id=claim_id)
+
+    async def vote_burst(self, rng: random.Random) -> None:
+        """Agents piling onto the hot claim at once, then someone reading it."""
+        claim_id = self.fixtures.claim_ids[0]
+        voters = rng.sample(self.fixtures.agents, min(VOTE_BURST_SIZE, len(self.fixtures.agents)))
+        await asyncio.gather(*(
+            self.request(
+                "POST",
+                "/claims/{claim_id}/vote",
+                agent=voter,
+                json={"value": round(rng.random(), 3)},
+                claim_id=claim_id,
+            )
+            for voter in voters
+        ))
+        await self.request("GET", "/claims/{claim_id}", claim_id=claim_id)
+
+    async def discuss(self, rng: random.Random) -> None:
+        """An agent adding evidence and a comment to a claim, and others replying."""
+        claim_id = rng.choice(self.fixtures.claim_ids)
+        author, replier = rng.sample(self.fixtures.agents, 2)
+        await self.request("GET", "/claims/{claim_id}", agent=author, claim_id=claim_id)
+        await self.request(
+            "GET", "/evidence/claims/{claim_id}/evidence", agent=author, claim_id=claim_id
+        )
+        await self.request(
+            "POST",
+            "/evidence/claims/{claim_id}/evidence",
+            agent=author,
+            json={"position": rng.choice(["supports", "opposes"]), "content": rng.choice(CONTENT)},
+            claim_id=claim_id,
+        )
+        comment = await self.request(
+            "POST",
+            "/comments/claims/{claim_id}/comments",
+            agent=author,
+            json={"content": rng.choice(CONTENT)},
+            claim_id=claim_id,
+        )
+        if comment is None:
+            return
+
+        await self.request(
+            "GET", "/comments/claims/{claim_id}/comments", agent=replier, claim_id=claim_id
+        )
+        await self.request(
+            "POST",
+            "/comments/claims/{claim_id}/comments",
+            agent=replier,
+            json={"content": rng.choice(CONTENT), "parent_id": comment["id"]},
+            claim_id=claim_id,
+        )
+        await self.request(
+            "POST",
+            "/comments/{comment_id}/vote",
+            agent=replier,
+            json={"direction": "up"},
+            comment_id=comment["id"],
+        )
+
+    async def view_profiles(self, rng: random.Random) -> None:
+        """A visitor looking at a prominent agent's profile and timeline."""
+        agent_id = rng.choice(self.fixtures.agents)[0]
+        await self.request("GET", "/profiles/{agent_id}", agent_id=agent_id)
+        await self.request("GET", "/profiles/{agent_id}/timeline", agent_id=agent_id)
+        await self.request("GET", "/agents/{agent_id}/stats", agent_id=agent_id)
+
+    async def run_user(self, rng: random.Random, deadline: float, iterations: int | None) -> None:
+        names, weights = list(SCENARIOS), list(SCENARIOS.values())
+        done = 0
+        while time.monotonic() < deadline and (iterations is None or done < iterations):
+            await getattr(self, rng.choices(names, weights)[0])(rng)
+            done += 1
+
+    async def run(
+        self,
+        users: int,
+        duration: float,
+        iterations: int | None = None,
+        seed: int = 0,
+    ) -> dict[str, Any]:
+        """
+        Run users concurrently for duration seconds, or until each has run
+        iterations scenarios, and report on the requests made.
+        """
+        started = time.monotonic()
+        await asyncio.gather(*(
+            self.run_user(random.Random(seed * 1000 + user), started + duration, iterations)
+            for user in range(users)
+        ))
+        elapsed = time.monotonic() - started
+
+        requests = sum(len(stats.latencies) for stats in self.endpoints.values())
+        return {
+            "users": users,
+            "seed": seed,
+            "elapsed": round(elapsed, 2),
+            "requests": requests,
+            "throughput": round(requests / elapsed, 2),
+            "endpoints": {
+                endpoint: self.endpoints[endpoint].summary(elapsed)
+                for endpoint in sorted(self.endpoints)
+            },
+        }
+
+
+@dataclass
+class Thresholds:
+    """How far a run may fall behind its baseline."""
+
+    latency: float = 0.25  # Relative increase in an endpoint's p50, p95 or p99
+    latency_floor: float = 5.0  # Milliseconds; smaller increases are noise
+    throughput: float = 0.2  # Relative drop in overall requests per second
+    queries: float = 1.0  # Increase in an endpoint's mean queries per request
+    error_rate: float = 0.01  # Increase in an endpoint's share of failed requests
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], thresholds: Thresholds) -> list[str]:
+    """Describe each regression of a report against a baseline."""
+    regressions = []
+    if report["throughput"] < baseline["throughput"] * (1 - thresholds.throughput):
+        regressions.append(
+            f"throughput: {report['throughput']} req/s, was {baseline['throughput']}"
+        )
+
+    for endpoint, current in report["endpoints"].items():
+        before = baseline["endpoints"].get(endpoint)
+        if before is None:
+            continue  # New endpoints have nothing to regress from
+
+        for name, value in current["latency_ms"].items():
+            previous = before["latency_ms"][name]
+            if (
+                value > previous * (1 + thresholds.latency)
+                and value - previous > thresholds.latency_floor
+            ):
+                regressions.append(f"{endpoint}: {name} {value}ms, was {previous}ms")
+
+        if current["queries"] and before["queries"]:
+            # Cache misses make the most queries noisy; a new query per
+            # request, or per row, moves the mean
+            value, previous = current["queries"]["mean"], before["queries"]["mean"]
+            if value > previous + thresholds.queries:
+                regressions.append(f"{endpoint}: {value} queries per request, was {previous}")
+
+        if current["error_rate"] > before["error_rate"] + thresholds.error_rate:
+            regressions.append(
+                f"{endpoint}: {current['error_rate']:.1%} errors, was {before['error_rate']:.1%}"
+            )
+    return regressions
+
+
+def print_report(report: dict[str, Any]) -> None:
+    print(f"{'endpoint':<48} {'reqs':>6} {'p50':>8} {'p95':>8} {'p99':>8} "
+          f"{'queries':>8} {'errors':>7}")
+    for endpoint, stats in report["endpoints"].items():
+        latency = stats["latency_ms"]
+        queries = f"{stats['queries']['mean']:.1f}" if stats["queries"] else "-"
+        print(f"{endpoint:<48} {stats['requests']:>6} {latency['p50']:>8.1f} "
+              f"{latency['p95']:>8.1f} {latency['p99']:>8.1f} {queries:>8} "
+              f"{stats['error_rate']:>7.1%}")
+    print(f"{report['requests']} requests in {report['elapsed']}s: "
+          f"{report['throughput']} req/s with {report['users']} users")
+
+
+async def main(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmark, in-process unless given a URL."""
+    engine = create_async_engine(settings.database_url, echo=False)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with async_session() as session:
+            fixtures = await load_fixtures(session, args.claims, args.agents)
+    finally:
+        await engine.dispose()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    async with AsyncExitStack() as stack:
+        if args.url:
+            client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+        else:
+            # Log lines per request would drown the report, which has the query counts
+            logging.getLogger("app.core.query_stats").setLevel(logging.ERROR)
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            client = httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app),
+                base_url="http://benchmark",
+                timeout=args.timeout,
+            )
+        await stack.enter_async_context(client)
+        return await LoadTest(client, fixtures).run(
+            args.users, args.duration, args.iterations, args.seed
+        )
+
+
+if __name__ == "__main__":
+    defaults = Thresholds()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="Server to load, e.g. http://localhost:8000; "
+                                      "by default the app runs in-process")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run for")
+    parser.add_argument("--iterations", type=int,
+                        help="Scenarios per user, ending the run before --duration")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--claims", type=int, default=1000,
+                        help="Most voted claims the scenarios act on")
+    parser.add_argument("--agents", type=int, default=500,
+                        help="Most reputable agents the scenarios act as")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Request timeout in seconds")
+    parser.add_argument("--output", type=Path, help="Write the report here as JSON")
+    parser.add_argument("--baseline", type=Path, help="Report to compare against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Write the report to --baseline instead of comparing")
+    parser.add_argument("--max-latency-regression", type=float, default=defaults.latency,
+                        help="Allowed relative increase in an endpoint's p50/p95/p99")
+    parser.add_argument("--latency-floor", type=float, default=defaults.latency_floor,
+                        help="Latency increases below this many milliseconds are ignored")
+    parser.add_argument("--max-throughput-drop", type=float, default=defaults.throughput,
+                        help="Allowed relative drop in requests per second")
+    parser.add_argument("--max-query-increase", type=float, default=defaults.queries,
+                        help="Allowed increase in an endpoint's mean queries per request")
+    parser.add_argument("--max-error-increase", type=float, default=defaults.error_rate,
+                        help="Allowed increase in an endpoint's error rate")
+    args = parser.parse_args()
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline needs --baseline")
+
+    report = asyncio.run(main(args))
+    print_report(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+    elif args.baseline:
+        regressions = compare(
+            report,
+            json.loads(args.baseline.read_text()),
+            Thresholds(
+                latency=args.max_latency_regression,
+                latency_floor=args.latency_floor,
+                throughput=args.max_throughput_drop,
+                queries=args.max_query_increase,
+                error_rate=args.max_error_increase,
+            ),
+        )
+        if regressions:
+            print(f"{len(regressions)} regressions against {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
@@ -0,0 +1,502 @@
+"""
+Generate a synthetic, production-shaped dataset for load tests and benchmarks.
+
+Activity follows power laws, as on the live platform: a few agents cast
+most votes, a few claims draw most votes, evidence and comments, and
+reputation is heavy-tailed. Comments form reply trees, and claims carry
+gradient history. Denormalized counters (vote and evidence counts,
+gradients, agent activity) match the generated rows.
+
+Rows are generated a chunk of claims at a time and streamed into Postgres
+with COPY, so memory use does not grow with the dataset and tens of
+millions of votes load in minutes. The same seed and parameters always
+produce the same rows.
+
+Existing data is cleared first. For the small hand-written demo dataset,
+use scripts/seed_data.py instead.
+
+Run with: python -m scripts.generate_dataset --agents 200000 --claims 1000000 --seed 1
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from itertools import accumulate
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.models.agent import AgentTier
+from app.models.claim import ComplexityTier
+from app.models.evidence import (
+    EvidenceContentType,
+    EvidencePosition,
+    EvidenceVisibility,
+    VoteDirection,
+)
+from app.models.history import ReputationChangeReason
+from app.services.reputation_service import TIER_CONFIG
+
+COLUMNS = {
+    "humans": ["id", "email", "created_at", "updated_at"],
+    "agents": [
+        "id", "human_id", "username", "display_name", "reputation_score", "tier",
+        "evidence_per_day", "votes_per_day", "learning_score", "accuracy_rate",
+        "total_resolved_votes", "correct_resolved_votes", "first_activity_at", "created_at",
+        "updated_at",
+    ],
+    "reputation_history": [
+        "id", "agent_id", "previous_score", "new_score", "delta", "reason", "recorded_at",
+    ],
+    "claims": [
+        "id", "statement", "author_agent_id", "gradient", "complexity_tier", "tags",
+        "vote_count", "evidence_count", "public_evidence_count", "root_comment_count",
+        "created_at", "updated_at",
+    ],
+    "claim_votes": ["claim_id", "agent_id", "value", "weight", "created_at", "updated_at"],
+    "evidence": [
+        "id", "claim_id", "author_agent_id", "position", "content_type", "content",
+        "vote_score", "upvotes", "downvotes", "visibility", "created_at", "updated_at",
+    ],
+    "evidence_votes": ["evidence_id", "agent_id", "direction", "created_at", "updated_at"],
+    # Parents come before their replies, so the path trigger finds them
+    "comments": [
+        "id", "claim_id", "author_agent_id", "parent_id", "content", "is_edited", "is_deleted",
+        "upvotes", "downvotes", "created_at", "updated_at",
+    ],
+    "gradient_history": ["id", "claim_id", "gradient", "vote_count", "recorded_at"],
+    "agent_activity": ["agent_id", "claims_authored", "evidence_submitted", "votes_cast"],
+}
+
+# Cleared before loading, dependents first
+CLEARED_TABLES = [
+    "notifications", "comment_votes", "comments", "evidence_votes", "evidence",
+    "evidence_blobs", "claim_votes", "claim_parents", "gradient_history",
+    "agent_claim_follows", "agent_claim_bookmarks", "agent_expertise", "claims",
+    "rate_limit_counters", "reputation_history", "agent_activity", "agents", "humans",
+    # Truncating skips the counting triggers
+    "platform_counters",
+]
+
+TOPICS = [
+    "science", "health", "politics", "economics", "technology", "history", "climate",
+    "nutrition", "space", "biology", "psychology", "law", "sports", "education", "energy",
+    "medicine", "geography", "culture", "security", "finance",
+]
+
+WORDS = (
+    "study report data evidence shows average rate increase decrease global local "
+    "people market energy water climate vaccine policy growth risk model trial effect "
+    "significant majority minority annual historical record trend cause linked between "
+    "higher lower than most every after before during since claims found measured"
+).split()
+
+COMMENTS = [
+    "Interesting point, do you have a source?",
+    "The evidence here looks solid to me.",
+    "I disagree, the study has a small sample.",
+    "Context matters a lot for this one.",
+    "This is well documented.",
+    "Can you elaborate on that?",
+]
+
+
+@dataclass
+class DatasetSpec:
+    """Size and shape of a generated dataset."""
+
+    agents: int = 10_000
+    claims: int = 100_000
+    # Counts per claim are Pareto-distributed with these means; the lower
+    # alpha (above 1), the heavier the tail
+    mean_votes: float = 20.0
+    vote_alpha: float = 1.5
+    mean_evidence: float = 2.0
+    mean_evidence_votes: float = 3.0
+    mean_comments: float = 3.0
+    reply_rate: float = 0.5  # Share of comments replying to an earlier one
+    # Zipf exponent of agent activity: how much the most active agents dominate
+    agent_skew: float = 0.8
+    history_points: int = 8  # Most gradient history entries per claim
+    days: int = 365  # Claims are spread over this many days up to end
+    seed: int = 0
+    chunk_size: int = 5_000  # Claims generated and copied at a time
+    end: datetime = field(
+        default_factory=lambda: datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    )
+
+
+def pareto_count(rng: random.Random, mean: float, alpha: float, cap: int) -> int:
+    """A heavy-tailed count with about the given mean, at most cap."""
+    scale = mean * (alpha - 1) / alpha
+    return min(cap, int(scale * rng.paretovariate(alpha)))
+
+
+def tier_for(reputation: float) -> AgentTier:
+    for tier, config in reversed(TIER_CONFIG.items()):
+        if reputation >= config["min_reputation"]:
+            return tier
+    return AgentTier.NEW
+
+
+def vote_weight(reputation: float) -> float:
+    """The weight GradientService gives a vote: log(1 + reputation), at least 0.1."""
+    return max(0.1, math.log(1 + max(0.0, reputation)))
+
+
+class DatasetGenerator:
+    """
+    Generates the rows of a dataset, by table, in COPY column order.
+
+    Every random choice comes from one seeded generator, in a fixed order.
+    """
+
+    def __init__(self, spec: DatasetSpec):
+        if spec.vote_alpha <= 1:
+            raise ValueError("vote_alpha must be above 1 for the mean to exist")
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.start = spec.end - timedelta(days=spec.days)
+        self.agent_ids: list[UUID] = []
+        self.reputations: list[float] = []
+        self.weights: list[float] = []
+        # Agents by activity rank; earlier agents are picked more often
+        self._agent_cum_weights = list(
+            accumulate(1 / (rank + 1) ** spec.agent_skew for rank in range(spec.agents))
+        )
+        self._claims_authored = [0] * spec.agents
+        self._evidence_submitted = [0] * spec.agents
+        self._votes_cast = [0] * spec.agents
+
+    def uuid(self) -> UUID:
+        return UUID(int=self.rng.getrandbits(128), version=4)
+
+    def moment_after(self, moment: datetime) -> datetime:
+        """A time between moment and the end, most likely soon after moment."""
+        return moment + (self.spec.end - moment) * self.rng.random() ** 3
+
+    def pick_agents(self, count: int, exclude: int | None = None) -> list[int]:
+        """Distinct agent indexes, favoring the most active agents."""
+        count = min(count, (self.spec.agents - 1) // 2)
+        picked = dict.fromkeys(
+            self.rng.choices(range(self.spec.agents), cum_weights=self._agent_cum_weights, k=count)
+        )
+        picked.pop(exclude, None)
+        # Duplicates of the most active agents are made up for uniformly
+        while len(picked) < count:
+            index = self.rng.randrange(self.spec.agents)
+            if index != exclude:
+                picked.setdefault(index)
+        return list(picked)
+
+    def agent_rows(self) -> dict[str, list[tuple]]:
+        """Humans, agents and their reputation history."""
+        rows: dict[str, list[tuple]] = {"humans": [], "agents": [], "reputation_history": []}
+        for i in range(self.spec.agents):
+            human_id, agent_id = self.uuid(), self.uuid()
+            created = self.start + (self.spec.end - self.start) * self.rng.random() / 2
+            reputation = round(10 * self.rng.paretovariate(1.2) - 10, 1)
+            tier = tier_for(reputation)
+            accuracy = min(1.0, max(0.0, self.rng.gauss(0.65, 0.12)))
+            resolved = pareto_count(self.rng, 20, 1.5, 100_000)
+            self.agent_ids.append(agent_id)
+            self.reputations.append(reputation)
+            self.weights.append(vote_weight(reputation))
+
+            rows["humans"].append((human_id, f"agent{i}@example.com", created, created))
+            rows["agents"].append((
+                agent_id, human_id, f"agent{i}", f"Agent {i}", reputation, tier.value,
+                TIER_CONFIG[tier]["evidence_per_day"], TIER_CONFIG[tier]["votes_per_day"],
+                0.5 + (accuracy - 0.5) * 0.8, accuracy, resolved, round(resolved * accuracy),
+                created, created, created,
+            ))
+
+            score = 0.0
+            moment = created
+            for _ in range(self.rng.randint(1, 5)):
+                moment = self.moment_after(moment)
+                delta = (reputation - score) * self.rng.random()
+                rows["reputation_history"].append((
+                    self.uuid(), agent_id, score, score + delta, delta,
+                    self.rng.choice(list(ReputationChangeReason)).value, moment,
+                ))
+                score += delta
+        return rows
+
+    def claim_rows(self) -> Iterator[dict[str, list[tuple]]]:
+        """Claims with their votes, evidence, comments and history, a chunk at a time."""
+        for first in range(0, self.spec.claims, self.spec.chunk_size):
+            rows: dict[str, list[tuple]] = {
+                table: []
+                for table in (
+                    "claims", "claim_votes", "evidence", "evidence_votes", "comments",
+                    "gradient_history",
+                )
+            }
+            for _ in range(first, min(first + self.spec.chunk_size, self.spec.claims)):
+                self._claim(rows)
+            yield rows
+
+    def _claim(self, rows: dict[str, list[tuple]]) -> None:
+        spec, rng = self.spec, self.rng
+        claim_id = self.uuid()
+        (author,) = self.pick_agents(1)
+        self._claims_authored[author] += 1
+        created = self.start + (spec.end - self.start) * rng.random()
+        tags = sorted(set(rng.choices(TOPICS, k=rng.randint(1, 3))))
+        statement = " ".join(rng.choices(WORDS, k=rng.randint(8, 24))).capitalize() + "."
+        truth = rng.betavariate(0.7, 0.7)
+
+        # Votes cluster around the claim's truth value
+        voters = self.pick_agents(
+            pareto_count(rng, spec.mean_votes, spec.vote_alpha, spec.agents), author
+        )
+        # The hottest loop, with lookups hoisted
+        gauss, uniform, weights, agent_ids = rng.gauss, rng.random, self.weights, self.agent_ids
+        votes_cast = self._votes_cast
+        span = spec.end - created
+        weighted_sum = weight_total = 0.0
+        votes = []
+        for voter in voters:
+            value = min(1.0, max(0.0, gauss(truth, 0.2)))
+            weight = weights[voter]
+            moment = created + span * uniform() ** 3
+            votes.append((claim_id, agent_ids[voter], value, weight, moment, moment))
+            weighted_sum += weight * value
+            weight_total += weight
+            votes_cast[voter] += 1
+        gradient = weighted_sum / weight_total if voters else 0.5
+        rows["claim_votes"].extend(votes)
+
+        evidence_count = pareto_count(rng, spec.mean_evidence, spec.vote_alpha, 100)
+        for _ in range(evidence_count):
+            self._evidence(rows, claim_id, created, truth)
+
+        root_count = 0
+        comment_times: list[tuple[UUID, datetime]] = []
+        for _ in range(pareto_count(rng, spec.mean_comments, spec.vote_alpha, 1000)):
+            (commenter,) = self.pick_agents(1)
+            parent_id = None
+            moment = self.moment_after(created)
+            if comment_times and rng.random() < spec.reply_rate:
+                parent_id, parent_created = rng.choice(comment_times)
+                moment = self.moment_after(parent_created)
+            else:
+                root_count += 1
+            comment_id = self.uuid()
+            comment_times.append((comment_id, moment))
+            rows["comments"].append((
+                comment_id, claim_id, self.agent_ids[commenter], parent_id,
+                rng.choice(COMMENTS), False, False, pareto_count(rng, 2, 1.5, 10_000),
+                rng.randint(0, 2), moment, moment,
+            ))
+
+        points = min(spec.history_points, len(votes))
+        for i in range(points):
+            progress = (i + 1) / points
+            moment = created + (spec.end - created) * progress
+            rows["gradient_history"].append((
+                self.uuid(), claim_id, 0.5 + (gradient - 0.5) * progress,
+                int(len(votes) * progress), moment,
+            ))
+
+        rows["claims"].append((
+            claim_id, statement, self.agent_ids[author], gradient,
+            rng.choice(list(ComplexityTier)).value, tags, len(votes), evidence_count,
+            evidence_count, root_count, created, created,
+        ))
+
+    def _evidence(
+        self, rows: dict[str, list[tuple]], claim_id: UUID, claim_created: datetime, truth: float
+    ) -> None:
+        spec, rng = self.spec, self.rng
+        evidence_id = self.uuid()
+        (author,) = self.pick_agents(1)
+        self._evidence_submitted[author] += 1
+        position = rng.choices(
+            [EvidencePosition.SUPPORTS, EvidencePosition.OPPOSES, EvidencePosition.NEUTRAL],
+            weights=[truth, 1 - truth, 0.2],
+        )[0]
+        created = self.moment_after(claim_created)
+
+        upvotes = downvotes = 0
+        voters = self.pick_agents(
+            pareto_count(rng, spec.mean_evidence_votes, spec.vote_alpha, spec.agents), author
+        )
+        for voter in voters:
+            direction = VoteDirection.UP if rng.random() < 0.72 else VoteDirection.DOWN
+            if direction == VoteDirection.UP:
+                upvotes += 1
+            else:
+                downvotes += 1
+            moment = self.moment_after(created)
+            rows["evidence_votes"].append(
+                (evidence_id, self.agent_ids[voter], direction.value, moment, moment)
+            )
+            self._votes_cast[voter] += 1
+
+        rows["evidence"].append((
+            evidence_id, claim_id, self.agent_ids[author], position.value,
+            EvidenceContentType.TEXT.value,
+            f"Evidence that {position.value} the claim: "
+            + " ".join(rng.choices(WORDS, k=rng.randint(20, 60))),
+            upvotes - downvotes, upvotes, downvotes, EvidenceVisibility.PUBLIC.value,
+            created, created,
+        ))
+
+    def activity_rows(self) -> list[tuple]:
+        """Agent activity counters, once every claim has been generated."""
+        return [
+            (agent_id, claims, evidence, votes)
+            for agent_id, claims, evidence, votes in zip(
+                self.agent_ids, self._claims_authored, self._evidence_submitted, self._votes_cast
+            )
+            if claims or evidence or votes
+        ]
+
+
+async def clear_tables(session: AsyncSession) -> None:
+    """Remove all platform data."""
+    for table in CLEARED_TABLES:
+        await session.execute(text(f"TRUNCATE TABLE {table} CASCADE"))
+
+
+async def drop_secondary_constraints(session: AsyncSession, tables: list[str]) -> list[str]:
+    """
+    Drop the foreign keys and non-unique indexes of tables.
+
+    Checking a foreign key and updating every index for each copied row
+    is most of the cost of a bulk load; rebuilding them afterwards checks
+    and sorts all rows at once. Primary keys and unique indexes stay.
+
+    Returns:
+        Statements recreating what was dropped
+    """
+    result = await session.execute(
+        text("""
+            SELECT conrelid::regclass::text, conname, pg_get_constraintdef(oid)
+            FROM pg_constraint
+            WHERE contype = 'f' AND conparentid = 0
+              AND conrelid = ANY(CAST(:tables AS regclass[]))
+        """),
+        {"tables": tables},
+    )
+    foreign_keys = result.all()
+    result = await session.execute(
+        text("""
+            SELECT indexrelid::regclass::text, pg_get_indexdef(indexrelid)
+            FROM pg_index
+            WHERE NOT indisunique AND indrelid = ANY(CAST(:tables AS regclass[]))
+        """),
+        {"tables": tables},
+    )
+    indexes = result.all()
+
+    for table, name, _ in foreign_keys:
+        await session.execute(text(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"'))
+    for name, _ in indexes:
+        await session.execute(text(f"DROP INDEX {name}"))
+    # Indexes of partitioned tables are defined ON ONLY the parent, which
+    # would leave out the partitions
+    return [definition.replace(" ON ONLY ", " ON ", 1) for _, definition in indexes] + [
+        f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}'
+        for table, name, definition in foreign_keys
+    ]
+
+
+async def load_dataset(session: AsyncSession, spec: DatasetSpec) -> dict[str, int]:
+    """
+    Generate a dataset and COPY it in, without committing.
+
+    Foreign keys and secondary indexes are rebuilt once loading is done,
+    and the next chunk is generated while the last one is copied.
+
+    Returns:
+        Rows copied by table
+    """
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+    copied = dict.fromkeys(COLUMNS, 0)
+
+    async def copy(rows_by_table: dict[str, list[tuple]]) -> None:
+        for table, rows in rows_by_table.items():
+            if rows:
+                await raw.driver_connection.copy_records_to_table(
+                    table, records=rows, columns=COLUMNS[table]
+                )
+                copied[table] += len(rows)
+
+    rebuild = await drop_secondary_constraints(session, list(COLUMNS))
+    generator = DatasetGenerator(spec)
+    await copy(generator.agent_rows())
+    chunks = generator.claim_rows()
+    pending = asyncio.ensure_future(asyncio.to_thread(next, chunks, None))
+    while (rows := await pending) is not None:
+        pending = asyncio.ensure_future(asyncio.to_thread(next, chunks, None))
+        await copy(rows)
+    await copy({"agent_activity": generator.activity_rows()})
+
+    for statement in rebuild:
+        await session.execute(text(statement))
+    return copied
+
+
+async def main(spec: DatasetSpec) -> None:
+    """Clear the database and load a generated dataset."""
+    engine = create_async_engine(settings.database_url, echo=False)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    started = time.monotonic()
+    try:
+        async with async_session() as session:
+            await clear_tables(session)
+            copied = await load_dataset(session, spec)
+            await session.commit()
+            # Fresh statistics, so benchmarks do not start on a naive planner
+            await session.execute(text("ANALYZE"))
+    finally:
+        await engine.dispose()
+
+    for table, count in copied.items():
+        print(f"  {table}: {count}")
+    print(f"Loaded in {time.monotonic() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    defaults = DatasetSpec()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--agents", type=int, default=defaults.agents)
+    parser.add_argument("--claims", type=int, default=defaults.claims)
+    parser.add_argument("--mean-votes", type=float, default=defaults.mean_votes,
+                        help="Mean votes per claim")
+    parser.add_argument("--vote-alpha", type=float, default=defaults.vote_alpha,
+                        help="Pareto shape of per-claim counts, above 1; lower is more skewed")
+    parser.add_argument("--mean-evidence", type=float, default=defaults.mean_evidence,
+                        help="Mean evidence per claim")
+    parser.add_argument("--mean-comments", type=float, default=defaults.mean_comments,
+                        help="Mean comments per claim")
+    parser.add_argument("--agent-skew", type=float, default=defaults.agent_skew,
+                        help="Zipf exponent of agent activity")
+    parser.add_argument("--days", type=int, default=defaults.days,
+                        help="Days of history to spread claims over")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args()
+
+    asyncio.run(main(DatasetSpec(
+        agents=args.agents,
+        claims=args.claims,
+        mean_votes=args.mean_votes,
+        vote_alpha=args.vote_alpha,
+        mean_evidence=args.mean_evidence,
+        mean_comments=args.mean_comments,
+        agent_skew=args.agent_skew,
+        days=args.days,
+        seed=args.seed,
+    )))
@@ -0,0 +1,77 @@
+"""
+Import claims in bulk from an NDJSON file.
+
+Each line is a JSON object with "statement" and optionally "complexity_tier",
+"tags", "parent_ids" (existing claims), "key" and "parent_keys" (keys of
+earlier lines in the same file). The file is streamed, so its size is not
+limited by memory. Invalid lines are skipped and listed afterwards; use
+--dry-run to only validate.
+
+Run with: python -m scripts.import_claims claims.ndjson --author <username>
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import AsyncIterator
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+from app.models.agent import Agent
+from app.services.import_service import ClaimImportService
+
+READ_SIZE = 256 * 1024
+
+
+async def read_chunks(path: str) -> AsyncIterator[bytes]:
+    """Read a file (or stdin for "-") in blocks without blocking the event loop."""
+    stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+    try:
+        while chunk := await asyncio.to_thread(stream.read, READ_SIZE):
+            yield chunk
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
+
+
+async def main(path: str, author: str, dry_run: bool) -> int:
+    """Import the file and print a report. Returns the process exit code."""
+    engine = create_async_engine(settings.database_url, echo=False)
+    async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with async_session() as session:
+            result = await session.execute(select(Agent.id).where(Agent.username == author))
+            agent_id = result.scalar_one_or_none()
+            if agent_id is None:
+                print(f"No agent named @{author}", file=sys.stderr)
+                return 1
+
+            report = await ClaimImportService(session).import_ndjson(agent_id, read_chunks(path))
+            if dry_run:
+                await session.rollback()
+            else:
+                await session.commit()
+    finally:
+        await engine.dispose()
+
+    verb = "Would create" if dry_run else "Created"
+    print(f"{verb} {report.created} claims, {report.failed} lines failed")
+    for error in report.errors:
+        print(f"  line {error['line']}: {error['error']}")
+    if report.failed > len(report.errors):
+        print(f"  ... and {report.failed - len(report.errors)} more")
+
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="NDJSON file, or - for stdin")
+    parser.add_argument("--author", required=True, help="Username of the authoring agent")
+    parser.add_argument("--dry-run", action="store_true", help="Validate without saving")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.path, args.author, args.dry_run)))
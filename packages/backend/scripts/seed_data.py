@@ -1,11 +1,15 @@
 """
 Seed script to populate the database with comprehensive sample data.
 
+This is a small hand-written demo dataset. For production-sized data, to
+load or benchmark against, use scripts/generate_dataset.py.
+
 Run with: python scripts/seed_data.py
 """
 
 import asyncio
 import random
+from collections import Counter
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
@@ -216,6 +220,8 @@ async def seed_database():
                 "reputation_history",
                 "agents",
                 "humans",
+                # Truncating skips the counting triggers
+                "platform_counters",
             ]
             for table in tables_to_clear:
                 await session.execute(text(f"TRUNCATE TABLE {table} CASCADE"))
@@ -273,9 +279,10 @@ async def seed_database():
             "biology": ["nick_neuro", "olivia_ocean", "alice_sci"],
         }
 
+        agents_by_username = {agent.username: agent for agent in agents}
         for tag, expert_usernames in tag_pools.items():
             for username in expert_usernames:
-                agent = next((a for a in agents if a.username == username), None)
+                agent = agents_by_username.get(username)
                 if agent:
                     expertise = AgentExpertise(
                         agent_id=agent.id,
@@ -432,8 +439,9 @@ async def seed_database():
         await session.flush()
 
         # Update evidence counts
+        evidence_counts = Counter(e.claim_id for e in evidence_list)
         for claim in claims:
-            claim.evidence_count = len([e for e in evidence_list if e.claim_id == claim.id])
+            claim.evidence_count = evidence_counts[claim.id]
 
         print(f"Created {len(evidence_list)} evidence items")
 
@@ -629,11 +637,18 @@ async def seed_database():
         await session.flush()
         print(f"Created {len(notifications)} notifications")
 
-        # ============ UPDATE SEARCH VECTORS ============
-        print("Updating search vectors...")
-        await session.execute(text(
-            "UPDATE claims SET search_vector = to_tsvector('english', statement)"
-        ))
+        # ============ ACTIVITY COUNTERS ============
+        # Rows above bypass the write paths that keep these counters
+        await session.execute(text("""
+            INSERT INTO agent_activity (agent_id, claims_authored, evidence_submitted, votes_cast)
+            SELECT
+                a.id,
+                (SELECT count(*) FROM claims c WHERE c.author_agent_id = a.id),
+                (SELECT count(*) FROM evidence e WHERE e.author_agent_id = a.id),
+                (SELECT count(*) FROM claim_votes cv WHERE cv.agent_id = a.id)
+                    + (SELECT count(*) FROM evidence_votes ev WHERE ev.agent_id = a.id)
+            FROM agents a
+        """))
 
         # ============ COMMIT ALL CHANGES ============
         await session.commit()
@@ -658,8 +673,7 @@ async def seed_database():
         print(f"  - {len(notifications)} notifications")
 
         print(f"\nSample logins (use with Google OAuth):")
-        for human in humans[:5]:
-            agent = next(a for a in agents if a.human_id == human.id)
+        for human, agent in zip(humans[:5], agents):
             print(f"  - {human.email} -> @{agent.username} ({agent.display_name})")
 
         print(f"\nTopics available: science, health, technology, environment, history,")
@@ -1,15 +1,19 @@
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
+from contextlib import contextmanager
 from typing import Any
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.core.database import Base, get_db
+from app.core.auth import get_read_db, get_read_session_maker
+from app.core.config import settings
+from app.core.database import Base, get_db, get_session_maker
+from app.core.query_stats import QueryStats
 from app.main import app
 from app.models.agent import Agent, AgentTier
 from app.models.human import Human
@@ -22,9 +26,54 @@ TEST_DATABASE_URL = os.environ.get(
 )
 
 
+class LazyLoadTracker:
+    """
+    Records relationship lazy loads issued through a session.
+
+    Relationships default to lazy="raise", so most unplanned loads fail on
+    their own; this also catches those that slip through, such as a
+    relationship declared with another lazy strategy or a lazyload() option.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.loads: list[str] = []
+        event.listen(session.sync_session, "do_orm_execute", self._on_execute)
+
+    def _on_execute(self, state) -> None:
+        if state.is_select and state.lazy_loaded_from is not None:
+            self.loads.append(str(state.loader_strategy_path))
+
+
+@contextmanager
+def max_queries(db_session: AsyncSession, limit: int) -> Generator[QueryStats, None, None]:
+    """
+    Fail if the block runs more than limit statements on the test database,
+    so N+1 regressions fail the suite:
+
+        with max_queries(db_session, 3):
+            response = await client.get(url)
+    """
+    stats = QueryStats()
+    engine = db_session.bind.sync_engine
+    listener = lambda *args: stats.record(args[2], 0.0)  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        yield stats
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert stats.count <= limit, (
+        f"{stats.count} queries run, at most {limit} expected:\n{stats.describe()}"
+    )
+
+
 @pytest_asyncio.fixture
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session with cleanup."""
+    """
+    Create a test database session with cleanup.
+
+    The test fails if anything it runs lazy loads a relationship; declare
+    loader options for what the code path needs instead.
+    """
     engine = create_async_engine(TEST_DATABASE_URL, echo=False)
     async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -35,6 +84,7 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         await session.execute(text("TRUNCATE TABLE comments CASCADE"))
         await session.execute(text("TRUNCATE TABLE evidence_votes CASCADE"))
         await session.execute(text("TRUNCATE TABLE evidence CASCADE"))
+        await session.execute(text("TRUNCATE TABLE evidence_blobs CASCADE"))
         await session.execute(text("TRUNCATE TABLE claim_votes CASCADE"))
         await session.execute(text("TRUNCATE TABLE claim_parents CASCADE"))
         await session.execute(text("TRUNCATE TABLE gradient_history CASCADE"))
@@ -46,23 +96,44 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         await session.execute(text("TRUNCATE TABLE agent_expertise CASCADE"))
         await session.execute(text("TRUNCATE TABLE agents CASCADE"))
         await session.execute(text("TRUNCATE TABLE humans CASCADE"))
+        # TRUNCATE does not fire the counting triggers
+        await session.execute(text("TRUNCATE TABLE platform_counters"))
         await session.commit()
 
+        lazy_loads = LazyLoadTracker(session)
+        session.info["lazy_loads"] = lazy_loads
         yield session
         # Rollback any uncommitted changes
         await session.rollback()
 
+        assert not lazy_loads.loads, f"Unplanned lazy loads: {lazy_loads.loads}"
+
     await engine.dispose()
 
 
 @pytest_asyncio.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test HTTP client."""
+async def client(
+    db_session: AsyncSession, override_redis: "MockRedis"
+) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Create a test HTTP client.
+
+    Authentication reads agent snapshots through Redis, so the client
+    always talks to the mock. Read-only sessions share the test session
+    instead of going to a replica. Work run concurrently with the request
+    uses the test database too, but only sees committed data.
+    """
 
     async def override_get_db():
         yield db_session
 
+    def override_get_session_maker():
+        return async_sessionmaker(db_session.bind, class_=AsyncSession, expire_on_commit=False)
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_session_maker] = override_get_session_maker
+    app.dependency_overrides[get_read_session_maker] = override_get_session_maker
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -118,35 +189,79 @@ class MockRedis:
 
     def __init__(self):
         self._data: dict[str, Any] = {}
+        self._ttls: dict[str, int] = {}
+        self.published: list[tuple[str, Any]] = []
 
     async def get(self, key: str) -> str | None:
         return self._data.get(key)
 
-    async def set(self, key: str, value: str, ex: int | None = None) -> None:
+    async def set(
+        self, key: str, value: str, ex: int | None = None, nx: bool = False
+    ) -> bool | None:
+        if nx and key in self._data:
+            return None
         self._data[key] = value
+        if ex is not None:
+            self._ttls[key] = ex
+        else:
+            self._ttls.pop(key, None)
+        return True
 
     async def setex(self, key: str, ttl: int, value: str) -> None:
         self._data[key] = value
+        self._ttls[key] = ttl
 
     async def delete(self, *keys: str) -> int:
         deleted = 0
         for key in keys:
             if key in self._data:
                 del self._data[key]
+                self._ttls.pop(key, None)
                 deleted += 1
         return deleted
 
     async def incr(self, key: str) -> int:
+        return await self.incrby(key, 1)
+
+    async def incrby(self, key: str, amount: int) -> int:
         current = int(self._data.get(key, 0))
-        self._data[key] = str(current + 1)
-        return current + 1
+        self._data[key] = str(current + amount)
+        return current + amount
 
     async def expire(self, key: str, ttl: int) -> None:
-        pass
+        if key in self._data:
+            self._ttls[key] = ttl
+
+    async def ttl(self, key: str) -> int:
+        if key not in self._data:
+            return -2
+        return self._ttls.get(key, -1)
 
     async def mget(self, keys: list[str]) -> list[str | None]:
         return [self._data.get(key) for key in keys]
 
+    async def sadd(self, key: str, *members: str) -> int:
+        current = self._data.setdefault(key, set())
+        added = len(set(members) - current)
+        current.update(members)
+        return added
+
+    async def spop(self, key: str, count: int | None = None) -> list[str] | str | None:
+        current = self._data.get(key, set())
+        popped = [current.pop() for _ in range(min(count or 1, len(current)))]
+        if not current:
+            self._data.pop(key, None)
+        if count is None:
+            return popped[0] if popped else None
+        return popped
+
+    async def pfadd(self, key: str, *elements: str) -> int:
+        # Exact sets stand in for HyperLogLogs
+        return int(await self.sadd(key, *elements) > 0)
+
+    async def pfcount(self, *keys: str) -> int:
+        return len(set().union(*(self._data.get(key, set()) for key in keys)))
+
     async def scan(self, cursor: int, match: str = "*", count: int = 100) -> tuple[int, list[str]]:
         """Mock scan for pattern matching keys."""
         import fnmatch
@@ -154,7 +269,11 @@ class MockRedis:
         matching_keys = [k for k in self._data.keys() if fnmatch.fnmatch(k, pattern)]
         return (0, matching_keys)  # Return cursor=0 to indicate end of scan
 
-    def pipeline(self):
+    async def publish(self, channel: str, message: Any) -> int:
+        self.published.append((channel, message))
+        return 0
+
+    def pipeline(self, transaction: bool = True):
         return MockPipeline(self)
 
     async def aclose(self):
@@ -169,17 +288,103 @@ class MockPipeline:
         self._commands: list[tuple] = []
 
     def setex(self, key: str, ttl: int, value: str):
-        self._commands.append(("setex", key, ttl, value))
+        self._commands.append(("setex", (key, ttl, value), {}))
+        return self
+
+    def set(self, key: str, value: str, **kwargs):
+        self._commands.append(("set", (key, value), kwargs))
+        return self
+
+    def sadd(self, key: str, *members: str):
+        self._commands.append(("sadd", (key, *members), {}))
+        return self
+
+    def incrby(self, key: str, amount: int):
+        self._commands.append(("incrby", (key, amount), {}))
+        return self
+
+    def ttl(self, key: str):
+        self._commands.append(("ttl", (key,), {}))
+        return self
+
+    def pfadd(self, key: str, *elements: str):
+        self._commands.append(("pfadd", (key, *elements), {}))
+        return self
+
+    def expire(self, key: str, ttl: int):
+        self._commands.append(("expire", (key, ttl), {}))
         return self
 
     async def execute(self):
-        for cmd in self._commands:
-            if cmd[0] == "setex":
-                await self._redis.setex(cmd[1], cmd[2], cmd[3])
-        return [True] * len(self._commands)
+        results = []
+        for name, args, kwargs in self._commands:
+            results.append(await getattr(self._redis, name)(*args, **kwargs))
+        self._commands = []
+        return results
 
 
 @pytest.fixture
 def mock_redis() -> MockRedis:
     """Create a mock Redis client."""
     return MockRedis()
+
+
+@pytest.fixture(autouse=True)
+def tiered_caches(mock_redis: MockRedis, monkeypatch: pytest.MonkeyPatch):
+    """Back the tiered caches with the mock, starting from empty in-process caches."""
+    from app.core.tiered_cache import TieredCache, clear_local_caches
+
+    monkeypatch.setattr(TieredCache, "redis_client", mock_redis)
+    clear_local_caches()
+    yield mock_redis
+    clear_local_caches()
+
+
+@pytest.fixture
+def override_redis(mock_redis: MockRedis):
+    """Route the API's Redis dependencies to the mock."""
+    from app.core.redis import get_redis, get_redis_bytes
+    from app.main import app
+
+    async def _override():
+        return mock_redis
+
+    app.dependency_overrides[get_redis] = _override
+    app.dependency_overrides[get_redis_bytes] = _override
+    yield mock_redis
+    app.dependency_overrides.pop(get_redis, None)
+    app.dependency_overrides.pop(get_redis_bytes, None)
+
+
+@pytest.fixture(scope="session")
+def s3_endpoint() -> Generator[str, None, None]:
+    """Run a local S3 stand-in (moto server) for the test session."""
+    from moto.server import ThreadedMotoServer
+
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    yield f"http://{host}:{port}"
+    server.stop()
+
+
+@pytest.fixture
+def local_s3(s3_endpoint: str, monkeypatch: pytest.MonkeyPatch) -> Generator[Any, None, None]:
+    """Point the shared S3 client at the local stand-in with an empty bucket."""
+    from app.services.s3_service import get_s3_client
+
+    monkeypatch.setattr(settings, "s3_endpoint_url", s3_endpoint)
+    monkeypatch.setattr(settings, "aws_access_key_id", "testing")
+    monkeypatch.setattr(settings, "aws_secret_access_key", "testing")
+    get_s3_client.cache_clear()
+
+    s3_client = get_s3_client()
+    s3_client.create_bucket(Bucket=settings.s3_bucket_name)
+    try:
+        yield s3_client
+    finally:
+        objects = s3_client.list_objects_v2(Bucket=settings.s3_bucket_name).get("Contents", [])
+        for obj in objects:
+            s3_client.delete_object(Bucket=settings.s3_bucket_name, Key=obj["Key"])
+        s3_client.delete_bucket(Bucket=settings.s3_bucket_name)
+        get_s3_client.cache_clear()
@@ -0,0 +1,202 @@
+"""Tests for batch claim voting."""
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.agent import Agent, AgentTier
+from app.models.claim import Claim, ClaimVote, ComplexityTier
+from app.models.history import GradientHistory
+from app.models.human import Human
+from app.models.rate_limit import ActionType
+from app.services.rate_limiter_service import RateLimiterService
+from app.services.reputation_service import ReputationService, reputation_cache
+from tests.conftest import MockRedis
+
+
+@pytest_asyncio.fixture
+async def other_author(db_session: AsyncSession) -> Agent:
+    """Create an agent whose claims the test agent votes on."""
+    human = Human(id=uuid4(), email="author@example.com")
+    db_session.add(human)
+    await db_session.flush()
+
+    agent = Agent(id=uuid4(), human_id=human.id, username="author", tier=AgentTier.NEW)
+    db_session.add(agent)
+    await db_session.flush()
+    return agent
+
+
+async def _create_claims(
+    db_session: AsyncSession, author: Agent, count: int
+) -> list[Claim]:
+    claims = [
+        Claim(
+            id=uuid4(),
+            statement=f"Batch voted claim {i}",
+            author_agent_id=author.id,
+            complexity_tier=ComplexityTier.SIMPLE,
+        )
+        for i in range(count)
+    ]
+    db_session.add_all(claims)
+    await db_session.flush()
+    return claims
+
+
+@pytest.mark.asyncio
+async def test_batch_vote_reports_partial_failure(
+    client,
+    override_redis: MockRedis,
+    db_session: AsyncSession,
+    test_agent: Agent,
+    other_author: Agent,
+    auth_headers: dict[str, str],
+):
+    """Valid votes are recorded while invalid ones are rejected individually."""
+    first, second = await _create_claims(db_session, other_author, 2)
+    (own,) = await _create_claims(db_session, test_agent, 1)
+    missing_id = uuid4()
+
+    response = await client.post(
+        "/api/v1/claims/votes",
+        json={"votes": [
+            {"claim_id": str(first.id), "value": 0.9},
+            {"claim_id": str(missing_id), "value": 0.5},
+            {"claim_id": str(own.id), "value": 1.0},
+            {"claim_id": str(second.id), "value": 0.2},
+            {"claim_id": str(first.id), "value": 0.1},
+        ]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["accepted"] == 2
+    assert data["rejected"] == 3
+    assert [r["success"] for r in data["results"]] == [True, False, False, True, False]
+    assert data["results"][1]["error"] == "Claim not found"
+    assert data["results"][0]["gradient"] == pytest.approx(0.9)
+    assert data["results"][3]["gradient"] == pytest.approx(0.2)
+
+    # Voting again updates the votes without counting them twice
+    response = await client.post(
+        "/api/v1/claims/votes",
+        json={"votes": [{"claim_id": str(first.id), "value": 0.4}]},
+        headers=auth_headers,
+    )
+    assert response.json()["results"][0]["gradient"] == pytest.approx(0.4)
+
+    await db_session.refresh(first)
+    assert first.vote_count == 1
+    assert first.gradient == pytest.approx(0.4)
+    vote_count = await db_session.scalar(
+        select(func.count()).select_from(ClaimVote).where(ClaimVote.claim_id == first.id)
+    )
+    assert vote_count == 1
+    # One history entry per claim per batch
+    history_count = await db_session.scalar(
+        select(func.count()).select_from(GradientHistory)
+        .where(GradientHistory.claim_id == first.id)
+    )
+    assert history_count == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_vote_consumes_rate_limit_once(
+    client,
+    override_redis: MockRedis,
+    db_session: AsyncSession,
+    test_agent: Agent,
+    other_author: Agent,
+    auth_headers: dict[str, str],
+):
+    """Votes beyond the remaining daily budget are rejected, the rest recorded."""
+    claims = await _create_claims(db_session, other_author, 5)
+    limiter = RateLimiterService(db_session, override_redis)
+    limit = await limiter.get_limit_for_action(test_agent, ActionType.CLAIM_VOTE)
+    await limiter.reserve(test_agent, ActionType.CLAIM_VOTE, limit - 3)
+
+    response = await client.post(
+        "/api/v1/claims/votes",
+        json={"votes": [{"claim_id": str(c.id), "value": 0.7} for c in claims]},
+        headers=auth_headers,
+    )
+    data = response.json()
+    assert [r["success"] for r in data["results"]] == [True, True, True, False, False]
+    assert data["results"][4]["error"].startswith("Rate limit exceeded")
+    assert await limiter.get_remaining(test_agent, ActionType.CLAIM_VOTE) == 0
+
+
+@pytest.mark.asyncio
+async def test_batch_vote_size_is_bounded(client, auth_headers: dict[str, str]):
+    """Empty and oversized batches are rejected."""
+    response = await client.post("/api/v1/claims/votes", json={"votes": []}, headers=auth_headers)
+    assert response.status_code == 422
+
+    votes = [{"claim_id": str(uuid4()), "value": 0.5} for _ in range(101)]
+    response = await client.post(
+        "/api/v1/claims/votes", json={"votes": votes}, headers=auth_headers
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_batch_and_single_votes_are_weighted_alike(
+    client,
+    override_redis: MockRedis,
+    db_session: AsyncSession,
+    test_agent: Agent,
+    other_author: Agent,
+    auth_headers: dict[str, str],
+):
+    """Both vote endpoints weigh votes by current reputation, not the principal snapshot."""
+    first, second = await _create_claims(db_session, other_author, 2)
+    # A reputation change the cached principal has not caught up with
+    await reputation_cache.set(f"{ReputationService.CACHE_PREFIX}{test_agent.id}", 250.0)
+
+    response = await client.post(
+        "/api/v1/claims/votes",
+        json={"votes": [{"claim_id": str(first.id), "value": 0.9}]},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    response = await client.post(
+        f"/api/v1/claims/{second.id}/vote", json={"value": 0.9}, headers=auth_headers
+    )
+    assert response.status_code == 200
+
+    result = await db_session.execute(
+        select(ClaimVote.weight).where(ClaimVote.agent_id == test_agent.id)
+    )
+    assert result.scalars().all() == [2.5, 2.5]
+
+
+@pytest.mark.asyncio
+async def test_single_vote_saves_the_gradient(
+    client,
+    override_redis: MockRedis,
+    db_session: AsyncSession,
+    other_author: Agent,
+    auth_headers: dict[str, str],
+):
+    """A vote stores the new gradient, with a history entry counting the vote."""
+    (claim,) = await _create_claims(db_session, other_author, 1)
+
+    response = await client.post(
+        f"/api/v1/claims/{claim.id}/vote", json={"value": 0.9}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["gradient"] == pytest.approx(0.9)
+    assert response.json()["vote_count"] == 1
+
+    result = await db_session.execute(
+        select(Claim.gradient, Claim.vote_count).where(Claim.id == claim.id)
+    )
+    assert result.one() == (pytest.approx(0.9), 1)
+    result = await db_session.execute(
+        select(GradientHistory.gradient, GradientHistory.vote_count)
+        .where(GradientHistory.claim_id == claim.id)
+    )
+    assert result.all() == [(pytest.approx(0.9), 1)]
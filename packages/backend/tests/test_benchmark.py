@@ -0,0 +1,77 @@
+"""Tests for the endpoint load-test harness."""
+import random
+from datetime import UTC, datetime
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import scripts.benchmark as benchmark
+from scripts.benchmark import (
+    SCENARIOS,
+    EndpointStats,
+    LoadTest,
+    Thresholds,
+    compare,
+    load_fixtures,
+    parse_server_timing,
+)
+from scripts.generate_dataset import DatasetSpec, load_dataset
+
+
+def test_runs_are_compared_with_their_baseline():
+    """Latency, query and error regressions past the thresholds are reported."""
+    assert parse_server_timing('cdn;dur=2, db;dur=12.5;desc="7 queries"') == (12.5, 7)
+    assert parse_server_timing(None) is None
+
+    def report(latency: float, queries: int, status: int) -> dict:
+        stats = EndpointStats()
+        for i in range(100):
+            stats.record(latency + i, status if i < 5 else 200, (1.0, queries))
+        return {
+            "throughput": 100.0,
+            "endpoints": {"GET /claims": stats.summary(elapsed=1.0)},
+        }
+
+    baseline = report(latency=10.0, queries=2, status=200)
+    assert baseline["endpoints"]["GET /claims"]["latency_ms"] == {
+        "p50": 59.5,
+        "p95": 104.05,
+        "p99": 108.01,
+    }
+    assert compare(report(12.0, 2, 200), baseline, Thresholds()) == []
+    assert compare(report(12.0, 4, 500), baseline, Thresholds()) == [
+        "GET /claims: 4.0 queries per request, was 2.0",
+        "GET /claims: 5.0% errors, was 0.0%",
+    ]
+    assert compare(report(50.0, 2, 200), baseline, Thresholds(latency=0.5)) == [
+        "GET /claims: p50 99.5ms, was 59.5ms",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_scenarios_exercise_the_api(
+    db_session: AsyncSession, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+):
+    """Each scenario's requests succeed and report their query counts."""
+    # Requests share the test session, so cannot run concurrently
+    monkeypatch.setattr(benchmark, "VOTE_BURST_SIZE", 1)
+    spec = DatasetSpec(agents=50, claims=30, chunk_size=20, end=datetime.now(UTC))
+    await load_dataset(db_session, spec)
+    # Profiles are built on connections of their own, which need the rows committed
+    await db_session.commit()
+    fixtures = await load_fixtures(db_session, claims=10, agents=20)
+
+    load_test = LoadTest(client, fixtures)
+    for scenario in SCENARIOS:
+        await getattr(load_test, scenario)(random.Random(0))
+
+    assert {
+        "GET /discover/trending",
+        "POST /claims/{claim_id}/vote",
+        "POST /comments/{comment_id}/vote",
+        "GET /profiles/{agent_id}",
+    } <= set(load_test.endpoints)
+    for endpoint, stats in load_test.endpoints.items():
+        assert set(stats.statuses) <= {200, 201}, endpoint
+        assert len(stats.queries) == len(stats.latencies)
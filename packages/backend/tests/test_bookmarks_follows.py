@@ -81,7 +81,9 @@ async def test_remove_bookmark(client, bookmark_claim: Claim, auth_headers: dict
 
 
 @pytest.mark.asyncio
-async def test_list_bookmarks(client, bookmark_claim: Claim, auth_headers: dict[str, str]):
+async def test_list_bookmarks(
+    client, override_redis, bookmark_claim: Claim, auth_headers: dict[str, str]
+):
     """Test listing bookmarked claims."""
     # Bookmark the claim
     await client.post(
@@ -90,7 +92,9 @@ async def test_list_bookmarks(client, bookmark_claim: Claim, auth_headers: dict[
     )
 
     # List bookmarks
-    response = await client.get("/api/v1/claims/bookmarks", headers=auth_headers)
+    response = await client.get(
+        "/api/v1/claims/bookmarks", params={"include_total": True}, headers=auth_headers
+    )
 
     assert response.status_code == 200
     data = response.json()
@@ -105,9 +109,11 @@ async def test_list_bookmarks(client, bookmark_claim: Claim, auth_headers: dict[
 
 
 @pytest.mark.asyncio
-async def test_list_bookmarks_empty(client, auth_headers: dict[str, str]):
+async def test_list_bookmarks_empty(client, override_redis, auth_headers: dict[str, str]):
     """Test listing bookmarks when none exist."""
-    response = await client.get("/api/v1/claims/bookmarks", headers=auth_headers)
+    response = await client.get(
+        "/api/v1/claims/bookmarks", params={"include_total": True}, headers=auth_headers
+    )
 
     assert response.status_code == 200
     data = response.json()
@@ -191,7 +197,9 @@ async def test_unfollow_claim(client, bookmark_claim: Claim, auth_headers: dict[
 
 
 @pytest.mark.asyncio
-async def test_list_following(client, bookmark_claim: Claim, auth_headers: dict[str, str]):
+async def test_list_following(
+    client, override_redis, bookmark_claim: Claim, auth_headers: dict[str, str]
+):
     """Test listing followed claims."""
     # Follow the claim
     await client.post(
@@ -200,7 +208,9 @@ async def test_list_following(client, bookmark_claim: Claim, auth_headers: dict[
     )
 
     # List following
-    response = await client.get("/api/v1/claims/following", headers=auth_headers)
+    response = await client.get(
+        "/api/v1/claims/following", params={"include_total": True}, headers=auth_headers
+    )
 
     assert response.status_code == 200
     data = response.json()
@@ -215,9 +225,11 @@ async def test_list_following(client, bookmark_claim: Claim, auth_headers: dict[
 
 
 @pytest.mark.asyncio
-async def test_list_following_empty(client, auth_headers: dict[str, str]):
+async def test_list_following_empty(client, override_redis, auth_headers: dict[str, str]):
     """Test listing followed claims when none exist."""
-    response = await client.get("/api/v1/claims/following", headers=auth_headers)
+    response = await client.get(
+        "/api/v1/claims/following", params={"include_total": True}, headers=auth_headers
+    )
 
     assert response.status_code == 200
     data = response.json()
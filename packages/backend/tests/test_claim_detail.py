@@ -0,0 +1,97 @@
+"""Tests for the claim detail read path."""
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.agent import Agent
+from app.models.claim import Claim, ClaimParent, ClaimVote, ComplexityTier
+from app.models.history import GradientHistory
+
+
+@pytest.mark.asyncio
+async def test_claim_detail_includes_vote_history_and_parents(
+    client,
+    db_session: AsyncSession,
+    override_redis,
+    test_agent: Agent,
+    auth_headers: dict[str, str],
+):
+    """The detail page carries the caller's vote, newest history first and parents."""
+    parent = Claim(
+        id=uuid4(),
+        statement="A parent claim",
+        author_agent_id=test_agent.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+        tags=["base"],
+    )
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim with history",
+        author_agent_id=test_agent.id,
+        complexity_tier=ComplexityTier.MODERATE,
+        gradient=0.8,
+        vote_count=1,
+    )
+    db_session.add_all([parent, claim])
+    await db_session.flush()
+
+    start = datetime.now(UTC) - timedelta(hours=10)
+    db_session.add_all([
+        ClaimParent(parent_id=parent.id, child_id=claim.id),
+        ClaimVote(claim_id=claim.id, agent_id=test_agent.id, value=0.8, weight=1.0),
+        *[
+            GradientHistory(
+                claim_id=claim.id,
+                gradient=i / 10,
+                vote_count=i,
+                recorded_at=start + timedelta(hours=i),
+            )
+            for i in range(5)
+        ],
+    ])
+    await db_session.flush()
+
+    response = await client.get(
+        f"/api/v1/claims/{claim.id}",
+        params={"history_limit": 3},
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["gradient"] == 0.8
+    assert data["user_vote"] == 0.8
+    assert data["author"]["username"] == test_agent.username
+    assert data["tags"] == []
+    assert [h["vote_count"] for h in data["gradient_history"]] == [4, 3, 2]
+
+    (parent_data,) = data["parent_claims"]
+    assert parent_data["id"] == str(parent.id)
+    assert parent_data["author"]["username"] == test_agent.username
+    assert parent_data["tags"] == ["base"]
+
+
+@pytest.mark.asyncio
+async def test_claim_detail_anonymous_and_missing(
+    client, db_session: AsyncSession, override_redis, test_agent
+):
+    """Anonymous callers get no vote; unknown claims are 404."""
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim nobody voted on",
+        author_agent_id=test_agent.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(claim)
+    await db_session.flush()
+
+    response = await client.get(f"/api/v1/claims/{claim.id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["user_vote"] is None
+    assert data["gradient_history"] == []
+    assert data["parent_claims"] == []
+
+    response = await client.get(f"/api/v1/claims/{uuid4()}")
+    assert response.status_code == 404
@@ -0,0 +1,118 @@
+"""Tests for bulk NDJSON claim import."""
+import json
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.agent import Agent, AgentTier
+from app.models.claim import Claim, ClaimParent, ComplexityTier
+from app.services.import_service import MAX_LINE_BYTES, ClaimImportService
+
+
+@pytest_asyncio.fixture
+async def trusted_agent(db_session: AsyncSession, test_agent: Agent) -> Agent:
+    """Promote the test agent to the tier allowed to import."""
+    test_agent.tier = AgentTier.TRUSTED
+    await db_session.flush()
+    return test_agent
+
+
+def _ndjson(*lines: dict | str) -> bytes:
+    return b"\n".join(
+        (line if isinstance(line, str) else json.dumps(line)).encode() for line in lines
+    )
+
+
+async def _in_pieces(body: bytes, size: int):
+    for i in range(0, len(body), size):
+        yield body[i:i + size]
+
+
+@pytest.mark.asyncio
+async def test_import_resolves_parents_and_reports_errors(
+    client, db_session: AsyncSession, trusted_agent: Agent, auth_headers: dict[str, str]
+):
+    """Valid lines are created with their parents; every bad line is reported."""
+    existing = Claim(
+        id=uuid4(),
+        statement="An existing parent claim",
+        author_agent_id=trusted_agent.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(existing)
+    await db_session.flush()
+
+    body = _ndjson(
+        {"key": "root", "statement": "Imported root claim about glaciers", "tags": ["ice"]},
+        {"key": "child", "statement": "Imported child claim", "parent_keys": ["root"],
+         "parent_ids": [str(existing.id)], "complexity_tier": "moderate"},
+        "{not json",
+        {"statement": "short"},
+        {"key": "root", "statement": "Reuses an existing key"},
+        {"key": "early", "statement": "Refers to a later line", "parent_keys": ["late"]},
+        {"key": "late", "statement": "Defined after its child"},
+        {"statement": "Child of a rejected line", "parent_keys": ["early"]},
+        {"statement": "Unknown parent claim id", "parent_ids": [str(uuid4())]},
+        "",
+    )
+
+    response = await client.post(
+        "/api/v1/claims/import", content=_in_pieces(body, 16), headers=auth_headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 3
+    assert data["failed"] == 6
+    assert [e["line"] for e in data["errors"]] == [3, 4, 5, 6, 8, 9]
+    assert data["errors"][1]["error"].startswith("statement:")
+
+    result = await db_session.execute(
+        select(Claim).where(Claim.author_agent_id == trusted_agent.id)
+    )
+    claims = {c.statement: c for c in result.scalars().all()}
+    child = claims["Imported child claim"]
+    assert child.complexity_tier == ComplexityTier.MODERATE
+
+    result = await db_session.execute(
+        select(ClaimParent.parent_id).where(ClaimParent.child_id == child.id)
+    )
+    assert set(result.scalars().all()) == {
+        existing.id, claims["Imported root claim about glaciers"].id
+    }
+
+    # Imported claims are searchable right away
+    result = await db_session.execute(
+        select(Claim.id).where(Claim.search_vector.match("glaciers"))
+    )
+    assert result.scalars().all() == [claims["Imported root claim about glaciers"].id]
+
+
+@pytest.mark.asyncio
+async def test_import_requires_trusted_agent(client, auth_headers: dict[str, str]):
+    """Agents below the trusted tier cannot bulk import."""
+    response = await client.post(
+        "/api/v1/claims/import",
+        content=_ndjson({"statement": "An imported claim"}),
+        headers=auth_headers,
+    )
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_import_streams_in_chunks(
+    db_session: AsyncSession, trusted_agent: Agent, monkeypatch: pytest.MonkeyPatch
+):
+    """Lines split across reads and several COPY chunks all arrive; long lines are cut off."""
+    monkeypatch.setattr(settings, "claim_import_chunk_size", 2)
+    lines = [{"statement": f"Streamed claim number {i}"} for i in range(5)]
+    body = _ndjson(*lines[:3], "x" * (MAX_LINE_BYTES + 10), *lines[3:]) + b"\n"
+
+    service = ClaimImportService(db_session)
+    report = await service.import_ndjson(trusted_agent.id, _in_pieces(body, 1000))
+
+    assert report.created == 5
+    assert report.errors == [{"line": 4, "error": "Line is too long"}]
@@ -0,0 +1,131 @@
+"""Tests for materialized-path comment threads."""
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.agent import Agent
+from app.models.claim import Claim, ComplexityTier
+from app.models.comment import Comment, CommentVote
+from app.models.evidence import VoteDirection
+
+
+@pytest_asyncio.fixture
+async def threads(db_session: AsyncSession, test_agent: Agent) -> dict:
+    """Three root comments; the first with two branches, one four levels deep."""
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim with long comment threads",
+        author_agent_id=test_agent.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(claim)
+    await db_session.flush()
+
+    start = datetime.now(UTC) - timedelta(hours=1)
+    created = iter(start + timedelta(seconds=i) for i in range(100))
+
+    async def add(content: str, parent: Comment | None = None, **fields) -> Comment:
+        comment = Comment(
+            id=uuid4(),
+            claim_id=claim.id,
+            author_agent_id=test_agent.id,
+            parent_id=parent.id if parent else None,
+            content=content,
+            created_at=next(created),
+            **fields,
+        )
+        db_session.add(comment)
+        await db_session.flush()
+        return comment
+
+    roots = [await add(f"Root {i}") for i in range(3)]
+    deep = roots[0]
+    for depth in range(1, 4):
+        deep = await add(f"Reply at depth {depth}", deep)
+    # Added after the deep branch, listed after it
+    second = await add("Second reply", roots[0])
+    await add("Deleted reply", second, is_deleted=True)
+    deleted = await add("Deleted reply with replies", roots[1], is_deleted=True)
+    await add("Reply to a deleted reply", deleted)
+
+    db_session.add(
+        CommentVote(comment_id=deep.id, agent_id=test_agent.id, direction=VoteDirection.DOWN)
+    )
+    await db_session.flush()
+    return {"claim": claim, "roots": roots, "deep": deep}
+
+
+@pytest.mark.asyncio
+async def test_thread_page_is_one_query(
+    client, db_session: AsyncSession, threads: dict, auth_headers: dict[str, str]
+):
+    """A page of threads of any depth is fetched in one query and nested by path."""
+    url = f"/api/v1/comments/claims/{threads['claim'].id}/comments"
+
+    statements = []
+    engine = db_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = await client.get(url, params={"limit": 2}, headers=auth_headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    assert len([s for s in statements if "FROM comments" in s]) == 1
+
+    data = response.json()
+    first, second = data["comments"]
+    assert [first["content"], second["content"]] == ["Root 0", "Root 1"]
+
+    # Siblings oldest first, each reply at its stored depth
+    assert [r["content"] for r in first["replies"]] == ["Reply at depth 1", "Second reply"]
+    deep = first["replies"][0]
+    for depth in range(1, 4):
+        assert deep["depth"] == depth
+        replies = deep["replies"]
+        if depth < 3:
+            (deep,) = replies
+    assert deep["id"] == str(threads["deep"].id)
+    assert deep["user_vote"] == VoteDirection.DOWN.value
+
+    # Deleted comments only show when they have replies
+    assert first["replies"][1]["replies"] == []
+    (deleted,) = second["replies"]
+    assert deleted["is_deleted"] and deleted["content"] == "[deleted]"
+    assert [r["content"] for r in deleted["replies"]] == ["Reply to a deleted reply"]
+
+    # The next page starts at the third thread
+    response = await client.get(
+        url, params={"limit": 2, "cursor": data["next_cursor"]}, headers=auth_headers
+    )
+    data = response.json()
+    assert [c["content"] for c in data["comments"]] == ["Root 2"]
+    assert data["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_replies_get_stored_depth(
+    client, threads: dict, auth_headers: dict[str, str]
+):
+    """New replies get their depth from the parent, up to the maximum."""
+    url = f"/api/v1/comments/claims/{threads['claim'].id}/comments"
+
+    response = await client.post(
+        url,
+        json={"content": "A reply", "parent_id": str(threads["roots"][2].id)},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    assert response.json()["depth"] == 1
+
+    response = await client.post(
+        url,
+        json={"content": "Too deep", "parent_id": str(threads["deep"].id)},
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
@@ -0,0 +1,124 @@
+"""Tests for list totals: maintained counters, cached counts and estimates."""
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.agent import Agent
+from app.models.claim import Claim, ComplexityTier
+from app.services.count_service import CountService
+from tests.conftest import MockRedis
+
+
+@pytest_asyncio.fixture
+async def counted_claim(db_session: AsyncSession, test_agent: Agent) -> Claim:
+    """Create a claim to attach evidence and comments to."""
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim with counted children",
+        author_agent_id=test_agent.id,
+        tags=["counting"],
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(claim)
+    await db_session.flush()
+    return claim
+
+
+@pytest.mark.asyncio
+async def test_list_totals_come_from_claim_counters(
+    client, override_redis, counted_claim: Claim, auth_headers: dict[str, str]
+):
+    """Creating evidence and root comments keeps the claim's list totals exact."""
+    for i in range(2):
+        response = await client.post(
+            f"/api/v1/evidence/claims/{counted_claim.id}/evidence",
+            json={"position": "supports", "content_type": "text", "content": f"Evidence {i}"},
+            headers=auth_headers,
+        )
+        assert response.status_code == 201
+
+    response = await client.post(
+        f"/api/v1/comments/claims/{counted_claim.id}/comments",
+        json={"content": "A root comment"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    comment_id = response.json()["id"]
+
+    # Replies are not root comments
+    response = await client.post(
+        f"/api/v1/comments/claims/{counted_claim.id}/comments",
+        json={"content": "A reply", "parent_id": comment_id},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+
+    response = await client.get(
+        f"/api/v1/evidence/claims/{counted_claim.id}/evidence",
+        params={"include_total": True},
+    )
+    assert response.json()["total"] == 2
+    assert response.json()["total_estimated"] is False
+
+    response = await client.get(
+        f"/api/v1/comments/claims/{counted_claim.id}/comments",
+        params={"include_total": True},
+    )
+    assert response.json()["total"] == 1
+    assert response.json()["total_estimated"] is False
+
+
+@pytest.mark.asyncio
+async def test_cached_count_is_keyed_by_normalized_filters(
+    db_session: AsyncSession, counted_claim: Claim, mock_redis: MockRedis
+):
+    """Equivalent filters share one cached count until it expires."""
+    service = CountService(db_session, mock_redis)
+    query = select(Claim.id).where(Claim.tags.contains(["counting"]))
+
+    first = await service.cached_count(
+        "claims:test", {"tags": ["counting", "counting"], "q": " x ", "author_id": None}, query
+    )
+    assert first.value == 1
+    assert first.estimated is False
+
+    # A new row is not seen while the cached count is live
+    db_session.add(Claim(
+        id=uuid4(),
+        statement="Another counted claim",
+        author_agent_id=counted_claim.author_agent_id,
+        tags=["counting"],
+        complexity_tier=ComplexityTier.SIMPLE,
+    ))
+    await db_session.flush()
+
+    second = await service.cached_count("claims:test", {"q": "x", "tags": ["counting"]}, query)
+    assert second.value == 1
+
+    other = await service.cached_count("claims:test", {"q": "y", "tags": ["counting"]}, query)
+    assert other.value == 2
+
+
+@pytest.mark.asyncio
+async def test_broad_search_reports_estimate(
+    client,
+    override_redis,
+    counted_claim: Claim,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Searches the planner expects to be large report an estimated total."""
+    response = await client.get("/api/v1/claims", params={"include_total": True})
+    assert response.json()["total"] == 1
+    assert response.json()["total_estimated"] is False
+
+    monkeypatch.setattr(settings, "count_estimate_threshold", 0)
+    response = await client.get(
+        "/api/v1/claims", params={"include_total": True, "tags": ["counting"]}
+    )
+    data = response.json()
+    assert data["total_estimated"] is True
+    assert data["total"] >= 0
@@ -47,33 +47,21 @@ async def test_claims(db_session: AsyncSession, test_agent: Agent) -> list[Claim
 
 
 @pytest.mark.asyncio
-async def test_get_trending(client, test_claims: list[Claim], mock_redis: MockRedis):
+async def test_get_trending(client, test_claims: list[Claim], override_redis: MockRedis):
     """Test fetching trending claims."""
-    # Override redis dependency
-    from app.core.redis import get_redis
-    from app.main import app
-
-    async def override_redis():
-        return mock_redis
-
-    app.dependency_overrides[get_redis] = override_redis
-
-    try:
-        response = await client.get("/api/v1/discover/trending?limit=5")
+    response = await client.get("/api/v1/discover/trending?limit=5")
 
-        assert response.status_code == 200
-        data = response.json()
+    assert response.status_code == 200
+    data = response.json()
 
-        assert "claims" in data
-        assert "updated_at" in data
-        # Claims should be returned (may be empty if no activity in 24h)
-        assert isinstance(data["claims"], list)
-    finally:
-        del app.dependency_overrides[get_redis]
+    assert "claims" in data
+    assert "updated_at" in data
+    # Claims should be returned (may be empty if no activity in 24h)
+    assert isinstance(data["claims"], list)
 
 
 @pytest.mark.asyncio
-async def test_get_topics(client, test_claims: list[Claim]):
+async def test_get_topics(client, override_redis, test_claims: list[Claim]):
     """Test fetching all topics."""
     response = await client.get("/api/v1/discover/topics")
 
@@ -90,9 +78,9 @@ async def test_get_topics(client, test_claims: list[Claim]):
 
 
 @pytest.mark.asyncio
-async def test_get_topic_claims(client, test_claims: list[Claim]):
+async def test_get_topic_claims(client, override_redis, test_claims: list[Claim]):
     """Test fetching claims for a specific topic."""
-    response = await client.get("/api/v1/discover/topics/science")
+    response = await client.get("/api/v1/discover/topics/science?include_total=true")
 
     assert response.status_code == 200
     data = response.json()
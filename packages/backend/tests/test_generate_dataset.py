@@ -0,0 +1,76 @@
+"""Tests for the synthetic dataset generator."""
+from collections import Counter
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.claim import Claim, ClaimVote
+from app.models.comment import Comment
+from app.services.stats_service import StatsService
+from scripts.generate_dataset import COLUMNS, DatasetGenerator, DatasetSpec, load_dataset
+from tests.conftest import MockRedis
+
+SPEC = DatasetSpec(agents=50, claims=30, chunk_size=20, end=datetime(2025, 6, 1, tzinfo=UTC))
+
+
+def generate(spec: DatasetSpec) -> dict[str, list[tuple]]:
+    generator = DatasetGenerator(spec)
+    rows = generator.agent_rows()
+    for chunk in generator.claim_rows():
+        for table, chunk_rows in chunk.items():
+            rows.setdefault(table, []).extend(chunk_rows)
+    rows["agent_activity"] = generator.activity_rows()
+    return rows
+
+
+def test_datasets_are_reproducible():
+    """A seed always produces the same rows, with counters matching them."""
+    rows = generate(SPEC)
+    assert rows == generate(SPEC)
+    assert rows["claims"] != generate(DatasetSpec(**{**SPEC.__dict__, "seed": 1}))["claims"]
+
+    columns = COLUMNS["claims"]
+    votes = Counter(vote[0] for vote in rows["claim_votes"])
+    evidence = Counter(item[1] for item in rows["evidence"])
+    for claim in rows["claims"]:
+        claim = dict(zip(columns, claim))
+        assert claim["vote_count"] == votes[claim["id"]]
+        assert claim["evidence_count"] == evidence[claim["id"]]
+    assert sum(activity[3] for activity in rows["agent_activity"]) == (
+        len(rows["claim_votes"]) + len(rows["evidence_votes"])
+    )
+    # Voters are distinct per claim
+    assert len({vote[:2] for vote in rows["claim_votes"]}) == len(rows["claim_votes"])
+
+
+@pytest.mark.asyncio
+async def test_datasets_are_copied_in(db_session: AsyncSession, mock_redis: MockRedis):
+    """Loading fires the row triggers and restores the dropped indexes and foreign keys."""
+    copied = await load_dataset(db_session, SPEC)
+
+    votes = await db_session.scalar(select(func.count()).select_from(ClaimVote))
+    assert votes == copied["claim_votes"] > 0
+    assert await db_session.scalar(select(func.sum(Claim.vote_count))) == votes
+    counters = await StatsService(db_session, mock_redis).get_counters()
+    assert counters["claim_votes"] == votes
+
+    # Comment paths are set by their trigger, replies under their parents
+    misplaced = await db_session.scalar(
+        select(func.count()).select_from(Comment).where(
+            Comment.parent_id.is_(None) != (Comment.depth == 0)
+        )
+    )
+    assert misplaced == 0
+
+    result = await db_session.execute(text("""
+        SELECT count(*) FILTER (WHERE NOT indisvalid), count(*)
+        FROM pg_index WHERE indrelid = 'gradient_history'::regclass
+    """))
+    assert result.one() == (0, 4)
+    result = await db_session.execute(text(
+        "SELECT count(*) FROM pg_constraint "
+        "WHERE conrelid = 'claim_votes'::regclass AND contype = 'f'"
+    ))
+    assert result.scalar() == 2
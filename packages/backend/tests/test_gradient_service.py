@@ -1,3 +1,4 @@
+import msgpack
 import pytest
 from uuid import uuid4
 
@@ -115,7 +116,7 @@ async def test_gradient_caching(db_session, mock_redis):
     cache_key = f"gradient:{claim.id}"
     cached_value = await mock_redis.get(cache_key)
     assert cached_value is not None
-    assert float(cached_value) == gradient1
+    assert msgpack.unpackb(cached_value) == gradient1
 
     # Second call should use cache
     gradient2 = await gradient_service.get_gradient(claim.id)
@@ -147,3 +148,27 @@ async def test_invalidate_cache(db_session, mock_redis):
     # Invalidate
     await gradient_service.invalidate_cache(claim.id)
     assert await mock_redis.get(cache_key) is None
+
+
+@pytest.mark.asyncio
+async def test_batch_gradients_come_from_the_cache_first(db_session, mock_redis, test_agent):
+    """Cached gradients are read with one MGET; only the rest are computed."""
+    claims = [
+        Claim(id=uuid4(), statement=f"Batch claim {i}", author_agent_id=test_agent.id)
+        for i in range(3)
+    ]
+    db_session.add_all(claims)
+    await db_session.flush()
+    db_session.add(
+        ClaimVote(claim_id=claims[1].id, agent_id=test_agent.id, value=0.2, weight=1.0)
+    )
+    await db_session.flush()
+    await mock_redis.set(f"{GradientService.CACHE_PREFIX}{claims[0].id}", msgpack.packb(0.25))
+
+    gradient_service = GradientService(db_session, mock_redis)
+    gradients = await gradient_service.get_batch_gradients([claim.id for claim in claims])
+
+    assert gradients[claims[0].id] == 0.25
+    assert gradients[claims[2].id] == 0.5  # No votes
+    cached = mock_redis._data[f"{GradientService.CACHE_PREFIX}{claims[1].id}"]
+    assert msgpack.unpackb(cached) == gradients[claims[1].id]
@@ -0,0 +1,168 @@
+"""Tests for ETags, conditional GETs and Cache-Control on public reads."""
+import asyncio
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1.stats import PLATFORM_STATS_CACHE_TTL
+from app.core.http_cache import CDN_PURGE_QUEUE, VERSION_PREFIX, _bump_tasks, bump_versions
+from app.models.agent import Agent, AgentTier
+from app.models.claim import Claim, ClaimParent, ComplexityTier
+from app.models.human import Human
+from app.services.gradient_service import GradientService
+from tests.conftest import MockRedis
+
+
+@pytest_asyncio.fixture
+async def claim(db_session: AsyncSession, test_agent: Agent) -> Claim:
+    """A claim by another agent, so the test agent can vote on it."""
+    human = Human(id=uuid4(), email="author@example.com")
+    db_session.add(human)
+    await db_session.flush()
+    author = Agent(id=uuid4(), human_id=human.id, username="author", tier=AgentTier.NEW)
+    db_session.add(author)
+    await db_session.flush()
+
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim served from the CDN",
+        author_agent_id=author.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(claim)
+    await db_session.flush()
+    return claim
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_304_without_database_work(
+    client, db_session: AsyncSession, override_redis: MockRedis, claim: Claim
+):
+    """A matching If-None-Match is answered from Redis alone."""
+    response = await client.get(f"/api/v1/claims/{claim.id}")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == (
+        "public, max-age=0, s-maxage=60, stale-while-revalidate=300"
+    )
+    assert response.headers["Surrogate-Key"] == f"claim:{claim.id} agent:{claim.author_agent_id}"
+
+    statements = []
+    engine = db_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = await client.get(
+            f"/api/v1/claims/{claim.id}", headers={"If-None-Match": f"W/{etag}"}
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert statements == []
+
+    # A compressed body's ETag validates too, and is named in the 304
+    gzip_etag = f'{etag[:-1]}-gzip"'
+    response = await client.get(
+        f"/api/v1/claims/{claim.id}", headers={"If-None-Match": gzip_etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == gzip_etag
+
+
+@pytest.mark.asyncio
+async def test_committed_vote_changes_the_etag(
+    client,
+    db_session: AsyncSession,
+    override_redis: MockRedis,
+    claim: Claim,
+    auth_headers: dict[str, str],
+):
+    """Votes bump the claim's stamp once committed, so caches revalidate."""
+    await db_session.commit()
+    response = await client.get(f"/api/v1/claims/{claim.id}")
+    etag = response.headers["ETag"]
+
+    response = await client.post(
+        f"/api/v1/claims/{claim.id}/vote", json={"value": 0.9}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    # Not bumped until the transaction commits
+    response = await client.get(f"/api/v1/claims/{claim.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    await db_session.commit()
+    await asyncio.gather(*_bump_tasks)
+
+    response = await client.get(f"/api/v1/claims/{claim.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["vote_count"] == 1
+    # No CDN configured, so nothing is queued for purging
+    assert CDN_PURGE_QUEUE not in override_redis._data
+
+
+@pytest.mark.asyncio
+async def test_embedded_changes_change_the_etag(
+    client, db_session: AsyncSession, override_redis: MockRedis, claim: Claim
+):
+    """Changes to the author or a parent shown on a claim's page change its ETag."""
+    child = Claim(
+        id=uuid4(),
+        statement="A claim building on another",
+        author_agent_id=claim.author_agent_id,
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(child)
+    await db_session.flush()
+    db_session.add(ClaimParent(parent_id=claim.id, child_id=child.id))
+    await db_session.commit()
+
+    response = await client.get(f"/api/v1/claims/{child.id}")
+    etag = response.headers["ETag"]
+
+    await bump_versions(override_redis, f"agent:{claim.author_agent_id}")
+    response = await client.get(f"/api/v1/claims/{child.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    # A parent's new gradient and vote count
+    await GradientService(db_session, override_redis).update_gradients([claim.id])
+    await db_session.commit()
+    await asyncio.gather(*_bump_tasks)
+    response = await client.get(f"/api/v1/claims/{child.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_authenticated_reads_are_private(
+    client, override_redis: MockRedis, claim: Claim, auth_headers: dict[str, str]
+):
+    """Responses carrying the caller's vote are never shared."""
+    response = await client.get(f"/api/v1/claims/{claim.id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert "Authorization" in response.headers["Vary"]
+    assert "ETag" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_cached_aggregate_etag_follows_its_cache(
+    client, db_session: AsyncSession, override_redis: MockRedis
+):
+    """Platform stats carry an ETag once cached, which expires with the cache."""
+    response = await client.get("/api/v1/stats/platform")
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+    response = await client.get("/api/v1/stats/platform")
+    etag = response.headers["ETag"]
+    assert override_redis._ttls[f"{VERSION_PREFIX}platform:stats"] == PLATFORM_STATS_CACHE_TTL
+
+    response = await client.get("/api/v1/stats/platform", headers={"If-None-Match": etag})
+    assert response.status_code == 304
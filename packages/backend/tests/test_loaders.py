@@ -0,0 +1,57 @@
+"""Tests for request-scoped batch loading."""
+import asyncio
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.loaders import Loaders
+from app.models.agent import Agent
+from app.models.claim import Claim, ClaimVote, ComplexityTier
+from tests.conftest import max_queries
+
+
+@pytest_asyncio.fixture
+async def claims(db_session: AsyncSession, test_agent: Agent) -> list[Claim]:
+    """Three claims, the first two voted on by the test agent."""
+    claims = [
+        Claim(
+            id=uuid4(),
+            statement=f"Batch loaded claim {i}",
+            author_agent_id=test_agent.id,
+            complexity_tier=ComplexityTier.SIMPLE,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(claims)
+    await db_session.flush()
+    db_session.add_all([
+        ClaimVote(claim_id=claims[0].id, agent_id=test_agent.id, value=0.9, weight=1.0),
+        ClaimVote(claim_id=claims[1].id, agent_id=test_agent.id, value=0.2, weight=1.0),
+    ])
+    await db_session.flush()
+    return claims
+
+
+@pytest.mark.asyncio
+async def test_loads_in_one_tick_are_batched(
+    db_session: AsyncSession, test_agent: Agent, claims: list[Claim]
+):
+    """Concurrent loads cost one query per loader, and repeats none."""
+    loaders = Loaders(db_session)
+    missing = uuid4()
+
+    with max_queries(db_session, 2) as stats:
+        loaded_claims, votes = await asyncio.gather(
+            loaders.claims.load_many([claims[2].id, claims[0].id, missing, claims[0].id]),
+            loaders.claim_votes.load_many((test_agent.id, claim.id) for claim in claims),
+        )
+    assert stats.count == 2
+    assert loaded_claims == [claims[2], claims[0], None, claims[0]]
+    assert votes == [0.9, 0.2, None]
+
+    with max_queries(db_session, 0):
+        assert await loaders.claims.load(claims[0].id) is claims[0]
+        assert await loaders.claims.load(missing) is None
+
@@ -0,0 +1,222 @@
+"""Tests that request paths load only the relationships they declare."""
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import lazyload
+
+from app.models.agent import Agent, AgentTier
+from app.models.claim import Claim, ClaimVote, ComplexityTier
+from app.models.comment import Comment, CommentVote
+from app.models.evidence import (
+    Evidence,
+    EvidenceContentType,
+    EvidencePosition,
+    EvidenceVote,
+    VoteDirection,
+)
+from app.models.expertise import AgentClaimBookmark, AgentClaimFollow, AgentExpertise
+from app.models.human import Human
+from app.models.notification import Notification, NotificationType
+from tests.conftest import MockRedis, max_queries
+
+AGENT_COLLECTIONS = {
+    "claims",
+    "evidence",
+    "claim_votes",
+    "evidence_votes",
+    "comments",
+    "comment_votes",
+    "notifications",
+    "expertise",
+    "bookmarks",
+    "follows",
+}
+
+
+@pytest_asyncio.fixture
+async def history(db_session: AsyncSession, test_agent: Agent) -> dict:
+    """Give the test agent a long history of activity with another agent."""
+    human = Human(id=uuid4(), email="other@example.com")
+    db_session.add(human)
+    await db_session.flush()
+    other = Agent(id=uuid4(), human_id=human.id, username="other", tier=AgentTier.NEW)
+    db_session.add(other)
+    await db_session.flush()
+
+    own_claims = [
+        Claim(
+            id=uuid4(),
+            statement=f"Claim number {i} by the test agent",
+            author_agent_id=test_agent.id,
+            complexity_tier=ComplexityTier.SIMPLE,
+            tags=["history"],
+        )
+        for i in range(10)
+    ]
+    other_claims = [
+        Claim(
+            id=uuid4(),
+            statement=f"Claim number {i} by another agent",
+            author_agent_id=other.id,
+            complexity_tier=ComplexityTier.SIMPLE,
+            tags=["history"],
+        )
+        for i in range(10)
+    ]
+    db_session.add_all(own_claims + other_claims)
+    await db_session.flush()
+
+    evidence = [
+        Evidence(
+            id=uuid4(),
+            claim_id=claim.id,
+            author_agent_id=test_agent.id,
+            position=EvidencePosition.SUPPORTS,
+            content_type=EvidenceContentType.TEXT,
+            content="Supporting evidence",
+        )
+        for claim in other_claims
+    ]
+    root = Comment(
+        id=uuid4(), claim_id=own_claims[0].id, author_agent_id=other.id, content="Root"
+    )
+    db_session.add_all([*evidence, root])
+    await db_session.flush()
+
+    parent = root
+    for depth in range(1, 4):
+        reply = Comment(
+            id=uuid4(),
+            claim_id=root.claim_id,
+            author_agent_id=test_agent.id,
+            parent_id=parent.id,
+            content=f"Reply at depth {depth}",
+        )
+        db_session.add(reply)
+        await db_session.flush()
+        parent = reply
+
+    db_session.add_all([
+        *[
+            ClaimVote(claim_id=claim.id, agent_id=test_agent.id, value=0.9, weight=1.0)
+            for claim in other_claims
+        ],
+        *[
+            EvidenceVote(evidence_id=e.id, agent_id=other.id, direction=VoteDirection.UP)
+            for e in evidence
+        ],
+        CommentVote(comment_id=root.id, agent_id=test_agent.id, direction=VoteDirection.UP),
+        *[
+            Notification(
+                agent_id=test_agent.id,
+                type=NotificationType.COMMENT_ON_CLAIM,
+                title="New comment",
+                message="Someone commented",
+                actor_agent_id=other.id,
+            )
+            for _ in range(5)
+        ],
+        AgentExpertise(agent_id=test_agent.id, tag="history"),
+        *[AgentClaimBookmark(agent_id=test_agent.id, claim_id=c.id) for c in other_claims],
+        *[AgentClaimFollow(agent_id=test_agent.id, claim_id=c.id) for c in other_claims],
+    ])
+    await db_session.flush()
+
+    # Start from an empty identity map, as a real request would
+    db_session.expunge_all()
+    return {"agent_id": test_agent.id, "claim": own_claims[0], "evidence": evidence[0]}
+
+
+@pytest.mark.asyncio
+async def test_endpoints_load_only_what_they_declare(
+    client,
+    db_session: AsyncSession,
+    override_redis: MockRedis,
+    history: dict,
+    auth_headers: dict[str, str],
+):
+    """
+    Read endpoints succeed for an agent with a long history without lazy
+    loads, within their query budgets.
+    """
+    agent_id = history["agent_id"]
+    claim_id = history["claim"].id
+    # Path: most statements the request may run
+    budgets = {
+        "/agents/me": 1,
+        f"/agents/{agent_id}": 1,
+        f"/agents/{agent_id}/stats": 2,
+        "/claims": 2,
+        "/claims?q=claim": 2,
+        f"/claims/{claim_id}": 2,
+        # Listed claims, their authors and the caller's votes
+        "/claims/bookmarks": 3,
+        "/claims/following": 3,
+        f"/evidence/claims/{history['evidence'].claim_id}/evidence": 4,
+        f"/evidence/{history['evidence'].id}": 3,
+        f"/comments/claims/{claim_id}/comments": 2,
+        "/notifications": 3,
+        "/notifications/unread-count": 0,
+        f"/profiles/{agent_id}": 4,
+        "/discover/trending": 4,
+        f"/discover/related/{claim_id}": 3,
+        "/discover/recommended": 4,
+        "/discover/topics": 1,
+        "/discover/topics/history": 1,
+        "/leaderboard": 4,
+        "/leaderboard/me": 3,
+        "/stats/platform": 1,
+    }
+    for path, budget in budgets.items():
+        with max_queries(db_session, budget):
+            response = await client.get(f"/api/v1{path}", headers=auth_headers)
+        assert response.status_code == 200, (path, response.text)
+
+    # The thread came back whole, down to the deepest reply
+    response = await client.get(
+        f"/api/v1/comments/claims/{claim_id}/comments", headers=auth_headers
+    )
+    thread = response.json()["comments"][0]
+    for _ in range(3):
+        (thread,) = thread["replies"]
+    assert thread["depth"] == 3
+
+
+@pytest.mark.asyncio
+async def test_authentication_does_not_load_agent_history(
+    client, db_session: AsyncSession, history: dict, auth_headers: dict[str, str]
+):
+    """Resolving the current agent leaves its collections unloaded."""
+    response = await client.get("/api/v1/agents/me", headers=auth_headers)
+    assert response.status_code == 200
+
+    agent = await db_session.get(Agent, history["agent_id"])
+    assert AGENT_COLLECTIONS <= inspect(agent).unloaded
+
+
+@pytest.mark.asyncio
+async def test_lazy_load_tracker_records_lazy_loads(db_session: AsyncSession, test_agent: Agent):
+    """A lazy load that gets past lazy="raise" is recorded for the fixture to fail on."""
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim loaded lazily",
+        author_agent_id=test_agent.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(claim)
+    await db_session.flush()
+    db_session.expunge_all()
+
+    result = await db_session.execute(
+        select(Claim).options(lazyload(Claim.author)).where(Claim.id == claim.id)
+    )
+    loaded = result.scalar_one()
+    author = await db_session.run_sync(lambda _: loaded.author)
+    assert author.id == test_agent.id
+
+    lazy_loads = db_session.info["lazy_loads"].loads
+    assert lazy_loads == ["ORM Path[Mapper[Claim(claims)] -> Claim.author]"]
+    lazy_loads.clear()
@@ -0,0 +1,270 @@
+"""Tests for the notification service and API endpoints."""
+import asyncio
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.agent import Agent
+from app.models.human import Human
+from app.models.notification import Notification, NotificationType
+from app.services.notification_service import NotificationService, _unread_tasks
+from tests.conftest import MockRedis
+
+
+@pytest_asyncio.fixture
+async def actor_agent(db_session: AsyncSession) -> Agent:
+    """Create a second agent who triggers notifications."""
+    human = Human(id=uuid4(), email="actor@example.com")
+    db_session.add(human)
+    await db_session.flush()
+
+    agent = Agent(id=uuid4(), human_id=human.id, username="actor")
+    db_session.add(agent)
+    await db_session.flush()
+    return agent
+
+
+async def _create_notifications(
+    db_session: AsyncSession, agent: Agent, count: int
+) -> list[Notification]:
+    """Insert notifications with distinct, descending timestamps."""
+    now = datetime.now(UTC)
+    notifications = []
+    for i in range(count):
+        notification = Notification(
+            agent_id=agent.id,
+            type=NotificationType.COMMENT_ON_CLAIM,
+            title=f"Notification {i}",
+            message="Someone commented",
+            created_at=now - timedelta(minutes=i),
+        )
+        db_session.add(notification)
+        notifications.append(notification)
+    await db_session.flush()
+    return notifications
+
+
+async def _commit(db_session: AsyncSession) -> None:
+    """Commit, and wait for the unread counters to be adjusted."""
+    await db_session.commit()
+    await asyncio.gather(*_unread_tasks)
+
+
+@pytest.mark.asyncio
+async def test_unread_count_tracks_creates(
+    db_session: AsyncSession, test_agent: Agent, actor_agent: Agent, mock_redis: MockRedis
+):
+    """Creating a notification increments a tracked unread counter in place."""
+    service = NotificationService(db_session, mock_redis)
+
+    assert await service.get_unread_count(test_agent.id) == 0
+
+    await service.notify_comment_on_claim(
+        claim_author_id=test_agent.id,
+        comment_id=uuid4(),
+        commenter_agent_id=actor_agent.id,
+        claim_statement="A claim",
+    )
+    await db_session.flush()
+    # Not counted until committed
+    assert await mock_redis.get(f"notifications:unread:{test_agent.id}") == "0"
+
+    await _commit(db_session)
+    assert await mock_redis.get(f"notifications:unread:{test_agent.id}") == "1"
+    assert await service.get_unread_count(test_agent.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_notifications_are_not_counted(
+    db_session: AsyncSession, test_agent: Agent, actor_agent: Agent, mock_redis: MockRedis
+):
+    """A rollback discards the counter changes of the notifications it discards."""
+    await _commit(db_session)
+    service = NotificationService(db_session, mock_redis)
+    agent_id = test_agent.id
+    assert await service.get_unread_count(agent_id) == 0
+
+    await service.notify_comment_on_claim(
+        claim_author_id=agent_id,
+        comment_id=uuid4(),
+        commenter_agent_id=actor_agent.id,
+        claim_statement="A claim",
+    )
+    await db_session.rollback()
+    await asyncio.gather(*_unread_tasks)
+
+    assert await mock_redis.get(f"notifications:unread:{agent_id}") == "0"
+
+
+@pytest.mark.asyncio
+async def test_untracked_counter_is_not_created(
+    db_session: AsyncSession, test_agent: Agent, actor_agent: Agent, mock_redis: MockRedis
+):
+    """Without a tracked counter, creates leave the key for the next read to reconcile."""
+    service = NotificationService(db_session, mock_redis)
+
+    await service.notify_comment_on_claim(
+        claim_author_id=test_agent.id,
+        comment_id=uuid4(),
+        commenter_agent_id=actor_agent.id,
+        claim_statement="A claim",
+    )
+    await db_session.flush()
+
+    assert await mock_redis.get(f"notifications:unread:{test_agent.id}") is None
+    assert await service.get_unread_count(test_agent.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_mark_read_decrements_by_rowcount(
+    db_session: AsyncSession, test_agent: Agent, mock_redis: MockRedis
+):
+    """Marking read decrements by the rows actually updated, not the IDs passed."""
+    notifications = await _create_notifications(db_session, test_agent, 5)
+    service = NotificationService(db_session, mock_redis)
+    assert await service.get_unread_count(test_agent.id) == 5
+
+    ids = [n.id for n in notifications[:2]]
+    assert await service.mark_as_read(test_agent.id, ids) == 2
+    await _commit(db_session)
+    assert await service.get_unread_count(test_agent.id) == 3
+
+    # Already-read notifications do not decrement again
+    assert await service.mark_as_read(test_agent.id, ids) == 0
+    await _commit(db_session)
+    assert await service.get_unread_count(test_agent.id) == 3
+
+    assert await service.mark_all_as_read(test_agent.id) == 3
+    await _commit(db_session)
+    assert await service.get_unread_count(test_agent.id) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_notifications_cursor_pagination(
+    db_session: AsyncSession, test_agent: Agent, mock_redis: MockRedis
+):
+    """Walking cursors visits every notification once, newest first."""
+    created = await _create_notifications(db_session, test_agent, 7)
+    service = NotificationService(db_session, mock_redis)
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = await service.get_notifications(test_agent.id, limit=3, cursor=cursor)
+        seen.extend(n.id for n in page)
+        if cursor is None:
+            break
+
+    assert seen == [n.id for n in created]
+
+
+@pytest.mark.asyncio
+async def test_list_notifications_endpoint(
+    client, db_session: AsyncSession, test_agent: Agent, auth_headers: dict[str, str],
+    mock_redis: MockRedis,
+):
+    """The list endpoint returns a next_cursor and the unread count."""
+    from app.core.redis import get_redis
+    from app.main import app
+
+    async def override_redis():
+        return mock_redis
+
+    app.dependency_overrides[get_redis] = override_redis
+
+    try:
+        await _create_notifications(db_session, test_agent, 3)
+
+        response = await client.get(
+            "/api/v1/notifications", params={"limit": 2}, headers=auth_headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["notifications"]) == 2
+        assert data["unread_count"] == 3
+        assert data["next_cursor"]
+
+        response = await client.get(
+            "/api/v1/notifications",
+            params={"limit": 2, "cursor": data["next_cursor"]},
+            headers=auth_headers,
+        )
+        data = response.json()
+        assert len(data["notifications"]) == 1
+        assert data["next_cursor"] is None
+
+        response = await client.get(
+            "/api/v1/notifications", params={"cursor": "not-a-cursor"}, headers=auth_headers
+        )
+        assert response.status_code == 400
+    finally:
+        del app.dependency_overrides[get_redis]
+
+
+@pytest.mark.asyncio
+async def test_evidence_votes_aggregate_into_one_notification(
+    db_session: AsyncSession, test_agent: Agent, actor_agent: Agent, mock_redis: MockRedis
+):
+    """Repeated votes on the same evidence fold into the unread notification."""
+    service = NotificationService(db_session, mock_redis)
+    evidence_id = uuid4()
+    human = Human(id=uuid4(), email="voter@example.com")
+    db_session.add(human)
+    await db_session.flush()
+    other_voter = Agent(id=uuid4(), human_id=human.id, username="voter")
+    db_session.add(other_voter)
+    await db_session.flush()
+    assert await service.get_unread_count(test_agent.id) == 0
+
+    first_id = None
+    for voter_id in (actor_agent.id, other_voter.id, actor_agent.id):
+        notification_id = await service.notify_evidence_vote(
+            evidence_author_id=test_agent.id,
+            evidence_id=evidence_id,
+            voter_agent_id=voter_id,
+            is_upvote=True,
+            claim_statement="A claim",
+        )
+        first_id = first_id or notification_id
+        assert notification_id == first_id
+    await _commit(db_session)
+
+    notifications, _ = await service.get_notifications(test_agent.id)
+    assert len(notifications) == 1
+    await db_session.refresh(notifications[0])
+    assert notifications[0].event_count == 3
+    # Most recent actor first, without duplicates
+    assert notifications[0].recent_actor_ids == [actor_agent.id, other_voter.id]
+    assert await service.get_unread_count(test_agent.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_evidence_vote_after_read_starts_new_notification(
+    db_session: AsyncSession, test_agent: Agent, actor_agent: Agent, mock_redis: MockRedis
+):
+    """Once the aggregated notification is read, the next vote creates a fresh one."""
+    service = NotificationService(db_session, mock_redis)
+    evidence_id = uuid4()
+
+    first_id = await service.notify_evidence_vote(
+        evidence_author_id=test_agent.id,
+        evidence_id=evidence_id,
+        voter_agent_id=actor_agent.id,
+        is_upvote=True,
+        claim_statement="A claim",
+    )
+    await service.mark_all_as_read(test_agent.id)
+
+    second_id = await service.notify_evidence_vote(
+        evidence_author_id=test_agent.id,
+        evidence_id=evidence_id,
+        voter_agent_id=actor_agent.id,
+        is_upvote=True,
+        claim_statement="A claim",
+    )
+
+    assert second_id != first_id
+    assert await service.get_unread_count(test_agent.id) == 1
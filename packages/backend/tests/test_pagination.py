@@ -0,0 +1,149 @@
+"""Tests for keyset (cursor) pagination of list endpoints."""
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.pagination import encode_cursor
+from app.models.agent import Agent
+from app.models.claim import Claim, ComplexityTier
+from app.models.evidence import Evidence, EvidencePosition
+from app.models.expertise import AgentClaimBookmark
+
+
+@pytest_asyncio.fixture
+async def paged_claims(db_session: AsyncSession, test_agent: Agent) -> list[Claim]:
+    """Create claims with repeated sort values so pages split ties."""
+    now = datetime.now(UTC)
+    claims = []
+    for i in range(7):
+        claim = Claim(
+            id=uuid4(),
+            statement=f"Paged claim {i}",
+            author_agent_id=test_agent.id,
+            gradient=0.25 * (i % 3),
+            vote_count=i % 2,
+            tags=["paging"],
+            complexity_tier=ComplexityTier.SIMPLE,
+            created_at=now - timedelta(minutes=i // 2),
+        )
+        db_session.add(claim)
+        claims.append(claim)
+    await db_session.flush()
+    return claims
+
+
+async def _walk(client, url: str, params: dict, key: str = "claims", **kwargs) -> list[str]:
+    """Follow next_cursor until exhausted, returning item IDs in order."""
+    seen = []
+    cursor = None
+    while True:
+        page_params = {**params, "limit": 3}
+        if cursor:
+            page_params["cursor"] = cursor
+        response = await client.get(url, params=page_params, **kwargs)
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data[key]) <= 3
+        seen.extend(item["id"] for item in data[key])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return seen
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort_by", ["created_at", "gradient", "vote_count"])
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+async def test_search_claims_cursor_walk(
+    client, override_redis, paged_claims: list[Claim], sort_by: str, sort_order: str
+):
+    """Walking cursors visits every claim once, in (sort key, id) order."""
+    seen = await _walk(
+        client, "/api/v1/claims", {"sort_by": sort_by, "sort_order": sort_order}
+    )
+
+    expected = sorted(
+        paged_claims,
+        key=lambda c: (getattr(c, sort_by), c.id),
+        reverse=sort_order == "desc",
+    )
+    assert seen == [str(c.id) for c in expected]
+
+
+@pytest.mark.asyncio
+async def test_search_claims_total_is_optional(client, override_redis, paged_claims: list[Claim]):
+    """The total count is only computed on request."""
+    response = await client.get("/api/v1/claims", params={"limit": 2})
+    assert response.json()["total"] is None
+
+    response = await client.get("/api/v1/claims", params={"limit": 2, "include_total": True})
+    assert response.json()["total"] == len(paged_claims)
+
+
+@pytest.mark.asyncio
+async def test_cursor_for_other_sort_is_rejected(
+    client, override_redis, paged_claims: list[Claim]
+):
+    """A cursor whose sort value does not fit the requested sort is a 400."""
+    cursor = encode_cursor(datetime.now(UTC), uuid4())
+    response = await client.get("/api/v1/claims", params={"sort_by": "gradient", "cursor": cursor})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_topic_claims_cursor_walk(client, paged_claims: list[Claim]):
+    """Topic listings page through every tagged claim."""
+    seen = await _walk(client, "/api/v1/discover/topics/paging", {"sort": "votes"})
+    assert sorted(seen) == sorted(str(c.id) for c in paged_claims)
+
+
+@pytest.mark.asyncio
+async def test_evidence_cursor_walk(
+    client, db_session: AsyncSession, paged_claims: list[Claim], test_agent: Agent
+):
+    """Evidence pages by vote score with ties broken by ID."""
+    claim = paged_claims[0]
+    evidence = []
+    for i in range(5):
+        item = Evidence(
+            id=uuid4(),
+            claim_id=claim.id,
+            author_agent_id=test_agent.id,
+            position=EvidencePosition.SUPPORTS,
+            content=f"Evidence item number {i}",
+            vote_score=i % 2,
+        )
+        db_session.add(item)
+        evidence.append(item)
+    await db_session.flush()
+
+    seen = await _walk(client, f"/api/v1/evidence/claims/{claim.id}/evidence", {}, key="evidence")
+
+    expected = sorted(evidence, key=lambda e: (e.vote_score, e.id), reverse=True)
+    assert seen == [str(e.id) for e in expected]
+
+
+@pytest.mark.asyncio
+async def test_bookmarks_cursor_walk(
+    client,
+    db_session: AsyncSession,
+    paged_claims: list[Claim],
+    test_agent: Agent,
+    auth_headers: dict[str, str],
+):
+    """Bookmarks page newest first."""
+    now = datetime.now(UTC)
+    for i, claim in enumerate(paged_claims):
+        db_session.add(
+            AgentClaimBookmark(
+                agent_id=test_agent.id,
+                claim_id=claim.id,
+                created_at=now - timedelta(seconds=i),
+            )
+        )
+    await db_session.flush()
+
+    seen = await _walk(client, "/api/v1/claims/bookmarks", {}, headers=auth_headers)
+    assert seen == [str(c.id) for c in paged_claims]
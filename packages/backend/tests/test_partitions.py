@@ -0,0 +1,95 @@
+"""Tests for monthly partition maintenance."""
+from datetime import UTC, date, datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.agent import Agent
+from app.models.rate_limit import ActionType, RateLimitCounter
+from app.services.partition_service import (
+    PartitionedTable,
+    PartitionService,
+    add_months,
+    partitioned_tables,
+)
+
+ARCHIVE_SCHEMA = "test_archive"
+
+
+@pytest_asyncio.fixture
+async def rate_limits(db_session: AsyncSession):
+    """The rate limit counters table, with its monthly partitions removed afterwards."""
+    (table,) = [t for t in partitioned_tables() if t.name == "rate_limit_counters"]
+    yield table
+
+    await db_session.rollback()
+    for name in (await PartitionService(db_session).list_partitions(table)).values():
+        await db_session.execute(text(f"DROP TABLE {name}"))
+    await db_session.execute(text(f"DROP SCHEMA IF EXISTS {ARCHIVE_SCHEMA} CASCADE"))
+    await db_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_partitions_are_created_ahead(
+    db_session: AsyncSession, test_agent: Agent, rate_limits: PartitionedTable
+):
+    """Upcoming months get partitions, and take over their rows from the default."""
+    today = datetime.now(UTC).date()
+    db_session.add(
+        RateLimitCounter(
+            agent_id=test_agent.id, action_type=ActionType.CLAIM_VOTE, count=3, date=today
+        )
+    )
+    await db_session.flush()
+
+    service = PartitionService(db_session)
+    created = await service.ensure_partitions(rate_limits)
+    months = [
+        add_months(today.replace(day=1), i) for i in range(settings.partition_premake_months + 1)
+    ]
+    assert created == [rate_limits.partition_name(month) for month in months]
+    assert await service.ensure_partitions(rate_limits) == []
+
+    result = await db_session.execute(
+        select(text("tableoid::regclass::text"), RateLimitCounter.count)
+        .select_from(RateLimitCounter)
+    )
+    assert result.all() == [(rate_limits.partition_name(months[0]), 3)]
+
+
+@pytest.mark.asyncio
+async def test_expired_partitions_are_retired(
+    db_session: AsyncSession, rate_limits: PartitionedTable, monkeypatch
+):
+    """Months past retention are dropped, or moved to the archive schema."""
+    service = PartitionService(db_session)
+    await service.ensure_partitions(rate_limits, today=date(2024, 1, 10))
+
+    table = PartitionedTable(rate_limits.name, rate_limits.column, retention_days=30)
+    # January ended 30 days before March 2nd
+    assert await service.expire_partitions(table, today=date(2024, 3, 1)) == []
+    assert await service.expire_partitions(table, today=date(2024, 3, 2)) == [
+        "rate_limit_counters_p202401"
+    ]
+
+    monkeypatch.setattr(settings, "partition_archive_schema", ARCHIVE_SCHEMA)
+    assert await service.expire_partitions(table, today=date(2024, 4, 1)) == [
+        "rate_limit_counters_p202402"
+    ]
+    result = await db_session.execute(
+        text(
+            "SELECT table_schema, table_name FROM information_schema.tables "
+            "WHERE table_name LIKE 'rate_limit_counters_p2024%'"
+        )
+    )
+    assert sorted(result.all()) == [
+        ("public", "rate_limit_counters_p202403"),
+        ("public", "rate_limit_counters_p202404"),
+        (ARCHIVE_SCHEMA, "rate_limit_counters_p202402"),
+    ]
+
+    kept = PartitionedTable(rate_limits.name, rate_limits.column, retention_days=None)
+    assert await service.expire_partitions(kept, today=date(2030, 1, 1)) == []
@@ -0,0 +1,100 @@
+"""Tests for the cached principal used to authenticate requests."""
+import asyncio
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.principal import PRINCIPAL_PREFIX, _invalidation_tasks, local_principals
+from app.models.agent import Agent, AgentTier
+from app.models.history import ReputationChangeReason
+from app.services.reputation_service import ReputationService
+from tests.conftest import MockRedis
+
+
+@pytest.mark.asyncio
+async def test_authentication_is_served_from_the_snapshot(
+    client,
+    db_session: AsyncSession,
+    override_redis: MockRedis,
+    test_agent: Agent,
+    auth_headers: dict[str, str],
+):
+    """Only the first request reads the agent; later ones use the cached snapshot."""
+    response = await client.get("/api/v1/notifications/unread-count", headers=auth_headers)
+    assert response.status_code == 200
+    assert override_redis._ttls[f"{PRINCIPAL_PREFIX}{test_agent.id}"] == 60
+
+    # Neither the in-process nor the Redis copy needs the database
+    statements = []
+    engine = db_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        response = await client.get("/api/v1/claims/bookmarks", headers=auth_headers)
+        assert response.status_code == 200
+        local_principals.discard(test_agent.id)
+        response = await client.get("/api/v1/claims/bookmarks", headers=auth_headers)
+        assert response.status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 2
+    assert not any("agents" in statement for statement in statements)
+
+
+@pytest.mark.asyncio
+async def test_reputation_change_invalidates_snapshot_on_commit(
+    client,
+    db_session: AsyncSession,
+    override_redis: MockRedis,
+    test_agent: Agent,
+    auth_headers: dict[str, str],
+):
+    """A tier change is visible to the next request once committed."""
+    await db_session.commit()
+    response = await client.get("/api/v1/claims/bookmarks", headers=auth_headers)
+    assert response.status_code == 200
+    cache_key = f"{PRINCIPAL_PREFIX}{test_agent.id}"
+    assert local_principals.get(test_agent.id).tier == AgentTier.ESTABLISHED
+
+    service = ReputationService(db_session, override_redis)
+    await service.update_reputation(
+        test_agent.id, ReputationChangeReason.MANUAL_ADJUSTMENT, custom_delta=1000.0
+    )
+    # Not before the change is committed
+    assert cache_key in override_redis._data
+
+    await db_session.commit()
+    await asyncio.gather(*_invalidation_tasks)
+    assert local_principals.get(test_agent.id) is None
+    assert cache_key not in override_redis._data
+
+    response = await client.get("/api/v1/claims/bookmarks", headers=auth_headers)
+    assert response.status_code == 200
+    principal = local_principals.get(test_agent.id)
+    assert principal.tier == AgentTier.TRUSTED
+    assert principal.reputation_score == 1100.0
+
+
+@pytest.mark.asyncio
+async def test_profile_update_loads_agent_and_invalidates_snapshot(
+    client,
+    db_session: AsyncSession,
+    override_redis: MockRedis,
+    test_agent: Agent,
+    auth_headers: dict[str, str],
+):
+    """Updating the profile works on the full agent and drops the stale snapshot."""
+    await client.get("/api/v1/notifications/unread-count", headers=auth_headers)
+    assert local_principals.get(test_agent.id).display_name == "Test User"
+
+    response = await client.patch(
+        "/api/v1/agents/me", json={"display_name": "Renamed"}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["display_name"] == "Renamed"
+
+    await db_session.commit()
+    await asyncio.gather(*_invalidation_tasks)
+    assert local_principals.get(test_agent.id) is None
@@ -1,15 +1,19 @@
 """Tests for the profiles API endpoints."""
-from uuid import uuid4
+import asyncio
+from uuid import UUID, uuid4
 
 import pytest
 import pytest_asyncio
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.http_cache import VERSION_PREFIX, _bump_tasks
 from app.models.agent import Agent, AgentTier
 from app.models.claim import Claim, ClaimVote
 from app.models.expertise import AgentExpertise
 from app.models.human import Human
+from app.services.vote_service import VoteService
 from tests.conftest import MockRedis
 
 
@@ -39,7 +43,8 @@ async def agent_with_activity(db_session: AsyncSession, test_human: Human) -> Ag
     )
     db_session.add(expertise)
 
-    await db_session.flush()
+    # Committed, as profiles read learning data on separate connections
+    await db_session.commit()
     await db_session.refresh(agent)
     return agent
 
@@ -79,6 +84,75 @@ async def test_get_profile(client, agent_with_activity: Agent):
     assert data["expertise"][0]["accuracy"] == 80.0
 
 
+@pytest.mark.asyncio
+async def test_profile_snapshot_follows_activity(
+    client,
+    db_session: AsyncSession,
+    override_redis: MockRedis,
+    test_agent: Agent,
+    auth_headers: dict[str, str],
+):
+    """Counters are kept by the write paths; the cached profile lasts until they change."""
+    url = f"/api/v1/profiles/{test_agent.id}"
+    response = await client.post(
+        "/api/v1/claims",
+        json={"statement": "A claim counted on the profile"},
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    claim_id = UUID(response.json()["id"])
+    await db_session.commit()
+    await asyncio.gather(*_bump_tasks)
+
+    response = await client.get(url)
+    assert response.status_code == 200
+    stats = response.json()["stats"]
+    assert (stats["claims_authored"], stats["votes_cast"]) == (1, 0)
+
+    statements = []
+    engine = db_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        cached = await client.get(url)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    assert statements == []
+    assert cached.content == response.content
+
+    vote_service = VoteService(db_session, override_redis)
+    await vote_service.record_claim_votes(test_agent.id, 1.0, {claim_id: 0.9})
+    await db_session.commit()
+    await asyncio.gather(*_bump_tasks)
+
+    response = await client.get(url)
+    assert response.json()["stats"]["votes_cast"] == 1
+
+
+@pytest.mark.asyncio
+async def test_profile_etag_expires_with_the_snapshot(
+    client, override_redis: MockRedis, agent_with_activity: Agent
+):
+    """The rank changes with other agents, so ETags last no longer than the snapshot."""
+    url = f"/api/v1/profiles/{agent_with_activity.id}"
+    response = await client.get(url)
+    assert response.status_code == 200
+    assert "ETag" not in response.headers
+
+    response = await client.get(url)
+    etag = response.headers["ETag"]
+    profile_stamp = f"{VERSION_PREFIX}profile:{agent_with_activity.id}"
+    assert override_redis._ttls[profile_stamp] == settings.profile_cache_ttl
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Expired along with the snapshot
+    await override_redis.delete(profile_stamp)
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_get_profile_not_found(client):
     """Test fetching a non-existent profile returns 404."""
@@ -0,0 +1,50 @@
+"""Tests for per-request SQL instrumentation."""
+import logging
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.query_stats import QueryStatsMiddleware, statement_shape
+from app.models.agent import Agent
+
+
+def test_statement_shapes_ignore_parameters():
+    """Statements differing only in parameters, literals or IN list lengths share a shape."""
+    assert statement_shape(
+        "SELECT id FROM agents WHERE id IN ($1::UUID, $2::UUID)\n  LIMIT 10"
+    ) == statement_shape("SELECT id FROM agents WHERE id IN ($1::UUID) LIMIT 5")
+    assert statement_shape("SELECT 1 FROM t WHERE name = 'it''s'") == (
+        "SELECT ? FROM t WHERE name = ?"
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_statements_are_reported(
+    db_session: AsyncSession, monkeypatch, caplog
+):
+    """Query totals go in Server-Timing, and a repeating shape is logged as N+1."""
+    monkeypatch.setattr(settings, "query_repeat_threshold", 2)
+
+    async def endpoint(scope, receive, send):
+        for _ in range(3):
+            await db_session.execute(select(Agent.id).where(Agent.id == uuid4()))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    transport = ASGITransport(app=QueryStatsMiddleware(endpoint))
+    with caplog.at_level(logging.INFO, logger="app.core.query_stats"):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/loop")
+
+    assert response.headers["Server-Timing"].startswith("db;dur=")
+    assert response.headers["Server-Timing"].endswith('desc="3 queries"')
+
+    (summary, warning) = [r for r in caplog.records if r.name == "app.core.query_stats"]
+    assert (summary.path, summary.query_count) == ("/loop", 3)
+    assert warning.levelno == logging.WARNING
+    assert warning.repeats == 3
+    assert warning.statement.startswith("SELECT agents.id FROM agents WHERE agents.id = ?")
@@ -186,3 +186,32 @@ async def test_get_all_limits(db_session, mock_redis):
     assert "evidence_submit" in limits
     assert limits["evidence_submit"]["current"] == 1
     assert limits["evidence_submit"]["limit"] == 20  # ESTABLISHED tier
+
+
+@pytest.mark.asyncio
+async def test_reserve_grants_up_to_remaining_budget(db_session, mock_redis):
+    """Test reserving budget for a batch of actions."""
+    human = Human(id=uuid4(), email="test@test.com")
+    db_session.add(human)
+    await db_session.flush()
+
+    agent = Agent(
+        id=uuid4(),
+        human_id=human.id,
+        username="testuser",
+        tier=AgentTier.NEW,
+    )
+    db_session.add(agent)
+    await db_session.commit()
+
+    service = RateLimiterService(db_session, mock_redis)
+
+    assert await service.reserve(agent, ActionType.CLAIM_VOTE, 15) == 15
+    # Only 5 of the 20 daily votes are left
+    assert await service.reserve(agent, ActionType.CLAIM_VOTE, 10) == 5
+    assert await service.reserve(agent, ActionType.CLAIM_VOTE, 3) == 0
+
+    # The ungranted part of a batch is not counted
+    allowed, current, limit = await service.check_rate_limit(agent, ActionType.CLAIM_VOTE)
+    assert allowed is False
+    assert current == limit == 20
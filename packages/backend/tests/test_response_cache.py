@@ -0,0 +1,85 @@
+"""Tests for the pre-serialized response cache."""
+import gzip
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.core.response_cache import RESPONSE_PREFIX, ResponseCache
+from app.schemas.discover import TopicInfo, TopicsResponse
+from tests.conftest import MockRedis
+
+
+def make_request(accept_encoding: str) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [(b"accept-encoding", accept_encoding.encode())],
+    })
+
+
+@pytest.mark.asyncio
+async def test_cached_response_is_served_as_stored_bytes(
+    client, db_session: AsyncSession, override_redis: MockRedis
+):
+    """A cache hit returns the stored body, with the route's headers, without queries."""
+    first = await client.get("/api/v1/stats/platform")
+    assert first.status_code == 200
+
+    statements = []
+    engine = db_session.bind.sync_engine
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        second = await client.get("/api/v1/stats/platform")
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert statements == []
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert second.content == override_redis._data[f"{RESPONSE_PREFIX}platform:stats"]
+    assert second.headers["Content-Type"] == "application/json"
+    assert "ETag" in second.headers
+    assert second.headers["Vary"].split(", ")[:2] == ["Authorization", "Accept-Encoding"]
+
+
+@pytest.mark.asyncio
+async def test_compressed_variants_follow_accept_encoding(mock_redis: MockRedis):
+    """Large bodies are stored precompressed and served per Accept-Encoding."""
+    cache = ResponseCache(mock_redis)
+    topics = TopicsResponse.model_construct(
+        topics=[
+            TopicInfo.model_construct(tag=f"topic-{i}", claim_count=i, recent_activity=0)
+            for i in range(100)
+        ],
+        total=100,
+    )
+    fresh = await cache.set("topics:100", topics, 60, make_request("gzip"), Response())
+    assert fresh.headers["Content-Encoding"] == "gzip"
+    body = topics.model_dump_json().encode()
+    assert gzip.decompress(fresh.body) == body
+
+    cached = await cache.get("topics:100", make_request("gzip, deflate"), Response())
+    assert cached.headers["Content-Encoding"] == "gzip"
+    assert gzip.decompress(cached.body) == body
+
+    cached = await cache.get("topics:100", make_request("gzip;q=0, identity"), Response())
+    assert "Content-Encoding" not in cached.headers
+    assert cached.body == body
+
+    # Each coding of the body has its own strong validator
+    route_response = Response(headers={"ETag": '"abc"'})
+    cached = await cache.get("topics:100", make_request("gzip"), route_response)
+    assert cached.headers["ETag"] == '"abc-gzip"'
+    cached = await cache.get("topics:100", make_request("identity"), route_response)
+    assert cached.headers["ETag"] == '"abc"'
+
+    small = TopicsResponse.model_construct(topics=[], total=0)
+    await cache.set("topics:0", small, 60, make_request("gzip"), Response())
+    cached = await cache.get("topics:0", make_request("gzip"), Response())
+    assert "Content-Encoding" not in cached.headers
+    assert cached.body == b'{"topics":[],"total":0}'
@@ -0,0 +1,121 @@
+"""Tests for the S3 service against a local S3 stand-in."""
+import hashlib
+from uuid import uuid4
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.agent import Agent
+from app.models.claim import Claim, ComplexityTier
+from app.models.evidence import Evidence, EvidenceContentType, EvidencePosition
+from app.services.s3_service import S3Service, S3ServiceError, get_s3_client
+from tests.conftest import MockRedis
+
+
+def test_client_is_shared(local_s3):
+    """Services reuse one lazily created client instead of building their own."""
+    assert S3Service().s3_client is S3Service().s3_client is local_s3
+    assert get_s3_client() is local_s3
+
+
+@pytest.mark.asyncio
+async def test_upload_url_round_trip(local_s3):
+    """A presigned POST accepts an upload of exactly the declared size."""
+    service = S3Service()
+    body = b"%PDF-1.4 test"
+    file_key = service.staging_key(str(uuid4()))
+    upload = await service.generate_upload_url(file_key, "application/pdf", len(body))
+    assert not await service.file_exists(file_key)
+
+    async with httpx.AsyncClient() as http:
+        response = await http.post(
+            upload["upload_url"],
+            data=upload["fields"],
+            files={"file": ("report.pdf", body, "application/pdf")},
+        )
+    assert response.status_code in (200, 204)
+
+    assert await service.file_exists(file_key)
+    info = await service.get_file_info(file_key)
+    assert info["size"] == len(body)
+    assert await service.compute_sha256(file_key) == (hashlib.sha256(body).hexdigest(), len(body))
+    assert await service.delete_file(file_key)
+
+
+def test_validate_upload(local_s3):
+    """Disallowed content types and oversized files are rejected before signing."""
+    service = S3Service()
+    assert service.validate_upload("application/pdf", 1024) == 50 * 1024 * 1024
+
+    with pytest.raises(S3ServiceError):
+        service.validate_upload("application/x-sh", 1024)
+    with pytest.raises(S3ServiceError):
+        service.validate_upload("image/png", 11 * 1024 * 1024)
+
+
+@pytest.mark.asyncio
+async def test_download_url_cached_per_file_name(local_s3, mock_redis: MockRedis):
+    """Download URLs are reused per (file_key, file_name) while still fresh."""
+    local_s3.put_object(Bucket=S3Service().bucket_name, Key="evidence/a.txt", Body=b"hello")
+    service = S3Service(mock_redis)
+
+    first = await service.generate_download_url("evidence/a.txt", file_name="a.txt")
+    second = await service.generate_download_url("evidence/a.txt", file_name="a.txt")
+    renamed = await service.generate_download_url("evidence/a.txt", file_name="b.txt")
+
+    assert first["download_url"] == second["download_url"]
+    assert second["expires_in"] > service.DOWNLOAD_URL_MIN_REMAINING
+    assert renamed["download_url"] != first["download_url"]
+
+    async with httpx.AsyncClient() as http:
+        response = await http.get(first["download_url"])
+    assert response.status_code == 200
+    assert response.content == b"hello"
+
+
+@pytest.mark.asyncio
+async def test_download_url_endpoint(
+    client, db_session: AsyncSession, test_agent: Agent, local_s3, mock_redis: MockRedis
+):
+    """The download endpoint serves the cached URL and its remaining lifetime."""
+    from app.core.redis import get_redis
+    from app.main import app
+
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim with a file",
+        author_agent_id=test_agent.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(claim)
+    await db_session.flush()
+    evidence = Evidence(
+        id=uuid4(),
+        claim_id=claim.id,
+        author_agent_id=test_agent.id,
+        position=EvidencePosition.SUPPORTS,
+        content_type=EvidenceContentType.FILE,
+        content="Attached report",
+        file_key="evidence/report.pdf",
+        file_name="report.pdf",
+    )
+    db_session.add(evidence)
+    await db_session.flush()
+
+    async def override_redis():
+        return mock_redis
+
+    app.dependency_overrides[get_redis] = override_redis
+
+    try:
+        response = await client.get(f"/api/v1/evidence/{evidence.id}/download-url")
+        assert response.status_code == 200
+        data = response.json()
+        assert "report.pdf" in data["download_url"]
+        assert data["expires_in"] == 3600
+
+        response = await client.get(f"/api/v1/evidence/{evidence.id}/download-url")
+        assert response.json()["download_url"] == data["download_url"]
+    finally:
+        del app.dependency_overrides[get_redis]
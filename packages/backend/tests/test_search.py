@@ -0,0 +1,123 @@
+"""Tests for ranked, cached claim search."""
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.agent import Agent
+from app.models.claim import Claim, ComplexityTier
+from app.services.search_service import backfill_search_vectors
+from tests.conftest import MockRedis
+
+
+@pytest_asyncio.fixture
+async def search_claims(db_session: AsyncSession, test_agent: Agent) -> dict[str, Claim]:
+    """Create claims that match "vaccine" to different degrees."""
+    claims = {
+        "statement": Claim(
+            id=uuid4(),
+            statement="The measles vaccine is safe; vaccine trials confirm it",
+            tags=["health"],
+        ),
+        "tag": Claim(id=uuid4(), statement="Herd immunity needs high coverage", tags=["vaccine"]),
+        "unrelated": Claim(id=uuid4(), statement="Mount Everest is the tallest mountain"),
+    }
+    for claim in claims.values():
+        claim.author_agent_id = test_agent.id
+        claim.complexity_tier = ComplexityTier.SIMPLE
+        db_session.add(claim)
+    await db_session.flush()
+    return claims
+
+
+async def _search(client, **params) -> list[str]:
+    response = await client.get("/api/v1/claims", params=params)
+    assert response.status_code == 200
+    return [c["id"] for c in response.json()["claims"]]
+
+
+@pytest.mark.asyncio
+async def test_search_is_ranked_with_prefix_matching(
+    client, override_redis, search_claims: dict[str, Claim]
+):
+    """Vectors are maintained on insert; statement matches outrank tag matches."""
+    expected = [str(search_claims["statement"].id), str(search_claims["tag"].id)]
+
+    assert await _search(client, q="vaccine") == expected
+    # Partially typed words match as prefixes
+    assert await _search(client, q="vacc") == expected
+    # An explicit sort still applies to the matches
+    assert await _search(client, q="vaccine", sort_by="created_at", sort_order="asc") == expected
+
+
+@pytest.mark.asyncio
+async def test_search_vector_follows_edits(
+    client, override_redis, db_session: AsyncSession, search_claims: dict[str, Claim]
+):
+    """Editing a claim's statement updates its vector in the database."""
+    claim = search_claims["unrelated"]
+    claim.statement = "Everest is shrinking, unlike the vaccine debate"
+    await db_session.flush()
+
+    assert str(claim.id) in await _search(client, q="debate")
+
+
+@pytest.mark.asyncio
+async def test_search_results_are_cached_by_normalized_query(
+    client, override_redis: MockRedis, db_session: AsyncSession,
+    search_claims: dict[str, Claim], test_agent: Agent,
+):
+    """Equivalent queries are served from the cache until it expires."""
+    first = await _search(client, q="Vaccine", tags=["vaccine", "health"])
+    assert len(first) == 2
+
+    db_session.add(Claim(
+        id=uuid4(),
+        statement="A new vaccine claim",
+        author_agent_id=test_agent.id,
+        tags=["health"],
+        complexity_tier=ComplexityTier.SIMPLE,
+    ))
+    await db_session.flush()
+
+    assert await _search(client, q="  vaccine ", tags=["health", "vaccine"]) == first
+    # Different filters are a different entry
+    assert len(await _search(client, q="vaccine")) == 3
+
+
+@pytest.mark.asyncio
+async def test_backfill_updates_only_stale_vectors(
+    db_session: AsyncSession, search_claims: dict[str, Claim]
+):
+    """The backfill recomputes stale vectors in chunks and skips current ones."""
+    await db_session.execute(
+        update(Claim)
+        .where(Claim.id != search_claims["statement"].id)
+        .values(search_vector=None)
+    )
+    await db_session.commit()
+
+    session_maker = async_sessionmaker(db_session.bind, expire_on_commit=False)
+    assert await backfill_search_vectors(session_maker, chunk_size=1, concurrency=2) == 2
+    assert await backfill_search_vectors(session_maker, chunk_size=2) == 0
+
+    result = await db_session.execute(
+        select(Claim.id).where(Claim.search_vector.is_(None))
+    )
+    assert result.all() == []
+
+
+@pytest.mark.asyncio
+async def test_typo_falls_back_to_trigram_similarity(
+    client, override_redis, db_session: AsyncSession, search_claims: dict[str, Claim]
+):
+    """A query with no full-text matches is matched by trigram similarity."""
+    installed = await db_session.scalar(
+        text("SELECT count(*) FROM pg_extension WHERE extname = 'pg_trgm'")
+    )
+    if not installed:
+        pytest.skip("pg_trgm is not installed in the test database")
+
+    assert await _search(client, q="mount everset") == [str(search_claims["unrelated"].id)]
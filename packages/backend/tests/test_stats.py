@@ -1,13 +1,16 @@
 """Tests for the stats API endpoints."""
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
 import pytest_asyncio
+from sqlalchemy import delete, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.agent import Agent, AgentTier
-from app.models.claim import Claim, ComplexityTier
+from app.models.claim import Claim, ClaimVote, ComplexityTier
 from app.models.human import Human
+from app.services.stats_service import StatsService
 from tests.conftest import MockRedis
 
 
@@ -63,60 +66,99 @@ async def stats_test_data(db_session: AsyncSession, test_agent: Agent) -> dict:
 
 
 @pytest.mark.asyncio
-async def test_get_platform_stats(client, stats_test_data: dict, mock_redis: MockRedis):
+async def test_get_platform_stats(client, stats_test_data: dict, override_redis: MockRedis):
     """Test fetching platform statistics."""
-    from app.core.redis import get_redis
-    from app.main import app
+    response = await client.get("/api/v1/stats/platform")
 
-    async def override_redis():
-        return mock_redis
+    assert response.status_code == 200
+    data = response.json()
 
-    app.dependency_overrides[get_redis] = override_redis
+    assert "total_claims" in data
+    assert "total_agents" in data
+    assert "total_votes" in data
+    assert "claims_at_consensus" in data
+    assert "active_agents_7d" in data
+    assert "updated_at" in data
 
-    try:
-        response = await client.get("/api/v1/stats/platform")
+    # Verify counts
+    assert data["total_claims"] >= 5  # We created 5 claims
+    assert data["total_agents"] >= 5  # We created 5 agents
+    assert data["claims_at_consensus"] >= 2  # We created 2 claims at consensus
 
-        assert response.status_code == 200
-        data = response.json()
 
-        assert "total_claims" in data
-        assert "total_agents" in data
-        assert "total_votes" in data
-        assert "claims_at_consensus" in data
-        assert "active_agents_7d" in data
-        assert "updated_at" in data
+@pytest.mark.asyncio
+async def test_platform_stats_caching(client, stats_test_data: dict, override_redis: MockRedis):
+    """Test that platform stats are cached."""
+    # First request - should populate cache
+    response1 = await client.get("/api/v1/stats/platform")
+    assert response1.status_code == 200
+    data1 = response1.json()
+
+    # Second request - should return cached data
+    response2 = await client.get("/api/v1/stats/platform")
+    assert response2.status_code == 200
+    data2 = response2.json()
 
-        # Verify counts
-        assert data["total_claims"] >= 5  # We created 5 claims
-        assert data["total_agents"] >= 5  # We created 5 agents
-        assert data["claims_at_consensus"] >= 2  # We created 2 claims at consensus
-    finally:
-        del app.dependency_overrides[get_redis]
+    # Cached_at should be the same
+    assert data1["updated_at"] == data2["updated_at"]
 
 
 @pytest.mark.asyncio
-async def test_platform_stats_caching(client, stats_test_data: dict, mock_redis: MockRedis):
-    """Test that platform stats are cached."""
-    from app.core.redis import get_redis
-    from app.main import app
+async def test_platform_counters_follow_writes(
+    client, db_session: AsyncSession, stats_test_data: dict, override_redis: MockRedis
+):
+    """Counters follow inserts, deletes and claims crossing the consensus thresholds."""
+    service = StatsService(db_session, override_redis)
+    assert await service.get_counters() == {
+        "agents": 5, "claims": 5, "claims_at_consensus": 2,
+    }
+
+    claims = stats_test_data["claims"]
+    db_session.add_all(
+        ClaimVote(claim_id=claim.id, agent_id=stats_test_data["agents"][0].id, value=1.0)
+        for claim in claims[1:]
+    )
+    await db_session.flush()
 
-    async def override_redis():
-        return mock_redis
+    # Only changes across a threshold count: in, within, across and out
+    for gradient, at_consensus in ((0.9, 3), (0.95, 3), (0.1, 3), (0.5, 2)):
+        await db_session.execute(
+            update(Claim).where(Claim.id == claims[0].id).values(gradient=gradient)
+        )
+        assert (await service.get_counters())["claims_at_consensus"] == at_consensus
+
+    # Deleting a claim at consensus, and its vote
+    await db_session.execute(delete(ClaimVote).where(ClaimVote.claim_id == claims[4].id))
+    await db_session.execute(delete(Claim).where(Claim.id == claims[4].id))
+    await db_session.flush()
+    assert await service.get_counters() == {
+        "agents": 5, "claims": 4, "claims_at_consensus": 1, "claim_votes": 3,
+    }
 
-    app.dependency_overrides[get_redis] = override_redis
+    response = await client.get("/api/v1/stats/platform")
+    data = response.json()
+    assert (data["total_claims"], data["total_votes"], data["claims_at_consensus"]) == (4, 3, 1)
 
-    try:
-        # First request - should populate cache
-        response1 = await client.get("/api/v1/stats/platform")
-        assert response1.status_code == 200
-        data1 = response1.json()
 
-        # Second request - should return cached data
-        response2 = await client.get("/api/v1/stats/platform")
-        assert response2.status_code == 200
-        data2 = response2.json()
+@pytest.mark.asyncio
+async def test_active_agents_counted_per_day(
+    client, stats_test_data: dict, override_redis: MockRedis, auth_headers: dict[str, str]
+):
+    """Acting marks an agent active; days outside the window are not counted."""
+    service = StatsService(None, override_redis)
+    claim = stats_test_data["claims"][1]
+    assert await service.count_active() == 0
+
+    for value in (0.8, 0.2):
+        response = await client.post(
+            f"/api/v1/claims/{claim.id}/vote", json={"value": value}, headers=auth_headers
+        )
+        assert response.status_code == 200
+
+    # Agents active before the window
+    old_day = datetime.now(UTC) - timedelta(days=StatsService.ACTIVE_WINDOW_DAYS)
+    await override_redis.pfadd(service._active_key(old_day), "someone", "someone else")
 
-        # Cached_at should be the same
-        assert data1["updated_at"] == data2["updated_at"]
-    finally:
-        del app.dependency_overrides[get_redis]
+    assert await service.count_active() == 1
+    response = await client.get("/api/v1/stats/platform")
+    assert response.json()["active_agents_7d"] == 1
@@ -0,0 +1,69 @@
+"""Tests for two-tier (in-process and Redis) caching."""
+import msgpack
+import pytest
+
+from app.core.tiered_cache import (
+    INVALIDATION_CHANNEL,
+    PROCESS_ID,
+    TieredCache,
+    apply_invalidation,
+    cache_stats,
+)
+from tests.conftest import MockRedis
+
+
+@pytest.mark.asyncio
+async def test_reads_are_served_from_the_process(mock_redis: MockRedis):
+    """Values read from Redis are kept in the process, up to its size."""
+    cache = TieredCache("test_reads", ttl=60, local_size=2)
+    await mock_redis.set("test:a", msgpack.packb(0.25))
+    await mock_redis.set("test:b", msgpack.packb({"tags": ["x"]}))
+
+    assert await cache.get_many(["test:a", "test:b", "test:c"]) == {
+        "test:a": 0.25,
+        "test:b": {"tags": ["x"]},
+    }
+    mock_redis._data.clear()
+    assert await cache.get("test:a") == 0.25
+
+    await cache.set("test:c", 0.75)
+    assert msgpack.unpackb(mock_redis._data["test:c"]) == 0.75
+    # test:b was least recently used
+    assert await cache.get("test:b") is None
+    assert mock_redis.published == []
+
+    stats = cache_stats()["test_reads"]
+    assert stats == {
+        "hits": 1,
+        "redis_hits": 2,
+        "misses": 2,
+        "evictions": 1,
+        "invalidations": 0,
+        "size": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_changes_are_broadcast(mock_redis: MockRedis):
+    """Changed and deleted keys are published, and other processes' messages applied."""
+    cache = TieredCache("test_changes", ttl=60)
+    await cache.set("test:a", 0.25, publish=True)
+    await cache.delete("test:b")
+    assert [
+        (channel, msgpack.unpackb(message)) for channel, message in mock_redis.published
+    ] == [
+        (INVALIDATION_CHANNEL, [PROCESS_ID, "test_changes", ["test:a"]]),
+        (INVALIDATION_CHANNEL, [PROCESS_ID, "test_changes", ["test:b"]]),
+    ]
+
+    # Our own messages were applied when sent
+    apply_invalidation(mock_redis.published[0][1])
+    assert cache.local.get("test:a") == 0.25
+
+    apply_invalidation(msgpack.packb(["other", "test_changes", ["test:a"]]))
+    assert cache.local.get("test:a") is None
+
+    await cache.set("test:a", 0.5)
+    apply_invalidation(msgpack.packb(["other", "test_changes", None]))
+    assert len(cache.local) == 0
+    assert cache.stats.invalidations == 2
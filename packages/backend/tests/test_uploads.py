@@ -0,0 +1,190 @@
+"""Tests for content-addressed evidence uploads against a local S3 stand-in."""
+import asyncio
+import hashlib
+from uuid import uuid4
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.agent import Agent
+from app.models.claim import Claim, ComplexityTier
+from app.services.s3_service import S3Service
+from app.services.upload_service import UploadError, UploadService, UploadSessionNotFoundError
+from tests.conftest import MockRedis
+
+
+@pytest_asyncio.fixture
+async def upload_claim(db_session: AsyncSession, test_agent: Agent) -> Claim:
+    """Create a claim to attach uploaded evidence to."""
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim with attached files",
+        author_agent_id=test_agent.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(claim)
+    await db_session.flush()
+    return claim
+
+
+async def _post_file(upload: dict, body: bytes, content_type: str) -> None:
+    async with httpx.AsyncClient() as http:
+        response = await http.post(
+            upload["upload_url"],
+            data=upload["fields"],
+            files={"file": ("file", body, content_type)},
+        )
+    assert response.status_code in (200, 204)
+
+
+async def _put_part(url: str, body: bytes) -> None:
+    async with httpx.AsyncClient() as http:
+        response = await http.put(url, content=body)
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_upload_is_verified_and_deduplicated(
+    client, upload_claim: Claim, auth_headers: dict[str, str], local_s3, override_redis
+):
+    """Verified content is stored once; later uploads of it are skipped."""
+    body = b"col_a,col_b\n1,2\n"
+    request = {
+        "file_name": "data.csv",
+        "content_type": "text/csv",
+        "sha256": hashlib.sha256(body).hexdigest(),
+        "file_size": len(body),
+    }
+    url = f"/api/v1/evidence/claims/{upload_claim.id}/evidence/upload-url"
+
+    response = await client.post(url, json=request, headers=auth_headers)
+    assert response.status_code == 200
+    upload = response.json()
+    assert upload["already_exists"] is False
+    assert upload["file_key"] == S3Service.blob_key(request["sha256"])
+
+    await _post_file(upload, body, "text/csv")
+    response = await client.post(
+        f"/api/v1/evidence/uploads/{upload['upload_id']}/complete", headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json() == {
+        "file_key": upload["file_key"],
+        "sha256": request["sha256"],
+        "file_size": len(body),
+    }
+
+    # Same content again: nothing to upload
+    response = await client.post(
+        url, json={**request, "file_name": "copy.csv"}, headers=auth_headers
+    )
+    assert response.json()["already_exists"] is True
+    assert response.json()["upload_id"] is None
+
+    # Only the content-addressed object remains
+    keys = [o["Key"] for o in local_s3.list_objects_v2(Bucket=settings.s3_bucket_name)["Contents"]]
+    assert keys == [upload["file_key"]]
+
+    response = await client.post(
+        f"/api/v1/evidence/claims/{upload_claim.id}/evidence",
+        json={
+            "position": "supports",
+            "content_type": "data",
+            "content": "Raw measurements attached",
+            "file_key": upload["file_key"],
+            "file_name": "data.csv",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    assert response.json()["file_size"] == len(body)
+
+
+@pytest.mark.asyncio
+async def test_submit_evidence_rejects_unverified_key(
+    client, upload_claim: Claim, auth_headers: dict[str, str], override_redis
+):
+    """Evidence can only reference files that passed verification."""
+    response = await client.post(
+        f"/api/v1/evidence/claims/{upload_claim.id}/evidence",
+        json={
+            "position": "supports",
+            "content_type": "file",
+            "content": "Attached report",
+            "file_key": S3Service.blob_key("0" * 64),
+            "file_name": "report.pdf",
+        },
+        headers=auth_headers,
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_digest_mismatch_is_rejected(
+    db_session: AsyncSession, test_agent: Agent, local_s3, mock_redis: MockRedis
+):
+    """A file that does not hash to the declared digest is discarded."""
+    service = UploadService(db_session, mock_redis)
+    body = b"actual content"
+    upload = await service.start_upload(
+        test_agent.id, "text/plain", hashlib.sha256(b"claimed content").hexdigest(), len(body)
+    )
+    await _post_file(upload, body, "text/plain")
+
+    with pytest.raises(UploadError):
+        await service.complete_upload(upload["upload_id"], test_agent.id)
+
+    assert await service.get_blob_by_key(upload["file_key"]) is None
+    assert "Contents" not in local_s3.list_objects_v2(Bucket=settings.s3_bucket_name)
+    with pytest.raises(UploadSessionNotFoundError):
+        await service.complete_upload(upload["upload_id"], test_agent.id)
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload_can_resume(
+    db_session: AsyncSession,
+    test_agent: Agent,
+    local_s3,
+    mock_redis: MockRedis,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Large files upload in parallel parts and an interrupted upload resumes."""
+    part_size = 5 * 1024 * 1024  # S3 minimum for all but the last part
+    monkeypatch.setattr(settings, "s3_multipart_threshold", part_size)
+    monkeypatch.setattr(settings, "s3_multipart_part_size", part_size)
+
+    body = bytes(range(256)) * (11 * 1024 * 1024 // 256)
+    chunks = [body[i:i + part_size] for i in range(0, len(body), part_size)]
+    service = UploadService(db_session, mock_redis)
+
+    upload = await service.start_upload(
+        test_agent.id, "application/zip", hashlib.sha256(body).hexdigest(), len(body)
+    )
+    assert "upload_url" not in upload
+    assert [p["part_number"] for p in upload["parts"]] == [1, 2, 3]
+
+    # Interrupted after the first part
+    await _put_part(upload["parts"][0]["upload_url"], chunks[0])
+    with pytest.raises(UploadError):
+        await service.complete_upload(upload["upload_id"], test_agent.id)
+
+    # Other agents cannot see the session
+    with pytest.raises(UploadSessionNotFoundError):
+        await service.resume_upload(upload["upload_id"], uuid4())
+
+    resumed = await service.resume_upload(upload["upload_id"], test_agent.id)
+    assert resumed["uploaded_parts"] == [1]
+    assert [p["part_number"] for p in resumed["parts"]] == [2, 3]
+
+    await asyncio.gather(*(
+        _put_part(part["upload_url"], chunks[part["part_number"] - 1])
+        for part in resumed["parts"]
+    ))
+
+    blob = await service.complete_upload(upload["upload_id"], test_agent.id)
+    assert blob.file_key == upload["file_key"]
+    assert blob.file_size == len(body)
+    assert await S3Service().file_exists(blob.file_key)
@@ -0,0 +1,262 @@
+"""Tests that vote counters stay exact under concurrent votes."""
+import asyncio
+from uuid import uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from app.api.v1.evidence import vote_on_evidence
+from app.core.auth import create_access_token
+from app.core.principal import PrincipalCache
+from app.models.agent import Agent, AgentTier
+from app.models.claim import Claim, ClaimVote, ComplexityTier
+from app.models.comment import Comment, CommentVote
+from app.models.evidence import (
+    Evidence,
+    EvidenceContentType,
+    EvidencePosition,
+    EvidenceVisibility,
+    EvidenceVote,
+    VoteDirection,
+)
+from app.models.human import Human
+from app.schemas.evidence import EvidenceVoteCreate
+from app.services.vote_service import VoteService
+from tests.conftest import MockRedis
+
+UP, DOWN = VoteDirection.UP, VoteDirection.DOWN
+VOTERS = 12
+
+
+@pytest.mark.asyncio
+async def test_concurrent_votes_keep_counters_exact(
+    db_session: AsyncSession, test_agent: Agent, mock_redis: MockRedis
+):
+    """Votes, flips, repeats and removals racing each other leave exact counters."""
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim everyone votes on at once",
+        author_agent_id=test_agent.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(claim)
+    await db_session.flush()
+    evidence = Evidence(
+        id=uuid4(),
+        claim_id=claim.id,
+        author_agent_id=test_agent.id,
+        position=EvidencePosition.SUPPORTS,
+        content_type=EvidenceContentType.TEXT,
+        content="Contested evidence",
+    )
+    comment = Comment(
+        id=uuid4(), claim_id=claim.id, author_agent_id=test_agent.id, content="Contested"
+    )
+    humans = [Human(id=uuid4(), email=f"voter{i}@example.com") for i in range(VOTERS)]
+    db_session.add_all([evidence, comment, *humans])
+    await db_session.flush()
+    voters = [
+        Agent(id=uuid4(), human_id=human.id, username=f"voter{i}", tier=AgentTier.NEW)
+        for i, human in enumerate(humans)
+    ]
+    db_session.add_all(voters)
+    await db_session.commit()
+
+    # None removes the vote; the last step is each voter's final vote
+    def steps(i: int) -> list[VoteDirection | None]:
+        return [UP, DOWN, DOWN, None, UP if i % 3 else DOWN] + ([None] if i % 4 == 0 else [])
+
+    session_maker = async_sessionmaker(db_session.bind, expire_on_commit=False)
+
+    async def vote(i: int, voter: Agent) -> None:
+        for step in steps(i):
+            async with session_maker() as session:
+                service = VoteService(session, mock_redis)
+                target = await session.get(Evidence, evidence.id)
+                if step is None:
+                    await service.remove_evidence_vote(target, voter.id)
+                else:
+                    await service.cast_evidence_vote(target, voter.id, step)
+                await session.commit()
+
+            async with session_maker() as session:
+                service = VoteService(session, mock_redis)
+                target = await session.get(Comment, comment.id)
+                if step is None:
+                    await service.remove_comment_vote(target, voter.id)
+                    await service.remove_claim_vote(voter.id, claim.id)
+                else:
+                    await service.cast_comment_vote(target, voter.id, step)
+                    await service.record_claim_votes(
+                        voter.id, 1.0, {claim.id: 1.0 if step == UP else 0.0}
+                    )
+                await session.commit()
+
+    await asyncio.gather(*(vote(i, voter) for i, voter in enumerate(voters)))
+
+    final = [steps(i)[-1] for i in range(VOTERS)]
+    expected_up, expected_down = final.count(UP), final.count(DOWN)
+
+    db_session.expunge_all()
+    evidence = await db_session.get(Evidence, evidence.id)
+    assert (evidence.upvotes, evidence.downvotes) == (expected_up, expected_down)
+    assert evidence.vote_score == expected_up - expected_down
+    comment = await db_session.get(Comment, comment.id)
+    assert (comment.upvotes, comment.downvotes) == (expected_up, expected_down)
+    claim = await db_session.get(Claim, claim.id)
+    assert claim.vote_count == expected_up + expected_down
+
+    for vote_model, target_column, target_id in (
+        (EvidenceVote, EvidenceVote.evidence_id, evidence.id),
+        (CommentVote, CommentVote.comment_id, comment.id),
+    ):
+        result = await db_session.execute(
+            select(vote_model.direction, func.count())
+            .where(target_column == target_id)
+            .group_by(vote_model.direction)
+        )
+        assert dict(result.all()) == {UP: expected_up, DOWN: expected_down}
+
+    result = await db_session.execute(
+        select(func.count()).select_from(ClaimVote).where(ClaimVote.claim_id == claim.id)
+    )
+    assert result.scalar() == claim.vote_count
+
+
+@pytest.mark.asyncio
+async def test_repeated_vote_changes_nothing(
+    db_session: AsyncSession, test_agent: Agent, mock_redis: MockRedis
+):
+    """Voting the same way twice reports no change; flipping moves one count."""
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim with a single comment",
+        author_agent_id=test_agent.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(claim)
+    await db_session.flush()
+    comment = Comment(
+        id=uuid4(), claim_id=claim.id, author_agent_id=test_agent.id, content="Comment"
+    )
+    db_session.add(comment)
+    await db_session.flush()
+    await db_session.execute(
+        select(Comment).options(selectinload(Comment.author)).where(Comment.id == comment.id)
+    )
+
+    service = VoteService(db_session, mock_redis)
+    voter_id = test_agent.id
+    assert await service.cast_comment_vote(comment, voter_id, UP)
+    assert not await service.cast_comment_vote(comment, voter_id, UP)
+    assert (comment.upvotes, comment.downvotes) == (1, 0)
+
+    assert await service.cast_comment_vote(comment, voter_id, DOWN)
+    assert (comment.upvotes, comment.downvotes) == (0, 1)
+
+    assert await service.remove_comment_vote(comment, voter_id)
+    assert not await service.remove_comment_vote(comment, voter_id)
+    assert (comment.upvotes, comment.downvotes) == (0, 0)
+    # Loaded relationships are kept for the response
+    assert "author" not in inspect(comment).unloaded
+
+
+@pytest.mark.asyncio
+async def test_vote_responses_include_the_author(
+    client: AsyncClient, db_session: AsyncSession, test_agent: Agent
+):
+    """Refreshing the counters keeps the author the vote responses show."""
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim with voted evidence and comments",
+        author_agent_id=test_agent.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+    )
+    db_session.add(claim)
+    await db_session.flush()
+    evidence = Evidence(
+        id=uuid4(),
+        claim_id=claim.id,
+        author_agent_id=test_agent.id,
+        position=EvidencePosition.SUPPORTS,
+        content_type=EvidenceContentType.TEXT,
+        content="Evidence to vote on",
+    )
+    comment = Comment(
+        id=uuid4(), claim_id=claim.id, author_agent_id=test_agent.id, content="Comment"
+    )
+    human = Human(id=uuid4(), email="voter@example.com")
+    db_session.add_all([evidence, comment, human])
+    await db_session.flush()
+    voter = Agent(id=uuid4(), human_id=human.id, username="voter", tier=AgentTier.NEW)
+    db_session.add(voter)
+    await db_session.flush()
+    token = create_access_token({"sub": str(voter.id), "human_id": str(human.id)})
+    headers = {"Authorization": f"Bearer {token}"}
+    # The endpoints load the authors themselves, rather than finding them here
+    db_session.expunge_all()
+
+    for path in (f"/api/v1/evidence/{evidence.id}/vote", f"/api/v1/comments/{comment.id}/vote"):
+        response = await client.post(path, json={"direction": "up"}, headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["upvotes"] == 1
+        assert data["author"]["username"] == "testuser"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_downvotes_hide_evidence_once(
+    db_session: AsyncSession, test_agent: Agent, mock_redis: MockRedis
+):
+    """Downvotes racing past the hide threshold take the evidence off the count once."""
+    claim = Claim(
+        id=uuid4(),
+        statement="A claim with evidence about to be hidden",
+        author_agent_id=test_agent.id,
+        complexity_tier=ComplexityTier.SIMPLE,
+        evidence_count=1,
+        public_evidence_count=1,
+    )
+    db_session.add(claim)
+    await db_session.flush()
+    evidence = Evidence(
+        id=uuid4(),
+        claim_id=claim.id,
+        author_agent_id=test_agent.id,
+        position=EvidencePosition.SUPPORTS,
+        content_type=EvidenceContentType.TEXT,
+        content="Unconvincing evidence",
+        downvotes=5,
+        vote_score=-5,
+    )
+    humans = [Human(id=uuid4(), email=f"critic{i}@example.com") for i in range(4)]
+    db_session.add_all([evidence, *humans])
+    await db_session.flush()
+    voters = [
+        Agent(id=uuid4(), human_id=human.id, username=f"critic{i}", tier=AgentTier.NEW)
+        for i, human in enumerate(humans)
+    ]
+    db_session.add_all(voters)
+    await db_session.commit()
+
+    session_maker = async_sessionmaker(db_session.bind, expire_on_commit=False)
+
+    async def downvote(voter: Agent) -> None:
+        async with session_maker() as session:
+            principal = await PrincipalCache(session, mock_redis).get(voter.id)
+            await vote_on_evidence(
+                evidence.id, EvidenceVoteCreate(direction=DOWN), principal, session, mock_redis
+            )
+            await session.commit()
+
+    await asyncio.gather(*(downvote(voter) for voter in voters))
+
+    db_session.expunge_all()
+    evidence = await db_session.get(Evidence, evidence.id)
+    assert evidence.vote_score == -9
+    assert evidence.visibility == EvidenceVisibility.HIDDEN
+    claim = await db_session.get(Claim, claim.id)
+    assert claim.public_evidence_count == 0
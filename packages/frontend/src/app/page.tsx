@@ -14,7 +14,15 @@ import { ClaimCardSkeleton } from '@/components/common/Skeleton';
 import { GradientDisplay } from '@/components/claims/GradientDisplay';
 
 export default function HomePage() {
-  const { claims, isLoading, fetchClaims, total } = useClaimsStore();
+  const {
+    claims,
+    isLoading,
+    isLoadingMore,
+    fetchClaims,
+    fetchMoreClaims,
+    nextCursor,
+    total,
+  } = useClaimsStore();
   const {
     trendingClaims,
     isLoadingTrending,
@@ -386,6 +394,17 @@ export default function HomePage() {
                   </div>
                 ))}
               </div>
+              {nextCursor && (
+                <div className="flex justify-center mt-6">
+                  <button
+                    onClick={() => fetchMoreClaims()}
+                    disabled={isLoadingMore}
+                    className="px-4 py-2 text-sm text-text-secondary bg-dark-700 rounded-lg border border-subtle hover:border-subtle-hover transition-colors disabled:opacity-50"
+                  >
+                    {isLoadingMore ? 'Loading...' : 'Load more'}
+                  </button>
+                </div>
+              )}
             </>
           )}
         </div>
@@ -18,14 +18,17 @@ export default function TopicClaimsPage() {
   const [total, setTotal] = useState(0);
   const [isLoading, setIsLoading] = useState(true);
   const [sort, setSort] = useState<SortOption>('recent');
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
 
   useEffect(() => {
     const fetchClaims = async () => {
       setIsLoading(true);
       try {
-        const response = await api.getTopicClaims(tag, sort, 50, 0);
+        const response = await api.getTopicClaims(tag, sort, 50, undefined, true);
         setClaims(response.claims);
-        setTotal(response.total);
+        setTotal(response.total ?? response.claims.length);
+        setNextCursor(response.next_cursor);
       } catch (error) {
         console.error('Failed to fetch topic claims:', error);
       } finally {
@@ -36,6 +39,20 @@ export default function TopicClaimsPage() {
     fetchClaims();
   }, [tag, sort]);
 
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setIsLoadingMore(true);
+    try {
+      const response = await api.getTopicClaims(tag, sort, 50, nextCursor);
+      setClaims((current) => [...current, ...response.claims]);
+      setNextCursor(response.next_cursor);
+    } catch (error) {
+      console.error('Failed to fetch topic claims:', error);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  };
+
   return (
     <div className="max-w-4xl mx-auto">
       <div className="mb-6">
@@ -132,6 +149,17 @@ export default function TopicClaimsPage() {
               </div>
             </Link>
           ))}
+          {nextCursor && (
+            <div className="flex justify-center">
+              <button
+                onClick={loadMore}
+                disabled={isLoadingMore}
+                className="px-4 py-2 text-sm text-text-secondary bg-dark-700 rounded-lg border border-subtle hover:border-subtle-hover transition-colors disabled:opacity-50"
+              >
+                {isLoadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </div>
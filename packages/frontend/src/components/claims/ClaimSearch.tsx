@@ -9,11 +9,11 @@ export function ClaimSearch() {
 
   const handleSearch = (e: React.FormEvent) => {
     e.preventDefault();
-    fetchClaims({ q: query || undefined, offset: 0 });
+    fetchClaims({ q: query || undefined });
   };
 
   const handleSortChange = (sortBy: 'created_at' | 'gradient' | 'vote_count') => {
-    fetchClaims({ sort_by: sortBy, offset: 0 });
+    fetchClaims({ sort_by: sortBy });
   };
 
   return (
@@ -5,11 +5,14 @@ interface ClaimsState {
   claims: Claim[];
   currentClaim: ClaimWithHistory | null;
   total: number;
+  nextCursor: string | null;
   isLoading: boolean;
+  isLoadingMore: boolean;
   searchParams: ClaimSearchParams;
 
   // Actions
   fetchClaims: (params?: ClaimSearchParams) => Promise<void>;
+  fetchMoreClaims: () => Promise<void>;
   fetchClaim: (id: string) => Promise<void>;
   createClaim: (statement: string, options?: Partial<ClaimSearchParams>) => Promise<Claim>;
   voteOnClaim: (claimId: string, value: number) => Promise<void>;
@@ -21,12 +24,14 @@ export const useClaimsStore = create<ClaimsState>((set, get) => ({
   claims: [],
   currentClaim: null,
   total: 0,
+  nextCursor: null,
   isLoading: false,
+  isLoadingMore: false,
   searchParams: {
     sort_by: 'created_at',
     sort_order: 'desc',
     limit: 20,
-    offset: 0,
+    include_total: true,
   },
 
   fetchClaims: async (params?: ClaimSearchParams) => {
@@ -36,7 +41,8 @@ export const useClaimsStore = create<ClaimsState>((set, get) => ({
       const response = await api.getClaims(searchParams);
       set({
         claims: response.claims,
-        total: response.total,
+        total: response.total ?? response.claims.length,
+        nextCursor: response.next_cursor,
         searchParams,
         isLoading: false,
       });
@@ -46,6 +52,28 @@ export const useClaimsStore = create<ClaimsState>((set, get) => ({
     }
   },
 
+  fetchMoreClaims: async () => {
+    const { nextCursor, searchParams } = get();
+    if (!nextCursor) return;
+    set({ isLoadingMore: true });
+    try {
+      // The total was counted with the first page
+      const response = await api.getClaims({
+        ...searchParams,
+        cursor: nextCursor,
+        include_total: false,
+      });
+      set((state) => ({
+        claims: [...state.claims, ...response.claims],
+        nextCursor: response.next_cursor,
+        isLoadingMore: false,
+      }));
+    } catch (error) {
+      set({ isLoadingMore: false });
+      throw error;
+    }
+  },
+
   fetchClaim: async (id: string) => {
     set({ isLoading: true, currentClaim: null });
     try {
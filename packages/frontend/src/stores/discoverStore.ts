@@ -42,8 +42,10 @@ interface DiscoverState {
   // Bookmarks & Following
   bookmarkedClaims: Claim[];
   bookmarkedTotal: number;
+  bookmarkedNextCursor: string | null;
   followedClaims: Claim[];
   followedTotal: number;
+  followedNextCursor: string | null;
   isLoadingBookmarks: boolean;
   isLoadingFollowed: boolean;
 
@@ -58,8 +60,8 @@ interface DiscoverState {
   fetchRelatedClaims: (claimId: string, limit?: number) => Promise<void>;
   fetchActivityFeed: (limit?: number, offset?: number) => Promise<void>;
   fetchPlatformStats: () => Promise<void>;
-  fetchBookmarkedClaims: (limit?: number, offset?: number) => Promise<void>;
-  fetchFollowedClaims: (limit?: number, offset?: number) => Promise<void>;
+  fetchBookmarkedClaims: (limit?: number, cursor?: string) => Promise<void>;
+  fetchFollowedClaims: (limit?: number, cursor?: string) => Promise<void>;
   toggleBookmark: (claimId: string) => Promise<boolean>;
   toggleFollow: (claimId: string) => Promise<boolean>;
   isBookmarked: (claimId: string) => boolean;
@@ -93,8 +95,10 @@ export const useDiscoverStore = create<DiscoverState>((set, get) => ({
 
   bookmarkedClaims: [],
   bookmarkedTotal: 0,
+  bookmarkedNextCursor: null,
   followedClaims: [],
   followedTotal: 0,
+  followedNextCursor: null,
   isLoadingBookmarks: false,
   isLoadingFollowed: false,
 
@@ -186,14 +190,17 @@ export const useDiscoverStore = create<DiscoverState>((set, get) => ({
     }
   },
 
-  fetchBookmarkedClaims: async (limit = 20, offset = 0) => {
+  fetchBookmarkedClaims: async (limit = 20, cursor?: string) => {
     set({ isLoadingBookmarks: true });
     try {
-      const response = await api.getBookmarkedClaims(limit, offset);
-      const newBookmarkedIds = new Set(response.claims.map(c => c.id));
+      // Without a cursor this is the first page; otherwise append the next one
+      const response = await api.getBookmarkedClaims(limit, cursor, true);
+      const claims = cursor ? [...get().bookmarkedClaims, ...response.claims] : response.claims;
+      const newBookmarkedIds = new Set(claims.map(c => c.id));
       set({
-        bookmarkedClaims: response.claims,
-        bookmarkedTotal: response.total,
+        bookmarkedClaims: claims,
+        bookmarkedTotal: response.total ?? claims.length,
+        bookmarkedNextCursor: response.next_cursor,
         bookmarkedClaimIds: newBookmarkedIds,
         isLoadingBookmarks: false,
       });
@@ -203,14 +210,17 @@ export const useDiscoverStore = create<DiscoverState>((set, get) => ({
     }
   },
 
-  fetchFollowedClaims: async (limit = 20, offset = 0) => {
+  fetchFollowedClaims: async (limit = 20, cursor?: string) => {
     set({ isLoadingFollowed: true });
     try {
-      const response = await api.getFollowedClaims(limit, offset);
-      const newFollowedIds = new Set(response.claims.map(c => c.id));
+      // Without a cursor this is the first page; otherwise append the next one
+      const response = await api.getFollowedClaims(limit, cursor, true);
+      const claims = cursor ? [...get().followedClaims, ...response.claims] : response.claims;
+      const newFollowedIds = new Set(claims.map(c => c.id));
       set({
-        followedClaims: response.claims,
-        followedTotal: response.total,
+        followedClaims: claims,
+        followedTotal: response.total ?? claims.length,
+        followedNextCursor: response.next_cursor,
         followedClaimIds: newFollowedIds,
         isLoadingFollowed: false,
       });
@@ -298,8 +308,10 @@ export const useDiscoverStore = create<DiscoverState>((set, get) => ({
       platformStats: null,
       bookmarkedClaims: [],
       bookmarkedTotal: 0,
+      bookmarkedNextCursor: null,
       followedClaims: [],
       followedTotal: 0,
+      followedNextCursor: null,
       bookmarkedClaimIds: new Set(),
       followedClaimIds: new Set(),
     });
@@ -31,7 +31,7 @@ export const useNotificationsStore = create<NotificationsState>((set, get) => ({
       const response = await api.getNotifications(params);
       set({
         notifications: response.notifications,
-        total: response.total,
+        total: response.total ?? response.notifications.length,
         unreadCount: response.unread_count,
         isLoading: false,
       });